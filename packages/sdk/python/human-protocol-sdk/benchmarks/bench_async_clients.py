@@ -0,0 +1,69 @@
+"""Measures get_status throughput over many escrows on a node with network
+latency, comparing the blocking EscrowClient, called one by one and from a
+thread pool, with AsyncEscrowClient called concurrently with asyncio.gather.
+
+Run with:
+    python -m benchmarks.bench_async_clients
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from web3 import Web3
+from web3.eth import AsyncEth
+
+from benchmarks.provider import AsyncLocalProvider, LocalProvider
+from human_protocol_sdk.escrow import AsyncEscrowClient, EscrowClient
+
+
+def bench_sync(escrow_addresses, latency, max_workers=None):
+    escrow_client = EscrowClient(Web3(LocalProvider(latency=latency)))
+
+    start = time.perf_counter()
+    if max_workers:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(escrow_client.get_status, escrow_addresses))
+    else:
+        for escrow_address in escrow_addresses:
+            escrow_client.get_status(escrow_address)
+    return time.perf_counter() - start
+
+
+async def bench_async(escrow_addresses, latency):
+    w3 = Web3(
+        AsyncLocalProvider(latency=latency),
+        middlewares=[],
+        modules={"eth": (AsyncEth,)},
+    )
+    escrow_client = await AsyncEscrowClient.create(w3)
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *[
+            escrow_client.get_status(escrow_address)
+            for escrow_address in escrow_addresses
+        ]
+    )
+    return time.perf_counter() - start
+
+
+def main(size: int = 500, latency: float = 0.005):
+    escrow_addresses = [Web3.toChecksumAddress(f"0x{i + 1:040x}") for i in range(size)]
+
+    # Every first read of an escrow also checks it against the factory,
+    # so each get_status costs two round trips
+    print(f"get_status of {size} escrows, {latency * 1e3:.0f} ms per request")
+    for name, elapsed in (
+        ("EscrowClient, sequential", bench_sync(escrow_addresses, latency)),
+        ("EscrowClient, 8 threads", bench_sync(escrow_addresses, latency, 8)),
+        (
+            "AsyncEscrowClient, gather",
+            asyncio.run(bench_async(escrow_addresses, latency)),
+        ),
+    ):
+        print(f"{name:26} {elapsed:7.2f} s  {size / elapsed:8.0f} calls/s")
+
+
+if __name__ == "__main__":
+    main()
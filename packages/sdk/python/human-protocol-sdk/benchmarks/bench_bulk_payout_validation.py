@@ -0,0 +1,62 @@
+"""Measures the pre-flight validation of a large payout, comparing the
+per-recipient Web3.isAddress loop with validate_bulk_payout.
+
+Run with:
+    python -m benchmarks.bench_bulk_payout_validation
+"""
+
+import random
+import timeit
+
+from web3 import Web3
+
+from human_protocol_sdk.escrow import validate_bulk_payout
+
+
+def legacy_validation(recipients, amounts):
+    for recipient in recipients:
+        if not Web3.isAddress(recipient):
+            raise ValueError(f"Invalid recipient address: {recipient}")
+    if len(recipients) != len(amounts):
+        raise ValueError("Arrays must have same length")
+    if 0 in amounts:
+        raise ValueError("Amounts cannot be empty")
+    if any(amount < 0 for amount in amounts):
+        raise ValueError("Amounts cannot be negative")
+    return sum(amounts)
+
+
+def main(size: int = 50000, number: int = 5):
+    rng = random.Random(0)
+    recipients = [
+        Web3.toChecksumAddress(f"0x{rng.getrandbits(160):040x}") for _ in range(size)
+    ]
+    amounts = [rng.randrange(1, 10**18) for _ in range(size)]
+
+    legacy_time = timeit.timeit(
+        lambda: legacy_validation(recipients, amounts), number=number
+    )
+    report_time = timeit.timeit(
+        lambda: validate_bulk_payout(recipients, amounts, 10, 10), number=number
+    )
+
+    print(f"{size} checksum recipients")
+    print(f"Web3.isAddress loop:  {legacy_time / number * 1e3:.1f} ms")
+    print(f"validate_bulk_payout: {report_time / number * 1e3:.1f} ms")
+
+    lowercase_recipients = [recipient.lower() for recipient in recipients]
+    legacy_time = timeit.timeit(
+        lambda: legacy_validation(lowercase_recipients, amounts), number=number
+    )
+    report_time = timeit.timeit(
+        lambda: validate_bulk_payout(lowercase_recipients, amounts, 10, 10),
+        number=number,
+    )
+
+    print(f"{size} lowercase recipients")
+    print(f"Web3.isAddress loop:  {legacy_time / number * 1e3:.1f} ms")
+    print(f"validate_bulk_payout: {report_time / number * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
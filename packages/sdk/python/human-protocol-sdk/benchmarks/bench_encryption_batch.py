@@ -0,0 +1,50 @@
+"""Measures decrypting a batch of signed and encrypted submissions with a
+passphrase-protected key, one by one with Encryption.decrypt and spread
+over worker processes with Encryption.decrypt_many.
+
+Run with:
+    python -m benchmarks.bench_encryption_batch
+"""
+
+import os
+import time
+import warnings
+
+from human_protocol_sdk.encryption import Encryption
+from test.human_protocol_sdk.utils.encryption import (
+    passphrase,
+    private_key,
+    private_key3,
+    public_key,
+    public_key3,
+)
+
+
+def main(number: int = 200):
+    warnings.simplefilter("ignore")
+    sender = Encryption(private_key)
+    messages = sender.sign_and_encrypt_many(
+        [f'{{"submission": {i}}}' for i in range(number)], [public_key3]
+    )
+    encryption = Encryption(private_key3, passphrase)
+
+    start = time.perf_counter()
+    for message in messages:
+        encryption.decrypt(message, public_key)
+    results = {"decrypt": time.perf_counter() - start}
+
+    for max_workers in sorted({2, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        encryption.decrypt_many(messages, public_key, max_workers=max_workers)
+        results[f"decrypt_many({max_workers})"] = time.perf_counter() - start
+
+    print(f"{number} messages, passphrase-protected key")
+    for name, elapsed in results.items():
+        print(
+            f"{name:<16} {elapsed:.2f} s, {number / elapsed:.0f} messages/s, "
+            f"x{results['decrypt'] / elapsed:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Measures the size of signed and encrypted messages and the time to write
+and read them, armored and binary (armor=False).
+
+Run with:
+    python -m benchmarks.bench_encryption_binary
+"""
+
+import os
+import time
+import warnings
+
+from human_protocol_sdk.encryption import Encryption
+from test.human_protocol_sdk.utils.encryption import (
+    private_key,
+    private_key2,
+    public_key,
+    public_key2,
+)
+
+
+def measure(function, number: int) -> tuple:
+    start = time.perf_counter()
+    for _ in range(number):
+        result = function()
+    return result, (time.perf_counter() - start) / number
+
+
+def main():
+    warnings.simplefilter("ignore")
+    sender = Encryption(private_key)
+    recipient = Encryption(private_key2)
+
+    print("size, encrypt ms, decrypt ms")
+    for size, number in ((1024, 50), (64 * 1024, 10), (256 * 1024, 3)):
+        # Already compressed data, like a results archive
+        payload = os.urandom(size)
+        for armor in (True, False):
+            encrypted, encrypt = measure(
+                lambda: sender.sign_and_encrypt(payload, [public_key2], armor=armor),
+                number,
+            )
+            decrypted, decrypt = measure(
+                lambda: recipient.decrypt(encrypted, public_key), number
+            )
+            assert decrypted == payload
+            name = f"{size // 1024} KB {'armored' if armor else 'binary'}"
+            print(
+                f"{name:<17} {len(encrypted):>8} B "
+                f"{encrypt * 1000:>8.1f} {decrypt * 1000:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
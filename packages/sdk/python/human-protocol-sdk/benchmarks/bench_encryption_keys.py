@@ -0,0 +1,62 @@
+"""Measures the per-message cost of signing and encrypting for, and
+verifying messages from, a few recipient keys, parsing the armored keys
+for every message as before the public key cache, and with the cache.
+
+Run with:
+    python -m benchmarks.bench_encryption_keys
+"""
+
+import time
+
+from human_protocol_sdk.encryption import (
+    PUBLIC_KEY_CACHE,
+    Encryption,
+    EncryptionUtils,
+)
+from test.human_protocol_sdk.utils.encryption import (
+    private_key,
+    public_key,
+    public_key2,
+    public_key3,
+)
+
+MESSAGE = '{"escrow_address": "0x0000000000000000000000000000000000000000"}'
+
+
+def measure(function, number: int, cached: bool) -> float:
+    PUBLIC_KEY_CACHE.clear()
+    start = time.perf_counter()
+    for _ in range(number):
+        if not cached:
+            PUBLIC_KEY_CACHE.clear()
+        function()
+    return (time.perf_counter() - start) / number
+
+
+def main(number: int = 200):
+    encryption = Encryption(private_key)
+    signed_message = encryption.sign(MESSAGE)
+    benchmarks = {
+        "sign_and_encrypt": lambda: encryption.sign_and_encrypt(
+            MESSAGE, [public_key2, public_key3]
+        ),
+        "EncryptionUtils.encrypt": lambda: EncryptionUtils.encrypt(
+            MESSAGE, [public_key2, public_key3]
+        ),
+        "EncryptionUtils.verify": lambda: EncryptionUtils.verify(
+            signed_message, public_key
+        ),
+    }
+
+    print(f"{number} messages, ms/message")
+    for name, function in benchmarks.items():
+        uncached = measure(function, number, cached=False)
+        cached = measure(function, number, cached=True)
+        print(
+            f"{name:<24} parsed every time: {uncached * 1e3:.2f}, "
+            f"cached: {cached * 1e3:.2f}, x{uncached / cached:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
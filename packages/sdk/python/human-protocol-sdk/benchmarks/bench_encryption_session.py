@@ -0,0 +1,65 @@
+"""Measures the per-message cost of signing and encrypting, and decrypting,
+with a key without passphrase, a passphrase-protected key unlocked for
+every message, and the same key within an unlocked session.
+
+Run with:
+    python -m benchmarks.bench_encryption_session
+"""
+
+import contextlib
+import time
+import warnings
+
+from human_protocol_sdk.encryption import Encryption
+from test.human_protocol_sdk.utils.encryption import (
+    passphrase,
+    private_key2,
+    private_key3,
+    public_key2,
+    public_key3,
+)
+
+MESSAGE = '{"escrow_address": "0x0000000000000000000000000000000000000000"}'
+
+
+def measure(function, number: int, context) -> float:
+    with context:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        return (time.perf_counter() - start) / number
+
+
+def main(number: int = 50):
+    warnings.simplefilter("ignore")
+    unprotected = Encryption(private_key2)
+    protected = Encryption(private_key3, passphrase)
+    messages = {
+        unprotected: unprotected.sign_and_encrypt(MESSAGE, [public_key2]),
+        protected: protected.sign_and_encrypt(MESSAGE, [public_key3]),
+    }
+    cases = {
+        "no passphrase": (unprotected, contextlib.nullcontext),
+        "passphrase": (protected, contextlib.nullcontext),
+        "passphrase, session": (protected, protected.unlocked),
+    }
+
+    print(f"{number} messages, ms/message")
+    for name, (encryption, context) in cases.items():
+        public_key = public_key2 if encryption is unprotected else public_key3
+        encrypt = measure(
+            lambda: encryption.sign_and_encrypt(MESSAGE, [public_key]),
+            number,
+            context(),
+        )
+        decrypt = measure(
+            lambda: encryption.decrypt(messages[encryption]), number, context()
+        )
+        print(
+            f"{name:<20} sign_and_encrypt: {encrypt * 1e3:.2f}, "
+            f"decrypt: {decrypt * 1e3:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Measures peak Python memory and time of signing and encrypting a large
+payload, then decrypting it, with sign_and_encrypt/decrypt and with
+sign_and_encrypt_stream/decrypt_stream between local files. The payload
+is small by default, as pgpy takes seconds per MB to build and armor a
+message in memory.
+
+Run with:
+    python -m benchmarks.bench_encryption_stream
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+import warnings
+
+from human_protocol_sdk.encryption import Encryption
+from test.human_protocol_sdk.utils.encryption import (
+    private_key,
+    private_key2,
+    public_key,
+    public_key2,
+)
+
+
+def measure(function) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def write(path: str, chunks) -> None:
+    with open(path, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+
+
+def main(size_mb: int = 4):
+    warnings.simplefilter("ignore")
+    sender = Encryption(private_key)
+    recipient = Encryption(private_key2)
+    # Text of size_mb, as sign_and_encrypt takes a str
+    payload = os.urandom(size_mb * 1024 * 1024 // 2).hex()
+
+    with tempfile.TemporaryDirectory() as directory:
+        plain_path = os.path.join(directory, "results.json")
+        encrypted_path = os.path.join(directory, "results.json.pgp")
+        decrypted_path = os.path.join(directory, "decrypted.json")
+        with open(plain_path, "w") as f:
+            f.write(payload)
+
+        encrypted, *encrypt = measure(
+            lambda: sender.sign_and_encrypt(payload, [public_key2])
+        )
+        decrypted, *decrypt = measure(lambda: recipient.decrypt(encrypted, public_key))
+        assert decrypted == payload
+        del encrypted, decrypted
+
+        _, *encrypt_stream = measure(
+            lambda: write(
+                encrypted_path,
+                sender.sign_and_encrypt_stream(plain_path, [public_key2]),
+            )
+        )
+        _, *decrypt_stream = measure(
+            lambda: write(
+                decrypted_path, recipient.decrypt_stream(encrypted_path, public_key)
+            )
+        )
+        with open(decrypted_path) as f:
+            assert f.read() == payload
+
+    print(f"{size_mb} MB payload")
+    results = {
+        "sign_and_encrypt": encrypt,
+        "decrypt": decrypt,
+        "sign_and_encrypt_stream": encrypt_stream,
+        "decrypt_stream": decrypt_stream,
+    }
+    for name, (elapsed, peak) in results.items():
+        print(f"{name:<24} {elapsed:.2f} s, peak {peak / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Measures the per-call cost of EscrowClient.get_balance with and without
+the contract interface cache.
+
+The escrow contract cache is dropped before every call, so each call
+builds its contract instance from the interface like it used to.
+
+Run with:
+    python -m benchmarks.bench_interface_cache
+"""
+
+import timeit
+
+from web3 import Web3
+
+from benchmarks.provider import LocalProvider
+from human_protocol_sdk.escrow import EscrowClient
+from human_protocol_sdk.utils import INTERFACE_CACHE
+
+ESCROW_ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+def main(number: int = 200):
+    escrow_client = EscrowClient(Web3(LocalProvider()))
+
+    def uncached():
+        INTERFACE_CACHE.clear()
+        escrow_client.invalidate_escrow_cache()
+        escrow_client.get_balance(ESCROW_ADDRESS)
+
+    def cached():
+        escrow_client.invalidate_escrow_cache()
+        escrow_client.get_balance(ESCROW_ADDRESS)
+
+    uncached_time = timeit.timeit(uncached, number=number) / number
+    cached()
+    cached_time = timeit.timeit(cached, number=number) / number
+
+    print(f"get_balance, artifact parsed per call: {uncached_time * 1e3:.3f} ms")
+    print(f"get_balance, cached interface:         {cached_time * 1e3:.3f} ms")
+    print(
+        f"Saved per call:                        {(uncached_time - cached_time) * 1e3:.3f} ms"
+    )
+    print(f"Cache: {INTERFACE_CACHE.info()}")
+
+
+if __name__ == "__main__":
+    main()
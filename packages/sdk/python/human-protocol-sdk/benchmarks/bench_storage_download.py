@@ -0,0 +1,135 @@
+"""Measures StorageClient.download_files against a local stub S3 server
+that answers GetObject after a fixed latency, comparing one by one
+downloads with concurrent ones, and with a disk cache.
+
+Run with:
+    python -m benchmarks.bench_storage_download
+"""
+
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from human_protocol_sdk.storage import (
+    Credentials,
+    StorageClient,
+    StorageDiskCache,
+    set_storage_cache,
+)
+
+BUCKET = "results"
+
+
+class StubS3Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.01
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        query = parse_qs(urlparse(self.path).query)
+        if "list-type" in query:
+            self.list_objects(query.get("prefix", [""])[0])
+            return
+        body = self.path.encode() * 64
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"00000000000000000000000000000000"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        time.sleep(self.latency)
+        # Objects with an even last digit already exist
+        exists = int(self.path[-6], 16) % 2 == 0
+        self.send_response(200 if exists else 404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_PUT(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("ETag", '"00000000000000000000000000000000"')
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def list_objects(self, prefix: str):
+        # Every listed key with an even last digit, in a single page
+        keys = [
+            key for key in getattr(self.server, "keys", []) if key.startswith(prefix)
+        ]
+        contents = "".join(
+            f"<Contents><Key>{key}</Key><Size>1</Size>"
+            "<LastModified>2024-01-01T00:00:00Z</LastModified></Contents>"
+            for key in keys
+            if int(key[-6], 16) % 2 == 0
+        )
+        body = (
+            '<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+            f"<Name>{BUCKET}</Name><Prefix>{prefix}</Prefix>"
+            f"<KeyCount>{len(keys)}</KeyCount><IsTruncated>false</IsTruncated>"
+            f"{contents}</ListBucketResult>"
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main(number: int = 500, latency: float = 0.01):
+    StubS3Handler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubS3Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    client = StorageClient(
+        endpoint_url=f"127.0.0.1:{server.server_port}",
+        region="us-east-1",
+        credentials=Credentials(access_key="access-key", secret_key="secret-key"),
+        secure=False,
+    )
+    files = [f"s3{i:040x}.json" for i in range(number)]
+
+    try:
+        results = {}
+        for max_workers in (1, 5, 10):
+            start = time.perf_counter()
+            client.download_files(files, BUCKET, max_workers=max_workers)
+            results[max_workers] = time.perf_counter() - start
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = StorageDiskCache(directory)
+            set_storage_cache(cache)
+            for name in ("disk cache, cold", "disk cache, warm"):
+                start = time.perf_counter()
+                client.download_files(files, BUCKET)
+                results[name] = time.perf_counter() - start
+            set_storage_cache(None)
+            cache_info = cache.info()
+            cache.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"{number} objects from a local stub S3 server, {latency * 1e3:.0f} ms each")
+    for max_workers, elapsed in results.items():
+        name = (
+            f"max_workers={max_workers}" if max_workers in (1, 5, 10) else max_workers
+        )
+        print(
+            f"{name:<17} {elapsed:.2f} s, "
+            f"{number / elapsed:.0f} objects/s, "
+            f"x{results[1] / elapsed:.1f}"
+        )
+    print(f"Cache: {cache_info}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Measures peak Python memory of transferring a large object with a local
+stub S3 server, comparing download_files with download_file_to_path, and
+upload_files with upload_stream.
+
+Run with:
+    python -m benchmarks.bench_storage_stream
+"""
+
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from human_protocol_sdk.storage import Credentials, StorageClient
+
+BUCKET = "datasets"
+BLOCK = os.urandom(64 * 1024)
+XMLNS = "http://s3.amazonaws.com/doc/2006-03-01/"
+ETAG = '"00000000000000000000000000000000"'
+
+
+class StubLargeObjectHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    size = 128 * 1024 * 1024
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Content-Length", str(self.size))
+        self.end_headers()
+        for _ in range(self.size // len(BLOCK)):
+            self.wfile.write(BLOCK)
+
+    def do_HEAD(self):
+        # Only objects being uploaded exist, for upload_stream to copy them
+        if "/.uploads/" not in self.path:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(self.size))
+        self.send_header("ETag", ETAG)
+        self.send_header("Last-Modified", "Mon, 01 Jan 2024 00:00:00 GMT")
+        self.end_headers()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        query = urlparse(self.path).query
+        if query.startswith("uploads"):
+            self.send_xml(
+                "InitiateMultipartUploadResult",
+                f"<Bucket>{BUCKET}</Bucket><Key>key</Key><UploadId>1</UploadId>",
+            )
+        else:
+            self.send_xml(
+                "CompleteMultipartUploadResult",
+                f"<Bucket>{BUCKET}</Bucket><Key>key</Key><ETag>{ETAG}</ETag>",
+            )
+
+    def do_PUT(self):
+        length = int(self.headers.get("Content-Length", 0))
+        while length > 0:
+            length -= len(self.rfile.read(min(length, 1024 * 1024)))
+        if "x-amz-copy-source" in self.headers:
+            self.send_xml(
+                "CopyObjectResult",
+                f"<ETag>{ETAG}</ETag><LastModified>2024-01-01T00:00:00Z</LastModified>",
+            )
+            return
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_DELETE(self):
+        self.send_response(204)
+        self.end_headers()
+
+    def send_xml(self, root: str, content: str):
+        body = f'<{root} xmlns="{XMLNS}">{content}</{root}>'.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def measure(function) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(size_mb: int = 128):
+    StubLargeObjectHandler.size = size_mb * 1024 * 1024
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubLargeObjectHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    client = StorageClient(
+        endpoint_url=f"127.0.0.1:{server.server_port}",
+        region="us-east-1",
+        credentials=Credentials(access_key="access-key", secret_key="secret-key"),
+        secure=False,
+    )
+
+    # About size_mb once serialized, created before measuring
+    results = [BLOCK[:32].hex() for _ in range(StubLargeObjectHandler.size // 68)]
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "dataset.zip")
+            results = {
+                "download_files": measure(
+                    lambda: client.download_files(["dataset.zip"], BUCKET)
+                ),
+                "download_file_to_path": measure(
+                    lambda: client.download_file_to_path("dataset.zip", BUCKET, path)
+                ),
+                "upload_files": measure(lambda: client.upload_files([results], BUCKET)),
+                "upload_stream": measure(
+                    lambda: client.upload_stream(
+                        (
+                            BLOCK
+                            for _ in range(StubLargeObjectHandler.size // len(BLOCK))
+                        ),
+                        BUCKET,
+                        extension=".zip",
+                    )
+                ),
+            }
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"{size_mb} MB object with a local stub S3 server")
+    for name, (elapsed, peak) in results.items():
+        print(f"{name:<22} {elapsed:.2f} s, peak {peak / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
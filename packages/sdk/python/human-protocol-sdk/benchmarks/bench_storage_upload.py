@@ -0,0 +1,70 @@
+"""Measures StorageClient.upload_files against a local stub S3 server
+that answers HeadObject and PutObject after a fixed latency, half of the
+files being already in the bucket, comparing one by one uploads with
+pipelined ones, with and without a dedup index.
+
+Run with:
+    python -m benchmarks.bench_storage_upload
+"""
+
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+from benchmarks.bench_storage_download import BUCKET, StubS3Handler
+from human_protocol_sdk.storage import (
+    Credentials,
+    StorageClient,
+    StorageDedupIndex,
+)
+
+
+def main(number: int = 500, latency: float = 0.01):
+    StubS3Handler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubS3Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    client = StorageClient(
+        endpoint_url=f"127.0.0.1:{server.server_port}",
+        region="us-east-1",
+        credentials=Credentials(access_key="access-key", secret_key="secret-key"),
+        secure=False,
+    )
+    files = [
+        {"escrow": f"0x{i:040x}", "answers": [{"label": i % 7}] * 100}
+        for i in range(number)
+    ]
+    server.keys = [client._serialize_file(file, BUCKET)[1]["key"] for file in files]
+
+    try:
+        results = {}
+        for max_workers in (1, 5, 10):
+            start = time.perf_counter()
+            client.upload_files(files, BUCKET, max_workers=max_workers)
+            results[max_workers] = time.perf_counter() - start
+
+        client.dedup_index = StorageDedupIndex()
+        start = time.perf_counter()
+        client.upload_files(files, BUCKET)
+        results["dedup index"] = time.perf_counter() - start
+        start = time.perf_counter()
+        client.upload_files(files, BUCKET)
+        results["dedup index, again"] = time.perf_counter() - start
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"{number} objects to a local stub S3 server, {latency * 1e3:.0f} ms each")
+    for max_workers, elapsed in results.items():
+        name = (
+            f"max_workers={max_workers}" if max_workers in (1, 5, 10) else max_workers
+        )
+        print(
+            f"{name:<19} {elapsed:.2f} s, "
+            f"{number / elapsed:.0f} objects/s, "
+            f"x{results[1] / elapsed:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Measures subgraph query latency against a local stub GraphQL server,
+comparing a new connection per query (requests.post) with the pooled
+session used by get_data_from_subgraph.
+
+Run with:
+    python -m benchmarks.bench_subgraph_session
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from human_protocol_sdk.utils import (
+    SUBGRAPH_METRICS,
+    close_subgraph_sessions,
+    get_data_from_subgraph,
+)
+
+QUERY = "{ launchedEscrows(first:1000) { id } }"
+
+
+class StubSubgraphHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    body = json.dumps(
+        {"data": {"launchedEscrows": [{"id": f"0x{i:040x}"} for i in range(1000)]}}
+    ).encode()
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main(number: int = 500):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubSubgraphHandler)
+    server.connections = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/subgraph"
+
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            requests.post(url, json={"query": QUERY}).json()
+        new_connection_time = time.perf_counter() - start
+        new_connections = server.connections
+
+        server.connections = 0
+        SUBGRAPH_METRICS.clear()
+        start = time.perf_counter()
+        for _ in range(number):
+            get_data_from_subgraph(url, QUERY)
+        session_time = time.perf_counter() - start
+    finally:
+        close_subgraph_sessions()
+        server.shutdown()
+        server.server_close()
+
+    print(f"{number} queries to a local stub subgraph")
+    print(
+        f"requests.post:          {new_connection_time / number * 1e3:.2f} ms/query, "
+        f"{new_connections} connections"
+    )
+    print(
+        f"get_data_from_subgraph: {session_time / number * 1e3:.2f} ms/query, "
+        f"{server.connections} connections"
+    )
+    print(f"Metrics: {SUBGRAPH_METRICS.info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+from web3.providers.async_base import AsyncBaseProvider
+from web3.providers.base import BaseProvider
+
+from human_protocol_sdk.constants import ChainId
+
+
+class LocalProvider(BaseProvider):
+    """In-process provider answering the RPC calls used by the benchmarks.
+
+    Every ``eth_call`` returns ``result``, so view functions returning
+    a single word (balance, status, bool, ...) can be decoded. ``latency``
+    seconds are spent on every request, to simulate a remote node.
+    """
+
+    def __init__(self, result: int = 1, latency: float = 0):
+        self.result = "0x" + result.to_bytes(32, "big").hex()
+        self.latency = latency
+        self.requests = 0
+
+    def make_request(self, method, params):
+        self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return _make_response(method, self.result)
+
+    def isConnected(self):
+        return True
+
+
+class AsyncLocalProvider(AsyncBaseProvider):
+    """Async counterpart of LocalProvider, for the async clients."""
+
+    def __init__(self, result: int = 1, latency: float = 0):
+        self.result = "0x" + result.to_bytes(32, "big").hex()
+        self.latency = latency
+        self.requests = 0
+
+    async def make_request(self, method, params):
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return _make_response(method, self.result)
+
+    async def isConnected(self):
+        return True
+
+
+def _make_response(method, result):
+    if method == "eth_chainId":
+        return {"jsonrpc": "2.0", "id": 1, "result": hex(ChainId.LOCALHOST.value)}
+    if method == "eth_call":
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+    raise NotImplementedError(method)
@@ -30,6 +30,7 @@ NETWORKS = {
         "staking_address": "0x05398211bA2046E296fBc9a9D3EB49e3F15C3123",
         "reward_pool_address": "0x4A5963Dd6792692e9147EdC7659936b96251917a",
         "kvstore_address": "0x70671167176C4934204B1C7e97F5e86695857ef2",
+        "multicall_address": "0xcA11bde05977b3631167028862bE2a173976CA11",
         "old_subgraph_url": "",
         "old_factory_address": "",
     },
@@ -42,6 +43,7 @@ NETWORKS = {
         "staking_address": "0xf46B45Df3d956369726d8Bd93Ba33963Ab692920",
         "reward_pool_address": "0x0376D26246Eb35FF4F9924cF13E6C05fd0bD7Fb4",
         "kvstore_address": "0xc9Fe39c4b6e1d7A2991355Af159956982DADf842",
+        "multicall_address": "0xcA11bde05977b3631167028862bE2a173976CA11",
         "old_subgraph_url": "https://api.thegraph.com/subgraphs/name/humanprotocol/goerli",
         "old_factory_address": "0xaAe6a2646C1F88763E62e0cD08aD050Ea66AC46F",
     },
@@ -54,6 +56,7 @@ NETWORKS = {
         "staking_address": "0xdFbB79dC35a3A53741be54a2C9b587d6BafAbd1C",
         "reward_pool_address": "0xf376443BCc6d4d4D63eeC086bc4A9E4a83878e0e",
         "kvstore_address": "0x2B95bEcb6EBC4589f64CB000dFCF716b4aeF8aA6",
+        "multicall_address": "0xcA11bde05977b3631167028862bE2a173976CA11",
         "old_subgraph_url": "https://api.thegraph.com/subgraphs/name/humanprotocol/bsc",
         "old_factory_address": "0xc88bC422cAAb2ac8812de03176402dbcA09533f4",
     },
@@ -66,6 +69,7 @@ NETWORKS = {
         "staking_address": "0x5517fE916Fe9F8dB15B0DDc76ebDf0BdDCd4ed18",
         "reward_pool_address": "0xB0A0500103eCEc431b73F6BAd923F0a2774E6e29",
         "kvstore_address": "0x3aD4B091E054f192a822D1406f4535eAd38580e4",
+        "multicall_address": "0xcA11bde05977b3631167028862bE2a173976CA11",
         "old_subgraph_url": "https://api.thegraph.com/subgraphs/name/humanprotocol/bsctest",
         "old_factory_address": "0xaae6a2646c1f88763e62e0cd08ad050ea66ac46f",
     },
@@ -78,6 +82,7 @@ NETWORKS = {
         "staking_address": "0xcbAd56bE3f504E98bd70875823d3CC0242B7bB29",
         "reward_pool_address": "0xa8e32d777a3839440cc7c24D591A64B9481753B3",
         "kvstore_address": "0x35Cf4beBD58F9C8D75B9eA2599479b6C173d406F",
+        "multicall_address": "0xcA11bde05977b3631167028862bE2a173976CA11",
         "old_subgraph_url": "https://api.thegraph.com/subgraphs/name/humanprotocol/polygon",
         "old_factory_address": "0x45eBc3eAE6DA485097054ae10BA1A0f8e8c7f794",
     },
@@ -90,6 +95,7 @@ NETWORKS = {
         "staking_address": "0x7Fd3dF914E7b6Bd96B4c744Df32183b51368Bfac",
         "reward_pool_address": "0xf0145eD99AC3c4f877aDa7dA4D1E059ec9116BAE",
         "kvstore_address": "0xD7F61E812e139a5a02eDae9Dfec146E1b8eA3807",
+        "multicall_address": "0xcA11bde05977b3631167028862bE2a173976CA11",
         "old_subgraph_url": "https://api.thegraph.com/subgraphs/name/humanprotocol/mumbai",
         "old_factory_address": "0x558cd800f9F0B02f3B149667bDe003284c867E94",
     },
@@ -102,6 +108,7 @@ NETWORKS = {
         "staking_address": "0x05398211bA2046E296fBc9a9D3EB49e3F15C3123",
         "reward_pool_address": "0x4A5963Dd6792692e9147EdC7659936b96251917a",
         "kvstore_address": "0x70671167176C4934204B1C7e97F5e86695857ef2",
+        "multicall_address": "0xcA11bde05977b3631167028862bE2a173976CA11",
         "old_subgraph_url": "https://api.thegraph.com/subgraphs/name/humanprotocol/moonbeam",
         "old_factory_address": "0x98108c28B7767a52BE38B4860832dd4e11A7ecad",
     },
@@ -114,6 +121,7 @@ NETWORKS = {
         "staking_address": "0xBFC7009F3371F93F3B54DdC8caCd02914a37495c",
         "reward_pool_address": "0xf46B45Df3d956369726d8Bd93Ba33963Ab692920",
         "kvstore_address": "0xE3D74BBFa45B4bCa69FF28891fBE392f4B4d4e4d",
+        "multicall_address": "0xcA11bde05977b3631167028862bE2a173976CA11",
         "old_subgraph_url": "",
         "old_factory_address": "",
     },
@@ -126,6 +134,7 @@ NETWORKS = {
         "staking_address": "",
         "reward_pool_address": "",
         "kvstore_address": "0x4B79eaD28F52eD5686bf0e379717e85fc7aD10Df",
+        "multicall_address": "0xcA11bde05977b3631167028862bE2a173976CA11",
         "old_subgraph_url": "",
         "old_factory_address": "",
     },
@@ -138,6 +147,7 @@ NETWORKS = {
         "staking_address": "",
         "reward_pool_address": "",
         "kvstore_address": "0xd232c1426CF0653cE8a71DC98bCfDf10c471c114",
+        "multicall_address": "0xcA11bde05977b3631167028862bE2a173976CA11",
         "old_subgraph_url": "",
         "old_factory_address": "",
     },
@@ -150,6 +160,7 @@ NETWORKS = {
         "staking_address": "0x79F37FB9C210910733c16228AC4D14a8e32C11BD",
         "reward_pool_address": "0x881218246c25C6898aE96145259584340153aDA2",
         "kvstore_address": "0xE1055607327b1be2080D31211dCDC4D9338CaF4A",
+        "multicall_address": "",
         "old_subgraph_url": "",
         "old_factory_address": "0x27B423cE73d1dBdB48d2dd351398b5Ce8223117c",
     },
@@ -162,6 +173,7 @@ NETWORKS = {
         "staking_address": "0x9fE46736679d2D9a65F0992F2272dE9f3c7fa6e0",
         "reward_pool_address": "0xa513E6E4b8f2a923D98304ec87F64353C4D5C853",
         "kvstore_address": "0x5FC8d32690cc91D4c39d9d3abcBD16989F875707",
+        "multicall_address": "",
         "old_subgraph_url": "",
         "old_factory_address": "",
     },
@@ -179,6 +191,16 @@ class Status(Enum):
     Cancelled = 5
 
 
+class PayoutChunkStatus(Enum):
+    """Enum for bulk payout chunk statuses."""
+
+    Pending = "Pending"
+    Submitting = "Submitting"
+    Submitted = "Submitted"
+    Confirmed = "Confirmed"
+    Failed = "Failed"
+
+
 class Role(Enum):
     """Enum for roles."""
 
@@ -1,12 +1,253 @@
-from typing import Optional, List
-from pgpy import PGPKey, PGPMessage, PGPUID
+import bz2
+import functools
+import hashlib
+import hmac
+import math
+import os
+import threading
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional, List, Union
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
+from cryptography.hazmat.primitives.ciphers import Cipher, modes
+from pgpy import PGPKey, PGPMessage, PGPSignature, PGPUID
 from pgpy.constants import (
+    CompressionAlgorithm,
     SymmetricKeyAlgorithm,
     HashAlgorithm,
     KeyFlags,
     PubKeyAlgorithm,
+    SignatureType,
 )
 from pgpy.errors import PGPError
+from pgpy.packet import Packet
+
+from human_protocol_sdk.utils import LRUCache
+
+# Maximum number of parsed public keys kept in memory
+ENCRYPTION_KEY_CACHE_SIZE = int(os.getenv("ENCRYPTION_KEY_CACHE_SIZE", 128))
+# Seconds an unlocked session keeps the private key unlocked before locking it again
+ENCRYPTION_SESSION_MAX_AGE = float(os.getenv("ENCRYPTION_SESSION_MAX_AGE", 300))
+# Number of operations an unlocked session runs before locking the private key again
+ENCRYPTION_SESSION_MAX_OPERATIONS = int(
+    os.getenv("ENCRYPTION_SESSION_MAX_OPERATIONS", 10000)
+)
+# Number of processes batch operations are spread over
+ENCRYPTION_MAX_WORKERS = int(os.getenv("ENCRYPTION_MAX_WORKERS", os.cpu_count() or 1))
+# Size in bytes of the chunks read and written by stream operations
+ENCRYPTION_STREAM_CHUNK_SIZE = int(
+    os.getenv("ENCRYPTION_STREAM_CHUNK_SIZE", 1024 * 1024)
+)
+
+
+class PublicKeyCache:
+    """
+    Process-wide bounded cache of parsed public keys.
+
+    Parsing an armored key is slow in pgpy, and the same few oracle keys are
+    used for every message. Armored keys are looked up by their SHA-256 and
+    parsed keys are kept by fingerprint, least recently used first out.
+    Cached keys are shared, so they must not be modified.
+
+    Attributes:
+        hits (int): Number of lookups served from the cache
+        misses (int): Number of lookups that parsed the key
+    """
+
+    def __init__(self, max_size: int = ENCRYPTION_KEY_CACHE_SIZE):
+        """
+        Initializes a PublicKeyCache instance.
+
+        Args:
+            max_size (int): Maximum number of parsed keys kept
+        """
+        self._fingerprints = LRUCache(max_size)
+        self._keys = LRUCache(max_size)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, armored_key: Union[str, bytes]) -> PGPKey:
+        """
+        Gets a parsed key, parsing it if needed.
+
+        Args:
+            armored_key (Union[str, bytes]): Armored public key
+
+        Returns:
+            PGPKey: The parsed key
+
+        Raises:
+            PGPError: If the key can't be parsed
+        """
+        digest = hashlib.sha256(
+            armored_key.encode() if isinstance(armored_key, str) else armored_key
+        ).digest()
+        fingerprint = self._fingerprints.get(digest)
+        key = self._keys.get(fingerprint) if fingerprint is not None else None
+        if key is not None:
+            with self._lock:
+                self.hits += 1
+            return key
+
+        key, _ = PGPKey.from_blob(armored_key)
+        self._keys.put(key.fingerprint, key)
+        self._fingerprints.put(digest, key.fingerprint)
+        with self._lock:
+            self.misses += 1
+        return key
+
+    def clear(self) -> None:
+        """
+        Drops all parsed keys and resets the counters.
+
+        Returns:
+            None
+        """
+        self._fingerprints.clear()
+        self._keys.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict:
+        """
+        Gets statistics of the cache.
+
+        Returns:
+            dict: Number of hits, misses and parsed keys kept
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._keys)}
+
+
+PUBLIC_KEY_CACHE = PublicKeyCache()
+
+
+class UnlockedSession:
+    """
+    Context manager keeping the private key of an Encryption unlocked.
+
+    Unlocking a passphrase-protected key runs its key derivation function,
+    which costs more than signing or decrypting a small message. Within the
+    session the key is unlocked once, then again only after max_age seconds
+    or max_operations operations. A timer locks the key max_age seconds
+    after it was unlocked, even if the session is idle, so derived key
+    material is never kept longer than that. The key is locked again when
+    the session exits.
+
+    Example:
+        with encryption.unlocked():
+            for message in messages:
+                encryption.decrypt(message)
+
+    Attributes:
+        max_age (float): Seconds the key stays unlocked
+        max_operations (float): Number of operations run before the key is locked
+        unlocks (int): Number of times the key was unlocked
+    """
+
+    def __init__(self, encryption: "Encryption", max_age: float, max_operations: float):
+        """
+        Initializes an UnlockedSession instance.
+
+        Args:
+            encryption (Encryption): Encryption whose private key is unlocked
+            max_age (float): Seconds the key stays unlocked, math.inf for no limit
+            max_operations (float): Number of operations run before the key is locked, math.inf for no limit
+        """
+        self.encryption = encryption
+        self.max_age = max_age
+        self.max_operations = max_operations
+        self.unlocks = 0
+        self._lock = threading.RLock()
+        self._context = None
+        self._timer: Optional[threading.Timer] = None
+        self._unlocked_at = 0.0
+        self._operations = 0
+        self._nested = False
+
+    def __enter__(self) -> "UnlockedSession":
+        with self._lock:
+            # The outer session of the same Encryption is kept
+            self._nested = self.encryption._session is not None
+            if not self._nested:
+                self.encryption._session = self
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._nested:
+            return
+        with self._lock:
+            self._relock()
+            self.encryption._session = None
+
+    def use(self) -> None:
+        """
+        Makes sure the key is unlocked for one more operation.
+
+        Must be called with the session lock held for the whole operation.
+
+        Raises:
+            ValueError: If the key can't be unlocked
+        """
+        if self._context is not None and (
+            self._operations >= self.max_operations
+            or time.monotonic() - self._unlocked_at >= self.max_age
+        ):
+            self._relock()
+        if self._context is None and not self.encryption.private_key.is_unlocked:
+            context = self.encryption.private_key.unlock(self.encryption.passphrase)
+            try:
+                context.__enter__()
+            except PGPError as e:
+                raise ValueError("Failed to unlock private key: {}".format(str(e)))
+            self._context = context
+            self._unlocked_at = time.monotonic()
+            self._operations = 0
+            self.unlocks += 1
+            if self.max_age != math.inf:
+                self._timer = threading.Timer(self.max_age, self._expire, (context,))
+                self._timer.daemon = True
+                self._timer.start()
+        self._operations += 1
+
+    def _expire(self, context) -> None:
+        with self._lock:
+            # The key may have been unlocked again since the timer started
+            if self._context is context:
+                self._relock()
+
+    def _relock(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._context is not None:
+            self._context.__exit__(None, None, None)
+            self._context = None
+
+
+def _uses_private_key(method: Callable) -> Callable:
+    """
+    Runs an Encryption method within its unlocked session, if there is one.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        while True:
+            session = self._session
+            if session is None:
+                return method(self, *args, **kwargs)
+            with session._lock:
+                # The session may have exited while waiting for its lock
+                if self._session is session:
+                    session.use()
+                    return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class Encryption:
@@ -26,6 +267,10 @@ class Encryption:
             self.private_key, _ = PGPKey.from_blob(private_key_armored)
         except PGPError as e:
             raise ValueError("Invalid private key: {}".format(str(e)))
+        # Sent to the worker processes of batch operations
+        self._private_key_armored = private_key_armored
+        self._passphrase = passphrase
+        self._session: Optional[UnlockedSession] = None
 
         if not self.private_key.is_unlocked:
             if passphrase:
@@ -38,18 +283,54 @@ class Encryption:
             else:
                 raise ValueError("Private key locked. Passphrase needed")
 
-    def sign_and_encrypt(self, message: str, public_keys: List[str]) -> str:
+    def unlocked(
+        self,
+        max_age: Optional[float] = None,
+        max_operations: Optional[int] = None,
+    ) -> UnlockedSession:
+        """
+        Keeps the private key unlocked while the returned context manager is entered.
+
+        Operations on a passphrase-protected key otherwise unlock it every time.
+        It has no effect on keys without a passphrase.
+
+        Args:
+            max_age (float, optional): Seconds the key stays unlocked before being unlocked again.
+                Defaults to ENCRYPTION_SESSION_MAX_AGE.
+            max_operations (int, optional): Number of operations before the key is unlocked again.
+                Defaults to ENCRYPTION_SESSION_MAX_OPERATIONS.
+
+        Returns:
+            UnlockedSession: The session, to use in a with statement
+        """
+        return UnlockedSession(
+            self,
+            ENCRYPTION_SESSION_MAX_AGE if max_age is None else max_age,
+            ENCRYPTION_SESSION_MAX_OPERATIONS
+            if max_operations is None
+            else max_operations,
+        )
+
+    @_uses_private_key
+    def sign_and_encrypt(
+        self,
+        message: Union[str, bytes],
+        public_keys: List[str],
+        armor: bool = True,
+    ) -> Union[str, bytes]:
         """
         Signs and encrypts a message using the private key and recipient's public keys.
 
         Args:
-            message (str): Message to sign and encrypt
+            message (Union[str, bytes]): Message to sign and encrypt
             public_keys (list[str]): List of armored public keys of the recipients
+            armor (bool, optional): Whether to armor the message. A binary message is
+                about 25% smaller and skips base64 encoding on both ends. Defaults to True.
 
         Returns:
-            str: Armored and signed/encrypted message
+            Union[str, bytes]: Armored and signed/encrypted message, binary if armor is False
         """
-        pgp_message = PGPMessage.new(message)
+        pgp_message = _new_message(message)
         if not self.private_key.is_unlocked:
             try:
                 with self.private_key.unlock(self.passphrase):
@@ -63,22 +344,25 @@ class Encryption:
         sessionkey = cipher.gen_key()
 
         for public_key in public_keys:
-            recipient_key, _ = PGPKey.from_blob(public_key)
+            recipient_key = PUBLIC_KEY_CACHE.get(public_key)
             pgp_message = recipient_key.encrypt(pgp_message, sessionkey)
 
         del sessionkey
-        return pgp_message.__str__()
+        return _serialize_message(pgp_message, armor)
 
-    def decrypt(self, message: str, public_key: Optional[str] = None) -> str:
+    @_uses_private_key
+    def decrypt(
+        self, message: Union[str, bytes], public_key: Optional[str] = None
+    ) -> Union[str, bytes]:
         """
         Decrypts a message using the private key.
 
         Args:
-            message (str): Armored message to decrypt
+            message (Union[str, bytes]): Armored or binary message to decrypt
             public_key (str, optional): Armored public key used for signature verification. Defaults to None.
 
         Returns:
-            str: Decrypted message
+            Union[str, bytes]: Decrypted message, bytes if bytes were encrypted
         """
         pgp_message = PGPMessage.from_blob(message)
         decrypted_message = ""
@@ -92,10 +376,12 @@ class Encryption:
             else:
                 decrypted_message = self.private_key.decrypt(pgp_message)
             if public_key:
-                public_key, _ = PGPKey.from_blob(public_key)
-                public_key.verify(decrypted_message)
+                PUBLIC_KEY_CACHE.get(public_key).verify(decrypted_message)
 
-            return decrypted_message.message.__str__()
+            contents = decrypted_message.message
+            if isinstance(contents, bytearray):
+                return bytes(contents)
+            return contents.__str__()
         except PGPError as e:
             if (
                 decrypted_message
@@ -107,6 +393,7 @@ class Encryption:
                 )
             raise ValueError("Failed to decrypt message: {}".format(str(e)))
 
+    @_uses_private_key
     def sign(self, message: str) -> str:
         """
         Signs a message using the private key.
@@ -128,6 +415,280 @@ class Encryption:
             message |= self.private_key.sign(message)
         return message.__str__()
 
+    def sign_and_encrypt_stream(
+        self,
+        source: Union[str, os.PathLike, BinaryIO, Iterable[bytes]],
+        public_keys: List[str],
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        """
+        Signs and encrypts a large payload chunk by chunk.
+
+        The output is a binary OpenPGP message, readable by decrypt_stream
+        or any OpenPGP implementation such as GnuPG. Memory used is a few chunks,
+        whatever the size of the payload, and the iterator can be passed
+        directly to StorageClient.upload_stream.
+
+        Args:
+            source (Union[str, os.PathLike, BinaryIO, Iterable[bytes]]): Path of a local file,
+                binary file-like object or iterable of bytes chunks to encrypt
+            public_keys (list[str]): List of armored public keys of the recipients
+            chunk_size (int, optional): Size of the chunks in bytes. Defaults to ENCRYPTION_STREAM_CHUNK_SIZE.
+
+        Returns:
+            Iterator[bytes]: Chunks of the signed/encrypted message
+
+        Example:
+            client.upload_stream(
+                encryption.sign_and_encrypt_stream("results.zip", public_keys),
+                bucket="my-bucket",
+                extension=".zip.pgp",
+            )
+        """
+        chunk_size = chunk_size or ENCRYPTION_STREAM_CHUNK_SIZE
+        signing_key = _signing_key(self.private_key)
+        signature = PGPSignature.new(
+            SignatureType.BinaryDocument,
+            signing_key.key_algorithm,
+            HashAlgorithm.SHA256,
+            signing_key.fingerprint.keyid,
+        )
+        signature._signature.subpackets.addnew(
+            "IssuerFingerprint",
+            hashed=True,
+            _version=4,
+            _issuer_fpr=signing_key.fingerprint,
+        )
+        hasher = signature.hash_algorithm.hasher
+
+        def packets() -> Iterator[bytes]:
+            yield bytes(signature.make_onepass())
+            yield from _write_packet(
+                _LITERAL_DATA_TAG,
+                _literal_data(_read_chunks(source, chunk_size), hasher),
+                chunk_size,
+            )
+            yield bytes(self._finish_signature(signing_key, signature, hasher))
+
+        return _encrypt_packets(packets(), public_keys, chunk_size)
+
+    def decrypt_stream(
+        self,
+        source: Union[str, os.PathLike, BinaryIO, Iterable[bytes]],
+        public_key: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        """
+        Decrypts a large binary message chunk by chunk.
+
+        Messages written by sign_and_encrypt_stream, encrypt_stream or any
+        OpenPGP implementation are supported. Memory used is a few chunks,
+        whatever the size of the message. The integrity of the message and
+        its signature are only checked once it is fully read, so the output
+        must be discarded if the iterator raises.
+
+        Args:
+            source (Union[str, os.PathLike, BinaryIO, Iterable[bytes]]): Path of a local file,
+                binary file-like object or iterable of bytes chunks of the message,
+                e.g. StorageClient.stream_file
+            public_key (str, optional): Armored public key used for signature verification. Defaults to None.
+            chunk_size (int, optional): Size of the chunks in bytes. Defaults to ENCRYPTION_STREAM_CHUNK_SIZE.
+
+        Returns:
+            Iterator[bytes]: Chunks of the decrypted message
+
+        Raises:
+            ValueError: If the message can't be decrypted, or while iterating
+                if it is modified or its signature can't be verified
+
+        Example:
+            with open("results.zip", "wb") as f:
+                for chunk in encryption.decrypt_stream(
+                    client.stream_file("results.zip.pgp", "my-bucket")
+                ):
+                    f.write(chunk)
+        """
+        chunk_size = chunk_size or ENCRYPTION_STREAM_CHUNK_SIZE
+        reader = _ChunkReader(_read_chunks(source, chunk_size))
+
+        session_keys = []
+        while True:
+            header = _read_packet_header(reader)
+            if header is None:
+                raise ValueError("Failed to decrypt message: Message is not encrypted")
+            tag, length, partial = header
+            if tag == _ENCRYPTED_DATA_TAG:
+                break
+            packet = _read_packet(reader, tag, length, partial)
+            if tag == _SESSION_KEY_TAG:
+                session_keys.append(packet)
+            elif tag != _MARKER_TAG:
+                raise ValueError(
+                    "Failed to decrypt message: Unexpected packet {}".format(tag)
+                )
+
+        algorithm, key = self._decrypt_session_key(session_keys)
+        verification_key = PUBLIC_KEY_CACHE.get(public_key) if public_key else None
+        plaintext = _ChunkReader(
+            _decrypt_integrity_protected(
+                _ChunkReader(_packet_chunks(reader, length, partial, chunk_size)),
+                algorithm,
+                key,
+                chunk_size,
+            )
+        )
+        return _read_literal_data(plaintext, verification_key, chunk_size)
+
+    @_uses_private_key
+    def _finish_signature(
+        self, signing_key: PGPKey, signature: PGPSignature, hasher
+    ) -> PGPSignature:
+        """
+        Signs the digest of a streamed payload.
+
+        Args:
+            signing_key (PGPKey): Primary key or subkey of the private key used to sign
+            signature (PGPSignature): Signature to complete
+            hasher: Hash object already updated with the payload
+
+        Returns:
+            PGPSignature: The completed signature
+        """
+        hasher.update(signature.hashdata(b""))
+        digest = hasher.digest()
+        signature._signature.hash2 = bytearray(digest[:2])
+        if not self.private_key.is_unlocked:
+            try:
+                with self.private_key.unlock(self.passphrase):
+                    value = _sign_digest(signing_key, digest, signature)
+            except PGPError as e:
+                raise ValueError("Failed to unlock private key: {}".format(str(e)))
+        else:
+            value = _sign_digest(signing_key, digest, signature)
+        signature._signature.signature.from_signer(value)
+        signature._signature.update_hlen()
+        return signature
+
+    @_uses_private_key
+    def _decrypt_session_key(self, session_keys: list) -> tuple:
+        """
+        Decrypts the session key of a message encrypted for this key.
+
+        Args:
+            session_keys (list): Public-key encrypted session key packets of the message
+
+        Returns:
+            tuple: Symmetric algorithm and session key
+        """
+        keys = {self.private_key.fingerprint.keyid: self.private_key}
+        keys.update(self.private_key.subkeys)
+        session_key = next(
+            (packet for packet in session_keys if packet.encrypter in keys), None
+        )
+        if session_key is None:
+            raise ValueError(
+                "Failed to decrypt message: Cannot decrypt the provided message with this key"
+            )
+        key = keys[session_key.encrypter]
+        try:
+            if not self.private_key.is_unlocked:
+                try:
+                    with self.private_key.unlock(self.passphrase):
+                        return session_key.decrypt_sk(key._key)
+                except PGPError as e:
+                    raise ValueError("Failed to unlock private key: {}".format(str(e)))
+            return session_key.decrypt_sk(key._key)
+        except PGPError as e:
+            raise ValueError("Failed to decrypt message: {}".format(str(e)))
+
+    def sign_and_encrypt_many(
+        self,
+        messages: List[Union[str, bytes]],
+        public_keys: List[str],
+        max_workers: Optional[int] = None,
+        armor: bool = True,
+    ) -> List[Union[str, bytes, ValueError]]:
+        """
+        Signs and encrypts messages in parallel worker processes.
+
+        Each worker parses and unlocks the private key once, so batches
+        should be large enough for that to pay off.
+
+        Args:
+            messages (list[Union[str, bytes]]): Messages to sign and encrypt
+            public_keys (list[str]): List of armored public keys of the recipients
+            max_workers (int, optional): Number of processes. Defaults to ENCRYPTION_MAX_WORKERS.
+            armor (bool, optional): Whether to armor the messages. Defaults to True.
+
+        Returns:
+            list: Armored and signed/encrypted messages, binary if armor is False, in order.
+                A message that failed is returned as a ValueError instead.
+        """
+        return self._run_many(
+            _sign_and_encrypt_worker,
+            self.sign_and_encrypt,
+            [(message, public_keys, armor) for message in messages],
+            max_workers,
+        )
+
+    def decrypt_many(
+        self,
+        messages: List[Union[str, bytes]],
+        public_key: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Union[str, bytes, ValueError]]:
+        """
+        Decrypts messages in parallel worker processes.
+
+        Each worker parses and unlocks the private key once, so batches
+        should be large enough for that to pay off.
+
+        Args:
+            messages (list[Union[str, bytes]]): Armored or binary messages to decrypt
+            public_key (str, optional): Armored public key used for signature verification. Defaults to None.
+            max_workers (int, optional): Number of processes. Defaults to ENCRYPTION_MAX_WORKERS.
+
+        Returns:
+            list: Decrypted messages, in order. A message that failed is returned
+                as a ValueError instead.
+        """
+        return self._run_many(
+            _decrypt_worker,
+            self.decrypt,
+            [(message, public_key) for message in messages],
+            max_workers,
+        )
+
+    def _run_many(
+        self,
+        function: Callable,
+        method: Callable,
+        items: list,
+        max_workers: Optional[int],
+    ) -> list:
+        """
+        Runs a worker function over items in a process pool.
+
+        Args:
+            function (Callable): Module-level worker function
+            method (Callable): Method of this instance the worker function calls,
+                used when running in the current process
+            items (list): Arguments of each call
+            max_workers (int, optional): Number of processes
+
+        Returns:
+            list: Results of the calls, in order
+        """
+        with self.unlocked():
+            return _map_in_processes(
+                function,
+                items,
+                max_workers,
+                initializer=_init_worker,
+                initargs=(self._private_key_armored, self._passphrase),
+                inline=lambda item: _catch(method, *item),
+            )
+
 
 class EncryptionUtils:
     """
@@ -135,27 +696,61 @@ class EncryptionUtils:
     """
 
     @staticmethod
-    def encrypt(message: str, public_keys: List[str]) -> str:
+    def encrypt(
+        message: Union[str, bytes], public_keys: List[str], armor: bool = True
+    ) -> Union[str, bytes]:
         """
         Encrypts a message using the recipient's public keys.
 
         Args:
-            message (str): Message to encrypt
+            message (Union[str, bytes]): Message to encrypt
             public_keys (list[str]): List of armored public keys of the recipients
+            armor (bool, optional): Whether to armor the message. Defaults to True.
 
         Returns:
-            str: Armored and encrypted message
+            Union[str, bytes]: Armored and encrypted message, binary if armor is False
         """
-        pgp_message = PGPMessage.new(message)
+        pgp_message = _new_message(message)
         cipher = SymmetricKeyAlgorithm.AES256
         sessionkey = cipher.gen_key()
 
         for public_key in public_keys:
-            recipient_key, _ = PGPKey.from_blob(public_key)
+            recipient_key = PUBLIC_KEY_CACHE.get(public_key)
             pgp_message = recipient_key.encrypt(pgp_message, sessionkey)
 
         del sessionkey
-        return pgp_message.__str__()
+        return _serialize_message(pgp_message, armor)
+
+    @staticmethod
+    def encrypt_stream(
+        source: Union[str, os.PathLike, BinaryIO, Iterable[bytes]],
+        public_keys: List[str],
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        """
+        Encrypts a large payload chunk by chunk.
+
+        The output is a binary OpenPGP message, see Encryption.sign_and_encrypt_stream.
+
+        Args:
+            source (Union[str, os.PathLike, BinaryIO, Iterable[bytes]]): Path of a local file,
+                binary file-like object or iterable of bytes chunks to encrypt
+            public_keys (list[str]): List of armored public keys of the recipients
+            chunk_size (int, optional): Size of the chunks in bytes. Defaults to ENCRYPTION_STREAM_CHUNK_SIZE.
+
+        Returns:
+            Iterator[bytes]: Chunks of the encrypted message
+        """
+        chunk_size = chunk_size or ENCRYPTION_STREAM_CHUNK_SIZE
+        return _encrypt_packets(
+            _write_packet(
+                _LITERAL_DATA_TAG,
+                _literal_data(_read_chunks(source, chunk_size)),
+                chunk_size,
+            ),
+            public_keys,
+            chunk_size,
+        )
 
     @staticmethod
     def verify(message: str, public_key: str) -> bool:
@@ -173,12 +768,31 @@ class EncryptionUtils:
             signed_message = (
                 PGPMessage().from_blob(message) if isinstance(message, str) else message
             )
-            public_key, _ = PGPKey.from_blob(public_key)
-            public_key.verify(signed_message)
+            PUBLIC_KEY_CACHE.get(public_key).verify(signed_message)
             return True
         except PGPError as e:
             return False
 
+    @staticmethod
+    def verify_many(
+        messages: List[str], public_key: str, max_workers: Optional[int] = None
+    ) -> List[Union[bool, ValueError]]:
+        """
+        Verifies the signatures of messages in parallel worker processes.
+
+        Args:
+            messages (list[str]): Armored messages to verify
+            public_key (str): Armored public key
+            max_workers (int, optional): Number of processes. Defaults to ENCRYPTION_MAX_WORKERS.
+
+        Returns:
+            list: True if the signature of a message is valid, False otherwise, in order.
+                A message that can't be read is returned as a ValueError instead.
+        """
+        return _map_in_processes(
+            _verify_worker, [(message, public_key) for message in messages], max_workers
+        )
+
     @staticmethod
     def get_signed_data(message: str) -> str:
         """
@@ -197,3 +811,482 @@ class EncryptionUtils:
             return signed_message.message.__str__()
         except PGPError as e:
             return False
+
+
+def _new_message(message: Union[str, bytes]) -> PGPMessage:
+    """Creates a message, keeping bytes binary so they are decrypted as bytes."""
+    if isinstance(message, (bytes, bytearray)):
+        return PGPMessage.new(message, format="b")
+    return PGPMessage.new(message)
+
+
+def _serialize_message(pgp_message: PGPMessage, armor: bool) -> Union[str, bytes]:
+    """Serializes a message, armored or binary."""
+    return pgp_message.__str__() if armor else bytes(pgp_message)
+
+
+# Encryption instance of a worker process, with its private key unlocked
+_WORKER_ENCRYPTION: Optional[Encryption] = None
+
+
+def _init_worker(private_key_armored: str, passphrase: Optional[str]) -> None:
+    """
+    Parses and unlocks the private key once for the life of a worker process.
+
+    Args:
+        private_key_armored (str): Armored representation of the private key
+        passphrase (str, optional): Passphrase to unlock the private key
+    """
+    global _WORKER_ENCRYPTION
+    encryption = Encryption(private_key_armored, passphrase)
+    # The session is never exited, the key stays unlocked until the worker exits
+    encryption.unlocked(max_age=math.inf, max_operations=math.inf).__enter__()
+    _WORKER_ENCRYPTION = encryption
+
+
+def _catch(function: Callable, *args):
+    """Calls a function, returning its error as a ValueError, which can be pickled."""
+    try:
+        return function(*args)
+    except Exception as e:
+        return e if type(e) is ValueError else ValueError(str(e))
+
+
+def _sign_and_encrypt_worker(item: tuple) -> Union[str, bytes, ValueError]:
+    return _catch(_WORKER_ENCRYPTION.sign_and_encrypt, *item)
+
+
+def _decrypt_worker(item: tuple) -> Union[str, bytes, ValueError]:
+    return _catch(_WORKER_ENCRYPTION.decrypt, *item)
+
+
+def _verify_worker(item: tuple) -> Union[bool, ValueError]:
+    return _catch(EncryptionUtils.verify, *item)
+
+
+def _map_in_processes(
+    function: Callable,
+    items: list,
+    max_workers: Optional[int],
+    initializer: Optional[Callable] = None,
+    initargs: tuple = (),
+    inline: Optional[Callable] = None,
+) -> list:
+    """
+    Maps a module-level function over items in a process pool, in order.
+
+    A single item or worker runs in the current process.
+
+    Args:
+        function (Callable): Function to call with each item
+        items (list): Items to process
+        max_workers (int, optional): Number of processes. Defaults to ENCRYPTION_MAX_WORKERS.
+        initializer (Callable, optional): Called once in each worker process
+        initargs (tuple): Arguments of the initializer
+        inline (Callable, optional): Called instead of function when running in the current process
+
+    Returns:
+        list: Results of the function, in order
+    """
+    max_workers = min(max_workers or ENCRYPTION_MAX_WORKERS, len(items))
+    if max_workers <= 1:
+        return [(inline or function)(item) for item in items]
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=initializer, initargs=initargs
+    ) as executor:
+        # A few chunks per worker amortize the transfers and balance the load
+        chunksize = max(1, len(items) // (max_workers * 4))
+        return list(executor.map(function, items, chunksize=chunksize))
+
+
+# OpenPGP packet tags used by stream operations, see RFC 4880 section 4.3
+_SESSION_KEY_TAG = 1
+_SIGNATURE_TAG = 2
+_ONE_PASS_SIGNATURE_TAG = 4
+_COMPRESSED_DATA_TAG = 8
+_MARKER_TAG = 10
+_LITERAL_DATA_TAG = 11
+_ENCRYPTED_DATA_TAG = 18
+# Encoding of the modification detection code packet header, see RFC 4880 section 5.14
+_MDC_HEADER = b"\xd3\x14"
+_MDC_SIZE = len(_MDC_HEADER) + hashlib.sha1().digest_size
+
+
+class _ChunkReader:
+    """
+    Reads sized pieces of an iterable of bytes chunks.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = bytearray()
+
+    def read(self, size: int) -> bytes:
+        """Reads up to size bytes, fewer only at the end of the chunks."""
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def read_exact(self, size: int) -> bytes:
+        """Reads exactly size bytes."""
+        data = self.read(size)
+        if len(data) < size:
+            raise ValueError("Failed to decrypt message: Unexpected end of message")
+        return data
+
+
+def _read_chunks(
+    source: Union[str, os.PathLike, BinaryIO, Iterable[bytes]], chunk_size: int
+) -> Iterator[bytes]:
+    """Reads a local file, a file-like object or an iterable of bytes chunk by chunk."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            yield from iter(lambda: f.read(chunk_size), b"")
+    elif hasattr(source, "read"):
+        yield from iter(lambda: source.read(chunk_size), b"")
+    else:
+        yield from source
+
+
+def _packet_length(length: int) -> bytes:
+    """Encodes the length of a new format packet."""
+    if length < 192:
+        return bytes([length])
+    if length < 8384:
+        length -= 192
+        return bytes([(length >> 8) + 192, length & 0xFF])
+    return b"\xff" + length.to_bytes(4, "big")
+
+
+def _write_packet(
+    tag: int, chunks: Iterable[bytes], chunk_size: int
+) -> Iterator[bytes]:
+    """
+    Writes a packet whose length is not known in advance.
+
+    The body is split in partial lengths, which must be powers of two of at
+    least 512 bytes, so a single part is buffered at a time.
+    """
+    exponent = min(max(chunk_size.bit_length() - 1, 9), 30)
+    part_size = 1 << exponent
+    header = bytes([0xC0 | tag])
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        while len(buffer) > part_size:
+            yield header + bytes([0xE0 | exponent]) + buffer[:part_size]
+            header = b""
+            del buffer[:part_size]
+    yield header + _packet_length(len(buffer)) + bytes(buffer)
+
+
+def _literal_data(chunks: Iterable[bytes], hasher=None) -> Iterator[bytes]:
+    """Writes the body of a literal data packet, hashing the data to sign."""
+    # Binary data, without file name
+    yield b"b\x00" + int(time.time()).to_bytes(4, "big")
+    for chunk in chunks:
+        if hasher is not None:
+            hasher.update(chunk)
+        yield chunk
+
+
+def _encrypt_packets(
+    packets: Iterable[bytes], public_keys: List[str], chunk_size: int
+) -> Iterator[bytes]:
+    """
+    Encrypts packets for the recipients, returning the chunks of the message.
+
+    pgpy encrypts the session key for each recipient, the packets are
+    encrypted as they are read.
+    """
+    cipher = SymmetricKeyAlgorithm.AES256
+    sessionkey = cipher.gen_key()
+
+    pgp_message = PGPMessage.new(b"")
+    for public_key in public_keys:
+        recipient_key = PUBLIC_KEY_CACHE.get(public_key)
+        pgp_message = recipient_key.encrypt(pgp_message, sessionkey, cipher=cipher)
+    session_keys = b"".join(bytes(packet) for packet in pgp_message._sessionkeys)
+
+    def chunks() -> Iterator[bytes]:
+        yield session_keys
+        yield from _write_packet(
+            _ENCRYPTED_DATA_TAG,
+            _encrypt_integrity_protected(packets, cipher, sessionkey),
+            chunk_size,
+        )
+
+    return chunks()
+
+
+def _encrypt_integrity_protected(
+    chunks: Iterable[bytes], algorithm: SymmetricKeyAlgorithm, key: bytes
+) -> Iterator[bytes]:
+    """Writes the body of a symmetrically encrypted integrity protected data packet."""
+    block_size = algorithm.block_size // 8
+    encryptor = Cipher(
+        algorithm.cipher(bytes(key)), modes.CFB(bytes(block_size))
+    ).encryptor()
+    iv = algorithm.gen_iv()
+    prefix = iv + iv[-2:]
+    mdc = hashlib.sha1(prefix)
+    yield b"\x01" + encryptor.update(prefix)
+    for chunk in chunks:
+        mdc.update(chunk)
+        yield encryptor.update(chunk)
+    mdc.update(_MDC_HEADER)
+    yield encryptor.update(_MDC_HEADER + mdc.digest()) + encryptor.finalize()
+
+
+def _read_length(reader: _ChunkReader) -> tuple:
+    """Reads the length of a new format packet, and whether it is partial."""
+    octet = reader.read_exact(1)[0]
+    if octet < 192:
+        return octet, False
+    if octet < 224:
+        return ((octet - 192) << 8) + reader.read_exact(1)[0] + 192, False
+    if octet < 255:
+        return 1 << (octet & 0x1F), True
+    return int.from_bytes(reader.read_exact(4), "big"), False
+
+
+def _read_packet_header(reader: _ChunkReader) -> Optional[tuple]:
+    """
+    Reads the header of the next packet.
+
+    Returns:
+        tuple: Tag, length (None until the end of the data) and whether the
+            length is partial, or None at the end of the data
+    """
+    first = reader.read(1)
+    if not first:
+        return None
+    octet = first[0]
+    if not octet & 0x80:
+        raise ValueError("Failed to decrypt message: Invalid packet header")
+    if octet & 0x40:
+        return (octet & 0x3F, *_read_length(reader))
+    tag = (octet >> 2) & 0x0F
+    length_type = octet & 0x03
+    if length_type == 3:
+        return tag, None, False
+    return tag, int.from_bytes(reader.read_exact(1 << length_type), "big"), False
+
+
+def _packet_chunks(
+    reader: _ChunkReader, length: Optional[int], partial: bool, chunk_size: int
+) -> Iterator[bytes]:
+    """Reads the body of a packet chunk by chunk."""
+    while True:
+        while length is None or length > 0:
+            data = reader.read(
+                chunk_size if length is None else min(length, chunk_size)
+            )
+            if not data:
+                if length is None:
+                    return
+                raise ValueError("Failed to decrypt message: Unexpected end of message")
+            if length is not None:
+                length -= len(data)
+            yield data
+        if not partial:
+            return
+        length, partial = _read_length(reader)
+
+
+def _read_packet(
+    reader: _ChunkReader, tag: int, length: Optional[int], partial: bool
+) -> Packet:
+    """Reads a small packet and parses it with pgpy."""
+    body = b"".join(
+        _packet_chunks(reader, length, partial, ENCRYPTION_STREAM_CHUNK_SIZE)
+    )
+    return Packet(bytearray([0xC0 | tag]) + _packet_length(len(body)) + body)
+
+
+def _decrypt_integrity_protected(
+    reader: _ChunkReader,
+    algorithm: SymmetricKeyAlgorithm,
+    key: bytes,
+    chunk_size: int,
+) -> Iterator[bytes]:
+    """
+    Decrypts the body of a symmetrically encrypted integrity protected data packet.
+
+    The modification detection code is checked once the body is fully read.
+    """
+    if reader.read_exact(1) != b"\x01":
+        raise ValueError("Failed to decrypt message: Unsupported encrypted data")
+    block_size = algorithm.block_size // 8
+    decryptor = Cipher(
+        algorithm.cipher(bytes(key)), modes.CFB(bytes(block_size))
+    ).decryptor()
+    prefix = decryptor.update(reader.read_exact(block_size + 2))
+    if prefix[-4:-2] != prefix[-2:]:
+        raise ValueError("Failed to decrypt message: Decryption failed")
+    mdc = hashlib.sha1(prefix)
+    pending = b""
+    for chunk in iter(lambda: reader.read(chunk_size), b""):
+        pending += decryptor.update(chunk)
+        # The modification detection code packet ends the data
+        if len(pending) > _MDC_SIZE:
+            data = pending[:-_MDC_SIZE]
+            pending = pending[-_MDC_SIZE:]
+            mdc.update(data)
+            yield data
+    pending += decryptor.finalize()
+    mdc.update(_MDC_HEADER)
+    if not hmac.compare_digest(pending, _MDC_HEADER + mdc.digest()):
+        raise ValueError("Failed to decrypt message: Modification detected")
+
+
+def _decompress(
+    chunks: Iterable[bytes], algorithm: CompressionAlgorithm, chunk_size: int
+) -> Iterator[bytes]:
+    """Decompresses the body of a compressed data packet, chunk_size bytes at most at a time."""
+    if algorithm == CompressionAlgorithm.Uncompressed:
+        yield from chunks
+    elif algorithm == CompressionAlgorithm.BZ2:
+        decompressor = bz2.BZ2Decompressor()
+        for chunk in chunks:
+            yield decompressor.decompress(chunk, chunk_size)
+            while not decompressor.needs_input and not decompressor.eof:
+                yield decompressor.decompress(b"", chunk_size)
+    else:
+        # ZIP is raw deflate, ZLIB has a header
+        decompressor = zlib.decompressobj(
+            -15 if algorithm == CompressionAlgorithm.ZIP else 15
+        )
+        for chunk in chunks:
+            while chunk:
+                yield decompressor.decompress(chunk, chunk_size)
+                chunk = decompressor.unconsumed_tail
+        yield decompressor.flush()
+
+
+def _read_literal_data(
+    reader: _ChunkReader, public_key: Optional[PGPKey], chunk_size: int
+) -> Iterator[bytes]:
+    """
+    Reads the decrypted packets of a message, returning the chunks of its data.
+
+    The signature is verified with public_key, if given, once the data is fully read.
+    """
+    decrypted = reader
+    hashers = {}
+    signatures = []
+    data_read = False
+    while True:
+        header = _read_packet_header(reader)
+        if header is None:
+            break
+        tag, length, partial = header
+        if tag == _COMPRESSED_DATA_TAG:
+            compressed = _ChunkReader(
+                _packet_chunks(reader, length, partial, chunk_size)
+            )
+            algorithm = CompressionAlgorithm(compressed.read_exact(1)[0])
+            reader = _ChunkReader(
+                _decompress(
+                    iter(functools.partial(compressed.read, chunk_size), b""),
+                    algorithm,
+                    chunk_size,
+                )
+            )
+        elif tag in (_ONE_PASS_SIGNATURE_TAG, _SIGNATURE_TAG):
+            packet = _read_packet(reader, tag, length, partial)
+            if tag == _ONE_PASS_SIGNATURE_TAG:
+                hash_algorithm = packet.halg
+            else:
+                signature = PGPSignature() | packet
+                signatures.append(signature)
+                hash_algorithm = signature.hash_algorithm
+            if public_key is not None and not data_read:
+                hashers.setdefault(hash_algorithm, hash_algorithm.hasher)
+        elif tag == _LITERAL_DATA_TAG and not data_read:
+            body = _ChunkReader(_packet_chunks(reader, length, partial, chunk_size))
+            # Skip the format, file name and date
+            body.read_exact(1)
+            body.read_exact(body.read_exact(1)[0] + 4)
+            for chunk in iter(lambda: body.read(chunk_size), b""):
+                for hasher in hashers.values():
+                    hasher.update(chunk)
+                yield chunk
+            data_read = True
+        elif tag != _MARKER_TAG:
+            raise ValueError(
+                "Failed to decrypt message: Unexpected packet {}".format(tag)
+            )
+
+    # Reading to the end checks the modification detection code
+    if decrypted.read(chunk_size):
+        raise ValueError("Failed to decrypt message: Unexpected data after message")
+    if not data_read:
+        raise ValueError("Failed to decrypt message: No literal data")
+    if public_key is not None:
+        _verify_signatures(public_key, signatures, hashers)
+
+
+def _verify_signatures(public_key: PGPKey, signatures: list, hashers: dict) -> None:
+    """Verifies the signature of a streamed message made with public_key."""
+    keys = {public_key.fingerprint.keyid: public_key}
+    keys.update(public_key.subkeys)
+    signature = next(
+        (signature for signature in signatures if signature.signer in keys), None
+    )
+    if signature is None:
+        if signatures:
+            raise ValueError(
+                "Failed to decrypt message: Could not find signature with this public key"
+            )
+        raise ValueError("Failed to decrypt message: No signatures to verify")
+    hasher = hashers.get(signature.hash_algorithm)
+    if signature.type != SignatureType.BinaryDocument or hasher is None:
+        raise ValueError("Failed to decrypt message: Unsupported signature")
+    hasher = hasher.copy()
+    hasher.update(signature.hashdata(b""))
+    if not _verify_digest(keys[signature.signer], hasher.digest(), signature):
+        raise ValueError("Failed to decrypt message: Invalid signature")
+
+
+def _signing_key(key: PGPKey) -> PGPKey:
+    """Selects the key allowed to sign, the primary key first then its subkeys, like PGPKey.sign."""
+    for signing_key in [key, *key.subkeys.values()]:
+        if KeyFlags.Sign in signing_key._get_key_flags():
+            return signing_key
+    raise ValueError(
+        "Failed to sign message: Key {} has no signing key".format(
+            key.fingerprint.keyid
+        )
+    )
+
+
+def _sign_digest(key: PGPKey, digest: bytes, signature: PGPSignature) -> bytes:
+    """Signs the digest of the data of a signature, pgpy keys only sign whole data."""
+    if key.key_algorithm == PubKeyAlgorithm.EdDSA:
+        # OpenPGP EdDSA signs the digest itself
+        return key._key.keymaterial.__privkey__().sign(digest)
+    return key._key.sign(
+        digest, Prehashed(getattr(hashes, signature.hash_algorithm.name)())
+    )
+
+
+def _verify_digest(key: PGPKey, digest: bytes, signature: PGPSignature) -> bool:
+    """Verifies a signature against the digest of its data."""
+    if key.key_algorithm == PubKeyAlgorithm.EdDSA:
+        try:
+            key._key.keymaterial.__pubkey__().verify(signature.__sig__, digest)
+        except InvalidSignature:
+            return False
+        return True
+    return key._key.verify(
+        digest,
+        signature.__sig__,
+        Prehashed(getattr(hashes, signature.hash_algorithm.name)()),
+    )
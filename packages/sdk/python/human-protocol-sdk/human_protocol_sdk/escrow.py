@@ -1,24 +1,100 @@
 #!/usr/bin/env python3
 
+import asyncio
 import datetime
 import logging
+import operator
 import os
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from decimal import Decimal
-from typing import List, Optional
+from itertools import zip_longest
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from human_protocol_sdk.constants import NETWORKS, ChainId, Role, Status
+from human_protocol_sdk.constants import (
+    NETWORKS,
+    ChainId,
+    PayoutChunkStatus,
+    Role,
+    Status,
+)
+from human_protocol_sdk.multicall import Multicall, MulticallError
 from human_protocol_sdk.utils import (
-    get_data_from_subgraph,
+    AsyncPendingTransaction,
+    async_call,
+    async_get_chain_id,
+    async_handle_transaction,
+    async_iter_subgraph_pages,
+    async_submit_transaction,
+    get_async_contract,
     get_escrow_interface,
     get_factory_interface,
     get_erc20_interface,
+    get_nonce_manager,
     handle_transaction,
+    iter_subgraph_pages,
+    LRUCache,
+    PendingTransaction,
+    submit_transaction,
+    SUBGRAPH_PAGE_SIZE,
+    SubgraphQuery,
+    wait_for_receipts,
 )
+from eth_account.signers.local import LocalAccount
+from eth_utils import keccak
 from validators import url as URL
 from web3 import Web3, contract
+from web3.exceptions import TransactionNotFound
 from web3.middleware import geth_poa_middleware
 
+if TYPE_CHECKING:
+    from human_protocol_sdk.payout_journal import PayoutJournal
+
 GAS_LIMIT = int(os.getenv("GAS_LIMIT", 4712388))
+ESCROW_CACHE_SIZE = int(os.getenv("ESCROW_CACHE_SIZE", 4096))
+# Escrow contract accepts strictly less recipients than BULK_MAX_COUNT per payout
+BULK_MAX_COUNT = 100
+# Escrow contract accepts strictly less than BULK_MAX_VALUE in total per payout
+BULK_MAX_VALUE = 10**9 * 10**18
+ESCROW_STATES_CHUNK_SIZE = int(os.getenv("ESCROW_STATES_CHUNK_SIZE", 100))
+
+# View functions read to build an EscrowState, in constructor order
+ESCROW_STATE_FUNCTIONS = (
+    "getBalance",
+    "status",
+    "manifestUrl",
+    "finalResultsUrl",
+    "intermediateResultsUrl",
+    "token",
+    "recordingOracle",
+    "reputationOracle",
+)
+
+# Launched escrows sorted by id, to be read page by page
+LAUNCHED_ESCROWS_QUERY = SubgraphQuery(
+    "LaunchedEscrows",
+    {"first": "Int!", "where": "LaunchedEscrow_filter!"},
+    "launchedEscrows(first: $first, orderBy: id, orderDirection: asc, where: $where)",
+    "id",
+)
+
+# Same addresses Web3.isAddress accepts as text, mixed case ones must match the checksum
+HEX_ADDRESS_PATTERN = re.compile(r"(0[xX])?[0-9a-fA-F]{40}")
 
 LOG = logging.getLogger("human_protocol_sdk.escrow")
 
@@ -130,17 +206,340 @@ class EscrowFilter:
         self.date_to = date_to
 
 
+class PayoutChunk:
+    """
+    A class used to track one bulkPayOut transaction of a chunked payout.
+    """
+
+    def __init__(
+        self,
+        tx_id: int,
+        recipients: List[str],
+        amounts: List[Decimal],
+        status: PayoutChunkStatus = PayoutChunkStatus.Pending,
+        tx_hash: Optional[str] = None,
+        error: Optional[str] = None,
+        nonce: Optional[int] = None,
+    ):
+        """
+        Initializes a PayoutChunk instance.
+
+        Args:
+            tx_id (int): Serial number of the bulk, emitted in the BulkTransfer event
+            recipients (List[str]): Array of recipient addresses
+            amounts (List[Decimal]): Array of amounts the recipients will receive
+            status (PayoutChunkStatus): Status of the chunk
+            tx_hash (Optional[str]): Hash of the submitted transaction
+            error (Optional[str]): Reason of the failure
+            nonce (Optional[int]): Nonce reserved for the transaction, kept until it's
+                mined, so the chunk is never sent with two nonces
+        """
+
+        self.tx_id = tx_id
+        self.recipients = recipients
+        self.amounts = amounts
+        self.status = status
+        self.tx_hash = tx_hash
+        self.error = error
+        self.nonce = nonce
+
+
+class BulkPayoutRowError:
+    """
+    A class used to describe an invalid row of a payout.
+    """
+
+    def __init__(self, index: int, recipient: Any, amount: Any, reason: str):
+        """
+        Initializes a BulkPayoutRowError instance.
+
+        Args:
+            index (int): Position of the row in the payout
+            recipient (Any): Recipient of the row, None if missing
+            amount (Any): Amount of the row, None if missing
+            reason (str): Why the row is invalid
+        """
+
+        self.index = index
+        self.recipient = recipient
+        self.amount = amount
+        self.reason = reason
+
+
+class BulkPayoutReport:
+    """
+    A class used to hold the result of a payout validation.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        errors: List[BulkPayoutRowError],
+        duplicates: Dict[str, List[int]],
+        final_amounts: List[Optional[int]],
+        total_amount: int,
+        reputation_oracle_fee: int,
+        recording_oracle_fee: int,
+        balance: Optional[int] = None,
+    ):
+        """
+        Initializes a BulkPayoutReport instance.
+
+        Args:
+            size (int): Number of rows of the payout
+            errors (List[BulkPayoutRowError]): Invalid rows, in order
+            duplicates (Dict[str, List[int]]): Positions of every recipient paid more than once, by checksum address
+            final_amounts (List[Optional[int]]): Amount each recipient receives after fees, None for invalid rows
+            total_amount (int): Sum of the valid amounts, paid out of the escrow balance
+            reputation_oracle_fee (int): Total fee of the Reputation Oracle
+            recording_oracle_fee (int): Total fee of the Recording Oracle
+            balance (Optional[int]): Balance of the escrow, if it was checked
+        """
+
+        self.size = size
+        self.errors = errors
+        self.duplicates = duplicates
+        self.final_amounts = final_amounts
+        self.total_amount = total_amount
+        self.reputation_oracle_fee = reputation_oracle_fee
+        self.recording_oracle_fee = recording_oracle_fee
+        self.balance = balance
+
+    @property
+    def valid(self) -> bool:
+        """Checks if the payout can be submitted.
+
+        Duplicated recipients don't make the payout invalid.
+
+        Returns:
+            bool: True if there are no invalid rows, the total fits in a single
+                bulkPayOut and the balance is enough
+        """
+
+        return (
+            self.size > 0
+            and not self.errors
+            and self.total_amount < BULK_MAX_VALUE
+            and (self.balance is None or self.total_amount <= self.balance)
+        )
+
+
+def validate_bulk_payout(
+    recipients: Iterable[Any],
+    amounts: Iterable[Any],
+    reputation_oracle_fee: int = 0,
+    recording_oracle_fee: int = 0,
+) -> BulkPayoutReport:
+    """Validates a payout in a single pass, without any RPC call.
+
+    Any iterables are accepted, e.g. lists or NumPy arrays. Amounts must
+    be integers (Python, NumPy or integral Decimal). Fees are computed per
+    amount, rounding down, the same way the escrow contract does.
+
+    The rows are checked as a single bulkPayOut, whose total must be less
+    than BULK_MAX_VALUE. Amounts that can't fit in any bulkPayOut are
+    invalid rows, a larger total makes the report invalid.
+
+    Args:
+        recipients (Iterable[Any]): Recipient addresses
+        amounts (Iterable[Any]): Amounts the recipients will receive, before fees
+        reputation_oracle_fee (int): Fee percentage of the Reputation Oracle
+        recording_oracle_fee (int): Fee percentage of the Recording Oracle
+
+    Returns:
+        BulkPayoutReport: Every invalid row, the duplicated recipients and the payout amounts
+
+    Raises:
+        EscrowClientError: If the fee percentages are invalid
+    """
+
+    if not (0 <= reputation_oracle_fee <= 100) or not (
+        0 <= recording_oracle_fee <= 100
+    ):
+        raise EscrowClientError("Fee must be between 0 and 100")
+    if reputation_oracle_fee + recording_oracle_fee > 100:
+        raise EscrowClientError("Total fee must be less than 100")
+
+    errors = []
+    final_amounts = []
+    positions = defaultdict(list)
+    total_amount = 0
+    total_reputation_oracle_fee = 0
+    total_recording_oracle_fee = 0
+    size = 0
+    missing = object()
+
+    for index, (recipient, amount) in enumerate(
+        zip_longest(recipients, amounts, fillvalue=missing)
+    ):
+        size += 1
+        if recipient is missing or amount is missing:
+            errors.append(
+                BulkPayoutRowError(
+                    index,
+                    None if recipient is missing else recipient,
+                    None if amount is missing else amount,
+                    "Arrays must have same length",
+                )
+            )
+            final_amounts.append(None)
+            continue
+
+        key = _address_key(recipient)
+        value = _to_uint(amount)
+        if key is None:
+            reason = f"Invalid recipient address: {recipient}"
+        elif value is None:
+            reason = f"Invalid amount: {amount}"
+        elif value == 0:
+            reason = "Amounts cannot be empty"
+        elif value < 0:
+            reason = "Amounts cannot be negative"
+        elif value >= BULK_MAX_VALUE:
+            reason = f"Amount too high: {amount}"
+        else:
+            reason = None
+        if reason:
+            errors.append(BulkPayoutRowError(index, recipient, amount, reason))
+            final_amounts.append(None)
+            continue
+
+        positions[key].append(index)
+        single_reputation_oracle_fee = reputation_oracle_fee * value // 100
+        single_recording_oracle_fee = recording_oracle_fee * value // 100
+        final_amounts.append(
+            value - single_reputation_oracle_fee - single_recording_oracle_fee
+        )
+        total_amount += value
+        total_reputation_oracle_fee += single_reputation_oracle_fee
+        total_recording_oracle_fee += single_recording_oracle_fee
+
+    duplicates = {
+        Web3.toChecksumAddress(key): indexes
+        for key, indexes in positions.items()
+        if len(indexes) > 1
+    }
+
+    return BulkPayoutReport(
+        size,
+        errors,
+        duplicates,
+        final_amounts,
+        total_amount,
+        total_reputation_oracle_fee,
+        total_recording_oracle_fee,
+    )
+
+
+def _address_key(recipient: Any) -> Optional[str]:
+    """Checks an address like Web3.isAddress does.
+
+    Args:
+        recipient (Any): Address to check
+
+    Returns:
+        Optional[str]: Lowercase address without prefix, None if it's invalid
+    """
+
+    if isinstance(recipient, (bytes, bytearray)):
+        return recipient.hex() if len(recipient) == 20 else None
+    if not isinstance(recipient, str) or not HEX_ADDRESS_PATTERN.fullmatch(recipient):
+        return None
+
+    body = recipient[-40:]
+    key = body.lower()
+    if body != key and body != key.upper():
+        # Mixed case, only valid with the right EIP-55 checksum and "0x" prefix
+        if not recipient.startswith("0x"):
+            return None
+        digest = keccak(text=key).hex()
+        checksum = "".join(
+            char.upper() if nibble in "89abcdef" else char
+            for char, nibble in zip(key, digest)
+        )
+        if body != checksum:
+            return None
+    return key
+
+
+def _to_uint(amount: Any) -> Optional[int]:
+    """Converts an amount to a Python integer.
+
+    Args:
+        amount (Any): Amount to convert
+
+    Returns:
+        Optional[int]: Integer value, None if it's not integral
+    """
+
+    try:
+        return operator.index(amount)
+    except TypeError:
+        pass
+    if isinstance(amount, (Decimal, float)):
+        try:
+            if amount == int(amount):
+                return int(amount)
+        except (ValueError, OverflowError):
+            pass
+    return None
+
+
+class EscrowState:
+    """
+    A class used to hold a snapshot of the escrow state.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        balance: Decimal,
+        status: Status,
+        manifest_url: str,
+        results_url: str,
+        intermediate_results_url: str,
+        token_address: str,
+        recording_oracle_address: str,
+        reputation_oracle_address: str,
+    ):
+        """
+        Initializes a EscrowState instance.
+
+        Args:
+            address (str): Address of the escrow
+            balance (Decimal): Balance of the escrow
+            status (Status): Status of the escrow
+            manifest_url (str): Manifest file url
+            results_url (str): Final results file url
+            intermediate_results_url (str): Intermediate results file url
+            token_address (str): Address of the token used to fund the escrow
+            recording_oracle_address (str): Address of the Recording Oracle
+            reputation_oracle_address (str): Address of the Reputation Oracle
+        """
+
+        self.address = address
+        self.balance = balance
+        self.status = status
+        self.manifest_url = manifest_url
+        self.results_url = results_url
+        self.intermediate_results_url = intermediate_results_url
+        self.token_address = token_address
+        self.recording_oracle_address = recording_oracle_address
+        self.reputation_oracle_address = reputation_oracle_address
+
+
 class EscrowClient:
     """
     A class used to manage escrow on the HUMAN network.
     """
 
-    def __init__(self, web3: Web3):
+    def __init__(self, web3: Web3, escrow_cache_size: int = ESCROW_CACHE_SIZE):
         """
         Initializes a Escrow instance.
 
         Args:
             web3 (Web3): The Web3 object
+            escrow_cache_size (int): Maximum number of escrow contract instances kept in memory
         """
 
         # Initialize web3 instance
@@ -161,6 +560,16 @@ class EscrowClient:
             address=self.network["factory_address"], abi=factory_interface["abi"]
         )
 
+        # Escrow contract instances, keyed by checksum address
+        self._escrow_contracts = LRUCache(escrow_cache_size)
+
+        self.multicall = Multicall(self.w3, self.network.get("multicall_address"))
+
+        # Addresses confirmed to be created by the factory. Escrows can't be
+        # removed from the factory, so positive results never expire.
+        self._verified_escrows = set()
+        self._verified_escrows_lock = threading.Lock()
+
     def create_escrow(self, token_address: str, trusted_handlers: List[str]) -> str:
         """
         Creates an escrow contract that uses the token passed to pay oracle fees and reward workers.
@@ -199,16 +608,19 @@ class EscrowClient:
             None,
         ).args.escrow
 
-    def setup(self, escrow_address: str, escrow_config: EscrowConfig) -> None:
+    def setup(
+        self, escrow_address: str, escrow_config: EscrowConfig, wait: bool = True
+    ) -> Optional[PendingTransaction]:
         """
         Sets up the parameters of the escrow.
 
         Args:
             escrow_address (str): Address of the escrow to setup
             escrow_config (EscrowConfig): Object containing all the necessary information to setup an escrow
+            wait (bool): Wait for the transaction to be mined, otherwise return once it's sent
 
         Returns:
-            None
+            Optional[PendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
 
         Raises:
             EscrowClientError: If an error occurs while checking the parameters
@@ -217,8 +629,7 @@ class EscrowClient:
         if not Web3.isAddress(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
-        handle_transaction(
-            self.w3,
+        return self._handle_transaction(
             "Setup",
             self._get_escrow_contract(escrow_address).functions.setup(
                 escrow_config.reputation_oracle_address,
@@ -228,7 +639,7 @@ class EscrowClient:
                 escrow_config.manifest_url,
                 escrow_config.hash,
             ),
-            EscrowClientError,
+            wait,
         )
 
     def create_and_setup_escrow(
@@ -257,16 +668,19 @@ class EscrowClient:
 
         return escrow_address
 
-    def fund(self, escrow_address: str, amount: Decimal) -> None:
+    def fund(
+        self, escrow_address: str, amount: Decimal, wait: bool = True
+    ) -> Optional[PendingTransaction]:
         """
         Adds funds to the escrow.
 
         Args:
             escrow_address (str): Address of the escrow to setup
             amount (Decimal): Amount to be added as funds
+            wait (bool): Wait for the transaction to be mined, otherwise return once it's sent
 
         Returns:
-            None
+            Optional[PendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
 
         Raises:
             EscrowClientError: If an error occurs while checking the parameters
@@ -282,23 +696,23 @@ class EscrowClient:
         erc20_interface = get_erc20_interface()
         token_contract = self.w3.eth.contract(token_address, abi=erc20_interface["abi"])
 
-        handle_transaction(
-            self.w3,
-            "Fund",
-            token_contract.functions.transfer(escrow_address, amount),
-            EscrowClientError,
+        return self._handle_transaction(
+            "Fund", token_contract.functions.transfer(escrow_address, amount), wait
         )
 
-    def store_results(self, escrow_address: str, url: str, hash: str) -> None:
+    def store_results(
+        self, escrow_address: str, url: str, hash: str, wait: bool = True
+    ) -> Optional[PendingTransaction]:
         """Stores the results url.
 
         Args:
             escrow_address (str): Address of the escrow
             url (str): Results file url
             hash (str): Results file hash
+            wait (bool): Wait for the transaction to be mined, otherwise return once it's sent
 
         Returns:
-            None
+            Optional[PendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
 
         Raises:
             EscrowClientError: If an error occurs while checking the parameters
@@ -313,21 +727,23 @@ class EscrowClient:
         if not self.w3.eth.default_account:
             raise EscrowClientError("You must add an account to Web3 instance")
 
-        handle_transaction(
-            self.w3,
+        return self._handle_transaction(
             "Store Results",
             self._get_escrow_contract(escrow_address).functions.storeResults(url, hash),
-            EscrowClientError,
+            wait,
         )
 
-    def complete(self, escrow_address: str) -> None:
+    def complete(
+        self, escrow_address: str, wait: bool = True
+    ) -> Optional[PendingTransaction]:
         """Sets the status of an escrow to completed.
 
         Args:
             escrow_address (str): Address of the escrow to complete
+            wait (bool): Wait for the transaction to be mined, otherwise return once it's sent
 
         Returns:
-            None
+            Optional[PendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
 
         Raises:
             EscrowClientError: If an error occurs while checking the parameters
@@ -336,11 +752,10 @@ class EscrowClient:
         if not Web3.isAddress(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
-        handle_transaction(
-            self.w3,
+        return self._handle_transaction(
             "Complete",
             self._get_escrow_contract(escrow_address).functions.complete(),
-            EscrowClientError,
+            wait,
         )
 
     def bulk_payout(
@@ -351,7 +766,8 @@ class EscrowClient:
         final_results_url: str,
         final_results_hash: str,
         txId: Decimal,
-    ) -> None:
+        wait: bool = True,
+    ) -> Optional[PendingTransaction]:
         """Pays out the amounts specified to the workers and sets the URL of the final results file.
 
         Args:
@@ -361,9 +777,10 @@ class EscrowClient:
             final_results_url (str): Final results file url
             final_results_hash (str): Final results file hash
             txId (Decimal): Serial number of the bulks
+            wait (bool): Wait for the transaction to be mined, otherwise return once it's sent
 
         Returns:
-            None
+            Optional[PendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
 
         Raises:
             EscrowClientError: If an error occurs while checking the parameters
@@ -371,19 +788,21 @@ class EscrowClient:
 
         if not Web3.isAddress(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
-        for recipient in recipients:
-            if not Web3.isAddress(recipient):
-                raise EscrowClientError(f"Invalid recipient address: {recipient}")
-        if len(recipients) == 0:
+        report = validate_bulk_payout(recipients, amounts)
+        if report.size == 0:
             raise EscrowClientError("Arrays must have any value")
-        if len(recipients) != len(amounts):
-            raise EscrowClientError("Arrays must have same length")
-        if 0 in amounts:
-            raise EscrowClientError("Amounts cannot be empty")
-        if any(amount < 0 for amount in amounts):
-            raise EscrowClientError("Amounts cannot be negative")
+        if report.errors:
+            raise EscrowClientError(report.errors[0].reason)
+        if report.size >= BULK_MAX_COUNT:
+            raise EscrowClientError(
+                f"Too many recipients: {report.size}. Use bulk_payout_chunked instead"
+            )
+        if report.total_amount >= BULK_MAX_VALUE:
+            raise EscrowClientError(
+                f"Bulk value too high: {report.total_amount}. Use bulk_payout_chunked instead"
+            )
         balance = self.get_balance(escrow_address)
-        total_amount = sum(amounts)
+        total_amount = report.total_amount
         if total_amount > balance:
             raise EscrowClientError(
                 f"Escrow does not have enough balance. Current balance: {balance}. Amounts: {total_amount}"
@@ -393,97 +812,191 @@ class EscrowClient:
         if not final_results_hash:
             raise EscrowClientError("Invalid empty final results hash")
 
-        handle_transaction(
-            self.w3,
+        return self._handle_transaction(
             "Bulk Payout",
             self._get_escrow_contract(escrow_address).functions.bulkPayOut(
                 recipients, amounts, final_results_url, final_results_hash, txId
             ),
-            EscrowClientError,
+            wait,
         )
 
-    def cancel(self, escrow_address: str) -> None:
-        """Cancels the specified escrow and sends the balance to the canceler.
+    def plan_bulk_payout(
+        self,
+        recipients: List[str],
+        amounts: List[Decimal],
+        txId: int,
+        chunk_size: int = BULK_MAX_COUNT - 1,
+    ) -> List[PayoutChunk]:
+        """Splits a payout into chunks accepted by a single bulkPayOut.
+
+        A chunk is closed once it has chunk_size recipients, or before its
+        total would reach BULK_MAX_VALUE.
 
         Args:
-            escrow_address (str): Address of the escrow to cancel
+            recipients (List[str]): Array of recipient addresses
+            amounts (List[Decimal]): Array of amounts the recipients will receive
+            txId (int): Serial number of the first bulk, the following chunks use sequential ones
+            chunk_size (int): Maximum number of recipients per chunk
 
         Returns:
-            None
+            List[PayoutChunk]: Chunks to pay out, in order
 
         Raises:
             EscrowClientError: If an error occurs while checking the parameters
         """
 
-        if not Web3.isAddress(escrow_address):
-            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
-
-        handle_transaction(
-            self.w3,
-            "Cancel",
-            self._get_escrow_contract(escrow_address).functions.cancel(),
-            EscrowClientError,
-        )
+        if not 0 < chunk_size < BULK_MAX_COUNT:
+            raise EscrowClientError(
+                f"Chunk size must be between 1 and {BULK_MAX_COUNT - 1}"
+            )
+        if len(recipients) == 0:
+            raise EscrowClientError("Arrays must have any value")
+        if len(recipients) != len(amounts):
+            raise EscrowClientError("Arrays must have same length")
 
-    def abort(self, escrow_address: str) -> None:
-        """Cancels the specified escrow, sends the balance to the canceler and selfdestructs the escrow contract.
+        chunks = []
+        chunk_amount = 0
+        for recipient, amount in zip(recipients, amounts):
+            # Invalid amounts are planned anyway, to be reported when checked
+            value = _to_uint(amount) or 0
+            if (
+                not chunks
+                or len(chunks[-1].recipients) == chunk_size
+                or chunk_amount + value >= BULK_MAX_VALUE
+            ):
+                chunks.append(PayoutChunk(int(txId) + len(chunks), [], []))
+                chunk_amount = 0
+            chunks[-1].recipients.append(recipient)
+            chunks[-1].amounts.append(amount)
+            chunk_amount += value
+
+        return chunks
+
+    def bulk_payout_chunked(
+        self,
+        escrow_address: str,
+        recipients: List[str],
+        amounts: List[Decimal],
+        final_results_url: str,
+        final_results_hash: str,
+        txId: int,
+        chunk_size: int = BULK_MAX_COUNT - 1,
+        journal: Optional["PayoutJournal"] = None,
+    ) -> List[PayoutChunk]:
+        """Pays out any number of workers, splitting the payout into several bulkPayOut transactions.
 
         Args:
-            escrow_address (str): Address of the escrow to abort
+            escrow_address (str): Address of the escrow
+            recipients (List[str]): Array of recipient addresses
+            amounts (List[Decimal]): Array of amounts the recipients will receive
+            final_results_url (str): Final results file url
+            final_results_hash (str): Final results file hash
+            txId (int): Serial number of the first bulk, the following chunks use sequential ones
+            chunk_size (int): Maximum number of recipients per transaction
+            journal (Optional[PayoutJournal]): Journal to record the progress in, so the
+                payout can be continued with resume_bulk_payout after a crash
 
         Returns:
-            None
+            List[PayoutChunk]: Report of every chunk. Chunks that are not
+                confirmed can be retried passing the report to execute_bulk_payout.
 
         Raises:
             EscrowClientError: If an error occurs while checking the parameters
+            PayoutJournalError: If the escrow has an unfinished payout in the journal,
+                to resume with resume_bulk_payout or remove with PayoutJournal.discard
         """
 
-        if not Web3.isAddress(escrow_address):
-            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
-
-        handle_transaction(
-            self.w3,
-            "Abort",
-            self._get_escrow_contract(escrow_address).functions.abort(),
-            EscrowClientError,
+        chunks = self.plan_bulk_payout(recipients, amounts, txId, chunk_size)
+        # Checked before recording the plan, so an invalid payout isn't left in the journal
+        unpaid_chunks = self._check_bulk_payout(
+            escrow_address, chunks, final_results_url, final_results_hash
+        )
+        if journal:
+            journal.record_plan(
+                escrow_address,
+                chunks,
+                final_results_url,
+                final_results_hash,
+                self.w3.eth.block_number,
+            )
+        return self._submit_bulk_payout(
+            escrow_address,
+            chunks,
+            unpaid_chunks,
+            final_results_url,
+            final_results_hash,
+            journal=journal,
         )
 
-    def add_trusted_handlers(self, escrow_address: str, handlers: List[str]) -> None:
-        """Adds an array of addresses to the trusted handlers list.
+    def resume_bulk_payout(
+        self,
+        escrow_address: str,
+        journal: "PayoutJournal",
+        timeout: float = 120,
+    ) -> List[PayoutChunk]:
+        """Continues a chunked payout recorded in the journal.
+
+        The journal is first reconciled with the BulkTransfer events emitted
+        by the escrow, so chunks that went out without being recorded are not
+        paid twice. Only the missing chunks are submitted.
 
         Args:
             escrow_address (str): Address of the escrow
-            handlers (List[str]): Array of trusted handler addresses
+            journal (PayoutJournal): Journal the payout was recorded in
+            timeout (float): Seconds to wait for all the receipts
 
         Returns:
-            None
+            List[PayoutChunk]: Report of every chunk of the payout
 
         Raises:
-            EscrowClientError: If an error occurs while checking the parameters
+            EscrowClientError: If there is no payout in the journal or an error occurs while checking the parameters
         """
+
         if not Web3.isAddress(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
-        for handler in handlers:
-            if not Web3.isAddress(handler):
-                raise EscrowClientError(f"Invalid handler address: {handler}")
+        payout = journal.load(escrow_address)
+        if payout is None:
+            raise EscrowClientError(
+                f"No payout recorded in the journal for escrow {escrow_address}"
+            )
 
-        handle_transaction(
-            self.w3,
-            "Add Trusted Handlers",
-            self._get_escrow_contract(escrow_address).functions.addTrustedHandlers(
-                handlers
-            ),
-            EscrowClientError,
+        for chunk in self.reconcile_bulk_payout(
+            escrow_address, payout.chunks, payout.from_block
+        ):
+            journal.update_chunk(escrow_address, chunk)
+
+        return self.execute_bulk_payout(
+            escrow_address,
+            payout.chunks,
+            payout.final_results_url,
+            payout.final_results_hash,
+            timeout,
+            journal,
         )
 
-    def get_balance(self, escrow_address: str) -> Decimal:
-        """Gets the balance for a specified escrow address.
+    def reconcile_bulk_payout(
+        self,
+        escrow_address: str,
+        chunks: List[PayoutChunk],
+        from_block: int = 0,
+    ) -> List[PayoutChunk]:
+        """Updates the status of the chunks with the state of the chain.
+
+        Chunks whose txId was emitted in a BulkTransfer event of the escrow
+        are confirmed. Submitted chunks are checked by their transaction:
+        a reverted one is failed, a dropped one is pending again.
+
+        A chunk keeps its nonce until the account mined a transaction with
+        it that didn't emit the event of the chunk. Only then the nonce is
+        released, and the chunk can be sent with another one.
 
         Args:
             escrow_address (str): Address of the escrow
+            chunks (List[PayoutChunk]): Chunks of the payout
+            from_block (int): Block to look for the events from
 
         Returns:
-            Decimal: Value of the balance
+            List[PayoutChunk]: Chunks whose status changed
 
         Raises:
             EscrowClientError: If an error occurs while checking the parameters
@@ -492,34 +1005,117 @@ class EscrowClient:
         if not Web3.isAddress(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
 
-        return self._get_escrow_contract(escrow_address).functions.getBalance().call()
+        unconfirmed = [
+            chunk for chunk in chunks if chunk.status != PayoutChunkStatus.Confirmed
+        ]
+        if not unconfirmed:
+            return []
+
+        mined_nonce = None
+        if any(chunk.nonce is not None for chunk in unconfirmed):
+            # Read before the events, so a nonce counted as mined has its event in them
+            mined_nonce = self.w3.eth.get_transaction_count(self.w3.eth.default_account)
+
+        escrow_contract = self._get_escrow_contract(escrow_address)
+        logs = escrow_contract.events.BulkTransfer.getLogs(
+            argument_filters={"_txId": [chunk.tx_id for chunk in unconfirmed]},
+            fromBlock=from_block,
+        )
+        paid_tx_hashes = {
+            log["args"]["_txId"]: Web3.toHex(log["transactionHash"]) for log in logs
+        }
+
+        changed = []
+        for chunk in unconfirmed:
+            state = (chunk.status, chunk.tx_hash, chunk.error, chunk.nonce)
+            status = chunk.status
+            if chunk.tx_id in paid_tx_hashes:
+                chunk.status = PayoutChunkStatus.Confirmed
+                chunk.tx_hash = paid_tx_hashes[chunk.tx_id]
+                chunk.error = None
+            else:
+                if chunk.status == PayoutChunkStatus.Submitted:
+                    self._reconcile_submitted_chunk(chunk)
+                if (
+                    chunk.status != PayoutChunkStatus.Confirmed
+                    and chunk.nonce is not None
+                    and chunk.nonce < mined_nonce
+                ):
+                    # The nonce was mined without paying the chunk
+                    chunk.nonce = None
+                    chunk.tx_hash = None
+                    if chunk.status != PayoutChunkStatus.Failed:
+                        chunk.status = PayoutChunkStatus.Pending
+            if state != (chunk.status, chunk.tx_hash, chunk.error, chunk.nonce):
+                LOG.debug(
+                    f"Bulk payout {chunk.tx_id} reconciled: {status.value} -> {chunk.status.value}"
+                )
+                changed.append(chunk)
+
+        return changed
+
+    def execute_bulk_payout(
+        self,
+        escrow_address: str,
+        chunks: List[PayoutChunk],
+        final_results_url: str,
+        final_results_hash: str,
+        timeout: float = 120,
+        journal: Optional["PayoutJournal"] = None,
+    ) -> List[PayoutChunk]:
+        """Submits the chunks not confirmed yet and waits for their receipts.
 
-    def get_manifest_url(self, escrow_address: str) -> str:
-        """Gets the manifest file URL.
+        Transactions are sent back to back with nonces from the nonce manager
+        instead of waiting for each receipt, then all the receipts are awaited
+        together. If a submission fails, the following chunks are left
+        pending, so they can be retried later with the same report. A chunk
+        is always sent again with the nonce it was first sent with.
 
         Args:
             escrow_address (str): Address of the escrow
+            chunks (List[PayoutChunk]): Chunks of the payout, as returned by plan_bulk_payout
+            final_results_url (str): Final results file url
+            final_results_hash (str): Final results file hash
+            timeout (float): Seconds to wait for all the receipts
+            journal (Optional[PayoutJournal]): Journal to record every status change in
 
         Returns:
-            str: Manifest file url
+            List[PayoutChunk]: The same chunks with their status updated
 
         Raises:
             EscrowClientError: If an error occurs while checking the parameters
         """
 
-        if not Web3.isAddress(escrow_address):
-            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
-
-        return self._get_escrow_contract(escrow_address).functions.manifestUrl().call()
+        unpaid_chunks = self._check_bulk_payout(
+            escrow_address, chunks, final_results_url, final_results_hash
+        )
+        return self._submit_bulk_payout(
+            escrow_address,
+            chunks,
+            unpaid_chunks,
+            final_results_url,
+            final_results_hash,
+            timeout,
+            journal,
+        )
 
-    def get_results_url(self, escrow_address: str) -> str:
-        """Gets the results file URL.
+    def _check_bulk_payout(
+        self,
+        escrow_address: str,
+        chunks: List[PayoutChunk],
+        final_results_url: str,
+        final_results_hash: str,
+    ) -> List[PayoutChunk]:
+        """Checks the parameters of a chunked payout before anything is submitted.
 
         Args:
             escrow_address (str): Address of the escrow
+            chunks (List[PayoutChunk]): Chunks of the payout
+            final_results_url (str): Final results file url
+            final_results_hash (str): Final results file hash
 
         Returns:
-            str: Results file url
+            List[PayoutChunk]: Chunks not paid yet, which are to be submitted
 
         Raises:
             EscrowClientError: If an error occurs while checking the parameters
@@ -527,28 +1123,352 @@ class EscrowClient:
 
         if not Web3.isAddress(escrow_address):
             raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+        if not self.w3.eth.default_account:
+            raise EscrowClientError("You must add an account to Web3 instance")
+        if not self.w3.middleware_onion.get("construct_sign_and_send_raw_middleware"):
+            raise EscrowClientError(
+                "You must add construct_sign_and_send_raw_middleware middleware to Web3 instance"
+            )
+        if not URL(final_results_url):
+            raise EscrowClientError(f"Invalid final results URL: {final_results_url}")
+        if not final_results_hash:
+            raise EscrowClientError("Invalid empty final results hash")
 
-        return (
-            self._get_escrow_contract(escrow_address).functions.finalResultsUrl().call()
-        )
+        unpaid_chunks = [
+            chunk
+            for chunk in chunks
+            if chunk.status
+            in (
+                PayoutChunkStatus.Pending,
+                PayoutChunkStatus.Submitting,
+                PayoutChunkStatus.Failed,
+            )
+        ]
+        for chunk in unpaid_chunks:
+            if len(chunk.recipients) == 0:
+                raise EscrowClientError("Arrays must have any value")
+            if len(chunk.recipients) != len(chunk.amounts):
+                raise EscrowClientError("Arrays must have same length")
+            if len(chunk.recipients) >= BULK_MAX_COUNT:
+                raise EscrowClientError(f"Too many recipients: {len(chunk.recipients)}")
+
+        total_amount = 0
+        for chunk in unpaid_chunks:
+            report = validate_bulk_payout(chunk.recipients, chunk.amounts)
+            if report.errors:
+                raise EscrowClientError(report.errors[0].reason)
+            if report.total_amount >= BULK_MAX_VALUE:
+                raise EscrowClientError(f"Bulk value too high: {report.total_amount}")
+            total_amount += report.total_amount
+
+        if unpaid_chunks:
+            balance = self.get_balance(escrow_address)
+            if total_amount > balance:
+                raise EscrowClientError(
+                    f"Escrow does not have enough balance. Current balance: {balance}. Amounts: {total_amount}"
+                )
+
+        return unpaid_chunks
+
+    def _submit_bulk_payout(
+        self,
+        escrow_address: str,
+        chunks: List[PayoutChunk],
+        unpaid_chunks: List[PayoutChunk],
+        final_results_url: str,
+        final_results_hash: str,
+        timeout: float = 120,
+        journal: Optional["PayoutJournal"] = None,
+    ) -> List[PayoutChunk]:
+        """Submits the checked chunks and waits for the receipts of the submitted ones.
 
-    def get_intermediate_results_url(self, escrow_address: str) -> str:
-        """Gets the intermediate results file URL.
+        The nonce of a chunk is reserved and recorded before its transaction is
+        sent. A chunk that may have been sent already is sent again with the
+        same nonce, so only one of its transactions can be mined.
 
         Args:
             escrow_address (str): Address of the escrow
+            chunks (List[PayoutChunk]): Chunks of the payout
+            unpaid_chunks (List[PayoutChunk]): Chunks to submit, as returned by _check_bulk_payout
+            final_results_url (str): Final results file url
+            final_results_hash (str): Final results file hash
+            timeout (float): Seconds to wait for all the receipts
+            journal (Optional[PayoutJournal]): Journal to record every status change in
 
         Returns:
-            str: Intermediate results file url
-
-        Raises:
-            EscrowClientError: If an error occurs while checking the parameters
+            List[PayoutChunk]: The same chunks with their status updated
         """
 
-        if not Web3.isAddress(escrow_address):
-            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
-
-        return (
+        escrow_contract = self._get_escrow_contract(escrow_address)
+        nonce_manager = get_nonce_manager(self.w3)
+        # Chunks with a nonce first, so the nonce manager doesn't hand theirs out
+        for chunk in sorted(
+            unpaid_chunks, key=lambda chunk: (chunk.nonce is None, chunk.nonce or 0)
+        ):
+            if chunk.nonce is None:
+                chunk.nonce = nonce_manager.next_nonce(self.w3.eth.default_account)
+            chunk.status = PayoutChunkStatus.Submitting
+            if journal:
+                journal.update_chunk(escrow_address, chunk)
+
+            try:
+                pending = submit_transaction(
+                    self.w3,
+                    "Bulk Payout",
+                    escrow_contract.functions.bulkPayOut(
+                        chunk.recipients,
+                        chunk.amounts,
+                        final_results_url,
+                        final_results_hash,
+                        chunk.tx_id,
+                    ),
+                    EscrowClientError,
+                    nonce=chunk.nonce,
+                )
+            except EscrowClientError as e:
+                # The nonce is kept, the transaction may have been sent before the error
+                chunk.status = PayoutChunkStatus.Failed
+                chunk.error = str(e)
+                LOG.warning(f"Bulk payout {chunk.tx_id} submission failed: {e}")
+                if journal:
+                    journal.update_chunk(escrow_address, chunk)
+                break
+
+            chunk.tx_hash = pending.tx_hash
+            chunk.status = PayoutChunkStatus.Submitted
+            chunk.error = None
+            if journal:
+                journal.update_chunk(escrow_address, chunk)
+
+        submitted_chunks = [
+            chunk for chunk in chunks if chunk.status == PayoutChunkStatus.Submitted
+        ]
+        receipts = wait_for_receipts(
+            self.w3,
+            [
+                PendingTransaction(
+                    self.w3,
+                    "Bulk Payout",
+                    chunk.tx_hash,
+                    EscrowClientError,
+                    self.w3.eth.default_account,
+                )
+                for chunk in submitted_chunks
+            ],
+            timeout,
+        )
+        for chunk, receipt in zip(submitted_chunks, receipts):
+            if isinstance(receipt, Exception):
+                LOG.warning(f"Bulk payout {chunk.tx_id} not confirmed yet: {receipt}")
+                continue
+
+            if receipt["status"] == 1:
+                chunk.status = PayoutChunkStatus.Confirmed
+            else:
+                chunk.status = PayoutChunkStatus.Failed
+                chunk.error = "Transaction reverted"
+                # Mined without paying, the chunk can be sent with another nonce
+                chunk.nonce = None
+            if journal:
+                journal.update_chunk(escrow_address, chunk)
+
+        return chunks
+
+    def preview_bulk_payout(
+        self,
+        escrow_address: str,
+        recipients: Iterable[Any],
+        amounts: Iterable[Any],
+    ) -> BulkPayoutReport:
+        """Validates a payout against the escrow, without sending any transaction.
+
+        The fee percentages and the balance of the escrow are read in a
+        single call, then every row is checked by validate_bulk_payout.
+
+        Args:
+            escrow_address (str): Address of the escrow
+            recipients (Iterable[Any]): Recipient addresses
+            amounts (Iterable[Any]): Amounts the recipients will receive, before fees
+
+        Returns:
+            BulkPayoutReport: Every invalid row, the duplicated recipients,
+                the amounts after fees and the escrow balance
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        functions = self._get_escrow_contract(escrow_address).functions
+        results = self.multicall.call(
+            [
+                functions.getBalance(),
+                functions.reputationOracleFeePercentage(),
+                functions.recordingOracleFeePercentage(),
+            ]
+        )
+        for result in results:
+            if isinstance(result, MulticallError):
+                raise EscrowClientError(f"Failed to get escrow state: {result}")
+        balance, reputation_oracle_fee, recording_oracle_fee = results
+
+        report = validate_bulk_payout(
+            recipients, amounts, reputation_oracle_fee, recording_oracle_fee
+        )
+        report.balance = balance
+        return report
+
+    def cancel(
+        self, escrow_address: str, wait: bool = True
+    ) -> Optional[PendingTransaction]:
+        """Cancels the specified escrow and sends the balance to the canceler.
+
+        Args:
+            escrow_address (str): Address of the escrow to cancel
+            wait (bool): Wait for the transaction to be mined, otherwise return once it's sent
+
+        Returns:
+            Optional[PendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return self._handle_transaction(
+            "Cancel", self._get_escrow_contract(escrow_address).functions.cancel(), wait
+        )
+
+    def abort(
+        self, escrow_address: str, wait: bool = True
+    ) -> Optional[PendingTransaction]:
+        """Cancels the specified escrow, sends the balance to the canceler and selfdestructs the escrow contract.
+
+        Args:
+            escrow_address (str): Address of the escrow to abort
+            wait (bool): Wait for the transaction to be mined, otherwise return once it's sent
+
+        Returns:
+            Optional[PendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return self._handle_transaction(
+            "Abort", self._get_escrow_contract(escrow_address).functions.abort(), wait
+        )
+
+    def add_trusted_handlers(
+        self, escrow_address: str, handlers: List[str], wait: bool = True
+    ) -> Optional[PendingTransaction]:
+        """Adds an array of addresses to the trusted handlers list.
+
+        Args:
+            escrow_address (str): Address of the escrow
+            handlers (List[str]): Array of trusted handler addresses
+            wait (bool): Wait for the transaction to be mined, otherwise return once it's sent
+
+        Returns:
+            Optional[PendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+        for handler in handlers:
+            if not Web3.isAddress(handler):
+                raise EscrowClientError(f"Invalid handler address: {handler}")
+
+        return self._handle_transaction(
+            "Add Trusted Handlers",
+            self._get_escrow_contract(escrow_address).functions.addTrustedHandlers(
+                handlers
+            ),
+            wait,
+        )
+
+    def get_balance(self, escrow_address: str) -> Decimal:
+        """Gets the balance for a specified escrow address.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            Decimal: Value of the balance
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return self._get_escrow_contract(escrow_address).functions.getBalance().call()
+
+    def get_manifest_url(self, escrow_address: str) -> str:
+        """Gets the manifest file URL.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            str: Manifest file url
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return self._get_escrow_contract(escrow_address).functions.manifestUrl().call()
+
+    def get_results_url(self, escrow_address: str) -> str:
+        """Gets the results file URL.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            str: Results file url
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return (
+            self._get_escrow_contract(escrow_address).functions.finalResultsUrl().call()
+        )
+
+    def get_intermediate_results_url(self, escrow_address: str) -> str:
+        """Gets the intermediate results file URL.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            str: Intermediate results file url
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return (
             self._get_escrow_contract(escrow_address)
             .functions.intermediateResultsUrl()
             .call()
@@ -592,66 +1512,163 @@ class EscrowClient:
             self._get_escrow_contract(escrow_address).functions.status().call()
         )
 
-    def get_launched_escrows(self, requester_address: str) -> List[str]:
+    def get_escrow_state(self, escrow_address: str) -> EscrowState:
+        """Gets the balance, status, urls and addresses of the escrow at once.
+
+        All the values are read from the same block in a single eth_call
+        through Multicall3, together with the factory check when the escrow
+        hasn't been verified yet. Where Multicall3 isn't deployed, the calls
+        are sent in a single JSON-RPC batch request instead.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            EscrowState: Snapshot of the escrow state
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        [escrow_state] = self._get_escrow_states_chunk(
+            [Web3.toChecksumAddress(escrow_address)]
+        )
+        if isinstance(escrow_state, EscrowClientError):
+            raise escrow_state
+        return escrow_state
+
+    def get_escrow_states(
+        self,
+        escrow_addresses: List[str],
+        chunk_size: int = ESCROW_STATES_CHUNK_SIZE,
+        max_workers: int = 4,
+        chunk_callback: Optional[Callable[[int, int, float], None]] = None,
+    ) -> Iterator[Union[EscrowState, EscrowClientError]]:
+        """Gets the state of many escrows, streaming the results in order.
+
+        Escrows are split in chunks, each chunk is read with a single eth_call
+        through Multicall3 (or JSON-RPC batch request), and up to max_workers
+        chunks are read concurrently.
+
+        Args:
+            escrow_addresses (List[str]): Addresses of the escrows
+            chunk_size (int): Number of escrows read per eth_call
+            max_workers (int): Maximum number of chunks read concurrently
+            chunk_callback (Optional[Callable[[int, int, float], None]]): Called with the
+                chunk index, number of escrows and latency in seconds of every chunk
+
+        Returns:
+            Iterator[Union[EscrowState, EscrowClientError]]: Snapshot of each escrow
+                state, in order. Escrows that can't be read are returned as
+                EscrowClientError instead of raising, so the rest can be read.
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if chunk_size <= 0:
+            raise EscrowClientError("Chunk size must be greater than 0")
+        if max_workers <= 0:
+            raise EscrowClientError("Max workers must be greater than 0")
+        for escrow_address in escrow_addresses:
+            if not Web3.isAddress(escrow_address):
+                raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return self._get_escrow_states(
+            [Web3.toChecksumAddress(address) for address in escrow_addresses],
+            chunk_size,
+            max_workers,
+            chunk_callback,
+        )
+
+    def get_launched_escrows(
+        self, requester_address: str, page_size: int = SUBGRAPH_PAGE_SIZE
+    ) -> List[str]:
         """Get escrows addresses created by a job requester.
 
         Args:
             requester_address (str): Address of the requester
+            page_size (int): Number of escrows read per subgraph query
 
         Returns:
             List[str]: List of escrow addresses
         """
 
-        launched_escrows_data = get_data_from_subgraph(
-            self.network["subgraph_url"],
-            """
-            {{
-                launchedEscrows(
-                    where:{{from:"{0}"}}
-                ) {{
-                    id
-                }}
-            }}
-            """.format(
-                requester_address
-            ),
-        )
-        launched_escrows = launched_escrows_data["data"]["launchedEscrows"]
+        return list(self.iter_launched_escrows(requester_address, page_size))
+
+    def iter_launched_escrows(
+        self, requester_address: str, page_size: int = SUBGRAPH_PAGE_SIZE
+    ) -> Iterator[str]:
+        """Streams the addresses of the escrows created by a job requester.
 
-        return [launched_escrows[i]["id"] for i in range(len(launched_escrows))]
+        Escrows are read from the subgraph page by page, the next page is
+        requested while the current one is consumed.
 
-    def get_escrows_filtered(self, filter: EscrowFilter) -> List[str]:
+        Args:
+            requester_address (str): Address of the requester
+            page_size (int): Number of escrows read per subgraph query
+
+        Returns:
+            Iterator[str]: Escrow addresses, in id order
+        """
+
+        return self._iter_launched_escrows({"from": requester_address}, page_size)
+
+    def get_escrows_filtered(
+        self, filter: EscrowFilter, page_size: int = SUBGRAPH_PAGE_SIZE
+    ) -> List[str]:
         """Get an array of escrow addresses based on the specified filter parameters.
 
         Args:
             filter (EscrowFilter): Object containing all the necessary parameters to filter
+            page_size (int): Number of escrows read per subgraph query
 
         Returns:
             List[str]: List of escrow addresses
         """
-        launched_escrows_data = get_data_from_subgraph(
-            self.network["subgraph_url"],
-            """
-            {{
-                launchedEscrows(where:{{{0}{1}{2}{3}}}
-                ) {{
-                    id
-                }}
-            }}
-            """.format(
-                """from:"{0}",""".format(filter.address) if filter.address else "",
-                """status:"{0}",""".format(filter.status.name) if filter.status else "",
-                """timestamp_gte:"{0}",""".format(int(filter.date_from.timestamp()))
-                if filter.date_from
-                else "",
-                """timestamp_lte:"{0}",""".format(int(filter.date_to.timestamp()))
-                if filter.date_to
-                else "",
-            ),
-        )
-        launched_escrows = launched_escrows_data["data"]["launchedEscrows"]
 
-        return [launched_escrows[i]["id"] for i in range(len(launched_escrows))]
+        return list(self.iter_escrows_filtered(filter, page_size))
+
+    def iter_escrows_filtered(
+        self, filter: EscrowFilter, page_size: int = SUBGRAPH_PAGE_SIZE
+    ) -> Iterator[str]:
+        """Streams the addresses of the escrows matching the filter parameters.
+
+        Escrows are read from the subgraph page by page, the next page is
+        requested while the current one is consumed.
+
+        Args:
+            filter (EscrowFilter): Object containing all the necessary parameters to filter
+            page_size (int): Number of escrows read per subgraph query
+
+        Returns:
+            Iterator[str]: Escrow addresses, in id order
+        """
+
+        return self._iter_launched_escrows(_escrows_filter_where(filter), page_size)
+
+    def _iter_launched_escrows(self, where: dict, page_size: int) -> Iterator[str]:
+        """Streams the ids of the launched escrows matching the filter.
+
+        Args:
+            where (dict): Filter of the launched escrows
+            page_size (int): Number of escrows read per subgraph query
+
+        Returns:
+            Iterator[str]: Escrow addresses, in id order
+        """
+
+        for page in iter_subgraph_pages(
+            self.network["subgraph_url"],
+            LAUNCHED_ESCROWS_QUERY,
+            {"where": where},
+            page_size,
+        ):
+            for launched_escrow in page:
+                yield launched_escrow["id"]
 
     def get_recording_oracle_address(self, escrow_address: str) -> str:
         """Gets the recording oracle address of the escrow.
@@ -695,9 +1712,68 @@ class EscrowClient:
             .call()
         )
 
+    def prewarm_escrow_cache(self, requester_address: Optional[str] = None) -> int:
+        """Marks the escrows indexed by the subgraph as created by the factory.
+
+        Afterwards, the factory check for those escrows doesn't need any RPC call.
+
+        Args:
+            requester_address (Optional[str]): Only load the escrows launched by this address
+
+        Returns:
+            int: Number of escrows loaded
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if requester_address and not Web3.isAddress(requester_address):
+            raise EscrowClientError(f"Invalid requester address: {requester_address}")
+
+        count = 0
+        for page in iter_subgraph_pages(
+            self.network["subgraph_url"],
+            LAUNCHED_ESCROWS_QUERY,
+            {"where": {"from": requester_address} if requester_address else {}},
+        ):
+            escrow_addresses = [
+                Web3.toChecksumAddress(launched_escrow["id"])
+                for launched_escrow in page
+            ]
+            with self._verified_escrows_lock:
+                self._verified_escrows.update(escrow_addresses)
+            count += len(escrow_addresses)
+
+        return count
+
+    def invalidate_escrow_cache(self, escrow_address: Optional[str] = None) -> None:
+        """Removes cached escrow contract instances.
+
+        Args:
+            escrow_address (Optional[str]): Address of the escrow to remove, removes all if not provided
+
+        Returns:
+            None
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if escrow_address is None:
+            self._escrow_contracts.clear()
+            return
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        self._escrow_contracts.pop(Web3.toChecksumAddress(escrow_address))
+
     def _get_escrow_contract(self, address: str) -> contract:
         """Returns the escrow contract instance.
 
+        Instances are cached per address, so the factory check only runs
+        the first time an escrow is used.
+
         Args:
             address (str): Address of the deployed escrow
 
@@ -706,8 +1782,1035 @@ class EscrowClient:
 
         """
 
-        if not self.factory_contract.functions.hasEscrow(address):
+        checksum_address = Web3.toChecksumAddress(address)
+        escrow_contract = self._escrow_contracts.get(checksum_address)
+        if escrow_contract is not None:
+            return escrow_contract
+
+        if not self._is_factory_escrow(checksum_address):
             raise EscrowClientError("Escrow address is not provided by the factory")
         # Initialize contract instance
         escrow_interface = get_escrow_interface()
-        return self.w3.eth.contract(address=address, abi=escrow_interface["abi"])
+        escrow_contract = self.w3.eth.contract(
+            address=checksum_address, abi=escrow_interface["abi"]
+        )
+        self._escrow_contracts.put(checksum_address, escrow_contract)
+        return escrow_contract
+
+    def _get_escrow_states(
+        self,
+        checksum_addresses: List[str],
+        chunk_size: int,
+        max_workers: int,
+        chunk_callback: Optional[Callable[[int, int, float], None]],
+    ) -> Iterator[Union[EscrowState, EscrowClientError]]:
+        """Reads the escrow states chunk by chunk, keeping max_workers chunks in flight.
+
+        Args:
+            checksum_addresses (List[str]): Checksum addresses of the escrows
+            chunk_size (int): Number of escrows read per eth_call
+            max_workers (int): Maximum number of chunks read concurrently
+            chunk_callback (Optional[Callable[[int, int, float], None]]): Called for every chunk
+
+        Returns:
+            Iterator[Union[EscrowState, EscrowClientError]]: State of each escrow, in order
+        """
+
+        def read_chunk(chunk: List[str]) -> Tuple[list, float]:
+            start = time.perf_counter()
+            escrow_states = self._get_escrow_states_chunk(chunk)
+            return escrow_states, time.perf_counter() - start
+
+        def collect(chunk_index: int, future: Future) -> list:
+            escrow_states, latency = future.result()
+            LOG.debug(
+                f"Read chunk {chunk_index} of {len(escrow_states)} escrows in {latency:.3f}s"
+            )
+            if chunk_callback:
+                chunk_callback(chunk_index, len(escrow_states), latency)
+            return escrow_states
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            try:
+                for chunk_index, i in enumerate(
+                    range(0, len(checksum_addresses), chunk_size)
+                ):
+                    chunk = checksum_addresses[i : i + chunk_size]
+                    pending.append((chunk_index, executor.submit(read_chunk, chunk)))
+                    if len(pending) >= max_workers:
+                        yield from collect(*pending.popleft())
+                while pending:
+                    yield from collect(*pending.popleft())
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def _get_escrow_states_chunk(
+        self, checksum_addresses: List[str]
+    ) -> List[Union[EscrowState, EscrowClientError]]:
+        """Reads the state of the escrows with a single multicall.
+
+        The factory check of escrows not verified yet is done in the same call.
+
+        Args:
+            checksum_addresses (List[str]): Checksum addresses of the escrows
+
+        Returns:
+            List[Union[EscrowState, EscrowClientError]]: State of each escrow, in order
+        """
+
+        escrow_contracts = {}
+        verify = {}
+        try:
+            aggregated = self.multicall.is_aggregated()
+            calls = []
+            for checksum_address in checksum_addresses:
+                verify[checksum_address] = not self._is_verified_escrow(
+                    checksum_address
+                )
+                if verify[checksum_address] and not aggregated:
+                    if not self._is_factory_escrow(checksum_address):
+                        continue
+                    verify[checksum_address] = False
+
+                escrow_contract = self._escrow_contracts.get(checksum_address)
+                if escrow_contract is None:
+                    escrow_interface = get_escrow_interface()
+                    escrow_contract = self.w3.eth.contract(
+                        address=checksum_address, abi=escrow_interface["abi"]
+                    )
+                escrow_contracts[checksum_address] = escrow_contract
+
+                calls.extend(
+                    escrow_contract.get_function_by_name(fn_name)()
+                    for fn_name in ESCROW_STATE_FUNCTIONS
+                )
+                if verify[checksum_address]:
+                    calls.append(
+                        self.factory_contract.functions.hasEscrow(checksum_address)
+                    )
+
+            results = iter(self.multicall.call(calls))
+        except Exception as e:
+            # A failed call fails the escrows of this chunk only
+            return [EscrowClientError(str(e)) for _ in checksum_addresses]
+
+        escrow_states = []
+        for checksum_address in checksum_addresses:
+            if checksum_address not in escrow_contracts:
+                escrow_states.append(
+                    EscrowClientError("Escrow address is not provided by the factory")
+                )
+                continue
+
+            values = [next(results) for _ in ESCROW_STATE_FUNCTIONS]
+            if verify[checksum_address]:
+                has_escrow = next(results)
+                if isinstance(has_escrow, MulticallError):
+                    escrow_states.append(
+                        EscrowClientError(f"Failed to get escrow state: {has_escrow}")
+                    )
+                    continue
+                if has_escrow is not True:
+                    escrow_states.append(
+                        EscrowClientError(
+                            "Escrow address is not provided by the factory"
+                        )
+                    )
+                    continue
+                with self._verified_escrows_lock:
+                    self._verified_escrows.add(checksum_address)
+            self._escrow_contracts.put(
+                checksum_address, escrow_contracts[checksum_address]
+            )
+
+            error = next(
+                (value for value in values if isinstance(value, MulticallError)), None
+            )
+            if error:
+                escrow_states.append(
+                    EscrowClientError(f"Failed to get escrow state: {error}")
+                )
+                continue
+
+            (
+                balance,
+                status,
+                manifest_url,
+                results_url,
+                intermediate_results_url,
+                token_address,
+                recording_oracle_address,
+                reputation_oracle_address,
+            ) = values
+            escrow_states.append(
+                EscrowState(
+                    checksum_address,
+                    balance,
+                    Status(status),
+                    manifest_url,
+                    results_url,
+                    intermediate_results_url,
+                    token_address,
+                    recording_oracle_address,
+                    reputation_oracle_address,
+                )
+            )
+
+        return escrow_states
+
+    def _handle_transaction(
+        self, tx_name: str, tx, wait: bool
+    ) -> Optional[PendingTransaction]:
+        """Sends a transaction, waiting for it to be mined if requested.
+
+        Args:
+            tx_name (str): Name of the transaction
+            tx (obj): Transaction object
+            wait (bool): Wait for the transaction to be mined
+
+        Returns:
+            Optional[PendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
+        """
+
+        if wait:
+            handle_transaction(self.w3, tx_name, tx, EscrowClientError)
+            return None
+        return submit_transaction(self.w3, tx_name, tx, EscrowClientError)
+
+    def _reconcile_submitted_chunk(self, chunk: PayoutChunk) -> None:
+        """Updates the status of a submitted chunk with its transaction.
+
+        Args:
+            chunk (PayoutChunk): Submitted chunk of the payout
+
+        Returns:
+            None
+        """
+
+        try:
+            receipt = self.w3.eth.get_transaction_receipt(chunk.tx_hash)
+        except TransactionNotFound:
+            try:
+                self.w3.eth.get_transaction(chunk.tx_hash)
+            except TransactionNotFound:
+                # Dropped from the mempool, it has to be submitted again
+                chunk.status = PayoutChunkStatus.Pending
+                chunk.tx_hash = None
+            return
+
+        if receipt["status"] == 1:
+            chunk.status = PayoutChunkStatus.Confirmed
+        else:
+            chunk.status = PayoutChunkStatus.Failed
+            chunk.error = "Transaction reverted"
+
+    def _is_verified_escrow(self, checksum_address: str) -> bool:
+        """Checks if the escrow is already known to be created by the factory.
+
+        Args:
+            checksum_address (str): Checksum address of the escrow
+
+        Returns:
+            bool: True if the escrow was verified before, False otherwise
+        """
+
+        with self._verified_escrows_lock:
+            return checksum_address in self._verified_escrows
+
+    def _is_factory_escrow(self, checksum_address: str) -> bool:
+        """Checks if the escrow was created by the factory.
+
+        Positive results are remembered, so each escrow is checked on-chain once.
+
+        Args:
+            checksum_address (str): Checksum address of the escrow
+
+        Returns:
+            bool: True if the escrow was created by the factory, False otherwise
+        """
+
+        if self._is_verified_escrow(checksum_address):
+            return True
+
+        if not self.factory_contract.functions.hasEscrow(checksum_address).call():
+            return False
+
+        with self._verified_escrows_lock:
+            self._verified_escrows.add(checksum_address)
+        return True
+
+
+class AsyncEscrowClient:
+    """
+    A class used to manage escrow on the HUMAN network, from asyncio code.
+
+    It has the same methods as EscrowClient for creating, funding, paying
+    out and reading escrows, as coroutines. Use create to get an instance.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        chain_id: int,
+        account: Optional[LocalAccount] = None,
+        escrow_cache_size: int = ESCROW_CACHE_SIZE,
+    ):
+        """
+        Initializes an AsyncEscrow instance.
+
+        Args:
+            web3 (Web3): The Web3 object, with an async provider and the AsyncEth module
+            chain_id (int): Chain id of the network
+            account (Optional[LocalAccount]): Account to sign transactions with,
+                the default account of the node is used if not provided
+            escrow_cache_size (int): Maximum number of escrow contract instances kept in memory
+        """
+
+        self.w3 = web3
+        self.account = account
+
+        try:
+            self.network = NETWORKS[ChainId(chain_id)]
+        except:
+            raise EscrowClientError(f"Invalid ChainId: {chain_id}")
+        self.chain_id = chain_id
+
+        # Initialize contract instances
+        self.factory_contract = get_async_contract(
+            self.w3, self.network["factory_address"], get_factory_interface()["abi"]
+        )
+        self._escrow_contracts = LRUCache(escrow_cache_size)
+        self._verified_escrows = set()
+
+    @classmethod
+    async def create(
+        cls, web3: Web3, account: Optional[LocalAccount] = None
+    ) -> "AsyncEscrowClient":
+        """Creates an AsyncEscrowClient for the network of the Web3 instance.
+
+        Args:
+            web3 (Web3): The Web3 object, with an async provider and the AsyncEth module
+            account (Optional[LocalAccount]): Account to sign transactions with
+
+        Returns:
+            AsyncEscrowClient: The client
+        """
+
+        return cls(web3, await async_get_chain_id(web3), account)
+
+    async def create_escrow(
+        self, token_address: str, trusted_handlers: List[str]
+    ) -> str:
+        """Creates an escrow contract that uses the token passed to pay oracle fees and reward workers.
+
+        Args:
+            token_address (str): Address of the token to use for pay outs
+            trusted_handlers (List[str]): Array of addresses that can perform actions on the contract
+
+        Returns:
+            str: Address of the escrow created
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(token_address):
+            raise EscrowClientError(f"Invalid token address: {token_address}")
+
+        for handler in trusted_handlers:
+            if not Web3.isAddress(handler):
+                raise EscrowClientError(f"Invalid handler address: {handler}")
+
+        transaction_receipt = await async_handle_transaction(
+            self.w3,
+            "Create Escrow",
+            self.factory_contract.functions.createEscrow(
+                token_address, trusted_handlers
+            ),
+            EscrowClientError,
+            self.account,
+            self._tx_options(),
+        )
+        return next(
+            (
+                self.factory_contract.events.Launched().processLog(log)
+                for log in transaction_receipt["logs"]
+                if log["address"] == self.network["factory_address"]
+            ),
+            None,
+        ).args.escrow
+
+    async def setup(
+        self, escrow_address: str, escrow_config: EscrowConfig, wait: bool = True
+    ) -> Optional[AsyncPendingTransaction]:
+        """
+        Sets up the parameters of the escrow.
+
+        Args:
+            escrow_address (str): Address of the escrow to setup
+            escrow_config (EscrowConfig): Object containing all the necessary information to setup an escrow
+            wait (bool): Wait for the transaction to be mined, otherwise return once it's sent
+
+        Returns:
+            Optional[AsyncPendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        escrow_contract = await self._get_escrow_contract(escrow_address)
+        return await self._handle_transaction(
+            "Setup",
+            escrow_contract.functions.setup(
+                escrow_config.reputation_oracle_address,
+                escrow_config.recording_oracle_address,
+                escrow_config.reputation_oracle_fee,
+                escrow_config.recording_oracle_fee,
+                escrow_config.manifest_url,
+                escrow_config.hash,
+            ),
+            wait,
+        )
+
+    async def create_and_setup_escrow(
+        self,
+        token_address: str,
+        trusted_handlers: List[str],
+        escrow_config: EscrowConfig,
+    ) -> str:
+        """
+        Creates and sets up an escrow.
+
+        Args:
+            token_address (str): Token to use for pay outs
+            trusted_handlers (List[str]): Array of addresses that can perform actions on the contract
+            escrow_config (EscrowConfig): Object containing all the necessary information to setup an escrow
+
+        Returns:
+            str: The address of the escrow created
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        escrow_address = await self.create_escrow(token_address, trusted_handlers)
+        await self.setup(escrow_address, escrow_config)
+
+        return escrow_address
+
+    async def fund(
+        self, escrow_address: str, amount: Decimal, wait: bool = True
+    ) -> Optional[AsyncPendingTransaction]:
+        """
+        Adds funds to the escrow.
+
+        Args:
+            escrow_address (str): Address of the escrow to setup
+            amount (Decimal): Amount to be added as funds
+            wait (bool): Wait for the transaction to be mined, otherwise return once it's sent
+
+        Returns:
+            Optional[AsyncPendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+        if 0 >= amount:
+            raise EscrowClientError("Amount must be positive")
+
+        token_address = await self.get_token_address(escrow_address)
+        token_contract = get_async_contract(
+            self.w3, token_address, get_erc20_interface()["abi"]
+        )
+
+        return await self._handle_transaction(
+            "Fund", token_contract.functions.transfer(escrow_address, amount), wait
+        )
+
+    async def store_results(
+        self, escrow_address: str, url: str, hash: str, wait: bool = True
+    ) -> Optional[AsyncPendingTransaction]:
+        """Stores the results url.
+
+        Args:
+            escrow_address (str): Address of the escrow
+            url (str): Results file url
+            hash (str): Results file hash
+            wait (bool): Wait for the transaction to be mined, otherwise return once it's sent
+
+        Returns:
+            Optional[AsyncPendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+        if not hash:
+            raise EscrowClientError("Invalid empty hash")
+        if not URL(url):
+            raise EscrowClientError(f"Invalid URL: {url}")
+
+        escrow_contract = await self._get_escrow_contract(escrow_address)
+        return await self._handle_transaction(
+            "Store Results", escrow_contract.functions.storeResults(url, hash), wait
+        )
+
+    async def complete(
+        self, escrow_address: str, wait: bool = True
+    ) -> Optional[AsyncPendingTransaction]:
+        """Sets the status of an escrow to completed.
+
+        Args:
+            escrow_address (str): Address of the escrow to complete
+            wait (bool): Wait for the transaction to be mined, otherwise return once it's sent
+
+        Returns:
+            Optional[AsyncPendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return await self._handle_transaction(
+            "Complete",
+            (await self._get_escrow_contract(escrow_address)).functions.complete(),
+            wait,
+        )
+
+    async def cancel(
+        self, escrow_address: str, wait: bool = True
+    ) -> Optional[AsyncPendingTransaction]:
+        """Cancels the specified escrow and sends the balance to the canceler.
+
+        Args:
+            escrow_address (str): Address of the escrow to cancel
+            wait (bool): Wait for the transaction to be mined, otherwise return once it's sent
+
+        Returns:
+            Optional[AsyncPendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return await self._handle_transaction(
+            "Cancel",
+            (await self._get_escrow_contract(escrow_address)).functions.cancel(),
+            wait,
+        )
+
+    async def abort(
+        self, escrow_address: str, wait: bool = True
+    ) -> Optional[AsyncPendingTransaction]:
+        """Cancels the specified escrow, sends the balance to the canceler and selfdestructs the escrow contract.
+
+        Args:
+            escrow_address (str): Address of the escrow to abort
+            wait (bool): Wait for the transaction to be mined, otherwise return once it's sent
+
+        Returns:
+            Optional[AsyncPendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return await self._handle_transaction(
+            "Abort",
+            (await self._get_escrow_contract(escrow_address)).functions.abort(),
+            wait,
+        )
+
+    async def bulk_payout(
+        self,
+        escrow_address: str,
+        recipients: List[str],
+        amounts: List[Decimal],
+        final_results_url: str,
+        final_results_hash: str,
+        txId: Decimal,
+        wait: bool = True,
+    ) -> Optional[AsyncPendingTransaction]:
+        """Pays out the amounts specified to the workers and sets the URL of the final results file.
+
+        Args:
+            escrow_address (str): Address of the escrow
+            recipients (List[str]): Array of recipient addresses
+            amounts (List[Decimal]): Array of amounts the recipients will receive
+            final_results_url (str): Final results file url
+            final_results_hash (str): Final results file hash
+            txId (Decimal): Serial number of the bulks
+            wait (bool): Wait for the transaction to be mined, otherwise return once it's sent
+
+        Returns:
+            Optional[AsyncPendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+        report = validate_bulk_payout(recipients, amounts)
+        if report.size == 0:
+            raise EscrowClientError("Arrays must have any value")
+        if report.errors:
+            raise EscrowClientError(report.errors[0].reason)
+        if report.size >= BULK_MAX_COUNT:
+            raise EscrowClientError(f"Too many recipients: {report.size}")
+        if report.total_amount >= BULK_MAX_VALUE:
+            raise EscrowClientError(f"Bulk value too high: {report.total_amount}")
+        balance = await self.get_balance(escrow_address)
+        if report.total_amount > balance:
+            raise EscrowClientError(
+                f"Escrow does not have enough balance. Current balance: {balance}. Amounts: {report.total_amount}"
+            )
+        if not URL(final_results_url):
+            raise EscrowClientError(f"Invalid final results URL: {final_results_url}")
+        if not final_results_hash:
+            raise EscrowClientError("Invalid empty final results hash")
+
+        escrow_contract = await self._get_escrow_contract(escrow_address)
+        return await self._handle_transaction(
+            "Bulk Payout",
+            escrow_contract.functions.bulkPayOut(
+                recipients, amounts, final_results_url, final_results_hash, txId
+            ),
+            wait,
+        )
+
+    async def add_trusted_handlers(
+        self, escrow_address: str, handlers: List[str], wait: bool = True
+    ) -> Optional[AsyncPendingTransaction]:
+        """Adds an array of addresses to the trusted handlers list.
+
+        Args:
+            escrow_address (str): Address of the escrow
+            handlers (List[str]): Array of trusted handler addresses
+            wait (bool): Wait for the transaction to be mined, otherwise return once it's sent
+
+        Returns:
+            Optional[AsyncPendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+        for handler in handlers:
+            if not Web3.isAddress(handler):
+                raise EscrowClientError(f"Invalid handler address: {handler}")
+
+        escrow_contract = await self._get_escrow_contract(escrow_address)
+        return await self._handle_transaction(
+            "Add Trusted Handlers",
+            escrow_contract.functions.addTrustedHandlers(handlers),
+            wait,
+        )
+
+    async def get_balance(self, escrow_address: str) -> Decimal:
+        """Gets the balance for a specified escrow address.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            Decimal: Value of the balance
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return await async_call(
+            (await self._get_escrow_contract(escrow_address)).functions.getBalance()
+        )
+
+    async def get_manifest_url(self, escrow_address: str) -> str:
+        """Gets the manifest file URL.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            str: Manifest file url
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return await async_call(
+            (await self._get_escrow_contract(escrow_address)).functions.manifestUrl()
+        )
+
+    async def get_results_url(self, escrow_address: str) -> str:
+        """Gets the results file URL.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            str: Results file url
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return await async_call(
+            (
+                await self._get_escrow_contract(escrow_address)
+            ).functions.finalResultsUrl()
+        )
+
+    async def get_intermediate_results_url(self, escrow_address: str) -> str:
+        """Gets the intermediate results file URL.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            str: Intermediate results file url
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return await async_call(
+            (
+                await self._get_escrow_contract(escrow_address)
+            ).functions.intermediateResultsUrl()
+        )
+
+    async def get_token_address(self, escrow_address: str) -> str:
+        """Gets the address of the token used to fund the escrow.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            str: Address of the token
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return await async_call(
+            (await self._get_escrow_contract(escrow_address)).functions.token()
+        )
+
+    async def get_status(self, escrow_address: str) -> Status:
+        """Gets the current status of the escrow.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            Status: Current status
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return Status(
+            await async_call(
+                (await self._get_escrow_contract(escrow_address)).functions.status()
+            )
+        )
+
+    async def get_recording_oracle_address(self, escrow_address: str) -> str:
+        """Gets the recording oracle address of the escrow.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            str: Recording oracle address
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return await async_call(
+            (
+                await self._get_escrow_contract(escrow_address)
+            ).functions.recordingOracle()
+        )
+
+    async def get_reputation_oracle_address(self, escrow_address: str) -> str:
+        """Gets the reputation oracle address of the escrow.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            str: Reputation oracle address
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        return await async_call(
+            (
+                await self._get_escrow_contract(escrow_address)
+            ).functions.reputationOracle()
+        )
+
+    async def get_escrow_state(self, escrow_address: str) -> EscrowState:
+        """Gets the balance, status, urls and addresses of the escrow at once.
+
+        The values are read concurrently.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            EscrowState: Current state of the escrow
+
+        Raises:
+            EscrowClientError: If an error occurs while checking the parameters
+        """
+
+        if not Web3.isAddress(escrow_address):
+            raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        functions = (await self._get_escrow_contract(escrow_address)).functions
+        try:
+            values = await asyncio.gather(
+                *[
+                    async_call(functions[function_name]())
+                    for function_name in ESCROW_STATE_FUNCTIONS
+                ]
+            )
+        except Exception as e:
+            raise EscrowClientError(f"Failed to get escrow state: {e}")
+
+        values[1] = Status(values[1])
+        return EscrowState(Web3.toChecksumAddress(escrow_address), *values)
+
+    async def get_launched_escrows(
+        self, requester_address: str, page_size: int = SUBGRAPH_PAGE_SIZE
+    ) -> List[str]:
+        """Get escrows addresses created by a job requester.
+
+        Args:
+            requester_address (str): Address of the requester
+            page_size (int): Number of escrows read per subgraph query
+
+        Returns:
+            List[str]: List of escrow addresses
+        """
+
+        return [
+            escrow_address
+            async for escrow_address in self.iter_launched_escrows(
+                requester_address, page_size
+            )
+        ]
+
+    def iter_launched_escrows(
+        self, requester_address: str, page_size: int = SUBGRAPH_PAGE_SIZE
+    ) -> AsyncIterator[str]:
+        """Streams the addresses of the escrows created by a job requester.
+
+        Args:
+            requester_address (str): Address of the requester
+            page_size (int): Number of escrows read per subgraph query
+
+        Returns:
+            AsyncIterator[str]: Escrow addresses, in id order
+        """
+
+        return self._iter_launched_escrows({"from": requester_address}, page_size)
+
+    async def get_escrows_filtered(
+        self, filter: EscrowFilter, page_size: int = SUBGRAPH_PAGE_SIZE
+    ) -> List[str]:
+        """Get an array of escrow addresses based on the specified filter parameters.
+
+        Args:
+            filter (EscrowFilter): Object containing all the necessary parameters to filter
+            page_size (int): Number of escrows read per subgraph query
+
+        Returns:
+            List[str]: List of escrow addresses
+        """
+
+        return [
+            escrow_address
+            async for escrow_address in self.iter_escrows_filtered(filter, page_size)
+        ]
+
+    def iter_escrows_filtered(
+        self, filter: EscrowFilter, page_size: int = SUBGRAPH_PAGE_SIZE
+    ) -> AsyncIterator[str]:
+        """Streams the addresses of the escrows matching the filter parameters.
+
+        Args:
+            filter (EscrowFilter): Object containing all the necessary parameters to filter
+            page_size (int): Number of escrows read per subgraph query
+
+        Returns:
+            AsyncIterator[str]: Escrow addresses, in id order
+        """
+
+        return self._iter_launched_escrows(_escrows_filter_where(filter), page_size)
+
+    async def _iter_launched_escrows(
+        self, where: dict, page_size: int
+    ) -> AsyncIterator[str]:
+        """Streams the ids of the launched escrows matching the filter.
+
+        Args:
+            where (dict): Filter of the launched escrows
+            page_size (int): Number of escrows read per subgraph query
+
+        Returns:
+            AsyncIterator[str]: Escrow addresses, in id order
+        """
+
+        async for page in async_iter_subgraph_pages(
+            self.network["subgraph_url"],
+            LAUNCHED_ESCROWS_QUERY,
+            {"where": where},
+            page_size,
+        ):
+            for launched_escrow in page:
+                yield launched_escrow["id"]
+
+    async def _handle_transaction(
+        self, tx_name: str, tx, wait: bool
+    ) -> Optional[AsyncPendingTransaction]:
+        """Sends a transaction, waiting for it to be mined if requested.
+
+        Args:
+            tx_name (str): Name of the transaction
+            tx (obj): Transaction object
+            wait (bool): Wait for the transaction to be mined
+
+        Returns:
+            Optional[AsyncPendingTransaction]: Handle to wait for the transaction if wait is False, None otherwise
+        """
+
+        if wait:
+            await async_handle_transaction(
+                self.w3,
+                tx_name,
+                tx,
+                EscrowClientError,
+                self.account,
+                self._tx_options(),
+            )
+            return None
+        return await async_submit_transaction(
+            self.w3,
+            tx_name,
+            tx,
+            EscrowClientError,
+            self.account,
+            self._tx_options(),
+        )
+
+    def _tx_options(self) -> Optional[dict]:
+        """Gets the parameters added to every transaction.
+
+        Returns:
+            Optional[dict]: The chain id if transactions are signed locally
+        """
+
+        return {"chainId": self.chain_id} if self.account else None
+
+    async def _get_escrow_contract(self, address: str) -> contract:
+        """Returns the escrow contract instance.
+
+        Instances are cached per address, so the factory check only runs
+        the first time an escrow is used.
+
+        Args:
+            address (str): Address of the deployed escrow
+
+        Returns:
+            Contract: The instance of the escrow contract
+
+        """
+
+        checksum_address = Web3.toChecksumAddress(address)
+        escrow_contract = self._escrow_contracts.get(checksum_address)
+        if escrow_contract is not None:
+            return escrow_contract
+
+        if checksum_address not in self._verified_escrows:
+            if not await async_call(
+                self.factory_contract.functions.hasEscrow(checksum_address)
+            ):
+                raise EscrowClientError("Escrow address is not provided by the factory")
+            self._verified_escrows.add(checksum_address)
+
+        escrow_contract = get_async_contract(
+            self.w3, checksum_address, get_escrow_interface()["abi"]
+        )
+        self._escrow_contracts.put(checksum_address, escrow_contract)
+        return escrow_contract
+
+
+def _escrows_filter_where(filter: EscrowFilter) -> dict:
+    """Builds the where filter of the launched escrows matching an escrow filter.
+
+    Args:
+        filter (EscrowFilter): Object containing all the necessary parameters to filter
+
+    Returns:
+        dict: The filter
+    """
+
+    where = {}
+    if filter.address:
+        where["from"] = filter.address
+    if filter.status:
+        where["status"] = filter.status.name
+    if filter.date_from:
+        where["timestamp_gte"] = str(int(filter.date_from.timestamp()))
+    if filter.date_to:
+        where["timestamp_lte"] = str(int(filter.date_to.timestamp()))
+    return where
@@ -5,8 +5,16 @@ import os
 from decimal import Decimal
 from typing import List, Optional
 
+from eth_account.signers.local import LocalAccount
 from human_protocol_sdk.constants import NETWORKS, ChainId
-from human_protocol_sdk.utils import get_kvstore_interface, handle_transaction
+from human_protocol_sdk.utils import (
+    async_call,
+    async_get_chain_id,
+    async_handle_transaction,
+    get_async_contract,
+    get_kvstore_interface,
+    handle_transaction,
+)
 from web3 import Web3
 from web3.middleware import geth_poa_middleware
 
@@ -119,3 +127,135 @@ class KVStoreClient:
             raise KVStoreClientError(f"Invalid address: {address}")
         result = self.kvstore_contract.functions.get(address, key).call()
         return result
+
+
+class AsyncKVStoreClient:
+    """
+    A class used to manage kvstore on the HUMAN network, from asyncio code.
+
+    It has the same methods as KVStoreClient, as coroutines. Use create to
+    get an instance.
+    """
+
+    def __init__(
+        self, web3: Web3, chain_id: int, account: Optional[LocalAccount] = None
+    ):
+        """
+        Initializes an AsyncKVStore instance.
+
+        Args:
+            web3 (Web3): The Web3 object, with an async provider and the AsyncEth module
+            chain_id (int): Chain id of the network
+            account (Optional[LocalAccount]): Account to sign transactions with,
+                the default account of the node is used if not provided
+        """
+
+        self.w3 = web3
+        self.account = account
+
+        try:
+            self.network = NETWORKS[ChainId(chain_id)]
+        except:
+            raise KVStoreClientError(f"Invalid ChainId: {chain_id}")
+        self.chain_id = chain_id
+
+        # Initialize contract instances
+        kvstore_interface = get_kvstore_interface()
+        self.kvstore_contract = get_async_contract(
+            self.w3, self.network["kvstore_address"], kvstore_interface["abi"]
+        )
+
+    @classmethod
+    async def create(
+        cls, web3: Web3, account: Optional[LocalAccount] = None
+    ) -> "AsyncKVStoreClient":
+        """Creates an AsyncKVStoreClient for the network of the Web3 instance.
+
+        Args:
+            web3 (Web3): The Web3 object, with an async provider and the AsyncEth module
+            account (Optional[LocalAccount]): Account to sign transactions with
+
+        Returns:
+            AsyncKVStoreClient: The client
+        """
+
+        return cls(web3, await async_get_chain_id(web3), account)
+
+    async def set(self, key: str, value: str) -> None:
+        """
+        Sets the value of a key-value pair in the contract.
+
+        Args:
+            key (str): The key of the key-value pair to set
+            value (str): The value of the key-value pair to set
+
+        Returns:
+            None
+        """
+
+        if not key:
+            raise KVStoreClientError("Key can not be empty")
+
+        await self._handle_transaction(
+            "Set", self.kvstore_contract.functions.set(key, value)
+        )
+
+    async def set_bulk(self, keys: List[str], values: List[str]) -> None:
+        """
+        Sets multiple key-value pairs in the contract.
+
+        Args:
+            keys (List[str]): A list of keys to set
+            values (List[str]): A list of values to set
+
+        Returns:
+            None
+        """
+
+        if "" in keys:
+            raise KVStoreClientError("Key can not be empty")
+        if len(keys) == 0:
+            raise KVStoreClientError("Arrays must have any value")
+        if len(keys) != len(values):
+            raise KVStoreClientError("Arrays must have same length")
+
+        await self._handle_transaction(
+            "Set Bulk", self.kvstore_contract.functions.setBulk(keys, values)
+        )
+
+    async def get(self, address: str, key: str) -> str:
+        """Gets the value of a key-value pair in the contract.
+
+        Args:
+            address (str): The Ethereum address associated with the key-value pair
+            key (str): The key of the key-value pair to get
+
+        Returns:
+            value (str): The value of the key-value pair if it exists
+        """
+
+        if not key:
+            raise KVStoreClientError("Key can not be empty")
+        if not Web3.isAddress(address):
+            raise KVStoreClientError(f"Invalid address: {address}")
+        return await async_call(self.kvstore_contract.functions.get(address, key))
+
+    async def _handle_transaction(self, tx_name: str, tx) -> None:
+        """Sends a transaction and waits for it to be mined.
+
+        Args:
+            tx_name (str): Name of the transaction
+            tx (obj): Transaction object
+
+        Returns:
+            None
+        """
+
+        await async_handle_transaction(
+            self.w3,
+            tx_name,
+            tx,
+            KVStoreClientError,
+            self.account,
+            {"chainId": self.chain_id} if self.account else None,
+        )
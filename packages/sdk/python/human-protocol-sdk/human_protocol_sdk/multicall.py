@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+
+import json
+import logging
+import threading
+from typing import Any, List, Optional
+
+from human_protocol_sdk.utils import decode_call_result
+from web3 import Web3
+from web3._utils.request import make_post_request
+from web3.contract import ContractFunction
+from web3.providers.rpc import HTTPProvider
+from web3.types import BlockIdentifier
+
+LOG = logging.getLogger("human_protocol_sdk.multicall")
+
+# Multicall3 is deployed at the same address on most EVM chains
+# See https://github.com/mds1/multicall
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
+
+
+class MulticallError(Exception):
+    """
+    Raises when a call aggregated by the multicall fails.
+    """
+
+    pass
+
+
+class Multicall:
+    """
+    A class used to aggregate contract view calls into a single eth_call.
+
+    When the Multicall3 contract is not deployed on the network (e.g. a local
+    Hardhat node), the eth_calls are sent in a single JSON-RPC batch request,
+    or one by one if the provider or the node doesn't support batches, so
+    results are the same.
+    """
+
+    def __init__(self, w3: Web3, address: Optional[str] = MULTICALL3_ADDRESS):
+        """
+        Initializes a Multicall instance.
+
+        Args:
+            w3 (Web3): The Web3 object
+            address (Optional[str]): Address of the Multicall3 contract, calls are not aggregated if empty
+        """
+
+        self.w3 = w3
+        self.address = Web3.toChecksumAddress(address) if address else None
+        self._available = None if address else False
+        self._batch_available = isinstance(self.w3.provider, HTTPProvider)
+        self._lock = threading.Lock()
+        self.multicall_contract = (
+            self.w3.eth.contract(address=self.address, abi=MULTICALL3_ABI)
+            if self.address
+            else None
+        )
+
+    def is_available(self) -> bool:
+        """Checks if the Multicall3 contract is deployed.
+
+        The result is checked once and remembered.
+
+        Returns:
+            bool: True if calls can be aggregated, False otherwise
+        """
+
+        with self._lock:
+            if self._available is None:
+                self._available = len(self.w3.eth.get_code(self.address)) > 0
+                if not self._available:
+                    LOG.info(
+                        f"Multicall3 not deployed at {self.address}, calls won't be aggregated"
+                    )
+            return self._available
+
+    def is_aggregated(self) -> bool:
+        """Checks if calls are sent in a single request.
+
+        Returns:
+            bool: True if calls are aggregated by Multicall3 or sent in a JSON-RPC batch
+        """
+
+        return self.is_available() or self._batch_available
+
+    def call(
+        self,
+        calls: List[ContractFunction],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> List[Any]:
+        """Executes view calls, in a single request if possible.
+
+        Args:
+            calls (List[ContractFunction]): Contract functions with their arguments bound
+            block_identifier (BlockIdentifier): Block to read the state from
+
+        Returns:
+            List[Any]: Decoded result of each call, in order. A failed call is
+                returned as a MulticallError instead of raising, so the rest
+                of the results can still be used.
+        """
+
+        if not calls:
+            return []
+
+        if not self.is_available():
+            if self._batch_available:
+                results = self._call_batch(calls, block_identifier)
+                if results is not None:
+                    return results
+            return [self._call_one(call, block_identifier) for call in calls]
+
+        results = self.multicall_contract.functions.aggregate3(
+            [(call.address, True, call._encode_transaction_data()) for call in calls]
+        ).call(block_identifier=block_identifier)
+
+        return [
+            self._decode(call, return_data)
+            if success
+            else MulticallError(f"Call to {call.fn_name} reverted")
+            for call, (success, return_data) in zip(calls, results)
+        ]
+
+    def _call_batch(
+        self, calls: List[ContractFunction], block_identifier: BlockIdentifier
+    ) -> Optional[List[Any]]:
+        """Executes view calls in a single JSON-RPC batch request.
+
+        The batch is posted to the endpoint of the HTTP provider, so it
+        doesn't go through the middlewares of the Web3 instance.
+
+        Args:
+            calls (List[ContractFunction]): Contract functions with their arguments bound
+            block_identifier (BlockIdentifier): Block to read the state from
+
+        Returns:
+            Optional[List[Any]]: Decoded result or MulticallError of each call,
+                None if the node doesn't support batches
+        """
+
+        if isinstance(block_identifier, int):
+            block_identifier = hex(block_identifier)
+        elif isinstance(block_identifier, bytes):
+            block_identifier = {"blockHash": Web3.toHex(block_identifier)}
+
+        request_data = json.dumps(
+            [
+                {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "method": "eth_call",
+                    "params": [
+                        {
+                            "to": call.address,
+                            "data": call._encode_transaction_data(),
+                        },
+                        block_identifier,
+                    ],
+                }
+                for request_id, call in enumerate(calls)
+            ]
+        ).encode()
+        responses = json.loads(
+            make_post_request(
+                self.w3.provider.endpoint_uri,
+                request_data,
+                **self.w3.provider.get_request_kwargs(),
+            )
+        )
+        if not isinstance(responses, list):
+            LOG.info(
+                "JSON-RPC batch requests not supported by the node, calls won't be aggregated"
+            )
+            self._batch_available = False
+            return None
+
+        responses = {response.get("id"): response for response in responses}
+        results = []
+        for request_id, call in enumerate(calls):
+            response = responses.get(request_id, {})
+            if "result" in response:
+                results.append(
+                    self._decode(call, Web3.toBytes(hexstr=response["result"]))
+                )
+            else:
+                error = response.get("error", {}).get("message", "no response")
+                results.append(
+                    MulticallError(f"Call to {call.fn_name} failed: {error}")
+                )
+        return results
+
+    def _call_one(
+        self, call: ContractFunction, block_identifier: BlockIdentifier
+    ) -> Any:
+        """Executes a single view call.
+
+        Args:
+            call (ContractFunction): Contract function with its arguments bound
+            block_identifier (BlockIdentifier): Block to read the state from
+
+        Returns:
+            Any: Decoded result or MulticallError if the call failed
+        """
+
+        try:
+            return call.call(block_identifier=block_identifier)
+        except Exception as e:
+            return MulticallError(f"Call to {call.fn_name} failed: {e}")
+
+    def _decode(self, call: ContractFunction, return_data: bytes) -> Any:
+        """Decodes the data returned by a call the same way web3 does.
+
+        Args:
+            call (ContractFunction): Contract function that was called
+            return_data (bytes): Raw return data
+
+        Returns:
+            Any: Decoded result or MulticallError if it can't be decoded
+        """
+
+        try:
+            return decode_call_result(self.w3, call, return_data)
+        except Exception as e:
+            return MulticallError(f"Could not decode {call.fn_name} result: {e}")
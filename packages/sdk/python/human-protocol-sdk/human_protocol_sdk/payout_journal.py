@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+
+import json
+import logging
+import sqlite3
+import threading
+from decimal import Decimal
+from typing import List, Optional
+
+from human_protocol_sdk.constants import PayoutChunkStatus
+from human_protocol_sdk.escrow import PayoutChunk
+from web3 import Web3
+
+LOG = logging.getLogger("human_protocol_sdk.payout_journal")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS payouts (
+    escrow_address TEXT PRIMARY KEY,
+    final_results_url TEXT NOT NULL,
+    final_results_hash TEXT NOT NULL,
+    from_block INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    escrow_address TEXT NOT NULL REFERENCES payouts(escrow_address) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    tx_id TEXT NOT NULL,
+    recipients TEXT NOT NULL,
+    amounts TEXT NOT NULL,
+    status TEXT NOT NULL,
+    tx_hash TEXT,
+    error TEXT,
+    nonce INTEGER,
+    PRIMARY KEY (escrow_address, tx_id)
+);
+"""
+
+
+class PayoutJournalError(Exception):
+    """
+    Raises when some error happens when interacting with the payout journal.
+    """
+
+    pass
+
+
+class JournaledPayout:
+    """
+    A class used to hold a chunked payout loaded from the journal.
+    """
+
+    def __init__(
+        self,
+        escrow_address: str,
+        chunks: List[PayoutChunk],
+        final_results_url: str,
+        final_results_hash: str,
+        from_block: int,
+    ):
+        """
+        Initializes a JournaledPayout instance.
+
+        Args:
+            escrow_address (str): Address of the escrow
+            chunks (List[PayoutChunk]): Chunks of the payout, in order
+            final_results_url (str): Final results file url
+            final_results_hash (str): Final results file hash
+            from_block (int): Block number at the time the payout was planned
+        """
+
+        self.escrow_address = escrow_address
+        self.chunks = chunks
+        self.final_results_url = final_results_url
+        self.final_results_hash = final_results_hash
+        self.from_block = from_block
+
+
+class PayoutJournal:
+    """
+    A class used to durably record the progress of chunked payouts.
+
+    The journal is a SQLite database holding, for each escrow, the planned
+    chunks, the hashes of the submitted transactions and their final status.
+    Every update is committed right away, so the progress survives a crash.
+    The nonce of a chunk is recorded before its transaction is sent.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes a PayoutJournal instance.
+
+        Args:
+            path (str): Path of the SQLite database, it's created if it doesn't exist
+        """
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.executescript(SCHEMA)
+
+    def record_plan(
+        self,
+        escrow_address: str,
+        chunks: List[PayoutChunk],
+        final_results_url: str,
+        final_results_hash: str,
+        from_block: int,
+    ) -> None:
+        """Records the chunks planned for a payout.
+
+        A completed payout of the same escrow is replaced.
+
+        Args:
+            escrow_address (str): Address of the escrow
+            chunks (List[PayoutChunk]): Chunks of the payout, as returned by plan_bulk_payout
+            final_results_url (str): Final results file url
+            final_results_hash (str): Final results file hash
+            from_block (int): Block number before any chunk is submitted
+
+        Returns:
+            None
+
+        Raises:
+            PayoutJournalError: If the escrow has an unfinished payout in the journal
+        """
+
+        escrow_address = Web3.toChecksumAddress(escrow_address)
+        with self._lock, self._connection:
+            unfinished = self._connection.execute(
+                "SELECT COUNT(*) FROM chunks WHERE escrow_address = ? AND status != ?",
+                (escrow_address, PayoutChunkStatus.Confirmed.value),
+            ).fetchone()[0]
+            if unfinished:
+                raise PayoutJournalError(
+                    f"Escrow {escrow_address} has an unfinished payout in the journal"
+                )
+
+            self._connection.execute(
+                "DELETE FROM payouts WHERE escrow_address = ?", (escrow_address,)
+            )
+            self._connection.execute(
+                "INSERT INTO payouts VALUES (?, ?, ?, ?)",
+                (escrow_address, final_results_url, final_results_hash, from_block),
+            )
+            self._connection.executemany(
+                "INSERT INTO chunks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        escrow_address,
+                        position,
+                        str(chunk.tx_id),
+                        json.dumps(chunk.recipients),
+                        json.dumps([str(amount) for amount in chunk.amounts]),
+                        chunk.status.value,
+                        chunk.tx_hash,
+                        chunk.error,
+                        chunk.nonce,
+                    )
+                    for position, chunk in enumerate(chunks)
+                ],
+            )
+
+    def update_chunk(self, escrow_address: str, chunk: PayoutChunk) -> None:
+        """Records the status of a chunk.
+
+        Args:
+            escrow_address (str): Address of the escrow
+            chunk (PayoutChunk): Chunk of the payout
+
+        Returns:
+            None
+
+        Raises:
+            PayoutJournalError: If the chunk is not recorded in the journal
+        """
+
+        escrow_address = Web3.toChecksumAddress(escrow_address)
+        with self._lock, self._connection:
+            updated = self._connection.execute(
+                "UPDATE chunks SET status = ?, tx_hash = ?, error = ?, nonce = ? "
+                "WHERE escrow_address = ? AND tx_id = ?",
+                (
+                    chunk.status.value,
+                    chunk.tx_hash,
+                    chunk.error,
+                    chunk.nonce,
+                    escrow_address,
+                    str(chunk.tx_id),
+                ),
+            ).rowcount
+        if not updated:
+            raise PayoutJournalError(
+                f"Chunk {chunk.tx_id} of escrow {escrow_address} is not in the journal"
+            )
+
+    def load(self, escrow_address: str) -> Optional[JournaledPayout]:
+        """Loads the payout recorded for an escrow.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            Optional[JournaledPayout]: Recorded payout, None if there is none
+        """
+
+        escrow_address = Web3.toChecksumAddress(escrow_address)
+        with self._lock:
+            payout = self._connection.execute(
+                "SELECT final_results_url, final_results_hash, from_block "
+                "FROM payouts WHERE escrow_address = ?",
+                (escrow_address,),
+            ).fetchone()
+            if payout is None:
+                return None
+
+            rows = self._connection.execute(
+                "SELECT tx_id, recipients, amounts, status, tx_hash, error, nonce "
+                "FROM chunks WHERE escrow_address = ? ORDER BY position",
+                (escrow_address,),
+            ).fetchall()
+
+        chunks = [
+            PayoutChunk(
+                int(tx_id),
+                json.loads(recipients),
+                [int(Decimal(amount)) for amount in json.loads(amounts)],
+                PayoutChunkStatus(status),
+                tx_hash,
+                error,
+                nonce,
+            )
+            for tx_id, recipients, amounts, status, tx_hash, error, nonce in rows
+        ]
+        return JournaledPayout(escrow_address, chunks, *payout)
+
+    def discard(self, escrow_address: str) -> None:
+        """Removes the payout recorded for an escrow, so a new one can be planned.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            None
+
+        Raises:
+            PayoutJournalError: If a chunk of the payout may have been sent and still be
+                paid, i.e. it's unconfirmed and keeps its nonce. reconcile_bulk_payout
+                releases the nonces mined without paying.
+        """
+
+        escrow_address = Web3.toChecksumAddress(escrow_address)
+        with self._lock, self._connection:
+            submitted = self._connection.execute(
+                "SELECT COUNT(*) FROM chunks WHERE escrow_address = ? AND status != ? "
+                "AND (nonce IS NOT NULL OR status IN (?, ?))",
+                (
+                    escrow_address,
+                    PayoutChunkStatus.Confirmed.value,
+                    PayoutChunkStatus.Submitting.value,
+                    PayoutChunkStatus.Submitted.value,
+                ),
+            ).fetchone()[0]
+            if submitted:
+                raise PayoutJournalError(
+                    f"Escrow {escrow_address} has submitted chunks in the journal"
+                )
+
+            self._connection.execute(
+                "DELETE FROM payouts WHERE escrow_address = ?", (escrow_address,)
+            )
+
+    def close(self) -> None:
+        """Closes the database connection.
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._connection.close()
@@ -7,21 +7,35 @@ from decimal import Decimal
 from typing import List, Optional
 
 import web3
+from eth_account.signers.local import LocalAccount
 from web3 import Web3
 from web3.middleware import geth_poa_middleware
 
 from human_protocol_sdk.constants import ChainId, NETWORKS
 from human_protocol_sdk.utils import (
+    async_call,
+    async_get_chain_id,
+    async_get_data_from_subgraph,
+    async_handle_transaction,
+    get_async_contract,
     get_erc20_interface,
     get_factory_interface,
     get_staking_interface,
     get_reward_pool_interface,
     get_data_from_subgraph,
     handle_transaction,
+    SubgraphQuery,
 )
 
 GAS_LIMIT = int(os.getenv("GAS_LIMIT", 4712388))
 
+REWARDS_INFO_QUERY = SubgraphQuery(
+    "RewardsInfo",
+    {"slasher": "Bytes!"},
+    "rewardAddedEvents(where: {slasher: $slasher})",
+    "escrow amount",
+)
+
 LOG = logging.getLogger("human_protocol_sdk.staking")
 
 
@@ -391,13 +405,8 @@ class StakingClient:
 
         reward_added_events_data = get_data_from_subgraph(
             self.network["subgraph_url"],
-            """
-rewardAddedEvents(where:{{slasher:"{0}"}}) {{
-    escrow
-    amount
-}}""".format(
-                slasher
-            ),
+            REWARDS_INFO_QUERY,
+            variables={"slasher": slasher},
         )
         reward_added_events = reward_added_events_data["data"]["rewardAddedEvents"]
 
@@ -421,3 +430,399 @@ rewardAddedEvents(where:{{slasher:"{0}"}}) {{
 
         # TODO: Use Escrow/Job Module once implemented
         return self.factory_contract.functions.hasEscrow(escrow_address).call()
+
+
+class AsyncStakingClient:
+    """A class used to manage staking, and allocation on the HUMAN network, from asyncio code.
+
+    It has the same methods as StakingClient, as coroutines. Use create to
+    get an instance.
+    """
+
+    def __init__(self, w3: Web3, chain_id: int, account: Optional[LocalAccount] = None):
+        """Initializes an AsyncStaking instance
+
+        Args:
+            w3 (Web3): The Web3 object, with an async provider and the AsyncEth module
+            chain_id (int): Chain id of the network
+            account (Optional[LocalAccount]): Account to sign transactions with,
+                the default account of the node is used if not provided
+        """
+
+        self.w3 = w3
+        self.account = account
+
+        try:
+            self.network = NETWORKS[ChainId(chain_id)]
+        except:
+            raise StakingClientError(f"Invalid ChainId: {chain_id}")
+
+        if not self.network:
+            raise StakingClientError("Empty network configuration")
+        self.chain_id = chain_id
+
+        # Initialize contract instances
+        self.hmtoken_contract = get_async_contract(
+            self.w3, self.network["hmt_address"], get_erc20_interface()["abi"]
+        )
+        self.factory_contract = get_async_contract(
+            self.w3, self.network["factory_address"], get_factory_interface()["abi"]
+        )
+        self.staking_contract = get_async_contract(
+            self.w3, self.network["staking_address"], get_staking_interface()["abi"]
+        )
+        self.reward_pool_contract = get_async_contract(
+            self.w3,
+            self.network["reward_pool_address"],
+            get_reward_pool_interface()["abi"],
+        )
+
+    @classmethod
+    async def create(
+        cls, w3: Web3, account: Optional[LocalAccount] = None
+    ) -> "AsyncStakingClient":
+        """Creates an AsyncStakingClient for the network of the Web3 instance.
+
+        Args:
+            w3 (Web3): The Web3 object, with an async provider and the AsyncEth module
+            account (Optional[LocalAccount]): Account to sign transactions with
+
+        Returns:
+            AsyncStakingClient: The client
+        """
+
+        return cls(w3, await async_get_chain_id(w3), account)
+
+    async def approve_stake(self, amount: Decimal) -> None:
+        """Approves HMT token for Staking.
+
+        Args:
+            amount (Decimal): Amount to approve
+
+        Returns:
+            None
+
+        Validations:
+            - Amount must be greater than 0
+        """
+
+        if amount <= 0:
+            raise StakingClientError("Amount to approve must be greater than 0")
+
+        await self._handle_transaction(
+            "Approve stake",
+            self.hmtoken_contract.functions.approve(
+                self.network["staking_address"], amount
+            ),
+        )
+
+    async def stake(self, amount: Decimal) -> None:
+        """Stakes HMT token.
+
+        Args:
+            amount (Decimal): Amount to stake
+
+        Returns:
+            None
+
+        Validations:
+            - Amount must be greater than 0
+            - Amount must be less than or equal to the approved amount (on-chain)
+            - Amount must be less than or equal to the balance of the staker (on-chain)
+        """
+
+        if amount <= 0:
+            raise StakingClientError("Amount to stake must be greater than 0")
+
+        await self._handle_transaction(
+            "Stake HMT", self.staking_contract.functions.stake(amount)
+        )
+
+    async def allocate(self, escrow_address: str, amount: Decimal) -> None:
+        """Allocates HMT token to the escrow.
+
+        Args:
+            escrow_address (str): Address of the escrow
+            amount (Decimal): Amount to allocate
+
+        Returns:
+            None
+
+        Validations:
+            - Amount must be greater than 0
+            - Escrow address must be valid
+            - Amount must be less than or equal to the staked amount (on-chain)
+        """
+
+        if amount <= 0:
+            raise StakingClientError("Amount to allocate must be greater than 0")
+
+        if not await self._is_valid_escrow(escrow_address):
+            raise StakingClientError(f"Invalid escrow address: {escrow_address}")
+
+        await self._handle_transaction(
+            "Allocate HMT",
+            self.staking_contract.functions.allocate(escrow_address, amount),
+        )
+
+    async def close_allocation(self, escrow_address: str) -> None:
+        """Closes allocated HMT token from the escrow.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            None
+
+        Validations:
+            - Escrow address must be valid
+            - Escrow should be cancelled / completed (on-chain)
+        """
+
+        if not await self._is_valid_escrow(escrow_address):
+            raise StakingClientError(f"Invalid escrow address: {escrow_address}")
+
+        await self._handle_transaction(
+            "Close allocation",
+            self.staking_contract.functions.closeAllocation(escrow_address),
+        )
+
+    async def unstake(self, amount: Decimal) -> None:
+        """Unstakes HMT token.
+
+        Args:
+            amount (Decimal): Amount to unstake
+
+        Returns:
+            None
+
+        Validations:
+            - Amount must be greater than 0
+            - Amount must be less than or equal to the staked amount which is not locked / allocated (on-chain)
+        """
+
+        if amount <= 0:
+            raise StakingClientError("Amount to unstake must be greater than 0")
+
+        await self._handle_transaction(
+            "Unstake HMT", self.staking_contract.functions.unstake(amount)
+        )
+
+    async def withdraw(self) -> None:
+        """Withdraws HMT token.
+
+        Returns:
+            None
+
+        Validations:
+            - There must be unstaked tokens which is unlocked (on-chain)
+        """
+
+        await self._handle_transaction(
+            "Withdraw HMT", self.staking_contract.functions.withdraw()
+        )
+
+    async def slash(
+        self, slasher: str, staker: str, escrow_address: str, amount: Decimal
+    ) -> None:
+        """Slashes HMT token.
+
+        Args:
+            slasher (str): Address of the slasher
+            staker (str): Address of the staker
+            escrow_address (str): Address of the escrow
+            amount (Decimal): Amount to slash
+
+        Returns:
+            None
+
+        Validations:
+            - Amount must be greater than 0
+            - Amount must be less than or equal to the amount allocated to the escrow (on-chain)
+            - Escrow address must be valid
+        """
+
+        if amount <= 0:
+            raise StakingClientError("Amount to slash must be greater than 0")
+
+        if not await self._is_valid_escrow(escrow_address):
+            raise StakingClientError(f"Invalid escrow address: {escrow_address}")
+
+        await self._handle_transaction(
+            "Slash HMT",
+            self.staking_contract.functions.slash(
+                slasher, staker, escrow_address, amount
+            ),
+        )
+
+    async def distribute_reward(self, escrow_address: str) -> None:
+        """Pays out rewards to the slashers for the specified escrow address.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            None
+
+        Validations:
+            - Escrow address must be valid
+        """
+
+        if not await self._is_valid_escrow(escrow_address):
+            raise StakingClientError(f"Invalid escrow address: {escrow_address}")
+
+        await self._handle_transaction(
+            "Distribute reward",
+            self.reward_pool_contract.functions.distributeReward(escrow_address),
+        )
+
+    async def get_all_stakers_info(self) -> List[dict]:
+        """Gets all stakers of the protocol
+
+        Returns:
+            List[dict]: List of stakers info
+        """
+
+        [stakers, staker_info] = await async_call(
+            self.staking_contract.functions.getListOfStakers()
+        )
+
+        return [
+            {
+                "staker": stakers[i],
+                "tokens_staked": staker_info[i][0],
+                "tokens_allocated": staker_info[i][1],
+                "tokens_locked": staker_info[i][2],
+                "tokens_locked_until": staker_info[i][3],
+            }
+            for i in range(len(stakers))
+        ]
+
+    async def get_staker_info(
+        self, staker_address: Optional[str] = None
+    ) -> Optional[dict]:
+        """Gets the staker info.
+
+        Args:
+            staker_address (Optional[str]): Address of the staker, defaults to the client account
+
+        Returns:
+            Optional[dict]: Staker info if staker exists, otherwise None
+        """
+
+        if not staker_address:
+            staker_address = (
+                self.account.address if self.account else self.w3.eth.default_account
+            )
+
+        [
+            tokens_staked,
+            tokens_allocated,
+            tokens_locked,
+            tokens_locked_until,
+        ] = await async_call(self.staking_contract.functions.getStaker(staker_address))
+
+        if (
+            tokens_staked == 0
+            and tokens_allocated == 0
+            and tokens_locked == 0
+            and tokens_locked_until == 0
+        ):
+            return None
+
+        return {
+            "tokens_staked": tokens_staked,
+            "tokens_allocated": tokens_allocated,
+            "tokens_locked": tokens_locked,
+            "tokens_locked_until": tokens_locked_until,
+        }
+
+    async def get_allocation(self, escrow_address: str) -> Optional[dict]:
+        """Gets the allocation info for the specified escrow.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            Optional[dict]: Allocation info if escrow exists, otherwise None
+        """
+
+        [
+            escrow_address,
+            staker,
+            tokens,
+            created_at,
+            closed_at,
+        ] = await async_call(
+            self.staking_contract.functions.getAllocation(escrow_address)
+        )
+
+        if escrow_address == web3.constants.ADDRESS_ZERO:
+            return None
+
+        return {
+            "escrow_address": escrow_address,
+            "staker": staker,
+            "tokens": tokens,
+            "created_at": created_at,
+            "closed_at": closed_at,
+        }
+
+    async def get_rewards_info(self, slasher: str) -> List[dict]:
+        """Get rewards of the given slasher
+
+        Args:
+            slasher (str): Address of the slasher
+
+        Returns:
+            List[dict]: List of rewards info
+        """
+
+        reward_added_events_data = await async_get_data_from_subgraph(
+            self.network["subgraph_url"],
+            REWARDS_INFO_QUERY,
+            variables={"slasher": slasher},
+        )
+        reward_added_events = reward_added_events_data["data"]["rewardAddedEvents"]
+
+        return [
+            {
+                "escrow_address": reward_added_events[i]["escrow"],
+                "amount": reward_added_events[i]["amount"],
+            }
+            for i in range(len(reward_added_events))
+        ]
+
+    async def _handle_transaction(self, tx_name: str, tx) -> None:
+        """Sends a transaction and waits for it to be mined.
+
+        Args:
+            tx_name (str): Name of the transaction
+            tx (obj): Transaction object
+
+        Returns:
+            None
+        """
+
+        await async_handle_transaction(
+            self.w3,
+            tx_name,
+            tx,
+            StakingClientError,
+            self.account,
+            {"chainId": self.chain_id} if self.account else None,
+        )
+
+    async def _is_valid_escrow(self, escrow_address: str) -> bool:
+        """Checks if the escrow address is valid.
+
+        Args:
+            escrow_address (str): Address of the escrow
+
+        Returns:
+            bool: True if the escrow address is valid, False otherwise
+        """
+
+        return await async_call(
+            self.factory_contract.functions.hasEscrow(escrow_address)
+        )
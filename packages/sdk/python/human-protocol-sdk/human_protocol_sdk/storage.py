@@ -3,10 +3,29 @@ import io
 import json
 import logging
 import os
-from typing import List, Optional
+import re
+import sqlite3
+import tempfile
+import uuid
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import requests
 from minio import Minio
+from minio.commonconfig import ComposeSource
+from minio.error import ServerError
 from validators import url as URL
 
 logging.getLogger("minio").setLevel(logging.INFO)
@@ -15,6 +34,42 @@ DEBUG = "true" in os.getenv("DEBUG", "false").lower()
 LOG = logging.getLogger("human_protocol_sdk.storage")
 LOG.setLevel(logging.DEBUG if DEBUG else logging.INFO)
 
+# Number of objects downloaded at the same time. Minio keeps up to 10
+# connections per host, larger values open connections that aren't reused.
+STORAGE_MAX_WORKERS = int(os.getenv("STORAGE_MAX_WORKERS", 10))
+# Number of times a download is retried after a transient error
+STORAGE_RETRIES = int(os.getenv("STORAGE_RETRIES", 3))
+# Seconds to wait before the first retry, doubled for every next one
+STORAGE_RETRY_BACKOFF = float(os.getenv("STORAGE_RETRY_BACKOFF", 0.5))
+# Size in bytes of the chunks streamed files are read in
+STORAGE_CHUNK_SIZE = int(os.getenv("STORAGE_CHUNK_SIZE", 1024 * 1024))
+# Size in bytes of the parts of streamed uploads, S3 requires at least 5 MB
+STORAGE_PART_SIZE = int(os.getenv("STORAGE_PART_SIZE", 16 * 1024 * 1024))
+# Number of parts of a streamed upload sent at the same time
+STORAGE_PARALLEL_PARTS = int(os.getenv("STORAGE_PARALLEL_PARTS", 4))
+# Prefix of the keys streamed uploads are written to before their hash is known
+STORAGE_UPLOAD_PREFIX = os.getenv("STORAGE_UPLOAD_PREFIX", ".uploads/")
+# Seconds a listing of the dedup index is trusted before listing again
+STORAGE_DEDUP_MAX_AGE = float(os.getenv("STORAGE_DEDUP_MAX_AGE", 300))
+# Number of hash characters of the key prefixes the dedup index lists,
+# 1 lists the bucket in 16 parts refreshed independently, 2 in 256
+STORAGE_DEDUP_PREFIX_LENGTH = int(os.getenv("STORAGE_DEDUP_PREFIX_LENGTH", 1))
+# Maximum size in bytes of the files kept by a StorageDiskCache
+STORAGE_CACHE_SIZE = int(os.getenv("STORAGE_CACHE_SIZE", 1024 * 1024 * 1024))
+# Seconds a cached file is served before being revalidated with the server
+STORAGE_CACHE_MAX_AGE = float(os.getenv("STORAGE_CACHE_MAX_AGE", 60))
+# Content-addressed keys as uploaded by StorageClient, their content never changes
+STORAGE_CONTENT_KEY_PATTERN = re.compile(r"(^|/)s3[0-9a-f]{40}(\.[^/]*)?$")
+# S3 error codes that won't change on retry
+STORAGE_PERMANENT_ERRORS = (
+    "NoSuchKey",
+    "NoSuchBucket",
+    "AccessDenied",
+    "InvalidAccessKeyId",
+    "SignatureDoesNotMatch",
+    "InvalidBucketName",
+)
+
 
 class StorageClientError(Exception):
     """
@@ -56,6 +111,693 @@ class Credentials:
         self.secret_key = secret_key
 
 
+class _HashingReader(io.RawIOBase):
+    """
+    Read-only stream over a file-like object or an iterable of bytes that
+    computes the SHA-1 of the data as it is read.
+    """
+
+    def __init__(self, source: Union[BinaryIO, Iterable[bytes]]):
+        self.sha1 = hashlib.sha1()
+        self.size = 0
+        if hasattr(source, "read"):
+            self._file = source
+            self._chunks = None
+        else:
+            self._file = None
+            self._chunks = iter(source)
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if self._file is not None:
+            data = self._file.read(size)
+        else:
+            data = self._read_chunks(size)
+        self.sha1.update(data)
+        self.size += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def _read_chunks(self, size: int) -> bytes:
+        parts = [self._pending]
+        length = len(self._pending)
+        while size < 0 or length < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            parts.append(chunk)
+            length += len(chunk)
+        data = b"".join(parts)
+        if size < 0:
+            size = len(data)
+        self._pending = data[size:]
+        return data[:size]
+
+
+class StorageDedupIndex:
+    """
+    Set of content-addressed keys (s3{hash}...) known to exist in buckets.
+
+    Keys are listed by prefix, s3 followed by the first prefix_length
+    characters of the hash, so a lookup only lists the part of the bucket
+    it falls in. A listing is trusted for max_age seconds: until then,
+    a key that isn't in the index is considered missing without any
+    request. Keys uploaded by the client are added as they are uploaded.
+
+    When a path is given, keys are stored in a SQLite database, so the
+    index doesn't have to be listed again after a restart.
+
+    Attributes:
+        max_age (float): Seconds a listing is trusted
+        prefix_length (int): Number of hash characters of the listed prefixes
+        hits (int): Number of lookups of a key in the index
+        misses (int): Number of lookups of a key not in the index
+        listings (int): Number of prefixes listed
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS objects (
+        bucket TEXT NOT NULL,
+        key TEXT NOT NULL,
+        PRIMARY KEY (bucket, key)
+    );
+    CREATE TABLE IF NOT EXISTS listings (
+        bucket TEXT NOT NULL,
+        prefix TEXT NOT NULL,
+        listed_at REAL NOT NULL,
+        PRIMARY KEY (bucket, prefix)
+    );
+    """
+
+    def __init__(
+        self,
+        max_age: float = STORAGE_DEDUP_MAX_AGE,
+        prefix_length: int = STORAGE_DEDUP_PREFIX_LENGTH,
+        path: Optional[str] = None,
+    ):
+        """
+        Initializes a StorageDedupIndex instance.
+
+        Args:
+            max_age (float): Seconds a listing is trusted before listing again
+            prefix_length (int): Number of hash characters of the listed prefixes
+            path (Optional[str]): Path of the SQLite database, keys are only kept in memory if not provided
+        """
+        self.max_age = max_age
+        self.prefix_length = prefix_length
+        self._keys: Dict[Tuple[str, str], set] = {}
+        self._listed_at: Dict[Tuple[str, str], float] = {}
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.listings = 0
+
+        self._connection = None
+        if path:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.executescript(self.SCHEMA)
+
+    def prefix(self, key: str) -> Optional[str]:
+        """
+        Gets the prefix a key is listed with.
+
+        Args:
+            key (str): Key of a file
+
+        Returns:
+            Optional[str]: The prefix, None if the key is not content-addressed
+        """
+        if not key.startswith("s3") or len(key) <= 2 + self.prefix_length:
+            return None
+        return key[: 2 + self.prefix_length]
+
+    def prefixes(self) -> List[str]:
+        """
+        Gets all the prefixes content-addressed keys are listed with.
+
+        Returns:
+            List[str]: The prefixes
+        """
+        return [
+            f"s3{i:0{self.prefix_length}x}" for i in range(16**self.prefix_length)
+        ]
+
+    def is_stale(self, bucket: str, prefix: str) -> bool:
+        """
+        Checks if a prefix must be listed before it can be trusted.
+
+        Args:
+            bucket (str): The name of the bucket
+            prefix (str): Prefix of the keys
+
+        Returns:
+            bool: True if the prefix was never listed or more than max_age seconds ago
+        """
+        listed_at = self._listed_at.get((bucket, prefix))
+        if listed_at is None and self._connection is not None:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT listed_at FROM listings WHERE bucket = ? AND prefix = ?",
+                    (bucket, prefix),
+                ).fetchone()
+            if row is not None:
+                listed_at = self._listed_at[(bucket, prefix)] = row[0]
+        return listed_at is None or time.time() - listed_at >= self.max_age
+
+    def lock(self, bucket: str, prefix: str) -> threading.Lock:
+        """
+        Gets the lock held while a prefix is listed, so it's listed once.
+
+        Args:
+            bucket (str): The name of the bucket
+            prefix (str): Prefix of the keys
+
+        Returns:
+            threading.Lock: The lock
+        """
+        with self._lock:
+            return self._locks.setdefault((bucket, prefix), threading.Lock())
+
+    def refresh(
+        self, bucket: str, prefix: str, keys: Iterable[str], listed_at: float
+    ) -> None:
+        """
+        Replaces the keys of a prefix with a new listing.
+
+        Args:
+            bucket (str): The name of the bucket
+            prefix (str): Prefix of the keys
+            keys (Iterable[str]): Keys of the prefix in the bucket
+            listed_at (float): Time the listing started at
+
+        Returns:
+            None
+        """
+        if self._connection is not None:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "DELETE FROM objects WHERE bucket = ? AND key >= ? AND key < ?",
+                    (bucket, prefix, prefix + "\uffff"),
+                )
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO objects VALUES (?, ?)",
+                    ((bucket, key) for key in keys),
+                )
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO listings VALUES (?, ?, ?)",
+                    (bucket, prefix, listed_at),
+                )
+        else:
+            keys = set(keys)
+            with self._lock:
+                self._keys[(bucket, prefix)] = keys
+        with self._lock:
+            self._listed_at[(bucket, prefix)] = listed_at
+            self.listings += 1
+
+    def contains(self, bucket: str, key: str) -> bool:
+        """
+        Checks if a key is in the index.
+
+        Args:
+            bucket (str): The name of the bucket
+            key (str): Key of the file
+
+        Returns:
+            bool: True if the key is known to exist in the bucket
+        """
+        with self._lock:
+            if self._connection is not None:
+                found = (
+                    self._connection.execute(
+                        "SELECT 1 FROM objects WHERE bucket = ? AND key = ?",
+                        (bucket, key),
+                    ).fetchone()
+                    is not None
+                )
+            else:
+                found = key in self._keys.get((bucket, self.prefix(key)), ())
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return found
+
+    def add(self, bucket: str, key: str) -> None:
+        """
+        Adds a key uploaded to the bucket.
+
+        Args:
+            bucket (str): The name of the bucket
+            key (str): Key of the file
+
+        Returns:
+            None
+        """
+        prefix = self.prefix(key)
+        if prefix is None:
+            return
+        with self._lock:
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute(
+                        "INSERT OR IGNORE INTO objects VALUES (?, ?)", (bucket, key)
+                    )
+            else:
+                self._keys.setdefault((bucket, prefix), set()).add(key)
+
+    def clear(self) -> None:
+        """
+        Removes all keys, every prefix will be listed again.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._keys.clear()
+            self._listed_at.clear()
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute("DELETE FROM objects")
+                    self._connection.execute("DELETE FROM listings")
+
+    def info(self) -> dict:
+        """
+        Gets statistics of the index.
+
+        Returns:
+            dict: Number of hits, misses and listings, and the hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "listings": self.listings,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        """
+        Closes the SQLite database, if any.
+
+        Returns:
+            None
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class StorageCacheEntry:
+    """
+    A class used to hold a cached file.
+    """
+
+    def __init__(self, key: str, etag: Optional[str], hash: str, stored_at: float):
+        """
+        Initializes a StorageCacheEntry instance.
+
+        Args:
+            key (str): URL of the file
+            etag (Optional[str]): ETag the server returned with the file
+            hash (str): SHA-256 of the content, name of the cached file
+            stored_at (float): Unix time the file was downloaded or last revalidated
+        """
+        self.key = key
+        self.etag = etag
+        self.hash = hash
+        self.stored_at = stored_at
+
+
+class StorageDiskCache:
+    """
+    Size-bounded LRU cache of downloaded files on disk.
+
+    Files are keyed by URL and stored once per content, under their SHA-256,
+    so the same file at different URLs takes space once. They're served
+    without any request for max_age seconds, then revalidated with their
+    ETag: the server only sends the file again if it changed. Files with
+    content-addressed keys (s3{hash}) are never revalidated.
+
+    Files are written to a temporary file and renamed, and the index is a
+    SQLite database, so several processes can share the same directory.
+
+    Attributes:
+        path (str): Directory of the cache
+        max_size (int): Maximum size of the cached files in bytes
+        max_age (float): Seconds a file is served without revalidation
+        hits (int): Number of files served without request
+        revalidations (int): Number of files served after the server answered not modified
+        misses (int): Number of files downloaded
+        evictions (int): Number of files removed to stay under max_size
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS entries (
+        key TEXT PRIMARY KEY,
+        etag TEXT,
+        hash TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        stored_at REAL NOT NULL,
+        used_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS entries_used_at ON entries (used_at);
+    CREATE INDEX IF NOT EXISTS entries_hash ON entries (hash);
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = STORAGE_CACHE_SIZE,
+        max_age: float = STORAGE_CACHE_MAX_AGE,
+    ):
+        """
+        Initializes a StorageDiskCache instance.
+
+        Args:
+            path (str): Directory of the cache, created if it doesn't exist
+            max_size (int): Maximum size of the cached files in bytes
+            max_age (float): Seconds a file is served without revalidation
+        """
+        self.path = path
+        self.max_size = max_size
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(os.path.join(path, "objects"), exist_ok=True)
+        self._connection = sqlite3.connect(
+            os.path.join(path, "index.db"), timeout=30, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.executescript(self.SCHEMA)
+
+    @staticmethod
+    def is_immutable(key: str) -> bool:
+        """
+        Checks if a file has a content-addressed key, so it can't change.
+
+        Args:
+            key (str): URL of the file
+
+        Returns:
+            bool: True if the key is s3{hash}, with an optional extension
+        """
+        return STORAGE_CONTENT_KEY_PATTERN.search(key) is not None
+
+    def get(self, key: str) -> Optional[StorageCacheEntry]:
+        """
+        Gets a cached file, fresh or not.
+
+        Args:
+            key (str): URL of the file
+
+        Returns:
+            Optional[StorageCacheEntry]: The cached file, None if there is none
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT etag, hash, stored_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        return StorageCacheEntry(key, *row) if row is not None else None
+
+    def is_fresh(self, entry: StorageCacheEntry) -> bool:
+        """
+        Checks if a file can be served without revalidation.
+
+        Args:
+            entry (StorageCacheEntry): Cached file
+
+        Returns:
+            bool: True if the key is immutable or the file was stored or revalidated less than max_age seconds ago
+        """
+        return (
+            self.is_immutable(entry.key) or time.time() - entry.stored_at < self.max_age
+        )
+
+    def read(self, entry: StorageCacheEntry) -> Optional[bytes]:
+        """
+        Reads the content of a cached file and marks it as recently used.
+
+        Args:
+            entry (StorageCacheEntry): Cached file
+
+        Returns:
+            Optional[bytes]: The content, None if the file was evicted meanwhile
+        """
+        try:
+            with open(self._object_path(entry.hash), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE entries SET used_at = ? WHERE key = ?", (time.time(), entry.key)
+            )
+        return data
+
+    def put(self, key: str, data: bytes, etag: Optional[str] = None) -> None:
+        """
+        Stores a downloaded file, evicting the least recently used ones if needed.
+
+        Args:
+            key (str): URL of the file
+            data (bytes): Content of the file
+            etag (Optional[str]): ETag the server returned with the file
+
+        Returns:
+            None
+        """
+        if len(data) > self.max_size:
+            return
+        hash = hashlib.sha256(data).hexdigest()
+        path = self._object_path(hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (key, etag, hash, len(data), now, now),
+            )
+            self._evict()
+
+    def revalidate(self, entry: StorageCacheEntry) -> None:
+        """
+        Marks a file as fresh after the server answered it wasn't modified.
+
+        Args:
+            entry (StorageCacheEntry): Cached file
+
+        Returns:
+            None
+        """
+        entry.stored_at = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE entries SET stored_at = ? WHERE key = ?",
+                (entry.stored_at, entry.key),
+            )
+
+    def record(self, result: str) -> None:
+        """
+        Records the result of a lookup.
+
+        Args:
+            result (str): "hit", "revalidation" or "miss"
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if result == "hit":
+                self.hits += 1
+            elif result == "revalidation":
+                self.revalidations += 1
+            else:
+                self.misses += 1
+
+    def size(self) -> int:
+        """
+        Gets the size of the cached files.
+
+        Returns:
+            int: Size in bytes, files with the same content are counted once
+        """
+        with self._lock:
+            return self._size()
+
+    def info(self) -> dict:
+        """
+        Gets statistics of the cache.
+
+        Returns:
+            dict: Number of hits, revalidations, misses and evictions, hit rate and size in bytes
+        """
+        size = self.size()
+        with self._lock:
+            lookups = self.hits + self.revalidations + self.misses
+            return {
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.revalidations) / lookups
+                if lookups
+                else 0.0,
+                "size": size,
+            }
+
+    def clear(self) -> None:
+        """
+        Removes all the files and resets the counters.
+
+        Returns:
+            None
+        """
+        with self._lock, self._connection:
+            for (hash,) in self._connection.execute(
+                "SELECT DISTINCT hash FROM entries"
+            ).fetchall():
+                self._remove_object(hash)
+            self._connection.execute("DELETE FROM entries")
+            self.hits = 0
+            self.revalidations = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def close(self) -> None:
+        """
+        Closes the SQLite database.
+
+        Returns:
+            None
+        """
+        self._connection.close()
+
+    def _size(self) -> int:
+        return self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM "
+            "(SELECT MAX(size) AS size FROM entries GROUP BY hash)"
+        ).fetchone()[0]
+
+    def _evict(self) -> None:
+        """Removes the least recently used files until the cache fits in max_size."""
+        size = self._size()
+        if size <= self.max_size:
+            return
+        for key, hash, entry_size in self._connection.execute(
+            "SELECT key, hash, size FROM entries ORDER BY used_at"
+        ).fetchall():
+            self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.evictions += 1
+            shared = self._connection.execute(
+                "SELECT 1 FROM entries WHERE hash = ? LIMIT 1", (hash,)
+            ).fetchone()
+            if shared is None:
+                self._remove_object(hash)
+                size -= entry_size
+                if size <= self.max_size:
+                    return
+
+    def _object_path(self, hash: str) -> str:
+        return os.path.join(self.path, "objects", hash[:2], hash)
+
+    def _remove_object(self, hash: str) -> None:
+        try:
+            os.unlink(self._object_path(hash))
+        except FileNotFoundError:
+            pass
+
+
+_STORAGE_CACHE: Optional[StorageDiskCache] = None
+
+
+def set_storage_cache(cache: Optional[StorageDiskCache]) -> None:
+    """
+    Sets the cache used by every StorageClient download of the process.
+
+    Args:
+        cache (Optional[StorageDiskCache]): The cache, None to disable caching
+
+    Returns:
+        None
+    """
+    global _STORAGE_CACHE
+    _STORAGE_CACHE = cache
+
+
+def get_storage_cache() -> Optional[StorageDiskCache]:
+    """
+    Gets the cache used by StorageClient downloads.
+
+    Returns:
+        Optional[StorageDiskCache]: The cache, None if caching is disabled
+    """
+    return _STORAGE_CACHE
+
+
+def _cached_download(
+    key: str, fetch: Callable[[Optional[str]], Tuple[Optional[bytes], Optional[str]]]
+) -> bytes:
+    """
+    Downloads a file through the storage cache, if one is set.
+
+    Args:
+        key (str): URL of the file
+        fetch (Callable): Downloads the file, given the ETag of the cached file or None.
+                          Returns its content and ETag, or None if it wasn't modified.
+
+    Returns:
+        bytes: The content of the file
+    """
+    cache = get_storage_cache()
+    if cache is None:
+        return fetch(None)[0]
+
+    entry = cache.get(key)
+    if entry is not None and cache.is_fresh(entry):
+        data = cache.read(entry)
+        if data is not None:
+            cache.record("hit")
+            return data
+
+    data, etag = fetch(entry.etag if entry is not None else None)
+    if data is None:
+        data = cache.read(entry)
+        if data is not None:
+            cache.revalidate(entry)
+            cache.record("revalidation")
+            return data
+        # Evicted by another process in the meantime
+        data, etag = fetch(None)
+
+    cache.record("miss")
+    cache.put(key, data, etag)
+    return data
+
+
 class StorageClient:
     """
     A class for downloading files from an S3-compatible service.
@@ -66,9 +808,12 @@ class StorageClient:
         credentials (Optional[Credentials]): The credentials required to authenticate with the S3-compatible service.
                                              Defaults to None for anonymous access.
         secure (Optional[bool]): Flag to indicate to use secure (TLS) connection to S3 service or not. Defaults to True.
+        dedup_index (Optional[StorageDedupIndex]): Index of the files in the buckets, used instead of a request
+                                                   to check if a file was already uploaded. Defaults to None.
 
     Attributes:
         client (Minio): The S3-compatible client used for interacting with the service.
+        dedup_index (Optional[StorageDedupIndex]): Index of the files in the buckets.
 
     Example:
         # Download a list of files from an S3-compatible service
@@ -86,6 +831,7 @@ class StorageClient:
         region: Optional[str] = None,
         credentials: Optional[Credentials] = None,
         secure: Optional[bool] = True,
+        dedup_index: Optional[StorageDedupIndex] = None,
     ):
         """
         Initializes the StorageClient with the given endpoint_url, region, and credentials.
@@ -98,6 +844,8 @@ class StorageClient:
             credentials (Optional[Credentials]): The credentials required to authenticate with the S3-compatible service.
                                                  Defaults to None for anonymous access.
             secure (Optional[bool]): Flag to indicate to use secure (TLS) connection to S3 service or not. Defaults to True.
+            dedup_index (Optional[StorageDedupIndex]): Index of the files in the buckets, used instead of a request
+                                                       to check if a file was already uploaded. Defaults to None.
         """
         try:
             self.client = (
@@ -117,6 +865,7 @@ class StorageClient:
             )
             self.endpoint = endpoint_url
             self.secure = secure
+            self.dedup_index = dedup_index
         except Exception as e:
             LOG.error(f"Connection with S3 failed because of: {e}")
             raise e
@@ -138,104 +887,753 @@ class StorageClient:
         if not URL(url):
             raise StorageClientError(f"Invalid URL: {url}")
 
-        try:
-            response = requests.get(url)
+        def fetch(etag: Optional[str]) -> Tuple[Optional[bytes], Optional[str]]:
+            if etag:
+                response = requests.get(url, headers={"If-None-Match": etag})
+                if response.status_code == 304:
+                    return None, None
+            else:
+                response = requests.get(url)
             response.raise_for_status()
 
-            return response.content
+            return response.content, response.headers.get("ETag")
+
+        try:
+            return _cached_download(url, fetch)
+        except Exception as e:
+            raise StorageClientError(str(e))
+
+    @staticmethod
+    def stream_file_from_url(
+        url: str, chunk_size: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """
+        Downloads a file from the specified URL chunk by chunk.
+
+        The connection is released when the iterator is exhausted or closed.
+
+        Args:
+            url (str): The URL of the file to download.
+            chunk_size (Optional[int]): Maximum size of a chunk in bytes. Defaults to STORAGE_CHUNK_SIZE.
+
+        Returns:
+            Iterator[bytes]: Chunks of the file content.
+
+        Raises:
+            StorageClientError: If an error occurs while downloading the file.
+        """
+        if not URL(url):
+            raise StorageClientError(f"Invalid URL: {url}")
+
+        try:
+            with requests.get(url, stream=True) as response:
+                response.raise_for_status()
+                yield from response.iter_content(chunk_size or STORAGE_CHUNK_SIZE)
         except Exception as e:
             raise StorageClientError(str(e))
 
-    def download_files(self, files: List[str], bucket: str) -> List[bytes]:
+    def download_files(
+        self,
+        files: List[str],
+        bucket: str,
+        max_workers: Optional[int] = None,
+        retries: Optional[int] = None,
+        fail_fast: Optional[bool] = True,
+    ) -> List[Union[bytes, StorageClientError]]:
         """
         Downloads a list of files from the specified S3-compatible bucket.
 
+        Files are downloaded concurrently and each download is retried on
+        transient errors (e.g. connection resets, SlowDown).
+
         Args:
             files (list[str]): A list of file keys to download.
             bucket (str): The name of the S3-compatible bucket to download from.
+            max_workers (Optional[int]): Maximum number of files downloaded at the same time.
+                                         Defaults to STORAGE_MAX_WORKERS, 1 downloads files one by one.
+            retries (Optional[int]): Number of retries of a failed download. Defaults to STORAGE_RETRIES.
+            fail_fast (Optional[bool]): Raise on the first failed download and cancel the rest.
+                                        If False, all files are downloaded and a failed one is returned
+                                        as a StorageClientError instead of its content. Defaults to True.
 
         Returns:
-            list: A list of file contents (bytes) downloaded from the bucket.
+            list: A list of file contents (bytes) downloaded from the bucket, in the order of files.
 
         Raises:
             StorageClientError: If an error occurs while downloading the files.
             StorageFileNotFoundError: If one of the specified files is not found in the bucket.
         """
-        result_files = []
-        for file in files:
+        max_workers = max_workers or STORAGE_MAX_WORKERS
+        retries = STORAGE_RETRIES if retries is None else retries
+
+        if max_workers <= 1 or len(files) <= 1:
+            result_files = []
+            for file in files:
+                try:
+                    result_files.append(self._download_file(bucket, file, retries))
+                except StorageClientError as e:
+                    if fail_fast:
+                        raise e
+                    result_files.append(e)
+            return result_files
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(files)),
+            thread_name_prefix="storage-download",
+        ) as executor:
+            cancelled = threading.Event()
+            futures = [
+                executor.submit(self._download_file, bucket, file, retries, cancelled)
+                for file in files
+            ]
+            if fail_fast:
+                done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+                cancelled.set()
+                for future in not_done:
+                    future.cancel()
+                # Raise the error of the first file that failed, in order
+                for future in futures:
+                    if future in done and future.exception():
+                        raise future.exception()
+                return [future.result() for future in futures]
+
+            return [
+                future.exception() if future.exception() else future.result()
+                for future in futures
+            ]
+
+    def _download_file(
+        self,
+        bucket: str,
+        file: str,
+        retries: int,
+        cancelled: Optional[threading.Event] = None,
+    ) -> bytes:
+        """
+        Downloads a file from the bucket through the storage cache, if one is set.
+
+        Args:
+            bucket (str): The name of the S3-compatible bucket to download from.
+            file (str): Key of the file to download.
+            retries (int): Number of retries of a failed download.
+            cancelled (Optional[threading.Event]): Stops retrying once set.
+
+        Returns:
+            bytes: The content of the file.
+
+        Raises:
+            StorageClientError: If an error occurs while downloading the file.
+            StorageFileNotFoundError: If the file is not found in the bucket.
+        """
+        return _cached_download(
+            self._object_url(bucket, file),
+            lambda etag: self._get_object(bucket, file, retries, cancelled, etag),
+        )
+
+    def _get_object(
+        self,
+        bucket: str,
+        file: str,
+        retries: int,
+        cancelled: Optional[threading.Event] = None,
+        etag: Optional[str] = None,
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Downloads a file from the bucket, retrying on transient errors.
+
+        Args:
+            bucket (str): The name of the S3-compatible bucket to download from.
+            file (str): Key of the file to download.
+            retries (int): Number of retries of a failed download.
+            cancelled (Optional[threading.Event]): Stops retrying once set.
+            etag (Optional[str]): Only download the file if its ETag is different.
+
+        Returns:
+            tuple: The content of the file and its ETag, None if the ETag matched.
+
+        Raises:
+            StorageClientError: If an error occurs while downloading the file.
+            StorageFileNotFoundError: If the file is not found in the bucket.
+        """
+        kwargs = {"request_headers": {"If-None-Match": etag}} if etag else {}
+        attempt = 0
+        while True:
+            response = None
             try:
-                response = self.client.get_object(bucket_name=bucket, object_name=file)
-                result_files.append(response.read())
+                response = self.client.get_object(
+                    bucket_name=bucket, object_name=file, **kwargs
+                )
+                return response.read(), response.headers.get("ETag")
+            except ServerError as e:
+                if e.status_code == 304:
+                    return None, None
+                self._wait_retry(e, file, attempt, retries, cancelled)
+                attempt += 1
             except Exception as e:
-                if hasattr(e, "code") and str(e.code) == "NoSuchKey":
-                    raise StorageFileNotFoundError("No object found - returning empty")
-                LOG.warning(
-                    f"Reading the key {file} with S3 failed" f" because of: {str(e)}"
+                self._wait_retry(e, file, attempt, retries, cancelled)
+                attempt += 1
+            finally:
+                if response is not None:
+                    response.close()
+                    response.release_conn()
+
+    def stream_file(
+        self,
+        file: str,
+        bucket: str,
+        chunk_size: Optional[int] = None,
+        retries: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        """
+        Downloads a file from the specified S3-compatible bucket chunk by chunk.
+
+        If the connection breaks, the download resumes from the last chunk.
+        The connection is released when the iterator is exhausted or closed.
+
+        Args:
+            file (str): Key of the file to download.
+            bucket (str): The name of the S3-compatible bucket to download from.
+            chunk_size (Optional[int]): Maximum size of a chunk in bytes. Defaults to STORAGE_CHUNK_SIZE.
+            retries (Optional[int]): Number of retries of a failed download. Defaults to STORAGE_RETRIES.
+
+        Returns:
+            Iterator[bytes]: Chunks of the file content.
+
+        Raises:
+            StorageClientError: If an error occurs while downloading the file.
+            StorageFileNotFoundError: If the file is not found in the bucket.
+
+        Example:
+            with open("dataset.zip", "wb") as f:
+                for chunk in client.stream_file("dataset.zip", "my-bucket"):
+                    f.write(chunk)
+        """
+        chunk_size = chunk_size or STORAGE_CHUNK_SIZE
+        retries = STORAGE_RETRIES if retries is None else retries
+
+        offset = 0
+        attempt = 0
+        while True:
+            response = None
+            try:
+                response = self.client.get_object(
+                    bucket_name=bucket, object_name=file, offset=offset
                 )
-                raise StorageClientError(str(e))
-        return result_files
+                for chunk in response.stream(chunk_size):
+                    offset += len(chunk)
+                    yield chunk
+                return
+            except Exception as e:
+                self._wait_retry(e, file, attempt, retries)
+                attempt += 1
+            finally:
+                if response is not None:
+                    response.close()
+                    response.release_conn()
 
-    def upload_files(self, files: List[object], bucket: str) -> List[str]:
+    def download_file_to_path(
+        self,
+        file: str,
+        bucket: str,
+        path: str,
+        chunk_size: Optional[int] = None,
+    ) -> int:
+        """
+        Downloads a file from the specified S3-compatible bucket to a local path.
+
+        The file is written chunk by chunk next to the path and moved there
+        once complete, so the path never has a partial file.
+
+        Args:
+            file (str): Key of the file to download.
+            bucket (str): The name of the S3-compatible bucket to download from.
+            path (str): Local path to write the file to.
+            chunk_size (Optional[int]): Maximum size of a chunk in bytes. Defaults to STORAGE_CHUNK_SIZE.
+
+        Returns:
+            int: Size of the file in bytes.
+
+        Raises:
+            StorageClientError: If an error occurs while downloading the file.
+            StorageFileNotFoundError: If the file is not found in the bucket.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".download-")
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in self.stream_file(file, bucket, chunk_size):
+                    f.write(chunk)
+                    size += len(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return size
+
+    def download_file_into(
+        self,
+        file: str,
+        bucket: str,
+        buffer: Union[bytearray, memoryview],
+        chunk_size: Optional[int] = None,
+    ) -> int:
+        """
+        Downloads a file from the specified S3-compatible bucket into a preallocated buffer.
+
+        Args:
+            file (str): Key of the file to download.
+            bucket (str): The name of the S3-compatible bucket to download from.
+            buffer (Union[bytearray, memoryview]): Writable buffer, at least as big as the file.
+            chunk_size (Optional[int]): Maximum size of a chunk in bytes. Defaults to STORAGE_CHUNK_SIZE.
+
+        Returns:
+            int: Size of the file in bytes, the file content is buffer[:size].
+
+        Raises:
+            StorageClientError: If an error occurs while downloading the file,
+                                or the file doesn't fit in the buffer.
+            StorageFileNotFoundError: If the file is not found in the bucket.
+        """
+        view = memoryview(buffer).cast("B")
+        size = 0
+        chunks = self.stream_file(file, bucket, chunk_size)
+        try:
+            for chunk in chunks:
+                if size + len(chunk) > len(view):
+                    raise StorageClientError(
+                        f"The key {file} doesn't fit in a buffer of {len(view)} bytes"
+                    )
+                view[size : size + len(chunk)] = chunk
+                size += len(chunk)
+        finally:
+            chunks.close()
+        return size
+
+    def _wait_retry(
+        self,
+        e: Exception,
+        file: str,
+        attempt: int,
+        retries: int,
+        cancelled: Optional[threading.Event] = None,
+    ) -> None:
+        """
+        Waits before retrying to read a file, or raises if the error can't be retried.
+
+        Args:
+            e (Exception): Error of the last attempt.
+            file (str): Key of the file.
+            attempt (int): Number of the last attempt, starting from 0.
+            retries (int): Number of retries of a failed download.
+            cancelled (Optional[threading.Event]): Stops retrying once set.
+
+        Raises:
+            StorageClientError: If the file can't be read.
+            StorageFileNotFoundError: If the file is not found in the bucket.
+        """
+        code = str(getattr(e, "code", ""))
+        if code == "NoSuchKey":
+            raise StorageFileNotFoundError("No object found - returning empty")
+        if (
+            attempt >= retries
+            or code in STORAGE_PERMANENT_ERRORS
+            or (cancelled is not None and cancelled.is_set())
+        ):
+            LOG.warning(
+                f"Reading the key {file} with S3 failed" f" because of: {str(e)}"
+            )
+            raise StorageClientError(str(e))
+        LOG.debug(f"Retrying to read the key {file} because of: {str(e)}")
+        time.sleep(STORAGE_RETRY_BACKOFF * 2**attempt)
+
+    def upload_files(
+        self,
+        files: List[object],
+        bucket: str,
+        max_workers: Optional[int] = None,
+    ) -> List[dict]:
         """
         Uploads a list of files to the specified S3-compatible bucket.
 
+        Files are serialized and hashed while previous ones are being checked
+        and uploaded. A file is only uploaded if its key is not in the bucket yet.
+
         Args:
             files (list[object]): A list of files to upload.
             bucket (str): The name of the S3-compatible bucket to upload to.
+            max_workers (Optional[int]): Maximum number of files checked and uploaded at the same time.
+                                         Defaults to STORAGE_MAX_WORKERS, 1 uploads files one by one.
 
         Returns:
-            list: A list of keys assigned to the uploaded files.
+            list: A list of dicts with the key, url and hash of each file, in the order of files.
 
         Raises:
             StorageClientError: If an error occurs while uploading the files.
         """
+        max_workers = max_workers or STORAGE_MAX_WORKERS
+
+        if max_workers <= 1 or len(files) <= 1:
+            result_files = []
+            for file in files:
+                data, result_file = self._serialize_file(file, bucket)
+                self._upload_file(bucket, result_file["key"], data)
+                result_files.append(result_file)
+            return result_files
+
+        # Bounds the serialized files waiting to be uploaded
+        pending = threading.BoundedSemaphore(max_workers * 2)
+        failed = threading.Event()
+
+        def on_done(future):
+            if not future.cancelled() and future.exception():
+                failed.set()
+            pending.release()
+
+        futures = {}
         result_files = []
-        for file in files:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(files)),
+            thread_name_prefix="storage-upload",
+        ) as executor:
             try:
-                artifact = json.dumps(file, sort_keys=True)
-            except Exception as e:
-                LOG.error("Can't extract the json from the object")
-                raise e
-
-            data = artifact.encode("utf-8")
-            hash = hashlib.sha1(data).hexdigest()
-            key = f"s3{hash}.json"
-            url = (
-                f"{'https' if self.secure else 'http'}://{self.endpoint}/{bucket}/{key}"
+                for file in files:
+                    if failed.is_set():
+                        break
+                    data, result_file = self._serialize_file(file, bucket)
+                    result_files.append(result_file)
+                    key = result_file["key"]
+                    if key in futures:
+                        # Same content earlier in the list
+                        continue
+                    pending.acquire()
+                    futures[key] = executor.submit(self._upload_file, bucket, key, data)
+                    futures[key].add_done_callback(on_done)
+                wait(futures.values(), return_when=FIRST_EXCEPTION)
+            finally:
+                # Only files not started yet are cancelled
+                for future in futures.values():
+                    future.cancel()
+
+        for future in futures.values():
+            if not future.cancelled() and future.exception():
+                raise future.exception()
+
+        return result_files
+
+    def _serialize_file(self, file: object, bucket: str) -> Tuple[bytes, dict]:
+        """
+        Serializes a file to JSON and computes its key.
+
+        Args:
+            file (object): File to serialize.
+            bucket (str): The name of the S3-compatible bucket the file is uploaded to.
+
+        Returns:
+            tuple: The serialized file and a dict with its key, url and hash.
+        """
+        try:
+            artifact = json.dumps(file, sort_keys=True)
+        except Exception as e:
+            LOG.error("Can't extract the json from the object")
+            raise e
+
+        data = artifact.encode("utf-8")
+        hash = hashlib.sha1(data).hexdigest()
+
+        return data, self._upload_result(bucket, f"s3{hash}.json", hash)
+
+    def _upload_file(self, bucket: str, key: str, data: bytes) -> None:
+        """
+        Uploads a file to the bucket, unless its key already exists.
+
+        Args:
+            bucket (str): The name of the S3-compatible bucket to upload to.
+            key (str): Key of the file.
+            data (bytes): Content of the file.
+
+        Raises:
+            StorageClientError: If an error occurs while uploading the file.
+        """
+        # check if file with same hash already exists in bucket
+        if self._object_exists(bucket, key):
+            return
+
+        # file does not exist in bucket, so upload it
+        try:
+            self.client.put_object(
+                bucket_name=bucket,
+                object_name=key,
+                data=io.BytesIO(data),
+                length=len(data),
             )
-            file_exist = None
+            LOG.debug(f"Uploaded to S3, key: {key}")
+        except Exception as e:
+            raise StorageClientError(str(e))
+        if self.dedup_index is not None:
+            self.dedup_index.add(bucket, key)
 
-            try:
-                # check if file with same hash already exists in bucket
-                file_exist = self.client.stat_object(
-                    bucket_name=bucket, object_name=key
+    def upload_stream(
+        self,
+        data: Union[str, os.PathLike, BinaryIO, Iterable[bytes]],
+        bucket: str,
+        key: Optional[str] = None,
+        extension: Optional[str] = "",
+        content_type: Optional[str] = "application/octet-stream",
+        part_size: Optional[int] = None,
+        parallel_parts: Optional[int] = None,
+    ) -> dict:
+        """
+        Uploads a large file to the specified S3-compatible bucket without loading it in memory.
+
+        The file is sent in multipart parts uploaded in parallel and its SHA-1
+        is computed while it is read. Memory used is about
+        (parallel_parts + 1) * part_size, whatever the size of the file.
+
+        Without a key, the file is stored under s3{hash}{extension} like
+        upload_files does. A local file is hashed first and not uploaded if the
+        key already exists. Other data is uploaded under STORAGE_UPLOAD_PREFIX
+        and copied to its key on the server once the hash is known.
+
+        Args:
+            data (Union[str, os.PathLike, BinaryIO, Iterable[bytes]]): Path of a local file,
+                binary file-like object or iterable of bytes chunks to upload.
+            bucket (str): The name of the S3-compatible bucket to upload to.
+            key (Optional[str]): Key to upload the file to. Defaults to the hash of the file.
+            extension (Optional[str]): Extension added to the hash when no key is given, e.g. ".zip".
+            content_type (Optional[str]): Content type of the file.
+            part_size (Optional[int]): Size of the parts in bytes. Defaults to STORAGE_PART_SIZE.
+            parallel_parts (Optional[int]): Number of parts sent at the same time.
+                                            Defaults to STORAGE_PARALLEL_PARTS.
+
+        Returns:
+            dict: The key, url and hash of the uploaded file.
+
+        Raises:
+            StorageClientError: If an error occurs while uploading the file.
+
+        Example:
+            result = client.upload_stream("results.zip", bucket="my-bucket", extension=".zip")
+        """
+        part_size = part_size or STORAGE_PART_SIZE
+        parallel_parts = parallel_parts or STORAGE_PARALLEL_PARTS
+
+        if isinstance(data, (str, os.PathLike)):
+            if key is None:
+                with open(data, "rb") as f:
+                    hash = _HashingReader(f)
+                    while hash.read(part_size):
+                        pass
+                key = f"s3{hash.sha1.hexdigest()}{extension}"
+                if self._object_exists(bucket, key):
+                    return self._upload_result(bucket, key, hash.sha1.hexdigest())
+            with open(data, "rb") as f:
+                return self._put_stream(
+                    _HashingReader(f),
+                    bucket,
+                    key,
+                    content_type,
+                    os.path.getsize(data),
+                    part_size,
+                    parallel_parts,
                 )
+
+        reader = _HashingReader(data)
+        if key is not None:
+            return self._put_stream(
+                reader, bucket, key, content_type, -1, part_size, parallel_parts
+            )
+
+        upload_key = f"{STORAGE_UPLOAD_PREFIX}{uuid.uuid4().hex}"
+        try:
+            self._put_stream(
+                reader, bucket, upload_key, content_type, -1, part_size, parallel_parts
+            )
+            hash = reader.sha1.hexdigest()
+            key = f"s3{hash}{extension}"
+            if not self._object_exists(bucket, key):
+                self.client.compose_object(
+                    bucket_name=bucket,
+                    object_name=key,
+                    sources=[ComposeSource(bucket, upload_key)],
+                )
+                LOG.debug(f"Uploaded to S3, key: {key}")
+                if self.dedup_index is not None:
+                    self.dedup_index.add(bucket, key)
+        except StorageClientError as e:
+            raise e
+        except Exception as e:
+            raise StorageClientError(str(e))
+        finally:
+            try:
+                self.client.remove_object(bucket_name=bucket, object_name=upload_key)
             except Exception as e:
-                if e.code == "NoSuchKey":
-                    # file does not exist in bucket, so upload it
-                    pass
-                else:
-                    LOG.warning(
-                        f"Reading the key {key} in S3 failed" f" because of: {str(e)}"
-                    )
-                    raise StorageClientError(str(e))
+                LOG.warning(
+                    f"Removing the key {upload_key} in S3 failed"
+                    f" because of: {str(e)}"
+                )
+
+        return self._upload_result(bucket, key, hash)
 
-            if not file_exist:
-                # file does not exist in bucket, so upload it
+    def _put_stream(
+        self,
+        reader: _HashingReader,
+        bucket: str,
+        key: str,
+        content_type: str,
+        length: int,
+        part_size: int,
+        parallel_parts: int,
+    ) -> dict:
+        """
+        Uploads a stream to the bucket in multipart parts.
+
+        Args:
+            reader (_HashingReader): Stream to upload.
+            bucket (str): The name of the S3-compatible bucket to upload to.
+            key (str): Key to upload the stream to.
+            content_type (str): Content type of the file.
+            length (int): Size of the stream, -1 if unknown.
+            part_size (int): Size of the parts in bytes.
+            parallel_parts (int): Number of parts sent at the same time.
+
+        Returns:
+            dict: The key, url and hash of the uploaded file.
+
+        Raises:
+            StorageClientError: If an error occurs while uploading the stream.
+        """
+        try:
+            self.client.put_object(
+                bucket_name=bucket,
+                object_name=key,
+                data=reader,
+                length=length,
+                content_type=content_type,
+                part_size=part_size,
+                num_parallel_uploads=parallel_parts,
+            )
+            LOG.debug(f"Uploaded to S3, key: {key}, size: {reader.size}")
+        except Exception as e:
+            LOG.warning(f"Uploading the key {key} to S3 failed because of: {str(e)}")
+            raise StorageClientError(str(e))
+        if self.dedup_index is not None:
+            self.dedup_index.add(bucket, key)
+
+        return self._upload_result(bucket, key, reader.sha1.hexdigest())
+
+    def _upload_result(self, bucket: str, key: str, hash: str) -> dict:
+        """
+        Builds the record returned for an uploaded file.
+
+        Args:
+            bucket (str): The name of the S3-compatible bucket.
+            key (str): Key of the file.
+            hash (str): SHA-1 of the file.
+
+        Returns:
+            dict: The key, url and hash of the file.
+        """
+        return {"key": key, "url": self._object_url(bucket, key), "hash": hash}
+
+    def _object_url(self, bucket: str, key: str) -> str:
+        """
+        Builds the URL of a file.
+
+        Args:
+            bucket (str): The name of the S3-compatible bucket.
+            key (str): Key of the file.
+
+        Returns:
+            str: The URL of the file.
+        """
+        return f"{'https' if self.secure else 'http'}://{self.endpoint}/{bucket}/{key}"
+
+    def _object_exists(self, bucket: str, key: str) -> bool:
+        """
+        Checks if a key exists in the bucket.
+
+        Content-addressed keys are looked up in the dedup index if the client
+        has one, listing their prefix first if it's stale.
+
+        Args:
+            bucket (str): The name of the S3-compatible bucket.
+            key (str): Key of the file.
+
+        Returns:
+            bool: True if the key exists, False otherwise.
+
+        Raises:
+            StorageClientError: If an error occurs while checking the key.
+        """
+        prefix = self.dedup_index.prefix(key) if self.dedup_index else None
+        if prefix is not None:
+            if self.dedup_index.is_stale(bucket, prefix):
+                self.refresh_dedup_index(bucket, [prefix])
+            return self.dedup_index.contains(bucket, key)
+
+        try:
+            self.client.stat_object(bucket_name=bucket, object_name=key)
+            return True
+        except Exception as e:
+            if getattr(e, "code", None) == "NoSuchKey":
+                return False
+            LOG.warning(f"Reading the key {key} in S3 failed because of: {str(e)}")
+            raise StorageClientError(str(e))
+
+    def refresh_dedup_index(
+        self, bucket: str, prefixes: Optional[List[str]] = None
+    ) -> None:
+        """
+        Lists the stale prefixes of a bucket into the dedup index.
+
+        Prefixes are listed concurrently, up to STORAGE_MAX_WORKERS at a time.
+        Call it before a large upload to list the whole bucket at once.
+
+        Args:
+            bucket (str): The name of the S3-compatible bucket.
+            prefixes (Optional[List[str]]): Prefixes to list. Defaults to all of them.
+
+        Returns:
+            None
+
+        Raises:
+            StorageClientError: If there is no dedup index or an error occurs while listing.
+        """
+        if self.dedup_index is None:
+            raise StorageClientError("StorageClient has no dedup index")
+
+        def list_prefix(prefix: str) -> None:
+            with self.dedup_index.lock(bucket, prefix):
+                # Another thread may have listed it while waiting for the lock
+                if not self.dedup_index.is_stale(bucket, prefix):
+                    return
+                listed_at = time.time()
                 try:
-                    self.client.put_object(
-                        bucket_name=bucket,
-                        object_name=key,
-                        data=io.BytesIO(data),
-                        length=len(data),
-                    )
-                    LOG.debug(f"Uploaded to S3, key: {key}")
+                    keys = [
+                        obj.object_name
+                        for obj in self.client.list_objects(
+                            bucket_name=bucket, prefix=prefix
+                        )
+                    ]
                 except Exception as e:
+                    LOG.warning(
+                        f"Listing {prefix} objects in S3 failed because of: {str(e)}"
+                    )
                     raise StorageClientError(str(e))
+                self.dedup_index.refresh(bucket, prefix, keys, listed_at)
+                LOG.debug(f"Listed {len(keys)} {prefix} objects of bucket {bucket}")
 
-            result_files.append({"key": key, "url": url, "hash": hash})
-
-        return result_files
+        prefixes = self.dedup_index.prefixes() if prefixes is None else prefixes
+        if len(prefixes) == 1:
+            list_prefix(prefixes[0])
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(STORAGE_MAX_WORKERS, len(prefixes)),
+            thread_name_prefix="storage-list",
+        ) as executor:
+            for future in [executor.submit(list_prefix, p) for p in prefixes]:
+                future.result()
 
     def bucket_exists(self, bucket: str) -> bool:
         """
@@ -1,17 +1,66 @@
+import asyncio
+import copy
+import hashlib
 import json
 import logging
+import os
+import re
+import sqlite3
+import threading
 import time
-from typing import Tuple, Optional
-
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from eth_account.signers.local import LocalAccount
+from eth_utils import is_checksum_address
+from hexbytes import HexBytes
+from urllib3.util.retry import Retry
 from web3 import Web3
-from web3.contract import Contract
-from web3.types import TxReceipt
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.method_formatters import receipt_formatter
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3._utils.validation import validate_address
+from web3.contract import Contract, ContractFunction
+from web3.exceptions import TransactionNotFound
+from web3.types import BlockIdentifier, ChecksumAddress, TxParams, TxReceipt
 
 from human_protocol_sdk.constants import ARTIFACTS_FOLDER
 
 logger = logging.getLogger("human_protocol_sdk.utils")
 
+# The Graph doesn't return more than 1000 entities per query
+SUBGRAPH_MAX_PAGE_SIZE = 1000
+SUBGRAPH_PAGE_SIZE = int(os.getenv("SUBGRAPH_PAGE_SIZE", SUBGRAPH_MAX_PAGE_SIZE))
+SUBGRAPH_TIMEOUT = float(os.getenv("SUBGRAPH_TIMEOUT", 30))
+SUBGRAPH_POOL_SIZE = int(os.getenv("SUBGRAPH_POOL_SIZE", 10))
+SUBGRAPH_RETRIES = int(os.getenv("SUBGRAPH_RETRIES", 3))
+SUBGRAPH_RETRY_BACKOFF = 0.5
+SUBGRAPH_RETRY_STATUSES = (429, 500, 502, 503, 504)
+SUBGRAPH_CACHE_SIZE = int(os.getenv("SUBGRAPH_CACHE_SIZE", 1024))
+SUBGRAPH_CACHE_TTL = float(os.getenv("SUBGRAPH_CACHE_TTL", 15))
+# Block indexed by the subgraph, used to know when cached responses are outdated
+SUBGRAPH_BLOCK_FIELD = " _meta { block { number } } "
+SUBGRAPH_HEAD_QUERY = "{" + SUBGRAPH_BLOCK_FIELD + "}"
+SUBGRAPH_VARIABLE_PATTERN = re.compile(r"\$(\w+)")
+SUBGRAPH_BATCH_CACHE_SIZE = 128
+
 
 def with_retry(fn, retries=3, delay=5, backoff=2):
     """Retry a function
@@ -99,9 +148,157 @@ def parse_transfer_transaction(
     return hmt_transferred and tx_balance is not None, tx_balance
 
 
+class LRUCache:
+    """Thread-safe mapping with a bounded size and least-recently-used eviction.
+
+    Attributes:
+        max_size (int): Maximum number of entries kept
+        hits (int): Number of lookups that found an entry
+        misses (int): Number of lookups that did not find an entry
+    """
+
+    def __init__(self, max_size: int):
+        if max_size <= 0:
+            raise ValueError("Cache size must be greater than 0")
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the entry for the key and marks it as recently used.
+
+        Args:
+            key (Hashable): Key of the entry
+            default (Any): Value returned when there is no entry
+
+        Returns:
+            Any: Cached value or default
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Stores an entry, evicting the least recently used one if full.
+
+        Args:
+            key (Hashable): Key of the entry
+            value (Any): Value to store
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Removes the entry for the key.
+
+        Args:
+            key (Hashable): Key of the entry
+            default (Any): Value returned when there is no entry
+
+        Returns:
+            Any: Removed value or default
+        """
+        with self._lock:
+            return self._entries.pop(key, default)
+
+    def clear(self) -> None:
+        """Removes all the entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class InterfaceCache:
+    """Process-wide cache of contract interfaces.
+
+    Each artifact file is parsed once; only the fields needed to build a
+    contract instance are kept in memory, bytecode and debug data are dropped.
+
+    Attributes:
+        hits (int): Number of lookups served from the cache
+        misses (int): Number of lookups that loaded the artifact from disk
+    """
+
+    KEPT_FIELDS = ("contractName", "sourceName", "abi")
+
+    def __init__(self):
+        self._interfaces: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, contract_entrypoint: str) -> dict:
+        """Returns the interface stored in the given artifact, loading it if needed.
+
+        Args:
+            contract_entrypoint (str): Path of the artifact JSON
+
+        Returns:
+            dict: Contract interface containing the contract abi
+        """
+        with self._lock:
+            contract_interface = self._interfaces.get(contract_entrypoint)
+            if contract_interface is not None:
+                self.hits += 1
+                return contract_interface
+
+            with open(contract_entrypoint) as f:
+                artifact = json.load(f)
+            contract_interface = {
+                field: artifact[field]
+                for field in self.KEPT_FIELDS
+                if field in artifact
+            }
+            self._interfaces[contract_entrypoint] = contract_interface
+            self.misses += 1
+            return contract_interface
+
+    def clear(self) -> None:
+        """Drops all cached interfaces and resets the counters."""
+        with self._lock:
+            self._interfaces.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict:
+        """Returns the cache statistics.
+
+        Returns:
+            dict: Number of hits, misses and cached interfaces
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._interfaces),
+            }
+
+
+INTERFACE_CACHE = InterfaceCache()
+
+
 def get_contract_interface(contract_entrypoint):
     """Retrieve the contract interface of a given contract.
 
+    The interface is loaded once per process and shared by all callers,
+    so it must not be modified.
+
     Args:
         contract_entrypoint: the entrypoint of the JSON.
 
@@ -109,9 +306,7 @@ def get_contract_interface(contract_entrypoint):
         returns the contract interface containing the contract abi.
 
     """
-    with open(contract_entrypoint) as f:
-        contract_interface = json.load(f)
-    return contract_interface
+    return INTERFACE_CACHE.get(contract_entrypoint)
 
 
 def get_erc20_interface():
@@ -194,8 +389,744 @@ def get_kvstore_interface():
     )
 
 
-def get_data_from_subgraph(url: str, query: str):
-    request = requests.post(url, json={"query": query})
+class SubgraphMetrics:
+    """Process-wide latency statistics of subgraph queries.
+
+    Attributes:
+        queries (int): Number of queries sent
+        failures (int): Number of queries without a successful response
+        total_latency (float): Sum of the query latencies, in seconds
+        max_latency (float): Highest query latency, in seconds
+        callback (Optional[Callable[[str, float, Optional[int]], None]]): Called with
+            the url, latency in seconds and HTTP status, None on connection errors,
+            of every query
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.callback = None
+        self.clear()
+
+    def record(self, url: str, latency: float, status: Optional[int]) -> None:
+        """Records a query.
+
+        Args:
+            url (str): Subgraph url
+            latency (float): Time to get the response, retries included, in seconds
+            status (Optional[int]): HTTP status, None if no response was received
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self.queries += 1
+            if status != 200:
+                self.failures += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+        if self.callback:
+            self.callback(url, latency, status)
+
+    def clear(self) -> None:
+        """Resets the counters."""
+        with self._lock:
+            self.queries = 0
+            self.failures = 0
+            self.total_latency = 0.0
+            self.max_latency = 0.0
+
+    def info(self) -> dict:
+        """Returns the query statistics.
+
+        Returns:
+            dict: Number of queries and failures, average and maximum latency in seconds
+        """
+        with self._lock:
+            return {
+                "queries": self.queries,
+                "failures": self.failures,
+                "average_latency": self.total_latency / self.queries
+                if self.queries
+                else 0.0,
+                "max_latency": self.max_latency,
+            }
+
+
+SUBGRAPH_METRICS = SubgraphMetrics()
+
+
+class SubgraphCacheEntry:
+    """
+    A class used to hold a cached subgraph response.
+    """
+
+    def __init__(self, data: dict, block: int, stored_at: float):
+        """
+        Initializes a SubgraphCacheEntry instance.
+
+        Args:
+            data (dict): Response of the query
+            block (int): Subgraph block the response was indexed at
+            stored_at (float): Unix time the response was received or last revalidated
+        """
+
+        self.data = data
+        self.block = block
+        self.stored_at = stored_at
+
+
+class SubgraphCache:
+    """TTL and LRU cache of subgraph responses.
+
+    Responses are keyed by subgraph url, normalized query and variables, and
+    stored with the block the subgraph had indexed. They're served without
+    any request for ttl seconds. Afterwards, the indexed head block is read
+    with a _meta query, once per subgraph and ttl period, and responses of
+    the same block are served again: they can only change when the head moves.
+
+    When a path is given, responses are also stored in a SQLite database,
+    so the cache survives restarts.
+
+    Attributes:
+        ttl (float): Seconds a response is served without checking the head block
+        hits (int): Number of lookups served from the cache
+        misses (int): Number of lookups that needed a query
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS responses (
+        key TEXT PRIMARY KEY,
+        data TEXT NOT NULL,
+        block INTEGER NOT NULL,
+        stored_at REAL NOT NULL,
+        used_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at);
+    """
+
+    def __init__(
+        self,
+        max_size: int = SUBGRAPH_CACHE_SIZE,
+        ttl: float = SUBGRAPH_CACHE_TTL,
+        path: Optional[str] = None,
+    ):
+        """
+        Initializes a SubgraphCache instance.
+
+        Args:
+            max_size (int): Maximum number of responses kept
+            ttl (float): Seconds a response is served without checking the head block
+            path (Optional[str]): Path of the SQLite database, responses are only kept in memory if not provided
+        """
+
+        self.ttl = ttl
+        self._entries = LRUCache(max_size)
+        self._head_blocks: Dict[str, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self._connection = None
+        if path:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.executescript(self.SCHEMA)
+
+    @staticmethod
+    def key(url: str, query: str, variables: Optional[dict] = None) -> str:
+        """Builds the cache key of a query.
+
+        Args:
+            url (str): Subgraph url
+            query (str): GraphQL query, whitespace is not significant
+            variables (Optional[dict]): Variables of the query
+
+        Returns:
+            str: The key
+        """
+
+        return "\n".join(
+            (
+                url,
+                " ".join(query.split()),
+                json.dumps(variables, sort_keys=True, separators=(",", ":")),
+            )
+        )
+
+    def get(self, key: str) -> Optional[SubgraphCacheEntry]:
+        """Gets a cached response, expired or not.
+
+        Args:
+            key (str): Key of the query
+
+        Returns:
+            Optional[SubgraphCacheEntry]: The cached response, None if there is none
+        """
+
+        entry = self._entries.get(key)
+        if entry is None and self._connection is not None:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT data, block, stored_at FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None:
+                    self._connection.execute(
+                        "UPDATE responses SET used_at = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+                    self._connection.commit()
+            if row is not None:
+                entry = SubgraphCacheEntry(json.loads(row[0]), row[1], row[2])
+                self._entries.put(key, entry)
+        return entry
+
+    def is_fresh(self, entry: SubgraphCacheEntry) -> bool:
+        """Checks if a response can be served without checking the head block.
+
+        Args:
+            entry (SubgraphCacheEntry): Cached response
+
+        Returns:
+            bool: True if the response was stored or revalidated less than ttl seconds ago
+        """
+
+        return time.time() - entry.stored_at < self.ttl
+
+    def put(self, key: str, data: dict, block: int) -> None:
+        """Stores a copy of a response.
+
+        Args:
+            key (str): Key of the query
+            data (dict): Response of the query
+            block (int): Subgraph block the response was indexed at
+
+        Returns:
+            None
+        """
+
+        now = time.time()
+        # The caller keeps the response, it may modify it
+        self._entries.put(key, SubgraphCacheEntry(copy.deepcopy(data), block, now))
+        if self._connection is not None:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (key, json.dumps(data), block, now, now),
+                )
+                self._connection.execute(
+                    "DELETE FROM responses WHERE key NOT IN "
+                    "(SELECT key FROM responses ORDER BY used_at DESC LIMIT ?)",
+                    (self._entries.max_size,),
+                )
+
+    def revalidate(self, key: str, entry: SubgraphCacheEntry) -> None:
+        """Marks a response as checked against the current head block.
+
+        Args:
+            key (str): Key of the query
+            entry (SubgraphCacheEntry): Cached response
+
+        Returns:
+            None
+        """
+
+        entry.stored_at = time.time()
+        if self._connection is not None:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "UPDATE responses SET stored_at = ? WHERE key = ?",
+                    (entry.stored_at, key),
+                )
+
+    def get_head_block(self, url: str) -> Optional[int]:
+        """Gets the head block of a subgraph read less than ttl seconds ago.
+
+        Args:
+            url (str): Subgraph url
+
+        Returns:
+            Optional[int]: The block number, None if it has to be read again
+        """
+
+        with self._lock:
+            block, checked_at = self._head_blocks.get(url, (None, 0))
+        return block if time.time() - checked_at < self.ttl else None
+
+    def set_head_block(self, url: str, block: int) -> None:
+        """Remembers the head block of a subgraph.
+
+        Args:
+            url (str): Subgraph url
+            block (int): Block number indexed by the subgraph
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._head_blocks[url] = (block, time.time())
+
+    def record(self, hit: bool) -> None:
+        """Counts a lookup.
+
+        Args:
+            hit (bool): True if the lookup was served from the cache
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def clear(self) -> None:
+        """Drops all cached responses and resets the counters."""
+        self._entries.clear()
+        with self._lock:
+            self._head_blocks.clear()
+            self.hits = 0
+            self.misses = 0
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute("DELETE FROM responses")
+
+    def info(self) -> dict:
+        """Returns the cache statistics.
+
+        Returns:
+            dict: Number of hits, misses and responses kept in memory
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
+
+    def close(self) -> None:
+        """Closes the database connection.
+
+        Returns:
+            None
+        """
+
+        if self._connection is not None:
+            with self._lock:
+                self._connection.close()
+
+
+_SUBGRAPH_CACHE: Optional[SubgraphCache] = None
+
+
+def set_subgraph_cache(cache: Optional[SubgraphCache]) -> None:
+    """Sets the cache used by every subgraph query of the process.
+
+    Args:
+        cache (Optional[SubgraphCache]): The cache, None to disable caching
+
+    Returns:
+        None
+    """
+
+    global _SUBGRAPH_CACHE
+    _SUBGRAPH_CACHE = cache
+
+
+def get_subgraph_cache() -> Optional[SubgraphCache]:
+    """Gets the cache used by subgraph queries.
+
+    Returns:
+        Optional[SubgraphCache]: The cache, None if caching is disabled
+    """
+
+    return _SUBGRAPH_CACHE
+
+
+class SubgraphQuery:
+    """
+    A class used to hold a precompiled GraphQL query with a single root field.
+
+    The document is built once and values are passed as GraphQL variables,
+    so the same document is sent every time: responses can be cached by
+    document id, and queries can be batched in a single request.
+
+    Attributes:
+        name (str): Name of the operation
+        entity (str): Name of the root field, the key of its data in the response
+        document (str): GraphQL document sent to the subgraph
+        id (str): SHA-256 of the document
+    """
+
+    def __init__(
+        self, name: str, variables: Dict[str, str], field: str, selection: str
+    ):
+        """
+        Initializes a SubgraphQuery instance.
+
+        Args:
+            name (str): Name of the operation
+            variables (Dict[str, str]): GraphQL type of each variable, by name
+            field (str): Root field with its arguments, referencing the variables as $name
+            selection (str): Fields selected on the root field
+        """
+
+        self.name = name
+        self.variables = variables
+        self.field = field
+        self.selection = selection
+        self.entity = field.split("(")[0].strip()
+        self.document = "query {0}{1} {{ {2} {{ {3} }} }}".format(
+            name,
+            "({0})".format(
+                ", ".join(f"${name}: {type}" for name, type in variables.items())
+            )
+            if variables
+            else "",
+            field,
+            selection,
+        )
+        self.id = hashlib.sha256(self.document.encode()).hexdigest()
+        # Same query also returning the indexed block, used by the cache
+        self.block_document = self.document[:-1] + SUBGRAPH_BLOCK_FIELD + "}"
+
+    def aliased(self, index: int) -> Tuple[str, str]:
+        """Builds the root field and variable definitions of the query in a batch.
+
+        The field is aliased and the variables renamed with the index, so
+        queries don't collide with each other.
+
+        Args:
+            index (int): Position of the query in the batch
+
+        Returns:
+            Tuple[str, str]: Variable definitions and aliased root field with its selection
+        """
+
+        definitions = ", ".join(
+            f"${name}_{index}: {type}" for name, type in self.variables.items()
+        )
+        field = SUBGRAPH_VARIABLE_PATTERN.sub(rf"$\1_{index}", self.field)
+        return definitions, f"q{index}: {field} {{ {self.selection} }}"
+
+
+_SUBGRAPH_BATCH_DOCUMENTS = LRUCache(SUBGRAPH_BATCH_CACHE_SIZE)
+
+
+def _build_batch(
+    queries: Sequence[Tuple[SubgraphQuery, Optional[dict]]]
+) -> Tuple[str, dict]:
+    """Merges queries into a single GraphQL document.
+
+    Documents are compiled once per sequence of queries.
+
+    Args:
+        queries (Sequence[Tuple[SubgraphQuery, Optional[dict]]]): Queries with their variables
+
+    Returns:
+        Tuple[str, dict]: The document, which also returns the indexed block, and its variables
+    """
+
+    key = tuple(query.id for query, _ in queries)
+    document = _SUBGRAPH_BATCH_DOCUMENTS.get(key)
+    if document is None:
+        aliased = [query.aliased(index) for index, (query, _) in enumerate(queries)]
+        definitions = ", ".join(definition for definition, _ in aliased if definition)
+        document = "query Batch{0} {{ {1}{2}}}".format(
+            f"({definitions})" if definitions else "",
+            " ".join(field for _, field in aliased),
+            SUBGRAPH_BLOCK_FIELD,
+        )
+        _SUBGRAPH_BATCH_DOCUMENTS.put(key, document)
+
+    variables = {
+        f"{name}_{index}": value
+        for index, (_, query_variables) in enumerate(queries)
+        for name, value in (query_variables or {}).items()
+    }
+    return document, variables
+
+
+def _split_batch(
+    response: dict, queries: Sequence[Tuple[SubgraphQuery, Optional[dict]]]
+) -> List[dict]:
+    """Splits the response of a batch into the response of each query.
+
+    Args:
+        response (dict): Response of the batch
+        queries (Sequence[Tuple[SubgraphQuery, Optional[dict]]]): Queries of the batch
+
+    Returns:
+        List[dict]: Response of each query, in order, with the errors of the batch if any
+    """
+
+    data = response.get("data") or {}
+    responses = []
+    for index, (query, _) in enumerate(queries):
+        query_response = {"data": {query.entity: data.get(f"q{index}")}}
+        if response.get("errors"):
+            query_response["errors"] = response["errors"]
+        responses.append(query_response)
+    return responses
+
+
+def _with_block_meta(query: Union[str, SubgraphQuery]) -> Tuple[str, bool]:
+    """Adds the indexed block to the fields requested by a query.
+
+    Args:
+        query (Union[str, SubgraphQuery]): GraphQL query
+
+    Returns:
+        Tuple[str, bool]: The query, and whether the _meta field was added
+    """
+
+    if isinstance(query, SubgraphQuery):
+        return query.block_document, True
+    if "_meta" in query:
+        return query, False
+    end = query.rindex("}")
+    return query[:end] + SUBGRAPH_BLOCK_FIELD + query[end:], True
+
+
+def _pop_block_meta(response: dict, added: bool) -> Optional[int]:
+    """Gets the indexed block of a response, removing the _meta field if it was added.
+
+    Args:
+        response (dict): Query response
+        added (bool): Whether the _meta field was added to the query
+
+    Returns:
+        Optional[int]: The block number, None if the response doesn't have it
+    """
+
+    data = response.get("data") or {}
+    meta = data.pop("_meta", None) if added else data.get("_meta")
+    try:
+        return int(meta["block"]["number"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+_SUBGRAPH_SESSIONS: Dict[str, requests.Session] = {}
+_SUBGRAPH_SESSIONS_LOCK = threading.Lock()
+
+
+def get_subgraph_session(
+    url: str,
+    pool_size: int = SUBGRAPH_POOL_SIZE,
+    retries: int = SUBGRAPH_RETRIES,
+) -> requests.Session:
+    """Gets the HTTP session shared by the queries to a subgraph.
+
+    The session keeps connections alive, so queries don't pay the TCP and
+    TLS setup again, asks for gzip responses, and retries with exponential
+    backoff on rate limiting and server errors. It's created on first use,
+    the arguments are ignored afterwards.
+
+    Args:
+        url (str): Subgraph url
+        pool_size (int): Maximum number of connections kept open to the subgraph
+        retries (int): Number of retries of a failed query
+
+    Returns:
+        requests.Session: The session of the subgraph
+    """
+
+    with _SUBGRAPH_SESSIONS_LOCK:
+        session = _SUBGRAPH_SESSIONS.get(url)
+        if session is None:
+            session = requests.Session()
+            session.headers["Accept-Encoding"] = "gzip"
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=pool_size,
+                max_retries=Retry(
+                    total=retries,
+                    backoff_factor=SUBGRAPH_RETRY_BACKOFF,
+                    status_forcelist=SUBGRAPH_RETRY_STATUSES,
+                    # GraphQL queries don't change any state
+                    allowed_methods=frozenset(["POST"]),
+                    raise_on_status=False,
+                ),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SUBGRAPH_SESSIONS[url] = session
+        return session
+
+
+def close_subgraph_sessions() -> None:
+    """Closes the connections of every subgraph session.
+
+    Returns:
+        None
+    """
+
+    with _SUBGRAPH_SESSIONS_LOCK:
+        for session in _SUBGRAPH_SESSIONS.values():
+            session.close()
+        _SUBGRAPH_SESSIONS.clear()
+
+
+def get_data_from_subgraph(
+    url: str,
+    query: Union[str, SubgraphQuery],
+    timeout: float = SUBGRAPH_TIMEOUT,
+    variables: Optional[dict] = None,
+):
+    cache = _SUBGRAPH_CACHE
+    document = query.document if isinstance(query, SubgraphQuery) else query
+    if cache is None:
+        return _post_subgraph_query(url, document, timeout, variables)
+
+    key = cache.key(url, _cache_query(query), variables)
+    entry = cache.get(key)
+    if entry is not None:
+        if cache.is_fresh(entry):
+            cache.record(hit=True)
+            return copy.deepcopy(entry.data)
+        head_block = cache.get_head_block(url)
+        if head_block is None:
+            head_block = _pop_block_meta(
+                _post_subgraph_query(url, SUBGRAPH_HEAD_QUERY, timeout), False
+            )
+            if head_block is not None:
+                cache.set_head_block(url, head_block)
+        if head_block == entry.block:
+            cache.revalidate(key, entry)
+            cache.record(hit=True)
+            return copy.deepcopy(entry.data)
+
+    cache.record(hit=False)
+    cached_query, added = _with_block_meta(query)
+    response = _post_subgraph_query(url, cached_query, timeout, variables)
+    block = _pop_block_meta(response, added)
+    if block is not None and not response.get("errors"):
+        cache.put(key, response, block)
+        cache.set_head_block(url, block)
+    return response
+
+
+def get_batched_data_from_subgraph(
+    url: str,
+    queries: Sequence[Tuple[SubgraphQuery, Optional[dict]]],
+    timeout: float = SUBGRAPH_TIMEOUT,
+) -> List[dict]:
+    """Sends many queries to a subgraph in a single request.
+
+    The queries are merged into one document, each root field aliased by
+    its position. When caching is enabled, fresh cached responses are
+    served and only the other queries are sent.
+
+    Args:
+        url (str): Subgraph url
+        queries (Sequence[Tuple[SubgraphQuery, Optional[dict]]]): Queries with their variables
+        timeout (float): Seconds to wait for the response
+
+    Returns:
+        List[dict]: Response of each query, in order, as returned by get_data_from_subgraph
+    """
+
+    responses, missing, keys = _get_fresh_responses(url, queries)
+    if missing:
+        batch = [queries[index] for index in missing]
+        document, variables = _build_batch(batch)
+        response = _post_subgraph_query(url, document, timeout, variables)
+        _store_batch(url, response, batch, [keys[index] for index in missing])
+        for index, query_response in zip(missing, _split_batch(response, batch)):
+            responses[index] = query_response
+    return responses
+
+
+def _cache_query(query: Union[str, SubgraphQuery]) -> str:
+    """Gets the text identifying a query in the cache.
+
+    Args:
+        query (Union[str, SubgraphQuery]): GraphQL query
+
+    Returns:
+        str: Document id of precompiled queries, the query text otherwise
+    """
+
+    return query.id if isinstance(query, SubgraphQuery) else query
+
+
+def _get_fresh_responses(
+    url: str, queries: Sequence[Tuple[SubgraphQuery, Optional[dict]]]
+) -> Tuple[List[Optional[dict]], List[int], List[Optional[str]]]:
+    """Gets the cached responses of a batch that can be served without any request.
+
+    Args:
+        url (str): Subgraph url
+        queries (Sequence[Tuple[SubgraphQuery, Optional[dict]]]): Queries with their variables
+
+    Returns:
+        Tuple[List[Optional[dict]], List[int], List[Optional[str]]]: Response of each query,
+            None if it has to be sent, positions of the queries to send and cache keys
+    """
+
+    cache = _SUBGRAPH_CACHE
+    responses = [None] * len(queries)
+    keys = [None] * len(queries)
+    missing = []
+    for index, (query, variables) in enumerate(queries):
+        if cache is not None:
+            keys[index] = cache.key(url, query.id, variables)
+            entry = cache.get(keys[index])
+            if entry is not None and cache.is_fresh(entry):
+                cache.record(hit=True)
+                responses[index] = copy.deepcopy(entry.data)
+                continue
+            cache.record(hit=False)
+        missing.append(index)
+    return responses, missing, keys
+
+
+def _store_batch(
+    url: str,
+    response: dict,
+    queries: Sequence[Tuple[SubgraphQuery, Optional[dict]]],
+    keys: Sequence[Optional[str]],
+) -> None:
+    """Caches the responses of a batch.
+
+    Args:
+        url (str): Subgraph url
+        response (dict): Response of the batch
+        queries (Sequence[Tuple[SubgraphQuery, Optional[dict]]]): Queries of the batch
+        keys (Sequence[Optional[str]]): Cache key of each query
+
+    Returns:
+        None
+    """
+
+    cache = _SUBGRAPH_CACHE
+    block = _pop_block_meta(response, True)
+    if cache is None or block is None or response.get("errors"):
+        return
+    for key, query_response in zip(keys, _split_batch(response, queries)):
+        cache.put(key, query_response, block)
+    cache.set_head_block(url, block)
+
+
+def _post_subgraph_query(
+    url: str, query: str, timeout: float, variables: Optional[dict] = None
+):
+    session = get_subgraph_session(url)
+    payload = {"query": query}
+    if variables is not None:
+        payload["variables"] = variables
+    start = time.perf_counter()
+    try:
+        request = session.post(url, json=payload, timeout=timeout)
+    except requests.RequestException:
+        SUBGRAPH_METRICS.record(url, time.perf_counter() - start, None)
+        raise
+    SUBGRAPH_METRICS.record(url, time.perf_counter() - start, request.status_code)
+
     if request.status_code == 200:
         return request.json()
     else:
@@ -206,17 +1137,340 @@ def get_data_from_subgraph(url: str, query: str):
         )
 
 
-def handle_transaction(w3: Web3, tx_name, tx, exception):
-    """Executes the transaction and waits for the receipt.
+def _page_variables(variables: Optional[dict], first: int, last_id: str) -> dict:
+    """Builds the variables of a page of a paginated query.
+
+    Args:
+        variables (Optional[dict]): Variables of the query
+        first (int): Number of entities in the page
+        last_id (str): Id the page starts after, "" for the first page
+
+    Returns:
+        dict: The variables, with first and the id_gt condition of the where filter
+    """
+
+    variables = dict(variables or {})
+    variables["first"] = first
+    variables["where"] = {**variables.get("where", {}), "id_gt": last_id}
+    return variables
+
+
+def iter_subgraph_pages(
+    url: str,
+    query: SubgraphQuery,
+    variables: Optional[dict] = None,
+    page_size: int = SUBGRAPH_PAGE_SIZE,
+    prefetch: bool = True,
+) -> Iterator[List[dict]]:
+    """Streams the entities of a subgraph query, page by page.
+
+    Pages are read in id order, each one starting after the last id of the
+    previous one, so results are complete at any size. The next page is
+    requested while the caller works on the current one, so at most two
+    pages are held in memory.
+
+    Args:
+        url (str): Subgraph url
+        query (SubgraphQuery): Query taking $first and $where variables, sorted by id
+        variables (Optional[dict]): Variables of the query, the id_gt condition
+            is added to the where filter
+        page_size (int): Number of entities per query, at most SUBGRAPH_MAX_PAGE_SIZE
+        prefetch (bool): Request the next page before the current one is returned
+
+    Returns:
+        Iterator[List[dict]]: Pages of entities, in id order
+
+    Raises:
+        ValueError: If the page size is not valid
+    """
+
+    if not 0 < page_size <= SUBGRAPH_MAX_PAGE_SIZE:
+        raise ValueError(
+            f"Page size must be between 1 and {SUBGRAPH_MAX_PAGE_SIZE}: {page_size}"
+        )
+
+    def get_page(last_id: str) -> List[dict]:
+        return get_data_from_subgraph(
+            url,
+            query,
+            variables=_page_variables(variables, page_size, last_id),
+        )["data"][query.entity]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page = get_page("")
+        while page:
+            # A short page is the last one
+            last_id = page[-1]["id"] if len(page) == page_size else None
+            next_page = (
+                executor.submit(get_page, last_id)
+                if prefetch and last_id is not None
+                else None
+            )
+            yield page
+            if last_id is None:
+                return
+            page = next_page.result() if next_page else get_page(last_id)
+
+
+async def async_iter_subgraph_pages(
+    url: str,
+    query: SubgraphQuery,
+    variables: Optional[dict] = None,
+    page_size: int = SUBGRAPH_PAGE_SIZE,
+    prefetch: bool = True,
+) -> AsyncIterator[List[dict]]:
+    """Streams the entities of a subgraph query, page by page, from asyncio code.
+
+    Same as iter_subgraph_pages, the next page is requested in a task.
+
+    Args:
+        url (str): Subgraph url
+        query (SubgraphQuery): Query taking $first and $where variables, sorted by id
+        variables (Optional[dict]): Variables of the query, the id_gt condition
+            is added to the where filter
+        page_size (int): Number of entities per query, at most SUBGRAPH_MAX_PAGE_SIZE
+        prefetch (bool): Request the next page before the current one is returned
+
+    Returns:
+        AsyncIterator[List[dict]]: Pages of entities, in id order
+
+    Raises:
+        ValueError: If the page size is not valid
+    """
+
+    if not 0 < page_size <= SUBGRAPH_MAX_PAGE_SIZE:
+        raise ValueError(
+            f"Page size must be between 1 and {SUBGRAPH_MAX_PAGE_SIZE}: {page_size}"
+        )
+
+    async def get_page(last_id: str) -> List[dict]:
+        return (
+            await async_get_data_from_subgraph(
+                url,
+                query,
+                variables=_page_variables(variables, page_size, last_id),
+            )
+        )["data"][query.entity]
+
+    page = await get_page("")
+    next_page = None
+    try:
+        while page:
+            last_id = page[-1]["id"] if len(page) == page_size else None
+            next_page = (
+                asyncio.ensure_future(get_page(last_id))
+                if prefetch and last_id is not None
+                else None
+            )
+            yield page
+            if last_id is None:
+                return
+            page = await (next_page or get_page(last_id))
+            next_page = None
+    finally:
+        # The caller stopped early
+        if next_page is not None:
+            next_page.cancel()
+
+
+# Node errors meaning the local nonce is behind the account, e.g. after
+# a transaction was sent outside of the SDK
+NONCE_ERRORS = ("nonce too low", "replacement transaction underpriced")
+# Node error meaning the same signed transaction is already in the mempool
+ALREADY_KNOWN_ERROR = "already known"
+
+# Raw transaction last sent by each thread, signed by construct_sign_and_send_raw_middleware
+_raw_transactions = threading.local()
+
+
+class NonceManager:
+    """
+    A class used to hand out consecutive nonces per sender account.
+
+    The pending transaction count is read from the node once, then nonces are
+    assigned locally, so transactions can be sent without waiting for the
+    previous ones to be mined.
+    """
+
+    def __init__(self, w3: Web3):
+        """
+        Initializes a NonceManager instance.
+
+        Args:
+            w3 (Web3): Web3 instance the transactions are sent with
+        """
+
+        self.w3 = w3
+        self._nonces = {}
+        self._lock = threading.Lock()
+
+    def next_nonce(self, account: str) -> int:
+        """Reserves the next nonce of an account.
+
+        Args:
+            account (str): Sender address
+
+        Returns:
+            int: Nonce to send the transaction with
+        """
+
+        with self._lock:
+            if account not in self._nonces:
+                self._nonces[account] = self.w3.eth.get_transaction_count(
+                    account, "pending"
+                )
+            nonce = self._nonces[account]
+            self._nonces[account] += 1
+            return nonce
+
+    def reset(self, account: Optional[str] = None) -> None:
+        """Forgets the local nonce, it's read from the node again on next use.
+
+        Args:
+            account (Optional[str]): Sender address, all accounts if not provided
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            if account is None:
+                self._nonces.clear()
+            else:
+                self._nonces.pop(account, None)
+
+
+_NONCE_MANAGERS = weakref.WeakKeyDictionary()
+_NONCE_MANAGERS_LOCK = threading.Lock()
+
+
+def get_nonce_manager(w3: Web3) -> NonceManager:
+    """Gets the nonce manager shared by every client using the Web3 instance.
+
+    Args:
+        w3 (Web3): Web3 instance
+
+    Returns:
+        NonceManager: The nonce manager of the Web3 instance
+    """
+
+    with _NONCE_MANAGERS_LOCK:
+        nonce_manager = _NONCE_MANAGERS.get(w3)
+        if nonce_manager is None:
+            nonce_manager = _NONCE_MANAGERS[w3] = NonceManager(w3)
+        return nonce_manager
+
+
+def _raw_transaction_middleware(make_request, w3):
+    """Remembers the raw transaction sent by the current thread.
+
+    It's injected below the signing middleware, so the hash of a transaction
+    the node already knows can be computed.
+    """
+
+    def middleware(method, params):
+        if method == "eth_sendRawTransaction":
+            _raw_transactions.last = params[0]
+        return make_request(method, params)
+
+    return middleware
+
+
+def _add_raw_transaction_middleware(w3: Web3) -> None:
+    """Adds the raw transaction middleware to the Web3 instance, once.
+
+    Args:
+        w3 (Web3): Web3 instance
+
+    Returns:
+        None
+    """
+
+    with _NONCE_MANAGERS_LOCK:
+        if not w3.middleware_onion.get("raw_transaction"):
+            w3.middleware_onion.inject(
+                _raw_transaction_middleware, "raw_transaction", layer=0
+            )
+
+
+class PendingTransaction:
+    """
+    A class used to follow a transaction sent without waiting for its receipt.
+    """
+
+    def __init__(
+        self,
+        w3: Web3,
+        tx_name: str,
+        tx_hash: str,
+        exception,
+        account: Optional[str] = None,
+    ):
+        """
+        Initializes a PendingTransaction instance.
+
+        Args:
+            w3 (Web3): Web3 instance
+            tx_name (str): Name of the transaction
+            tx_hash (str): Hash of the transaction
+            exception (Exception): Exception class to raise in case of error
+            account (Optional[str]): Sender address, all accounts if not provided
+        """
+
+        self.w3 = w3
+        self.tx_name = tx_name
+        self.tx_hash = tx_hash
+        self.exception = exception
+        self.account = account
+
+    def wait(self, timeout: float = 120, poll_latency: float = 0.1) -> TxReceipt:
+        """Waits for the transaction to be mined.
+
+        Args:
+            timeout (float): Seconds to wait for the receipt
+            poll_latency (float): Seconds between receipt checks
+
+        Returns:
+            TxReceipt: The transaction receipt
+
+        Raises:
+            Exception: The exception class of the transaction, if it's reverted or not mined in time
+        """
+
+        receipt = wait_for_receipts(self.w3, [self], timeout, poll_latency)[0]
+        if isinstance(receipt, Exception):
+            raise receipt
+        if receipt["status"] != 1:
+            raise self.exception(f"{self.tx_name} transaction failed: reverted")
+        return receipt
+
+
+def submit_transaction(
+    w3: Web3,
+    tx_name,
+    tx,
+    exception,
+    tx_options: Optional[TxParams] = None,
+    nonce: Optional[int] = None,
+) -> PendingTransaction:
+    """Sends the transaction without waiting for the receipt.
+
+    The nonce is assigned by the nonce manager of the Web3 instance, so
+    several transactions can be in flight at once. If the node already has
+    the same signed transaction, its hash is returned instead of sending it
+    again with another nonce.
 
     Args:
         w3 (Web3): Web3 instance
         tx_name (str): Name of the transaction
         tx (obj): Transaction object
         exception (Exception): Exception class to raise in case of error
+        tx_options (Optional[TxParams]): Transaction parameters, e.g. the gas to skip its estimation
+        nonce (Optional[int]): Nonce reserved with the nonce manager, the transaction
+            is only sent with it, so it can't be mined twice
 
     Returns:
-        obj: The transaction receipt
+        PendingTransaction: Handle to wait for the transaction
 
     Validations:
         - There must be a default account
@@ -228,14 +1482,674 @@ def handle_transaction(w3: Web3, tx_name, tx, exception):
         raise exception(
             "You must add construct_sign_and_send_raw_middleware middleware to Web3 instance"
         )
+
+    account = w3.eth.default_account
+    nonce_manager = get_nonce_manager(w3)
+    _add_raw_transaction_middleware(w3)
+    reserved_nonce = nonce
+    for attempt in range(2):
+        nonce = nonce_manager.next_nonce(account) if reserved_nonce is None else nonce
+        _raw_transactions.last = None
+        try:
+            tx_hash = tx.transact({**(tx_options or {}), "nonce": nonce})
+            return PendingTransaction(
+                w3, tx_name, Web3.toHex(tx_hash), exception, account
+            )
+        except Exception as e:
+            raw_transaction = _raw_transactions.last
+            if ALREADY_KNOWN_ERROR in str(e) and raw_transaction is not None:
+                logger.info(f"{tx_name} nonce {nonce} already sent")
+                return PendingTransaction(
+                    w3,
+                    tx_name,
+                    Web3.toHex(Web3.keccak(HexBytes(raw_transaction))),
+                    exception,
+                    account,
+                )
+            # The nonce wasn't used, read it again from the node
+            nonce_manager.reset(account)
+            if (
+                reserved_nonce is None
+                and attempt == 0
+                and any(error in str(e) for error in NONCE_ERRORS)
+            ):
+                logger.info(f"{tx_name} nonce {nonce} out of sync, retrying")
+                continue
+            _raise_transaction_error(tx_name, e, exception)
+
+
+def wait_for_receipts(
+    w3: Web3,
+    pending: Sequence[PendingTransaction],
+    timeout: float = 120,
+    poll_latency: float = 0.1,
+    max_workers: int = 8,
+) -> List[Union[TxReceipt, Exception]]:
+    """Waits for many transactions at once.
+
+    Each round checks every transaction not mined yet, so the total wait is
+    bounded by the slowest transaction instead of the sum of all of them.
+
+    Args:
+        w3 (Web3): Web3 instance
+        pending (Sequence[PendingTransaction]): Transactions to wait for
+        timeout (float): Seconds to wait for all the receipts
+        poll_latency (float): Seconds between rounds of receipt checks
+        max_workers (int): Number of receipts checked in parallel
+
+    Returns:
+        List[Union[TxReceipt, Exception]]: Receipt of each transaction, in order,
+            including reverted ones. A transaction not mined in time is returned
+            as an instance of its exception class instead of raising, and the
+            nonce of its sender is read again from the node, as it may have
+            been dropped.
+    """
+
+    def get_receipt(tx: PendingTransaction) -> Optional[TxReceipt]:
+        try:
+            return w3.eth.get_transaction_receipt(tx.tx_hash)
+        except TransactionNotFound:
+            return None
+
+    results = [None] * len(pending)
+    remaining = list(range(len(pending)))
+    deadline = time.monotonic() + timeout
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while remaining:
+            receipts = executor.map(
+                get_receipt, [pending[index] for index in remaining]
+            )
+            not_mined = []
+            for index, receipt in zip(remaining, receipts):
+                if receipt is None:
+                    not_mined.append(index)
+                else:
+                    results[index] = receipt
+            remaining = not_mined
+            if not remaining or time.monotonic() >= deadline:
+                break
+            time.sleep(poll_latency)
+
+    for index in remaining:
+        tx = pending[index]
+        get_nonce_manager(w3).reset(tx.account)
+        results[index] = tx.exception(
+            f"{tx.tx_name} transaction {tx.tx_hash} not mined after {timeout} seconds"
+        )
+    return results
+
+
+def handle_transaction(w3: Web3, tx_name, tx, exception):
+    """Executes the transaction and waits for the receipt.
+
+    Args:
+        w3 (Web3): Web3 instance
+        tx_name (str): Name of the transaction
+        tx (obj): Transaction object
+        exception (Exception): Exception class to raise in case of error
+
+    Returns:
+        obj: The transaction receipt
+
+    Validations:
+        - There must be a default account
+
+    """
+    pending = submit_transaction(w3, tx_name, tx, exception)
     try:
-        tx_hash = tx.transact()
-        return w3.eth.wait_for_transaction_receipt(tx_hash)
+        return w3.eth.wait_for_transaction_receipt(pending.tx_hash)
     except Exception as e:
-        if "reverted with reason string" in e.args[0]:
-            start_index = e.args[0].find("'") + 1
-            end_index = e.args[0].rfind("'")
-            message = e.args[0][start_index:end_index]
-            raise exception(f"{tx_name} transaction failed: {message}")
+        # The transaction may have been dropped, leaving a gap in the nonces
+        get_nonce_manager(w3).reset(pending.account)
+        _raise_transaction_error(tx_name, e, exception)
+
+
+def _raise_transaction_error(tx_name, error, exception):
+    """Raises the error of a transaction with the revert reason, if any.
+
+    Args:
+        tx_name (str): Name of the transaction
+        error (Exception): Error raised by web3
+        exception (Exception): Exception class to raise
+    """
+    message = error.args[0] if error.args else ""
+    if isinstance(message, str) and "reverted with reason string" in message:
+        start_index = message.find("'") + 1
+        end_index = message.rfind("'")
+        raise exception(
+            f"{tx_name} transaction failed: {message[start_index:end_index]}"
+        )
+    raise exception(f"{tx_name} transaction failed.")
+
+
+def decode_call_result(w3: Web3, call: ContractFunction, return_data: bytes) -> Any:
+    """Decodes the data returned by a view call the same way web3 does.
+
+    Args:
+        w3 (Web3): Web3 instance
+        call (ContractFunction): Contract function that was called
+        return_data (bytes): Raw return data
+
+    Returns:
+        Any: Decoded result, unwrapped if the function has a single output
+    """
+
+    output_types = get_abi_output_types(call.abi)
+    output_data = w3.codec.decode_abi(output_types, return_data)
+    normalized_data = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output_data)
+    if len(normalized_data) == 1:
+        return normalized_data[0]
+    return normalized_data
+
+
+class _AsyncContract(Contract):
+    """
+    Contract of an async Web3 instance, its address is not resolved with ENS.
+    """
+
+    def __init__(self, address: ChecksumAddress):
+        # Async providers can't resolve ENS names, and looking up the
+        # ENS module of the instance is slow, so only hex addresses are used
+        validate_address(address)
+        self.address = address
+        super().__init__()
+
+
+_ASYNC_CONTRACT_FACTORIES = weakref.WeakKeyDictionary()
+
+
+def get_async_contract(w3: Web3, address: str, abi: list) -> Contract:
+    """Creates a contract instance on a Web3 instance with an async provider.
+
+    web3 only creates contracts on blocking instances, but encoding calls and
+    decoding results only need the codec, so the same class is used here.
+    The contract class is built once per Web3 instance and ABI.
+
+    Args:
+        w3 (Web3): Web3 instance with an async provider and AsyncEth module
+        address (str): Address of the contract
+        abi (list): ABI of the contract
+
+    Returns:
+        Contract: The contract instance, to be used with async_call and async_handle_transaction
+    """
+
+    factories = _ASYNC_CONTRACT_FACTORIES.setdefault(w3, {})
+    # The ABI is kept with the class, so its id is not reused while cached
+    cached_abi, factory = factories.get(id(abi), (None, None))
+    if cached_abi is not abi:
+        factory = _AsyncContract.factory(w3, abi=abi)
+        factories[id(abi)] = (abi, factory)
+    return factory(Web3.toChecksumAddress(address))
+
+
+async def async_get_chain_id(w3: Web3) -> int:
+    """Gets the chain id of an async Web3 instance.
+
+    Args:
+        w3 (Web3): Web3 instance with an async provider
+
+    Returns:
+        int: Chain id
+    """
+
+    return int(await w3.manager.coro_request("eth_chainId", []), 16)
+
+
+async def async_call(
+    call: ContractFunction, block_identifier: BlockIdentifier = "latest"
+) -> Any:
+    """Executes a view call on an async Web3 instance.
+
+    Args:
+        call (ContractFunction): Contract function with its arguments bound
+        block_identifier (BlockIdentifier): Block to read the state from
+
+    Returns:
+        Any: Decoded result of the call
+    """
+
+    return_data = await call.web3.eth.call(
+        {"to": call.address, "data": call._encode_transaction_data()},
+        block_identifier,
+    )
+    return decode_call_result(call.web3, call, return_data)
+
+
+async def async_get_data_from_subgraph(
+    url: str,
+    query: Union[str, SubgraphQuery],
+    timeout: float = SUBGRAPH_TIMEOUT,
+    variables: Optional[dict] = None,
+):
+    cache = _SUBGRAPH_CACHE
+    document = query.document if isinstance(query, SubgraphQuery) else query
+    if cache is None:
+        return await _async_post_subgraph_query(url, document, timeout, variables)
+
+    key = cache.key(url, _cache_query(query), variables)
+    entry = cache.get(key)
+    if entry is not None:
+        if cache.is_fresh(entry):
+            cache.record(hit=True)
+            return copy.deepcopy(entry.data)
+        head_block = cache.get_head_block(url)
+        if head_block is None:
+            head_block = _pop_block_meta(
+                await _async_post_subgraph_query(url, SUBGRAPH_HEAD_QUERY, timeout),
+                False,
+            )
+            if head_block is not None:
+                cache.set_head_block(url, head_block)
+        if head_block == entry.block:
+            cache.revalidate(key, entry)
+            cache.record(hit=True)
+            return copy.deepcopy(entry.data)
+
+    cache.record(hit=False)
+    cached_query, added = _with_block_meta(query)
+    response = await _async_post_subgraph_query(url, cached_query, timeout, variables)
+    block = _pop_block_meta(response, added)
+    if block is not None and not response.get("errors"):
+        cache.put(key, response, block)
+        cache.set_head_block(url, block)
+    return response
+
+
+async def async_get_batched_data_from_subgraph(
+    url: str,
+    queries: Sequence[Tuple[SubgraphQuery, Optional[dict]]],
+    timeout: float = SUBGRAPH_TIMEOUT,
+) -> List[dict]:
+    """Sends many queries to a subgraph in a single request, from asyncio code.
+
+    Args:
+        url (str): Subgraph url
+        queries (Sequence[Tuple[SubgraphQuery, Optional[dict]]]): Queries with their variables
+        timeout (float): Seconds to wait for the response
+
+    Returns:
+        List[dict]: Response of each query, in order
+    """
+
+    responses, missing, keys = _get_fresh_responses(url, queries)
+    if missing:
+        batch = [queries[index] for index in missing]
+        document, variables = _build_batch(batch)
+        response = await _async_post_subgraph_query(url, document, timeout, variables)
+        _store_batch(url, response, batch, [keys[index] for index in missing])
+        for index, query_response in zip(missing, _split_batch(response, batch)):
+            responses[index] = query_response
+    return responses
+
+
+# Sessions are bound to the event loop they're created in
+_ASYNC_SUBGRAPH_SESSIONS = weakref.WeakKeyDictionary()
+
+
+def get_async_subgraph_session(
+    url: str, pool_size: int = SUBGRAPH_POOL_SIZE
+) -> aiohttp.ClientSession:
+    """Gets the HTTP session shared by the async queries to a subgraph.
+
+    Like get_subgraph_session, the session keeps up to pool_size connections
+    alive and asks for gzip responses. There is one session per event loop,
+    created on first use, the arguments are ignored afterwards.
+
+    Args:
+        url (str): Subgraph url
+        pool_size (int): Maximum number of connections open to the subgraph
+
+    Returns:
+        aiohttp.ClientSession: The session of the subgraph in the running loop
+    """
+
+    sessions = _ASYNC_SUBGRAPH_SESSIONS.setdefault(asyncio.get_running_loop(), {})
+    session = sessions.get(url)
+    if session is None or session.closed:
+        session = sessions[url] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=pool_size),
+            headers={"Accept-Encoding": "gzip"},
+        )
+    return session
+
+
+async def async_close_subgraph_sessions() -> None:
+    """Closes the connections of every subgraph session of the running loop.
+
+    Returns:
+        None
+    """
+
+    sessions = _ASYNC_SUBGRAPH_SESSIONS.pop(asyncio.get_running_loop(), {})
+    for session in sessions.values():
+        await session.close()
+
+
+async def _async_post_subgraph_query(
+    url: str, query: str, timeout: float, variables: Optional[dict] = None
+):
+    payload = {"query": query}
+    if variables is not None:
+        payload["variables"] = variables
+    session = get_async_subgraph_session(url)
+    status = None
+    start = time.perf_counter()
+    try:
+        # Same retries as get_subgraph_session, on rate limiting, server and connection errors
+        for attempt in range(SUBGRAPH_RETRIES + 1):
+            delay = SUBGRAPH_RETRY_BACKOFF * 2**attempt
+            try:
+                async with session.post(
+                    url, json=payload, timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as response:
+                    status = response.status
+                    if status == 200:
+                        return await response.json()
+                    if (
+                        status not in SUBGRAPH_RETRY_STATUSES
+                        or attempt == SUBGRAPH_RETRIES
+                    ):
+                        raise Exception(
+                            "Subgraph query failed. return code is {}.      {}".format(
+                                status, query
+                            )
+                        )
+                    retry_after = response.headers.get("Retry-After", "")
+                    if retry_after.isdigit():
+                        delay = int(retry_after)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == SUBGRAPH_RETRIES:
+                    raise
+            await asyncio.sleep(delay)
+    finally:
+        SUBGRAPH_METRICS.record(url, time.perf_counter() - start, status)
+
+
+class AsyncNonceManager:
+    """
+    A class used to hand out consecutive nonces per sender account, on an
+    async Web3 instance.
+    """
+
+    def __init__(self, w3: Web3):
+        """
+        Initializes an AsyncNonceManager instance.
+
+        Args:
+            w3 (Web3): Web3 instance with an async provider
+        """
+
+        self.w3 = w3
+        self._nonces = {}
+        self._lock = asyncio.Lock()
+
+    async def next_nonce(self, account: str) -> int:
+        """Reserves the next nonce of an account.
+
+        Args:
+            account (str): Sender address
+
+        Returns:
+            int: Nonce to send the transaction with
+        """
+
+        async with self._lock:
+            if account not in self._nonces:
+                self._nonces[account] = await self.w3.eth.get_transaction_count(
+                    account, "pending"
+                )
+            nonce = self._nonces[account]
+            self._nonces[account] += 1
+            return nonce
+
+    def reset(self, account: Optional[str] = None) -> None:
+        """Forgets the local nonce, it's read from the node again on next use.
+
+        Args:
+            account (Optional[str]): Sender address, all accounts if not provided
+
+        Returns:
+            None
+        """
+
+        if account is None:
+            self._nonces.clear()
         else:
-            raise exception(f"{tx_name} transaction failed.")
+            self._nonces.pop(account, None)
+
+
+_ASYNC_NONCE_MANAGERS = weakref.WeakKeyDictionary()
+
+
+def get_async_nonce_manager(w3: Web3) -> AsyncNonceManager:
+    """Gets the nonce manager shared by every async client using the Web3 instance.
+
+    Args:
+        w3 (Web3): Web3 instance with an async provider
+
+    Returns:
+        AsyncNonceManager: The nonce manager of the Web3 instance
+    """
+
+    nonce_manager = _ASYNC_NONCE_MANAGERS.get(w3)
+    if nonce_manager is None:
+        nonce_manager = _ASYNC_NONCE_MANAGERS[w3] = AsyncNonceManager(w3)
+    return nonce_manager
+
+
+class AsyncPendingTransaction:
+    """
+    A class used to follow a transaction sent by an async client.
+    """
+
+    def __init__(
+        self,
+        w3: Web3,
+        tx_name: str,
+        tx_hash: str,
+        exception,
+        account: Optional[str] = None,
+    ):
+        """
+        Initializes an AsyncPendingTransaction instance.
+
+        Args:
+            w3 (Web3): Web3 instance with an async provider
+            tx_name (str): Name of the transaction
+            tx_hash (str): Hash of the transaction
+            exception (Exception): Exception class to raise in case of error
+            account (Optional[str]): Sender address, all accounts if not provided
+        """
+
+        self.w3 = w3
+        self.tx_name = tx_name
+        self.tx_hash = tx_hash
+        self.exception = exception
+        self.account = account
+
+    async def wait(self, timeout: float = 120, poll_latency: float = 0.1) -> TxReceipt:
+        """Waits for the transaction to be mined.
+
+        Args:
+            timeout (float): Seconds to wait for the receipt
+            poll_latency (float): Seconds between receipt checks
+
+        Returns:
+            TxReceipt: The transaction receipt
+
+        Raises:
+            Exception: The exception class of the transaction, if it's reverted or not mined in time
+        """
+
+        receipt = (
+            await async_wait_for_receipts(self.w3, [self], timeout, poll_latency)
+        )[0]
+        if isinstance(receipt, Exception):
+            raise receipt
+        if receipt["status"] != 1:
+            raise self.exception(f"{self.tx_name} transaction failed: reverted")
+        return receipt
+
+
+async def async_submit_transaction(
+    w3: Web3,
+    tx_name,
+    tx,
+    exception,
+    account: Optional[LocalAccount] = None,
+    tx_options: Optional[TxParams] = None,
+) -> AsyncPendingTransaction:
+    """Sends the transaction from an async client without waiting for the receipt.
+
+    web3 has no async signing middleware, so the transaction is signed with
+    the given account. Without one, it's sent from the default account,
+    which must be managed by the node.
+
+    Args:
+        w3 (Web3): Web3 instance with an async provider
+        tx_name (str): Name of the transaction
+        tx (obj): Transaction object
+        exception (Exception): Exception class to raise in case of error
+        account (Optional[LocalAccount]): Account to sign the transaction with
+        tx_options (Optional[TxParams]): Transaction parameters, e.g. the gas to skip its estimation
+
+    Returns:
+        AsyncPendingTransaction: Handle to wait for the transaction
+
+    Validations:
+        - There must be an account or a default account
+
+    """
+    sender = account.address if account else w3.eth.default_account
+    if not is_checksum_address(sender):
+        raise exception("You must add an account to Web3 instance")
+
+    params = {
+        "from": sender,
+        "to": tx.address,
+        "data": tx._encode_transaction_data(),
+        **(tx_options or {}),
+    }
+    try:
+        if "gas" not in params:
+            params["gas"] = await w3.eth.estimate_gas(params)
+        if account and "gasPrice" not in params and "maxFeePerGas" not in params:
+            params["gasPrice"] = await w3.eth.gas_price
+        if account and "chainId" not in params:
+            params["chainId"] = await async_get_chain_id(w3)
+    except Exception as e:
+        _raise_transaction_error(tx_name, e, exception)
+
+    nonce_manager = get_async_nonce_manager(w3)
+    for attempt in range(2):
+        params["nonce"] = await nonce_manager.next_nonce(sender)
+        signed_tx = None
+        try:
+            if account:
+                signed_tx = account.sign_transaction(params)
+                tx_hash = await w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+            else:
+                tx_hash = await w3.eth.send_transaction(params)
+            return AsyncPendingTransaction(
+                w3, tx_name, Web3.toHex(tx_hash), exception, sender
+            )
+        except Exception as e:
+            if ALREADY_KNOWN_ERROR in str(e) and signed_tx is not None:
+                logger.info(f"{tx_name} nonce {params['nonce']} already sent")
+                return AsyncPendingTransaction(
+                    w3, tx_name, Web3.toHex(signed_tx.hash), exception, sender
+                )
+            # The nonce wasn't used, read it again from the node
+            nonce_manager.reset(sender)
+            if attempt == 0 and any(error in str(e) for error in NONCE_ERRORS):
+                logger.info(f"{tx_name} nonce {params['nonce']} out of sync, retrying")
+                continue
+            _raise_transaction_error(tx_name, e, exception)
+
+
+async def async_get_transaction_receipt(w3: Web3, tx_hash: str) -> Optional[TxReceipt]:
+    """Gets the receipt of a transaction from an async Web3 instance.
+
+    Args:
+        w3 (Web3): Web3 instance with an async provider
+        tx_hash (str): Hash of the transaction
+
+    Returns:
+        Optional[TxReceipt]: The receipt, None if the transaction is not mined yet
+    """
+
+    receipt = await w3.manager.coro_request("eth_getTransactionReceipt", [tx_hash])
+    return receipt_formatter(receipt) if receipt else None
+
+
+async def async_wait_for_receipts(
+    w3: Web3,
+    pending: Sequence[AsyncPendingTransaction],
+    timeout: float = 120,
+    poll_latency: float = 0.1,
+) -> List[Union[TxReceipt, Exception]]:
+    """Waits for many transactions at once from an async client.
+
+    Args:
+        w3 (Web3): Web3 instance with an async provider
+        pending (Sequence[AsyncPendingTransaction]): Transactions to wait for
+        timeout (float): Seconds to wait for all the receipts
+        poll_latency (float): Seconds between receipt checks
+
+    Returns:
+        List[Union[TxReceipt, Exception]]: Receipt of each transaction, in order,
+            including reverted ones. A transaction not mined in time is returned
+            as an instance of its exception class instead of raising, and the
+            nonce of its sender is read again from the node.
+    """
+
+    deadline = time.monotonic() + timeout
+
+    async def wait(tx: AsyncPendingTransaction) -> Union[TxReceipt, Exception]:
+        while True:
+            receipt = await async_get_transaction_receipt(w3, tx.tx_hash)
+            if receipt is not None:
+                return receipt
+            if time.monotonic() >= deadline:
+                get_async_nonce_manager(w3).reset(tx.account)
+                return tx.exception(
+                    f"{tx.tx_name} transaction {tx.tx_hash} not mined after {timeout} seconds"
+                )
+            await asyncio.sleep(poll_latency)
+
+    return list(await asyncio.gather(*[wait(tx) for tx in pending]))
+
+
+async def async_handle_transaction(
+    w3: Web3,
+    tx_name,
+    tx,
+    exception,
+    account: Optional[LocalAccount] = None,
+    tx_options: Optional[TxParams] = None,
+):
+    """Executes the transaction from an async client and waits for the receipt.
+
+    Args:
+        w3 (Web3): Web3 instance with an async provider
+        tx_name (str): Name of the transaction
+        tx (obj): Transaction object
+        exception (Exception): Exception class to raise in case of error
+        account (Optional[LocalAccount]): Account to sign the transaction with
+        tx_options (Optional[TxParams]): Transaction parameters
+
+    Returns:
+        obj: The transaction receipt
+
+    Validations:
+        - There must be an account or a default account
+
+    """
+    pending = await async_submit_transaction(
+        w3, tx_name, tx, exception, account, tx_options
+    )
+    receipt = (await async_wait_for_receipts(w3, [pending]))[0]
+    if isinstance(receipt, Exception):
+        raise receipt
+    return receipt
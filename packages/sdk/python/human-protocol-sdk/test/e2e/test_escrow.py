@@ -0,0 +1,78 @@
+import unittest
+from unittest.mock import patch
+
+import web3.providers.rpc
+
+from human_protocol_sdk.constants import Status
+from human_protocol_sdk.escrow import EscrowClient, EscrowConfig
+from human_protocol_sdk import multicall
+from human_protocol_sdk.staking import StakingClient
+
+from test.e2e.test_staking import get_w3_with_priv_key
+from test.human_protocol_sdk.utils import (
+    DEFAULT_GAS_PAYER_PRIV,
+)
+
+
+class EscrowTestCase(unittest.TestCase):
+    def setUp(self):
+        (self.w3, self.gas_payer) = get_w3_with_priv_key(DEFAULT_GAS_PAYER_PRIV)
+
+        self.staking_client = StakingClient(self.w3)
+        self.staking_client.approve_stake(10)
+        self.staking_client.stake(10)
+
+        self.escrow_client = EscrowClient(self.w3)
+        self.token_address = self.staking_client.hmtoken_contract.address
+        self.escrow_address = self.escrow_client.create_and_setup_escrow(
+            self.token_address,
+            [self.gas_payer.address],
+            EscrowConfig(
+                "0x70997970C51812dc3A010C7d01b50e0d17dc79C8",
+                "0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC",
+                10,
+                10,
+                "http://localhost:9000/manifests/manifest.json",
+                "s3ca3basd132bafcdas234243.json",
+            ),
+        )
+        self.escrow_client.fund(self.escrow_address, 100)
+
+    def test_get_escrow_state(self):
+        escrow_client = EscrowClient(self.w3)
+        # Multicall3 deployment is checked once, on the first read
+        escrow_client.multicall.is_available()
+
+        with patch.object(
+            web3.providers.rpc,
+            "make_post_request",
+            wraps=web3.providers.rpc.make_post_request,
+        ) as mock_rpc_post, patch.object(
+            multicall, "make_post_request", wraps=multicall.make_post_request
+        ) as mock_batch_post:
+            state = escrow_client.get_escrow_state(self.escrow_address)
+
+        # The views and the factory check are read in a single request
+        self.assertEqual(mock_rpc_post.call_count + mock_batch_post.call_count, 1)
+
+        self.assertEqual(state.address, self.escrow_address)
+        self.assertEqual(state.balance, 100)
+        self.assertEqual(state.status, Status.Pending)
+        self.assertEqual(
+            state.manifest_url, "http://localhost:9000/manifests/manifest.json"
+        )
+        self.assertEqual(state.results_url, "")
+        self.assertEqual(state.intermediate_results_url, "")
+        self.assertEqual(state.token_address, self.token_address)
+        self.assertEqual(
+            state.recording_oracle_address,
+            self.escrow_client.get_recording_oracle_address(self.escrow_address),
+        )
+        self.assertEqual(
+            state.reputation_oracle_address,
+            self.escrow_client.get_reputation_oracle_address(self.escrow_address),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(exit=True)
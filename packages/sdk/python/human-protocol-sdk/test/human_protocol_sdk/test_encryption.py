@@ -1,3 +1,8 @@
+import io
+import os
+import tempfile
+import threading
+import time
 import unittest
 from test.human_protocol_sdk.utils.encryption import (
     private_key,
@@ -12,7 +17,20 @@ from test.human_protocol_sdk.utils.encryption import (
     encrypted_unsigned_message,
 )
 
-from human_protocol_sdk.encryption import Encryption, EncryptionUtils
+from human_protocol_sdk.encryption import (
+    PUBLIC_KEY_CACHE,
+    Encryption,
+    EncryptionUtils,
+    PublicKeyCache,
+)
+from pgpy import PGPKey, PGPMessage, PGPUID
+from pgpy.constants import (
+    EllipticCurveOID,
+    HashAlgorithm,
+    KeyFlags,
+    PubKeyAlgorithm,
+    SymmetricKeyAlgorithm,
+)
 from pgpy.errors import PGPDecryptionError
 
 message = "Test message"
@@ -61,6 +79,52 @@ class TestEncryption(unittest.TestCase):
         encrypted_message = EncryptionUtils.encrypt(message, [public_key2, public_key3])
         self.assertIsInstance(encrypted_message, str)
 
+    def test_encrypt_binary(self):
+        encryption = Encryption(private_key)
+        armored_message = encryption.sign_and_encrypt(message, [public_key2])
+        binary_message = encryption.sign_and_encrypt(
+            message, [public_key2], armor=False
+        )
+        self.assertIsInstance(binary_message, bytes)
+        self.assertLess(len(binary_message), len(armored_message))
+
+        decrypted_message = Encryption(private_key2).decrypt(binary_message, public_key)
+        self.assertEqual(decrypted_message, message)
+
+    def test_encrypt_binary_unsigned_message(self):
+        encrypted_message = EncryptionUtils.encrypt(message, [public_key2], armor=False)
+        self.assertIsInstance(encrypted_message, bytes)
+
+        decrypted_message = Encryption(private_key2).decrypt(encrypted_message)
+        self.assertEqual(decrypted_message, message)
+
+    def test_decrypt_bytes(self):
+        data = b"\x00\x01 Test message \xff"
+        for armor in (True, False):
+            encrypted_message = Encryption(private_key).sign_and_encrypt(
+                data, [public_key2], armor=armor
+            )
+            decrypted_message = Encryption(private_key2).decrypt(
+                encrypted_message, public_key
+            )
+            self.assertEqual(decrypted_message, data)
+
+        # Bytes that look like text are still decrypted as bytes
+        encrypted_message = EncryptionUtils.encrypt(b"Test message", [public_key2])
+        self.assertEqual(
+            Encryption(private_key2).decrypt(encrypted_message), b"Test message"
+        )
+
+    def test_decrypt_binary_stream(self):
+        encrypted_message = Encryption(private_key).sign_and_encrypt(
+            message.encode(), [public_key2], armor=False
+        )
+
+        decrypted = Encryption(private_key2).decrypt_stream(
+            [encrypted_message], public_key
+        )
+        self.assertEqual(b"".join(decrypted), message.encode())
+
     def test_decrypt(self):
         encryption = Encryption(private_key2)
         decrypted_message = encryption.decrypt(encrypted_message)
@@ -127,3 +191,400 @@ class TestEncryption(unittest.TestCase):
         with self.assertRaises(ValueError) as cm:
             EncryptionUtils.get_signed_data("Invalid message")
         self.assertEqual(f"Expected: ASCII-armored PGP data", str(cm.exception))
+
+
+class TestUnlockedSession(unittest.TestCase):
+    def test_unlocked(self):
+        encryption = Encryption(private_key3, passphrase)
+
+        with encryption.unlocked() as session:
+            encrypted_message = encryption.sign_and_encrypt(message, [public_key3])
+            self.assertTrue(encryption.private_key.is_unlocked)
+            self.assertEqual(encryption.decrypt(encrypted_message), message)
+            encryption.sign(message)
+
+        self.assertEqual(session.unlocks, 1)
+        self.assertFalse(encryption.private_key.is_unlocked)
+        # Operations still work after the session
+        self.assertEqual(encryption.decrypt(encrypted_message), message)
+
+    def test_unlocked_max_operations(self):
+        encryption = Encryption(private_key3, passphrase)
+
+        with encryption.unlocked(max_operations=2) as session:
+            for _ in range(5):
+                encryption.sign(message)
+
+        self.assertEqual(session.unlocks, 3)
+
+    def test_unlocked_max_age(self):
+        encryption = Encryption(private_key3, passphrase)
+
+        with encryption.unlocked(max_age=0) as session:
+            for _ in range(3):
+                encryption.sign(message)
+
+        self.assertEqual(session.unlocks, 3)
+
+    def test_unlocked_max_age_idle(self):
+        encryption = Encryption(private_key3, passphrase)
+
+        with encryption.unlocked(max_age=0.2) as session:
+            encryption.sign(message)
+            self.assertTrue(encryption.private_key.is_unlocked)
+            time.sleep(0.5)
+            self.assertFalse(encryption.private_key.is_unlocked)
+            encryption.sign(message)
+
+        self.assertEqual(session.unlocks, 2)
+        self.assertFalse(encryption.private_key.is_unlocked)
+
+    def test_unlocked_exit_while_waiting(self):
+        encryption = Encryption(private_key3, passphrase)
+        session = encryption.unlocked()
+        session.__enter__()
+
+        with session._lock:
+            thread = threading.Thread(target=encryption.sign, args=(message,))
+            thread.start()
+            # The operation waits for the session lock, then the session exits
+            time.sleep(0.2)
+            session.__exit__(None, None, None)
+        thread.join()
+
+        self.assertEqual(session.unlocks, 0)
+        self.assertFalse(encryption.private_key.is_unlocked)
+
+    def test_unlocked_nested(self):
+        encryption = Encryption(private_key3, passphrase)
+
+        with encryption.unlocked() as session:
+            encryption.sign(message)
+            with encryption.unlocked():
+                encryption.sign(message)
+            self.assertTrue(encryption.private_key.is_unlocked)
+            encryption.sign(message)
+
+        self.assertEqual(session.unlocks, 1)
+        self.assertFalse(encryption.private_key.is_unlocked)
+
+    def test_unlocked_without_passphrase(self):
+        encryption = Encryption(private_key)
+
+        with encryption.unlocked() as session:
+            encryption.sign(message)
+
+        self.assertEqual(session.unlocks, 0)
+        self.assertTrue(encryption.private_key.is_unlocked)
+
+    def test_unlocked_exception(self):
+        encryption = Encryption(private_key3, passphrase)
+
+        with self.assertRaises(ValueError):
+            with encryption.unlocked():
+                encryption.sign(message)
+                encryption.decrypt("invalid message")
+
+        self.assertFalse(encryption.private_key.is_unlocked)
+        self.assertIsNone(encryption._session)
+
+
+class TestEncryptionBatch(unittest.TestCase):
+    def test_sign_and_encrypt_many(self):
+        encryption = Encryption(private_key3, passphrase)
+        messages = [f"{message} {i}" for i in range(6)]
+
+        encrypted_messages = encryption.sign_and_encrypt_many(
+            messages, [public_key2], max_workers=2
+        )
+
+        decryption = Encryption(private_key2)
+        self.assertEqual(
+            [decryption.decrypt(m, public_key3) for m in encrypted_messages],
+            messages,
+        )
+
+    def test_sign_and_encrypt_many_binary(self):
+        encryption = Encryption(private_key)
+        messages = [f"{message} {i}".encode() for i in range(4)]
+
+        encrypted_messages = encryption.sign_and_encrypt_many(
+            messages, [public_key2], max_workers=2, armor=False
+        )
+        self.assertTrue(all(isinstance(m, bytes) for m in encrypted_messages))
+
+        decrypted_messages = Encryption(private_key2).decrypt_many(
+            encrypted_messages, public_key, max_workers=2
+        )
+        self.assertEqual(decrypted_messages, messages)
+
+    def test_decrypt_many(self):
+        encryption = Encryption(private_key3, passphrase)
+        messages = [f"{message} {i}" for i in range(6)]
+        encrypted_messages = [
+            encryption.sign_and_encrypt(m, [public_key2]) for m in messages
+        ]
+        encrypted_messages[2] = encrypted_unsigned_message
+
+        for max_workers in (1, 2):
+            decrypted_messages = Encryption(private_key2).decrypt_many(
+                encrypted_messages, public_key3, max_workers=max_workers
+            )
+
+            self.assertEqual(
+                decrypted_messages[:2] + decrypted_messages[3:],
+                messages[:2] + messages[3:],
+            )
+            self.assertIsInstance(decrypted_messages[2], ValueError)
+
+    def test_decrypt_many_locked_private_key(self):
+        encrypted_messages = [
+            EncryptionUtils.encrypt(f"{message} {i}", [public_key3]) for i in range(4)
+        ]
+
+        decrypted_messages = Encryption(private_key3, passphrase).decrypt_many(
+            encrypted_messages, max_workers=2
+        )
+
+        self.assertEqual(decrypted_messages, [f"{message} {i}" for i in range(4)])
+
+    def test_verify_many(self):
+        encryption = Encryption(private_key)
+        messages = [encryption.sign(f"{message} {i}") for i in range(4)]
+        messages.append(Encryption(private_key2).sign(message))
+        messages.append(message)
+
+        result = EncryptionUtils.verify_many(messages, public_key, max_workers=2)
+
+        self.assertEqual(result[:5], [True, True, True, True, False])
+        self.assertIsInstance(result[5], ValueError)
+
+    def test_empty(self):
+        self.assertEqual(Encryption(private_key).decrypt_many([]), [])
+        self.assertEqual(EncryptionUtils.verify_many([], public_key), [])
+
+
+class TestPublicKeyCache(unittest.TestCase):
+    def setUp(self):
+        PUBLIC_KEY_CACHE.clear()
+
+    def test_get(self):
+        cache = PublicKeyCache(max_size=2)
+
+        key = cache.get(public_key)
+
+        self.assertIs(cache.get(public_key), key)
+        self.assertEqual(cache.info(), {"hits": 1, "misses": 1, "size": 1})
+
+    def test_get_same_key_armored_differently(self):
+        cache = PublicKeyCache(max_size=2)
+
+        key = cache.get(public_key)
+        other_key = cache.get(public_key + "\n")
+
+        self.assertEqual(key.fingerprint, other_key.fingerprint)
+        self.assertEqual(cache.info()["size"], 1)
+
+    def test_evict(self):
+        cache = PublicKeyCache(max_size=2)
+        cache.get(public_key)
+        cache.get(public_key2)
+        cache.get(public_key)
+        cache.get(public_key3)
+
+        cache.get(public_key)
+        self.assertEqual(cache.info()["hits"], 2)
+        cache.get(public_key2)
+        self.assertEqual(cache.info()["misses"], 4)
+
+    def test_invalid_key(self):
+        cache = PublicKeyCache(max_size=2)
+        with self.assertRaises(ValueError):
+            cache.get("invalid_public_key")
+        self.assertEqual(cache.info()["size"], 0)
+
+    def test_sign_and_encrypt(self):
+        encryption = Encryption(private_key)
+        for _ in range(3):
+            encrypted_message = encryption.sign_and_encrypt(message, [public_key2])
+            self.assertEqual(
+                Encryption(private_key2).decrypt(encrypted_message, public_key),
+                message,
+            )
+        self.assertEqual(PUBLIC_KEY_CACHE.info()["misses"], 2)
+        self.assertEqual(PUBLIC_KEY_CACHE.info()["hits"], 4)
+
+
+class TestEncryptionStream(unittest.TestCase):
+    def setUp(self):
+        self.data = os.urandom(100000)
+
+    def test_sign_and_encrypt_stream(self):
+        encrypted = b"".join(
+            Encryption(private_key).sign_and_encrypt_stream(
+                io.BytesIO(self.data), [public_key, public_key2], chunk_size=4096
+            )
+        )
+
+        for key in (private_key, private_key2):
+            decrypted = Encryption(key).decrypt_stream(
+                [encrypted[i : i + 1000] for i in range(0, len(encrypted), 1000)],
+                public_key,
+                chunk_size=4096,
+            )
+            self.assertEqual(b"".join(decrypted), self.data)
+
+    def test_sign_and_encrypt_stream_interoperates(self):
+        encrypted = b"".join(
+            Encryption(private_key).sign_and_encrypt_stream(
+                [self.data], [public_key2], chunk_size=1024
+            )
+        )
+
+        key, _ = PGPKey.from_blob(private_key2)
+        pgp_message = key.decrypt(PGPMessage.from_blob(encrypted))
+        self.assertEqual(bytes(pgp_message.message), self.data)
+        self.assertTrue(PGPKey.from_blob(public_key)[0].verify(pgp_message))
+
+    def test_sign_and_encrypt_stream_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.zip")
+            with open(path, "wb") as f:
+                f.write(self.data)
+            encrypted = b"".join(
+                Encryption(private_key).sign_and_encrypt_stream(path, [public_key])
+            )
+
+        decrypted = Encryption(private_key).decrypt_stream([encrypted], public_key)
+        self.assertEqual(b"".join(decrypted), self.data)
+
+    def test_sign_and_encrypt_stream_locked_private_key(self):
+        encryption = Encryption(private_key3, passphrase)
+        encrypted = b"".join(
+            encryption.sign_and_encrypt_stream([self.data], [public_key3])
+        )
+
+        decrypted = encryption.decrypt_stream([encrypted], public_key3)
+        self.assertEqual(b"".join(decrypted), self.data)
+        self.assertFalse(encryption.private_key.is_unlocked)
+
+    def test_sign_and_encrypt_stream_signing_subkey(self):
+        # The primary key can only certify, signing is done by a subkey
+        key = PGPKey.new(PubKeyAlgorithm.EdDSA, EllipticCurveOID.Ed25519)
+        key.add_uid(
+            PGPUID.new("Worker", email="worker@example.com"),
+            usage={KeyFlags.Certify},
+            hashes=[HashAlgorithm.SHA256],
+            ciphers=[SymmetricKeyAlgorithm.AES256],
+        )
+        signing_subkey = PGPKey.new(PubKeyAlgorithm.EdDSA, EllipticCurveOID.Ed25519)
+        key.add_subkey(signing_subkey, usage={KeyFlags.Sign})
+        encryption_subkey = PGPKey.new(
+            PubKeyAlgorithm.ECDH, EllipticCurveOID.Curve25519
+        )
+        key.add_subkey(
+            encryption_subkey,
+            usage={KeyFlags.EncryptCommunications, KeyFlags.EncryptStorage},
+        )
+
+        encrypted = b"".join(
+            Encryption(str(key)).sign_and_encrypt_stream([self.data], [str(key.pubkey)])
+        )
+
+        decrypted = Encryption(str(key)).decrypt_stream([encrypted], str(key.pubkey))
+        self.assertEqual(b"".join(decrypted), self.data)
+        pgp_message = key.decrypt(PGPMessage.from_blob(encrypted))
+        self.assertEqual(
+            pgp_message.signatures[0].signer, signing_subkey.fingerprint.keyid
+        )
+        self.assertTrue(key.pubkey.verify(pgp_message))
+
+    def test_encrypt_stream(self):
+        encrypted = b"".join(
+            EncryptionUtils.encrypt_stream([b"Test ", b"message"], [public_key])
+        )
+
+        decrypted = Encryption(private_key).decrypt_stream([encrypted])
+        self.assertEqual(b"".join(decrypted), message.encode())
+
+    def test_encrypt_stream_empty(self):
+        encrypted = b"".join(EncryptionUtils.encrypt_stream([], [public_key]))
+
+        decrypted = Encryption(private_key).decrypt_stream([encrypted])
+        self.assertEqual(b"".join(decrypted), b"")
+
+    def test_decrypt_stream_message(self):
+        encrypted = Encryption(private_key).sign_and_encrypt(message, [public_key2])
+
+        decrypted = Encryption(private_key2).decrypt_stream(
+            [bytes(PGPMessage.from_blob(encrypted))], public_key
+        )
+        self.assertEqual(b"".join(decrypted), message.encode())
+
+    def test_decrypt_stream_compressed_message(self):
+        # pgpy compresses messages, text compresses to several chunks
+        data = os.urandom(200000).hex().encode()
+        encrypted = Encryption(private_key).sign_and_encrypt(
+            data, [public_key2], armor=False
+        )
+
+        decrypted = Encryption(private_key2).decrypt_stream(
+            [encrypted], public_key, chunk_size=4096
+        )
+        self.assertEqual(b"".join(decrypted), data)
+
+    def test_decrypt_stream_wrong_private_key(self):
+        encrypted = b"".join(EncryptionUtils.encrypt_stream([self.data], [public_key]))
+
+        with self.assertRaises(ValueError) as cm:
+            Encryption(private_key2).decrypt_stream([encrypted])
+        self.assertEqual(
+            "Failed to decrypt message: Cannot decrypt the provided message with this key",
+            str(cm.exception),
+        )
+
+    def test_decrypt_stream_wrong_public_key(self):
+        encrypted = b"".join(
+            Encryption(private_key).sign_and_encrypt_stream([self.data], [public_key])
+        )
+
+        with self.assertRaises(ValueError) as cm:
+            list(Encryption(private_key).decrypt_stream([encrypted], public_key2))
+        self.assertEqual(
+            "Failed to decrypt message: Could not find signature with this public key",
+            str(cm.exception),
+        )
+
+    def test_decrypt_stream_unsigned_message(self):
+        encrypted = b"".join(EncryptionUtils.encrypt_stream([self.data], [public_key]))
+
+        with self.assertRaises(ValueError) as cm:
+            list(Encryption(private_key).decrypt_stream([encrypted], public_key))
+        self.assertEqual(
+            "Failed to decrypt message: No signatures to verify", str(cm.exception)
+        )
+
+    def test_decrypt_stream_modified_message(self):
+        encrypted = bytearray(
+            b"".join(EncryptionUtils.encrypt_stream([self.data], [public_key]))
+        )
+        encrypted[len(encrypted) // 2] ^= 1
+
+        with self.assertRaises(ValueError) as cm:
+            list(Encryption(private_key).decrypt_stream([bytes(encrypted)]))
+        self.assertEqual(
+            "Failed to decrypt message: Modification detected", str(cm.exception)
+        )
+
+    def test_decrypt_stream_truncated_message(self):
+        encrypted = b"".join(EncryptionUtils.encrypt_stream([self.data], [public_key]))
+
+        with self.assertRaises(ValueError):
+            list(Encryption(private_key).decrypt_stream([encrypted[:-100]]))
+
+    def test_decrypt_stream_not_encrypted(self):
+        with self.assertRaises(ValueError) as cm:
+            Encryption(private_key).decrypt_stream([b""])
+        self.assertEqual(
+            "Failed to decrypt message: Message is not encrypted", str(cm.exception)
+        )
@@ -1,17 +1,35 @@
+import asyncio
+from array import array
+from decimal import Decimal
 from types import SimpleNamespace
+import os
+import tempfile
 import unittest
 from datetime import datetime
 from test.human_protocol_sdk.utils import DEFAULT_GAS_PAYER_PRIV
-from unittest.mock import MagicMock, PropertyMock, patch
+from test.human_protocol_sdk.utils import FakeAsyncProvider, async_web3
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
-from human_protocol_sdk.constants import NETWORKS, ChainId, Status
+from eth_account import Account
+
+from human_protocol_sdk.constants import NETWORKS, ChainId, PayoutChunkStatus, Status
 from human_protocol_sdk.escrow import (
+    BULK_MAX_VALUE,
+    LAUNCHED_ESCROWS_QUERY,
+    AsyncEscrowClient,
     EscrowClient,
     EscrowClientError,
     EscrowConfig,
     EscrowFilter,
+    EscrowState,
+    PayoutChunk,
+    validate_bulk_payout,
 )
+from human_protocol_sdk.multicall import MulticallError
+from human_protocol_sdk.payout_journal import PayoutJournal
+from human_protocol_sdk.utils import AsyncPendingTransaction
 from web3 import Web3
+from web3.exceptions import TransactionNotFound
 from web3.middleware import construct_sign_and_send_raw_middleware
 from web3.providers.rpc import HTTPProvider
 
@@ -312,6 +330,38 @@ class EscrowTestCase(unittest.TestCase):
                 EscrowClientError,
             )
 
+    def test_setup_without_waiting(self):
+        mock_contract = MagicMock()
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        escrow_config = EscrowConfig(
+            "0x1234567890123456789012345678901234567890",
+            "0x1234567890123456789012345678901234567890",
+            10,
+            10,
+            "http://localhost",
+            "test",
+        )
+
+        with patch(
+            "human_protocol_sdk.escrow.submit_transaction"
+        ) as mock_submit, patch(
+            "human_protocol_sdk.escrow.handle_transaction"
+        ) as mock_handle:
+            pending = self.escrow.setup(
+                "0x1234567890123456789012345678901234567890",
+                escrow_config,
+                wait=False,
+            )
+
+            self.assertEqual(pending, mock_submit.return_value)
+            mock_submit.assert_called_once_with(
+                self.w3,
+                "Setup",
+                mock_contract.functions.setup.return_value,
+                EscrowClientError,
+            )
+            mock_handle.assert_not_called()
+
     def test_setup_invalid_address(self):
         escrow_address = "test"
         escrow_config = EscrowConfig(
@@ -334,6 +384,9 @@ class EscrowTestCase(unittest.TestCase):
         type(w3.eth).chain_id = PropertyMock(return_value=mock_chain_id)
 
         escrowClient = EscrowClient(w3)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = True
+        escrowClient.factory_contract.functions.hasEscrow = mock_has_escrow
 
         escrow_address = "0x1234567890123456789012345678901234567890"
         escrow_config = EscrowConfig(
@@ -396,7 +449,9 @@ class EscrowTestCase(unittest.TestCase):
         )
 
     def test_setup_invalid_escrow(self):
-        self.escrow.factory_contract.functions.hasEscrow = MagicMock(return_value=False)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = False
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
         escrow_address = "0x1234567890123456789012345678901234567890"
         escrow_config = EscrowConfig(
             "0x1234567890123456789012345678901234567890",
@@ -670,7 +725,9 @@ class EscrowTestCase(unittest.TestCase):
         )
 
     def test_store_results_invalid_escrow(self):
-        self.escrow.factory_contract.functions.hasEscrow = MagicMock(return_value=False)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = False
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
         escrow_address = "0x1234567890123456789012345678901234567890"
         url = "http://localhost"
         hash = "test"
@@ -715,6 +772,719 @@ class EscrowTestCase(unittest.TestCase):
                 EscrowClientError,
             )
 
+    def test_bulk_payout_too_many_recipients(self):
+        self.escrow._get_escrow_contract = MagicMock()
+        self.escrow.get_balance = MagicMock(return_value=1000)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        recipients = ["0x1234567890123456789012345678901234567890"] * 100
+        amounts = [1] * 100
+
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.bulk_payout(
+                escrow_address, recipients, amounts, "http://localhost", "test", 1
+            )
+        self.assertEqual(
+            "Too many recipients: 100. Use bulk_payout_chunked instead",
+            str(cm.exception),
+        )
+        self.escrow._get_escrow_contract.assert_not_called()
+
+    def test_bulk_payout_value_too_high(self):
+        self.escrow._get_escrow_contract = MagicMock()
+        self.escrow.get_balance = MagicMock(return_value=BULK_MAX_VALUE * 2)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        recipients = ["0x1234567890123456789012345678901234567890"] * 2
+        amounts = [BULK_MAX_VALUE // 2] * 2
+
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.bulk_payout(
+                escrow_address, recipients, amounts, "http://localhost", "test", 1
+            )
+        self.assertEqual(
+            f"Bulk value too high: {BULK_MAX_VALUE}. Use bulk_payout_chunked instead",
+            str(cm.exception),
+        )
+        self.escrow._get_escrow_contract.assert_not_called()
+
+    def test_plan_bulk_payout(self):
+        recipients = [f"0x{i:040x}" for i in range(250)]
+        amounts = list(range(1, 251))
+
+        chunks = self.escrow.plan_bulk_payout(recipients, amounts, 7)
+
+        self.assertEqual([chunk.tx_id for chunk in chunks], [7, 8, 9])
+        self.assertEqual([len(chunk.recipients) for chunk in chunks], [99, 99, 52])
+        self.assertEqual(sum([chunk.recipients for chunk in chunks], []), recipients)
+        self.assertEqual(sum([chunk.amounts for chunk in chunks], []), amounts)
+        self.assertTrue(
+            all(chunk.status == PayoutChunkStatus.Pending for chunk in chunks)
+        )
+
+    def test_plan_bulk_payout_value(self):
+        recipients = [f"0x{i:040x}" for i in range(5)]
+        amounts = [BULK_MAX_VALUE // 2, BULK_MAX_VALUE // 2, 1, BULK_MAX_VALUE - 1, 1]
+
+        chunks = self.escrow.plan_bulk_payout(recipients, amounts, 1, chunk_size=3)
+
+        self.assertEqual(
+            [chunk.amounts for chunk in chunks],
+            [
+                [BULK_MAX_VALUE // 2],
+                [BULK_MAX_VALUE // 2, 1],
+                [BULK_MAX_VALUE - 1],
+                [1],
+            ],
+        )
+        self.assertEqual([chunk.tx_id for chunk in chunks], [1, 2, 3, 4])
+        for chunk in chunks:
+            self.assertTrue(validate_bulk_payout(chunk.recipients, chunk.amounts).valid)
+
+    def test_plan_bulk_payout_invalid_params(self):
+        recipients = ["0x1234567890123456789012345678901234567890"]
+
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.plan_bulk_payout(recipients, [1], 1, chunk_size=100)
+        self.assertEqual("Chunk size must be between 1 and 99", str(cm.exception))
+
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.plan_bulk_payout([], [], 1)
+        self.assertEqual("Arrays must have any value", str(cm.exception))
+
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.plan_bulk_payout(recipients, [1, 2], 1)
+        self.assertEqual("Arrays must have same length", str(cm.exception))
+
+    def _mock_bulk_payout(self, balance=1000, receipt_statuses=None):
+        mock_contract = MagicMock()
+        mock_contract.functions.bulkPayOut.return_value.transact.side_effect = (
+            lambda tx: bytes([tx["nonce"]]) * 32
+        )
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        self.escrow.get_balance = MagicMock(return_value=balance)
+        self.w3.eth.get_transaction_count = MagicMock(return_value=5)
+        self.w3.eth.get_transaction_receipt = MagicMock(
+            side_effect=lambda tx_hash: {
+                "status": (receipt_statuses or {}).get(tx_hash, 1)
+            }
+        )
+        return mock_contract
+
+    def test_bulk_payout_chunked(self):
+        mock_contract = self._mock_bulk_payout()
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        recipients = [f"0x{i:040x}" for i in range(1, 251)]
+        amounts = [2] * 250
+
+        chunks = self.escrow.bulk_payout_chunked(
+            escrow_address, recipients, amounts, "http://localhost", "test", 1
+        )
+
+        self.assertEqual(len(chunks), 3)
+        self.assertTrue(
+            all(chunk.status == PayoutChunkStatus.Confirmed for chunk in chunks)
+        )
+        self.assertEqual(
+            [chunk.tx_hash for chunk in chunks],
+            [Web3.toHex(bytes([nonce]) * 32) for nonce in (5, 6, 7)],
+        )
+        self.assertEqual(
+            [call.args for call in mock_contract.functions.bulkPayOut.call_args_list],
+            [
+                (chunk.recipients, chunk.amounts, "http://localhost", "test", tx_id)
+                for chunk, tx_id in zip(chunks, (1, 2, 3))
+            ],
+        )
+        self.w3.eth.get_transaction_count.assert_called_once_with(
+            self.gas_payer.address, "pending"
+        )
+        self.escrow.get_balance.assert_called_once_with(escrow_address)
+        self.assertEqual(self.w3.eth.get_transaction_receipt.call_count, 3)
+
+    def test_execute_bulk_payout_submission_error(self):
+        mock_contract = self._mock_bulk_payout()
+        mock_contract.functions.bulkPayOut.return_value.transact.side_effect = [
+            b"\x01" * 32,
+            Exception("Error"),
+        ]
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        chunks = self.escrow.plan_bulk_payout(
+            [f"0x{i:040x}" for i in range(1, 31)], [1] * 30, 1, chunk_size=10
+        )
+
+        self.escrow.execute_bulk_payout(
+            escrow_address, chunks, "http://localhost", "test"
+        )
+
+        self.assertEqual(
+            [chunk.status for chunk in chunks],
+            [
+                PayoutChunkStatus.Confirmed,
+                PayoutChunkStatus.Failed,
+                PayoutChunkStatus.Pending,
+            ],
+        )
+        self.assertEqual(chunks[1].error, "Bulk Payout transaction failed.")
+
+    def test_execute_bulk_payout_resume(self):
+        mock_contract = self._mock_bulk_payout(receipt_statuses={"0x02": 0})
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        chunks = [
+            PayoutChunk(
+                1,
+                ["0x1234567890123456789012345678901234567890"],
+                [1],
+                PayoutChunkStatus.Confirmed,
+                "0x01",
+            ),
+            PayoutChunk(
+                2,
+                ["0x1234567890123456789012345678901234567890"],
+                [1],
+                PayoutChunkStatus.Submitted,
+                "0x02",
+            ),
+            PayoutChunk(3, ["0x1234567890123456789012345678901234567890"], [1]),
+            PayoutChunk(
+                4,
+                ["0x1234567890123456789012345678901234567890"],
+                [1],
+                PayoutChunkStatus.Failed,
+            ),
+        ]
+
+        self.escrow.execute_bulk_payout(
+            escrow_address, chunks, "http://localhost", "test"
+        )
+
+        self.assertEqual(
+            [
+                call.args[4]
+                for call in mock_contract.functions.bulkPayOut.call_args_list
+            ],
+            [3, 4],
+        )
+        self.assertEqual(
+            [chunk.status for chunk in chunks],
+            [
+                PayoutChunkStatus.Confirmed,
+                PayoutChunkStatus.Failed,
+                PayoutChunkStatus.Confirmed,
+                PayoutChunkStatus.Confirmed,
+            ],
+        )
+        self.assertEqual(chunks[1].error, "Transaction reverted")
+
+    def test_execute_bulk_payout_receipt_timeout(self):
+        self._mock_bulk_payout()
+        self.w3.eth.get_transaction_receipt = MagicMock(
+            side_effect=TransactionNotFound("Not found")
+        )
+        chunks = self.escrow.plan_bulk_payout(
+            ["0x1234567890123456789012345678901234567890"], [1], 1
+        )
+
+        self.escrow.execute_bulk_payout(
+            "0x1234567890123456789012345678901234567890",
+            chunks,
+            "http://localhost",
+            "test",
+            timeout=0,
+        )
+
+        self.assertEqual(chunks[0].status, PayoutChunkStatus.Submitted)
+
+    def test_execute_bulk_payout_not_enough_balance(self):
+        mock_contract = self._mock_bulk_payout(balance=10)
+        chunks = self.escrow.plan_bulk_payout(
+            [f"0x{i:040x}" for i in range(1, 21)], [1] * 20, 1, chunk_size=10
+        )
+
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.execute_bulk_payout(
+                "0x1234567890123456789012345678901234567890",
+                chunks,
+                "http://localhost",
+                "test",
+            )
+        self.assertEqual(
+            "Escrow does not have enough balance. Current balance: 10. Amounts: 20",
+            str(cm.exception),
+        )
+        mock_contract.functions.bulkPayOut.assert_not_called()
+
+    def test_reconcile_bulk_payout(self):
+        mock_contract = MagicMock()
+        mock_contract.events.BulkTransfer.getLogs.return_value = [
+            {"args": {"_txId": 2}, "transactionHash": b"\x02" * 32}
+        ]
+        self.escrow._get_escrow_contract = MagicMock(return_value=mock_contract)
+        receipts = {"0x03": {"status": 0}}
+        transactions = {"0x03": {}, "0x05": {}}
+
+        def get_transaction_receipt(tx_hash):
+            if tx_hash not in receipts:
+                raise TransactionNotFound(tx_hash)
+            return receipts[tx_hash]
+
+        def get_transaction(tx_hash):
+            if tx_hash not in transactions:
+                raise TransactionNotFound(tx_hash)
+            return transactions[tx_hash]
+
+        self.w3.eth.get_transaction_receipt = MagicMock(
+            side_effect=get_transaction_receipt
+        )
+        self.w3.eth.get_transaction = MagicMock(side_effect=get_transaction)
+        recipients = ["0x1234567890123456789012345678901234567890"]
+        chunks = [
+            PayoutChunk(1, recipients, [1], PayoutChunkStatus.Confirmed, "0x01"),
+            PayoutChunk(2, recipients, [1]),
+            PayoutChunk(3, recipients, [1], PayoutChunkStatus.Submitted, "0x03"),
+            PayoutChunk(4, recipients, [1], PayoutChunkStatus.Submitted, "0x04"),
+            PayoutChunk(5, recipients, [1], PayoutChunkStatus.Submitted, "0x05"),
+        ]
+
+        changed = self.escrow.reconcile_bulk_payout(
+            "0x1234567890123456789012345678901234567890", chunks, 10
+        )
+
+        mock_contract.events.BulkTransfer.getLogs.assert_called_once_with(
+            argument_filters={"_txId": [2, 3, 4, 5]}, fromBlock=10
+        )
+        self.assertEqual(changed, chunks[1:4])
+        self.assertEqual(
+            [(chunk.status, chunk.tx_hash) for chunk in chunks],
+            [
+                (PayoutChunkStatus.Confirmed, "0x01"),
+                (PayoutChunkStatus.Confirmed, Web3.toHex(b"\x02" * 32)),
+                (PayoutChunkStatus.Failed, "0x03"),
+                (PayoutChunkStatus.Pending, None),
+                (PayoutChunkStatus.Submitted, "0x05"),
+            ],
+        )
+
+    def test_reconcile_bulk_payout_all_confirmed(self):
+        self.escrow._get_escrow_contract = MagicMock()
+        chunks = [
+            PayoutChunk(
+                1,
+                ["0x1234567890123456789012345678901234567890"],
+                [1],
+                PayoutChunkStatus.Confirmed,
+            )
+        ]
+
+        self.assertEqual(
+            self.escrow.reconcile_bulk_payout(
+                "0x1234567890123456789012345678901234567890", chunks
+            ),
+            [],
+        )
+        self.escrow._get_escrow_contract.assert_not_called()
+
+    def test_bulk_payout_chunked_with_journal(self):
+        mock_contract = self._mock_bulk_payout()
+        mock_contract.functions.bulkPayOut.return_value.transact.side_effect = [
+            b"\x01" * 32,
+            Exception("Error"),
+        ]
+        type(self.w3.eth).block_number = PropertyMock(return_value=42)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        recipients = [f"0x{i:040x}" for i in range(1, 31)]
+
+        with tempfile.TemporaryDirectory() as directory:
+            journal = PayoutJournal(os.path.join(directory, "payouts.db"))
+            self.escrow.bulk_payout_chunked(
+                escrow_address,
+                recipients,
+                [1] * 30,
+                "http://localhost",
+                "test",
+                1,
+                chunk_size=10,
+                journal=journal,
+            )
+            payout = journal.load(escrow_address)
+            journal.close()
+
+        self.assertEqual(payout.from_block, 42)
+        self.assertEqual(
+            [(chunk.tx_id, chunk.status) for chunk in payout.chunks],
+            [
+                (1, PayoutChunkStatus.Confirmed),
+                (2, PayoutChunkStatus.Failed),
+                (3, PayoutChunkStatus.Pending),
+            ],
+        )
+        self.assertEqual(payout.chunks[0].tx_hash, Web3.toHex(b"\x01" * 32))
+
+    def test_bulk_payout_chunked_with_journal_invalid_payout(self):
+        mock_contract = self._mock_bulk_payout(balance=10)
+        type(self.w3.eth).block_number = PropertyMock(return_value=42)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        recipients = [f"0x{i:040x}" for i in range(1, 31)]
+
+        with tempfile.TemporaryDirectory() as directory:
+            journal = PayoutJournal(os.path.join(directory, "payouts.db"))
+            with self.assertRaises(EscrowClientError) as cm:
+                self.escrow.bulk_payout_chunked(
+                    escrow_address,
+                    recipients,
+                    [1] * 30,
+                    "http://localhost",
+                    "test",
+                    1,
+                    chunk_size=10,
+                    journal=journal,
+                )
+            payout = journal.load(escrow_address)
+            journal.close()
+
+        self.assertEqual(
+            "Escrow does not have enough balance. Current balance: 10. Amounts: 30",
+            str(cm.exception),
+        )
+        self.assertIsNone(payout)
+        mock_contract.functions.bulkPayOut.assert_not_called()
+
+    def test_resume_bulk_payout(self):
+        mock_contract = self._mock_bulk_payout()
+        mock_contract.events.BulkTransfer.getLogs.return_value = [
+            {"args": {"_txId": 2}, "transactionHash": b"\x02" * 32}
+        ]
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        chunks = self.escrow.plan_bulk_payout(
+            [f"0x{i:040x}" for i in range(1, 31)], [1] * 30, 1, chunk_size=10
+        )
+        chunks[0].status = PayoutChunkStatus.Confirmed
+
+        with tempfile.TemporaryDirectory() as directory:
+            journal = PayoutJournal(os.path.join(directory, "payouts.db"))
+            journal.record_plan(escrow_address, chunks, "http://localhost", "test", 7)
+            result = self.escrow.resume_bulk_payout(escrow_address, journal)
+            payout = journal.load(escrow_address)
+            journal.close()
+
+        mock_contract.events.BulkTransfer.getLogs.assert_called_once_with(
+            argument_filters={"_txId": [2, 3]}, fromBlock=7
+        )
+        self.assertEqual(
+            [
+                call.args[4]
+                for call in mock_contract.functions.bulkPayOut.call_args_list
+            ],
+            [3],
+        )
+        self.escrow.get_balance.assert_called_once_with(escrow_address)
+        self.assertTrue(
+            all(chunk.status == PayoutChunkStatus.Confirmed for chunk in result)
+        )
+        self.assertTrue(
+            all(chunk.status == PayoutChunkStatus.Confirmed for chunk in payout.chunks)
+        )
+
+    def test_bulk_payout_chunked_journal_write_ahead(self):
+        mock_contract = self._mock_bulk_payout()
+        type(self.w3.eth).block_number = PropertyMock(return_value=42)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        recipients = [f"0x{i:040x}" for i in range(1, 21)]
+        journaled = []
+
+        with tempfile.TemporaryDirectory() as directory:
+            journal = PayoutJournal(os.path.join(directory, "payouts.db"))
+
+            def transact(tx):
+                # The nonce is recorded before the transaction is sent
+                journaled.append(
+                    [
+                        (chunk.status, chunk.nonce)
+                        for chunk in journal.load(escrow_address).chunks
+                    ]
+                )
+                raise Exception("Read timed out")
+
+            mock_contract.functions.bulkPayOut.return_value.transact.side_effect = (
+                transact
+            )
+            chunks = self.escrow.bulk_payout_chunked(
+                escrow_address,
+                recipients,
+                [1] * 20,
+                "http://localhost",
+                "test",
+                1,
+                chunk_size=10,
+                journal=journal,
+            )
+            payout = journal.load(escrow_address)
+            journal.close()
+
+        self.assertEqual(
+            journaled,
+            [
+                [
+                    (PayoutChunkStatus.Submitting, 5),
+                    (PayoutChunkStatus.Pending, None),
+                ]
+            ],
+        )
+        # The send may have reached the node, so the nonce is kept
+        self.assertEqual(
+            [(chunk.status, chunk.nonce) for chunk in payout.chunks],
+            [(PayoutChunkStatus.Failed, 5), (PayoutChunkStatus.Pending, None)],
+        )
+        self.assertEqual(chunks[0].nonce, 5)
+
+    def test_execute_bulk_payout_reuses_nonce(self):
+        mock_contract = self._mock_bulk_payout()
+        self.w3.eth.get_transaction_count.return_value = 9
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        chunks = self.escrow.plan_bulk_payout(
+            [f"0x{i:040x}" for i in range(1, 21)], [1] * 20, 1, chunk_size=10
+        )
+        chunks[1].status = PayoutChunkStatus.Failed
+        chunks[1].nonce = 7
+
+        self.escrow.execute_bulk_payout(
+            escrow_address, chunks, "http://localhost", "test"
+        )
+
+        self.assertEqual(
+            [
+                (call.args[4], transact.args[0]["nonce"])
+                for call, transact in zip(
+                    mock_contract.functions.bulkPayOut.call_args_list,
+                    mock_contract.functions.bulkPayOut.return_value.transact.call_args_list,
+                )
+            ],
+            [(2, 7), (1, 9)],
+        )
+        self.assertTrue(
+            all(chunk.status == PayoutChunkStatus.Confirmed for chunk in chunks)
+        )
+
+    def test_reconcile_bulk_payout_nonces(self):
+        mock_contract = self._mock_bulk_payout()
+        mock_contract.events.BulkTransfer.getLogs.return_value = [
+            {"args": {"_txId": 1}, "transactionHash": b"\x01" * 32}
+        ]
+        self.w3.eth.get_transaction_count.return_value = 7
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        chunks = [
+            PayoutChunk(
+                1, [escrow_address], [1], PayoutChunkStatus.Submitting, nonce=5
+            ),
+            PayoutChunk(
+                2, [escrow_address], [1], PayoutChunkStatus.Submitting, nonce=6
+            ),
+            PayoutChunk(
+                3, [escrow_address], [1], PayoutChunkStatus.Failed, None, "Error", 7
+            ),
+        ]
+
+        changed = self.escrow.reconcile_bulk_payout(escrow_address, chunks)
+
+        self.assertEqual(changed, chunks[:2])
+        self.assertEqual(
+            [(chunk.status, chunk.nonce) for chunk in chunks],
+            [
+                (PayoutChunkStatus.Confirmed, 5),
+                # Mined without the event of the chunk
+                (PayoutChunkStatus.Pending, None),
+                # Not mined yet, it may still be paid
+                (PayoutChunkStatus.Failed, 7),
+            ],
+        )
+        self.w3.eth.get_transaction_count.assert_called_once_with(
+            self.gas_payer.address
+        )
+
+    def test_resume_bulk_payout_not_in_journal(self):
+        escrow_address = "0x1234567890123456789012345678901234567890"
+
+        with tempfile.TemporaryDirectory() as directory:
+            journal = PayoutJournal(os.path.join(directory, "payouts.db"))
+            with self.assertRaises(EscrowClientError) as cm:
+                self.escrow.resume_bulk_payout(escrow_address, journal)
+            journal.close()
+        self.assertEqual(
+            f"No payout recorded in the journal for escrow {escrow_address}",
+            str(cm.exception),
+        )
+
+    def test_execute_bulk_payout_value_too_high(self):
+        mock_contract = self._mock_bulk_payout(balance=BULK_MAX_VALUE * 2)
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        chunks = [
+            PayoutChunk(1, [escrow_address], [BULK_MAX_VALUE // 2]),
+            PayoutChunk(2, [escrow_address] * 2, [BULK_MAX_VALUE // 2] * 2),
+        ]
+
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.execute_bulk_payout(
+                escrow_address, chunks, "http://localhost", "test"
+            )
+        self.assertEqual(f"Bulk value too high: {BULK_MAX_VALUE}", str(cm.exception))
+        mock_contract.functions.bulkPayOut.assert_not_called()
+
+    def test_execute_bulk_payout_invalid_params(self):
+        chunks = [PayoutChunk(1, ["invalid_address"], [1])]
+        escrow_address = "0x1234567890123456789012345678901234567890"
+
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.execute_bulk_payout(
+                escrow_address, chunks, "http://localhost", "test"
+            )
+        self.assertEqual(
+            "Invalid recipient address: invalid_address", str(cm.exception)
+        )
+
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.execute_bulk_payout(
+                escrow_address, chunks, "invalid_url", "test"
+            )
+        self.assertEqual("Invalid final results URL: invalid_url", str(cm.exception))
+
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.execute_bulk_payout(
+                escrow_address, chunks, "http://localhost", ""
+            )
+        self.assertEqual("Invalid empty final results hash", str(cm.exception))
+
+    def test_validate_bulk_payout(self):
+        recipients = [
+            "0x1234567890123456789012345678901234567890",
+            "0xabcdefabcdefabcdefabcdefabcdefabcdefabcd",
+            "0x1234567890123456789012345678901234567890",
+        ]
+
+        report = validate_bulk_payout(recipients, array("Q", [100, 33, 7]), 10, 5)
+
+        self.assertTrue(report.valid)
+        self.assertEqual(report.size, 3)
+        self.assertEqual(report.errors, [])
+        self.assertEqual(report.total_amount, 140)
+        # Fees are rounded down per amount, like finalizePayouts
+        self.assertEqual(report.final_amounts, [85, 29, 7])
+        self.assertEqual(report.reputation_oracle_fee, 13)
+        self.assertEqual(report.recording_oracle_fee, 6)
+        self.assertEqual(
+            report.duplicates, {"0x1234567890123456789012345678901234567890": [0, 2]}
+        )
+
+    def test_validate_bulk_payout_invalid_rows(self):
+        recipients = [
+            "0x1234567890123456789012345678901234567890",
+            "invalid_address",
+            "0x1234567890123456789012345678901234567890",
+            "0x1234567890123456789012345678901234567890",
+            "0x1234567890123456789012345678901234567890",
+            "0x1234567890123456789012345678901234567890",
+        ]
+        amounts = [Decimal(10), 10, 0, -1, 1.5]
+
+        report = validate_bulk_payout(recipients, amounts)
+
+        self.assertFalse(report.valid)
+        self.assertEqual(
+            [(error.index, error.reason) for error in report.errors],
+            [
+                (1, "Invalid recipient address: invalid_address"),
+                (2, "Amounts cannot be empty"),
+                (3, "Amounts cannot be negative"),
+                (4, "Invalid amount: 1.5"),
+                (5, "Arrays must have same length"),
+            ],
+        )
+        self.assertIsNone(report.errors[-1].amount)
+        self.assertEqual(report.final_amounts, [10, None, None, None, None, None])
+        self.assertEqual(report.total_amount, 10)
+        self.assertEqual(report.duplicates, {})
+
+    def test_validate_bulk_payout_value_too_high(self):
+        recipients = ["0x1234567890123456789012345678901234567890"] * 2
+
+        report = validate_bulk_payout(recipients, [BULK_MAX_VALUE - 1, 1])
+
+        self.assertEqual(report.errors, [])
+        self.assertEqual(report.total_amount, BULK_MAX_VALUE)
+        self.assertFalse(report.valid)
+
+        report = validate_bulk_payout(recipients, [BULK_MAX_VALUE, 1])
+
+        self.assertEqual(
+            [(error.index, error.reason) for error in report.errors],
+            [(0, f"Amount too high: {BULK_MAX_VALUE}")],
+        )
+
+    def test_validate_bulk_payout_addresses_like_web3(self):
+        checksum_address = "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed"
+        addresses = [
+            checksum_address,
+            checksum_address.lower(),
+            "0x" + checksum_address[2:].upper(),
+            checksum_address[2:].lower(),
+            checksum_address[2:],
+            "0X" + checksum_address[2:].lower(),
+            "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAeD",
+            checksum_address[:-1],
+            checksum_address + "0",
+            "0x" + "g" * 40,
+            bytes.fromhex(checksum_address[2:]),
+            b"\x00" * 19,
+            None,
+            1,
+        ]
+
+        report = validate_bulk_payout(addresses, [1] * len(addresses))
+
+        invalid = {error.index for error in report.errors}
+        self.assertEqual(
+            [index not in invalid for index in range(len(addresses))],
+            [Web3.isAddress(address) for address in addresses],
+        )
+
+    def test_validate_bulk_payout_invalid_fee(self):
+        with self.assertRaises(EscrowClientError) as cm:
+            validate_bulk_payout([], [], 101, 0)
+        self.assertEqual("Fee must be between 0 and 100", str(cm.exception))
+
+        with self.assertRaises(EscrowClientError) as cm:
+            validate_bulk_payout([], [], 60, 50)
+        self.assertEqual("Total fee must be less than 100", str(cm.exception))
+
+    def test_preview_bulk_payout(self):
+        self.escrow._get_escrow_contract = MagicMock()
+        self.escrow.multicall.call = MagicMock(return_value=[100, 10, 20])
+        recipients = ["0x1234567890123456789012345678901234567890"] * 2
+
+        report = self.escrow.preview_bulk_payout(
+            "0x1234567890123456789012345678901234567890", recipients, [50, 51]
+        )
+
+        self.assertFalse(report.valid)
+        self.assertEqual(report.balance, 100)
+        self.assertEqual(report.total_amount, 101)
+        self.assertEqual(report.final_amounts, [35, 36])
+        self.assertEqual(report.reputation_oracle_fee, 10)
+        self.assertEqual(report.recording_oracle_fee, 20)
+
+    def test_preview_bulk_payout_call_error(self):
+        self.escrow._get_escrow_contract = MagicMock()
+        self.escrow.multicall.call = MagicMock(
+            return_value=[100, MulticallError("Call to reverted"), 20]
+        )
+
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.preview_bulk_payout(
+                "0x1234567890123456789012345678901234567890",
+                ["0x1234567890123456789012345678901234567890"],
+                [1],
+            )
+        self.assertEqual(
+            "Failed to get escrow state: Call to reverted", str(cm.exception)
+        )
+
     def test_bulk_payout_invalid_address(self):
         escrow_address = "0x1234567890123456789012345678901234567890"
         recipients = ["0x1234567890123456789012345678901234567890"]
@@ -893,6 +1663,9 @@ class EscrowTestCase(unittest.TestCase):
         type(w3.eth).chain_id = PropertyMock(return_value=mock_chain_id)
 
         escrowClient = EscrowClient(w3)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = True
+        escrowClient.factory_contract.functions.hasEscrow = mock_has_escrow
 
         escrow_address = "0x1234567890123456789012345678901234567890"
         recipients = ["0x1234567890123456789012345678901234567890"]
@@ -914,7 +1687,9 @@ class EscrowTestCase(unittest.TestCase):
         self.assertEqual("You must add an account to Web3 instance", str(cm.exception))
 
     def test_bulk_payout_invalid_escrow_address(self):
-        self.escrow.factory_contract.functions.hasEscrow = MagicMock(return_value=False)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = False
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
         self.escrow.get_balance = MagicMock(return_value=100)
         escrow_address = "0x1234567890123456789012345678901234567890"
         recipients = ["0x1234567890123456789012345678901234567890"]
@@ -1081,6 +1856,9 @@ class EscrowTestCase(unittest.TestCase):
         type(w3.eth).chain_id = PropertyMock(return_value=mock_chain_id)
 
         escrowClient = EscrowClient(w3)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = True
+        escrowClient.factory_contract.functions.hasEscrow = mock_has_escrow
 
         escrow_address = "0x1234567890123456789012345678901234567890"
 
@@ -1120,7 +1898,9 @@ class EscrowTestCase(unittest.TestCase):
         )
 
     def test_complete_invalid_address(self):
-        self.escrow.factory_contract.functions.hasEscrow = MagicMock(return_value=False)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = False
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
         escrow_address = "0x1234567890123456789012345678901234567890"
 
         with self.assertRaises(EscrowClientError) as cm:
@@ -1161,6 +1941,9 @@ class EscrowTestCase(unittest.TestCase):
         type(w3.eth).chain_id = PropertyMock(return_value=mock_chain_id)
 
         escrowClient = EscrowClient(w3)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = True
+        escrowClient.factory_contract.functions.hasEscrow = mock_has_escrow
 
         escrow_address = "0x1234567890123456789012345678901234567890"
 
@@ -1199,7 +1982,9 @@ class EscrowTestCase(unittest.TestCase):
         )
 
     def test_cancel_invalid_escrow(self):
-        self.escrow.factory_contract.functions.hasEscrow = MagicMock(return_value=False)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = False
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
         escrow_address = "0x1234567890123456789012345678901234567890"
 
         with self.assertRaises(EscrowClientError) as cm:
@@ -1240,6 +2025,9 @@ class EscrowTestCase(unittest.TestCase):
         type(w3.eth).chain_id = PropertyMock(return_value=mock_chain_id)
 
         escrowClient = EscrowClient(w3)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = True
+        escrowClient.factory_contract.functions.hasEscrow = mock_has_escrow
 
         escrow_address = "0x1234567890123456789012345678901234567890"
 
@@ -1278,7 +2066,9 @@ class EscrowTestCase(unittest.TestCase):
         )
 
     def test_abort_invalid_escrow(self):
-        self.escrow.factory_contract.functions.hasEscrow = MagicMock(return_value=False)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = False
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
         escrow_address = "0x1234567890123456789012345678901234567890"
 
         with self.assertRaises(EscrowClientError) as cm:
@@ -1334,6 +2124,9 @@ class EscrowTestCase(unittest.TestCase):
         type(w3.eth).chain_id = PropertyMock(return_value=mock_chain_id)
 
         escrowClient = EscrowClient(w3)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = True
+        escrowClient.factory_contract.functions.hasEscrow = mock_has_escrow
 
         escrow_address = "0x1234567890123456789012345678901234567890"
         handlers = [
@@ -1366,7 +2159,9 @@ class EscrowTestCase(unittest.TestCase):
         )
 
     def test_add_trusted_handlers_invalid_escrow(self):
-        self.escrow.factory_contract.functions.hasEscrow = MagicMock(return_value=False)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = False
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
         escrow_address = "0x1234567890123456789012345678901234567890"
         handlers = [
             "0x1234567890123456789012345678901234567891",
@@ -1417,7 +2212,9 @@ class EscrowTestCase(unittest.TestCase):
         self.assertEqual(result, 100)
 
     def test_get_balance_invalid_escrow(self):
-        self.escrow.factory_contract.functions.hasEscrow = MagicMock(return_value=False)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = False
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
         with self.assertRaises(EscrowClientError) as cm:
             self.escrow.get_balance("0x1234567890123456789012345678901234567890")
         self.assertEqual(
@@ -1466,7 +2263,9 @@ class EscrowTestCase(unittest.TestCase):
         self.assertEqual(result, "mock_value")
 
     def test_get_manifest_url_invalid_escrow(self):
-        self.escrow.factory_contract.functions.hasEscrow = MagicMock(return_value=False)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = False
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
         with self.assertRaises(EscrowClientError) as cm:
             self.escrow.get_manifest_url("0x1234567890123456789012345678901234567890")
         self.assertEqual(
@@ -1515,7 +2314,9 @@ class EscrowTestCase(unittest.TestCase):
         self.assertEqual(result, "mock_value")
 
     def test_get_results_url_invalid_escrow(self):
-        self.escrow.factory_contract.functions.hasEscrow = MagicMock(return_value=False)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = False
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
         with self.assertRaises(EscrowClientError) as cm:
             self.escrow.get_results_url("0x1234567890123456789012345678901234567890")
         self.assertEqual(
@@ -1564,7 +2365,9 @@ class EscrowTestCase(unittest.TestCase):
         self.assertEqual(result, "mock_value")
 
     def test_get_intermediate_results_url_invalid_escrow(self):
-        self.escrow.factory_contract.functions.hasEscrow = MagicMock(return_value=False)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = False
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
         with self.assertRaises(EscrowClientError) as cm:
             self.escrow.get_intermediate_results_url(
                 "0x1234567890123456789012345678901234567890"
@@ -1615,7 +2418,9 @@ class EscrowTestCase(unittest.TestCase):
         self.assertEqual(result, "0x1234567890123456789012345678901234567890")
 
     def test_get_token_address_invalid_escrow(self):
-        self.escrow.factory_contract.functions.hasEscrow = MagicMock(return_value=False)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = False
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
         with self.assertRaises(EscrowClientError) as cm:
             self.escrow.get_token_address("0x1234567890123456789012345678901234567890")
         self.assertEqual(
@@ -1664,7 +2469,9 @@ class EscrowTestCase(unittest.TestCase):
         self.assertEqual(result, Status.Launched)
 
     def test_get_status_invalid_escrow(self):
-        self.escrow.factory_contract.functions.hasEscrow = MagicMock(return_value=False)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = False
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
         with self.assertRaises(EscrowClientError) as cm:
             self.escrow.get_status("0x1234567890123456789012345678901234567890")
         self.assertEqual(
@@ -1674,7 +2481,7 @@ class EscrowTestCase(unittest.TestCase):
     def test_get_launched_escrows(self):
         requester_address = "0x1234567890123456789012345678901234567890"
         mock_function = MagicMock()
-        with patch("human_protocol_sdk.escrow.get_data_from_subgraph") as mock_function:
+        with patch("human_protocol_sdk.utils.get_data_from_subgraph") as mock_function:
             mock_function.return_value = {
                 "data": {
                     "launchedEscrows": [
@@ -1691,15 +2498,14 @@ class EscrowTestCase(unittest.TestCase):
 
             mock_function.assert_called_once_with(
                 "subgraph_url",
-                """
-            {
-                launchedEscrows(
-                    where:{from:"0x1234567890123456789012345678901234567890"}
-                ) {
-                    id
-                }
-            }
-            """,
+                LAUNCHED_ESCROWS_QUERY,
+                variables={
+                    "first": 1000,
+                    "where": {
+                        "from": "0x1234567890123456789012345678901234567890",
+                        "id_gt": "",
+                    },
+                },
             )
 
             self.assertEqual(len(launched_escrows), 2)
@@ -1710,6 +2516,47 @@ class EscrowTestCase(unittest.TestCase):
                 launched_escrows[1], "0x1234567890123456789012345678901234567892"
             )
 
+    def test_get_launched_escrows_paginated(self):
+        requester_address = "0x1234567890123456789012345678901234567890"
+        pages = [
+            [{"id": "0x01"}, {"id": "0x02"}],
+            [{"id": "0x03"}, {"id": "0x04"}],
+            [{"id": "0x05"}],
+        ]
+        with patch("human_protocol_sdk.utils.get_data_from_subgraph") as mock_function:
+            mock_function.side_effect = [
+                {"data": {"launchedEscrows": page}} for page in pages
+            ]
+            launched_escrows = self.escrow.get_launched_escrows(
+                requester_address, page_size=2
+            )
+
+            self.assertEqual(launched_escrows, ["0x01", "0x02", "0x03", "0x04", "0x05"])
+            self.assertEqual(
+                [call.kwargs["variables"] for call in mock_function.call_args_list],
+                [
+                    {"first": 2, "where": {"from": requester_address, "id_gt": last_id}}
+                    for last_id in ("", "0x02", "0x04")
+                ],
+            )
+
+    def test_iter_launched_escrows_stops_early(self):
+        with patch("human_protocol_sdk.utils.get_data_from_subgraph") as mock_function:
+            mock_function.side_effect = [
+                {"data": {"launchedEscrows": [{"id": "0x01"}, {"id": "0x02"}]}},
+                {"data": {"launchedEscrows": [{"id": "0x03"}, {"id": "0x04"}]}},
+                {"data": {"launchedEscrows": [{"id": "0x05"}, {"id": "0x06"}]}},
+            ]
+            launched_escrows = self.escrow.iter_launched_escrows(
+                "0x1234567890123456789012345678901234567890", page_size=2
+            )
+
+            self.assertEqual(next(launched_escrows), "0x01")
+            launched_escrows.close()
+
+            # Only the page after the one being read is prefetched
+            self.assertEqual(mock_function.call_count, 2)
+
     def test_escrow_filter_valid_params(self):
         escrow_address = "0x1234567890123456789012345678901234567891"
         date_from = datetime.fromtimestamp(1683811973)
@@ -1757,7 +2604,7 @@ class EscrowTestCase(unittest.TestCase):
             date_to=datetime.fromtimestamp(1683812007),
         )
         mock_function = MagicMock()
-        with patch("human_protocol_sdk.escrow.get_data_from_subgraph") as mock_function:
+        with patch("human_protocol_sdk.utils.get_data_from_subgraph") as mock_function:
             mock_function.return_value = {
                 "data": {
                     "launchedEscrows": [
@@ -1774,14 +2621,17 @@ class EscrowTestCase(unittest.TestCase):
 
             mock_function.assert_called_once_with(
                 "subgraph_url",
-                """
-            {
-                launchedEscrows(where:{from:"0x1234567890123456789012345678901234567891",status:"Pending",timestamp_gte:"1683811973",timestamp_lte:"1683812007",}
-                ) {
-                    id
-                }
-            }
-            """,
+                LAUNCHED_ESCROWS_QUERY,
+                variables={
+                    "first": 1000,
+                    "where": {
+                        "from": "0x1234567890123456789012345678901234567891",
+                        "status": "Pending",
+                        "timestamp_gte": "1683811973",
+                        "timestamp_lte": "1683812007",
+                        "id_gt": "",
+                    },
+                },
             )
 
             self.assertEqual(len(filtered), 2)
@@ -1830,7 +2680,9 @@ class EscrowTestCase(unittest.TestCase):
         self.assertEqual(result, "0x1234567890123456789012345678901234567890")
 
     def test_get_recording_oracle_address_invalid_escrow(self):
-        self.escrow.factory_contract.functions.hasEscrow = MagicMock(return_value=False)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = False
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
         with self.assertRaises(EscrowClientError) as cm:
             self.escrow.get_recording_oracle_address(
                 "0x1234567890123456789012345678901234567890"
@@ -1881,7 +2733,9 @@ class EscrowTestCase(unittest.TestCase):
         self.assertEqual(result, "0x1234567890123456789012345678901234567890")
 
     def test_get_reputation_oracle_address_invalid_escrow(self):
-        self.escrow.factory_contract.functions.hasEscrow = MagicMock(return_value=False)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = False
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
         with self.assertRaises(EscrowClientError) as cm:
             self.escrow.get_reputation_oracle_address(
                 "0x1234567890123456789012345678901234567890"
@@ -1890,6 +2744,583 @@ class EscrowTestCase(unittest.TestCase):
             "Escrow address is not provided by the factory", str(cm.exception)
         )
 
+    def test_get_escrow_contract_cached(self):
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = True
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
+        escrow_address = "0x1234567890123456789012345678901234567890"
+
+        first = self.escrow._get_escrow_contract(escrow_address)
+        second = self.escrow._get_escrow_contract(escrow_address.lower())
+
+        self.assertIs(first, second)
+        self.assertEqual(first.address, Web3.toChecksumAddress(escrow_address))
+        self.escrow.factory_contract.functions.hasEscrow.assert_called_once_with(
+            Web3.toChecksumAddress(escrow_address)
+        )
+
+    def test_get_escrow_contract_evicts_least_recently_used(self):
+        escrow = EscrowClient(self.w3, escrow_cache_size=2)
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = True
+        escrow.factory_contract.functions.hasEscrow = mock_has_escrow
+        escrow_addresses = [
+            "0x1234567890123456789012345678901234567890",
+            "0x1234567890123456789012345678901234567891",
+            "0x1234567890123456789012345678901234567892",
+        ]
+
+        first = escrow._get_escrow_contract(escrow_addresses[0])
+        escrow._get_escrow_contract(escrow_addresses[1])
+        escrow._get_escrow_contract(escrow_addresses[0])
+        escrow._get_escrow_contract(escrow_addresses[2])
+
+        self.assertIs(escrow._get_escrow_contract(escrow_addresses[0]), first)
+        self.assertNotIn(
+            Web3.toChecksumAddress(escrow_addresses[1]), escrow._escrow_contracts
+        )
+        escrow._get_escrow_contract(escrow_addresses[1])
+        # Evicted escrows are rebuilt without checking the factory again
+        self.assertEqual(escrow.factory_contract.functions.hasEscrow.call_count, 3)
+
+    def test_invalidate_escrow_cache(self):
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = True
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        first = self.escrow._get_escrow_contract(escrow_address)
+
+        self.escrow.invalidate_escrow_cache(escrow_address)
+        second = self.escrow._get_escrow_contract(escrow_address)
+        self.escrow.invalidate_escrow_cache()
+        third = self.escrow._get_escrow_contract(escrow_address)
+
+        self.assertIsNot(first, second)
+        self.assertIsNot(second, third)
+        self.assertEqual(self.escrow.factory_contract.functions.hasEscrow.call_count, 1)
+
+    def test_invalidate_escrow_cache_invalid_address(self):
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.invalidate_escrow_cache("invalid_address")
+        self.assertEqual(f"Invalid escrow address: invalid_address", str(cm.exception))
+
+    def test_invalid_escrow_is_not_cached(self):
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = False
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
+        escrow_address = "0x1234567890123456789012345678901234567890"
+
+        for _ in range(2):
+            with self.assertRaises(EscrowClientError):
+                self.escrow._get_escrow_contract(escrow_address)
+        self.assertEqual(self.escrow.factory_contract.functions.hasEscrow.call_count, 2)
+
+    def test_is_factory_escrow_executes_call(self):
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = True
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
+        escrow_address = Web3.toChecksumAddress(
+            "0x1234567890123456789012345678901234567890"
+        )
+
+        self.assertTrue(self.escrow._is_factory_escrow(escrow_address))
+        self.assertTrue(self.escrow._is_factory_escrow(escrow_address))
+
+        mock_has_escrow.assert_called_once_with(escrow_address)
+        mock_has_escrow.return_value.call.assert_called_once_with()
+
+    def test_is_factory_escrow_does_not_remember_negative_results(self):
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.side_effect = [False, True]
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
+        escrow_address = Web3.toChecksumAddress(
+            "0x1234567890123456789012345678901234567890"
+        )
+
+        self.assertFalse(self.escrow._is_factory_escrow(escrow_address))
+        self.assertTrue(self.escrow._is_factory_escrow(escrow_address))
+        self.assertEqual(mock_has_escrow.call_count, 2)
+
+    def test_prewarm_escrow_cache(self):
+        mock_has_escrow = MagicMock()
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
+        with patch("human_protocol_sdk.utils.get_data_from_subgraph") as mock_function:
+            mock_function.return_value = {
+                "data": {
+                    "launchedEscrows": [
+                        {"id": "0x1234567890123456789012345678901234567890"},
+                        {"id": "0x1234567890123456789012345678901234567891"},
+                    ]
+                }
+            }
+
+            result = self.escrow.prewarm_escrow_cache()
+
+            self.assertEqual(result, 2)
+            self.assertEqual(
+                mock_function.call_args.kwargs["variables"]["where"], {"id_gt": ""}
+            )
+            self.escrow._get_escrow_contract(
+                "0x1234567890123456789012345678901234567890"
+            )
+            self.escrow._get_escrow_contract(
+                "0x1234567890123456789012345678901234567891"
+            )
+            mock_has_escrow.assert_not_called()
+
+    def test_prewarm_escrow_cache_by_requester(self):
+        requester_address = "0x1234567890123456789012345678901234567891"
+        with patch("human_protocol_sdk.utils.get_data_from_subgraph") as mock_function:
+            mock_function.return_value = {"data": {"launchedEscrows": []}}
+
+            result = self.escrow.prewarm_escrow_cache(requester_address)
+
+            self.assertEqual(result, 0)
+            self.assertEqual(
+                mock_function.call_args.kwargs["variables"]["where"],
+                {"from": requester_address, "id_gt": ""},
+            )
+
+    def test_prewarm_escrow_cache_invalid_address(self):
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.prewarm_escrow_cache("invalid_address")
+        self.assertEqual(
+            f"Invalid requester address: invalid_address", str(cm.exception)
+        )
+
+    def test_get_escrow_state(self):
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        oracle_address = "0x1234567890123456789012345678901234567891"
+        self.escrow.multicall.is_aggregated = MagicMock(return_value=True)
+        self.escrow.multicall.call = MagicMock(
+            return_value=[
+                100,
+                Status.Pending.value,
+                "http://localhost/manifest.json",
+                "",
+                "http://localhost/intermediate.json",
+                escrow_address,
+                oracle_address,
+                oracle_address,
+                True,
+            ]
+        )
+
+        result = self.escrow.get_escrow_state(escrow_address.lower())
+
+        self.assertIsInstance(result, EscrowState)
+        self.assertEqual(result.address, escrow_address)
+        self.assertEqual(result.balance, 100)
+        self.assertEqual(result.status, Status.Pending)
+        self.assertEqual(result.manifest_url, "http://localhost/manifest.json")
+        self.assertEqual(result.results_url, "")
+        self.assertEqual(
+            result.intermediate_results_url, "http://localhost/intermediate.json"
+        )
+        self.assertEqual(result.token_address, escrow_address)
+        self.assertEqual(result.recording_oracle_address, oracle_address)
+        self.assertEqual(result.reputation_oracle_address, oracle_address)
+
+        calls = self.escrow.multicall.call.call_args.args[0]
+        self.assertEqual(len(calls), 9)
+        self.assertEqual(calls[-1].fn_name, "hasEscrow")
+        self.assertTrue(self.escrow._is_verified_escrow(escrow_address))
+        self.assertIn(escrow_address, self.escrow._escrow_contracts)
+
+    def test_get_escrow_state_verified_escrow(self):
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        self.escrow._verified_escrows.add(escrow_address)
+        self.escrow.multicall.is_aggregated = MagicMock(return_value=True)
+        self.escrow.multicall.call = MagicMock(
+            return_value=[100, 0, "", "", "", escrow_address, "", ""]
+        )
+
+        result = self.escrow.get_escrow_state(escrow_address)
+
+        self.assertEqual(result.status, Status.Launched)
+        calls = self.escrow.multicall.call.call_args.args[0]
+        self.assertEqual(len(calls), 8)
+        self.assertNotIn("hasEscrow", [call.fn_name for call in calls])
+
+    def test_get_escrow_state_without_multicall(self):
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        mock_has_escrow = MagicMock()
+        mock_has_escrow.return_value.call.return_value = True
+        self.escrow.factory_contract.functions.hasEscrow = mock_has_escrow
+        self.escrow.multicall.is_aggregated = MagicMock(return_value=False)
+        self.escrow.multicall.call = MagicMock(
+            return_value=[100, 0, "", "", "", escrow_address, "", ""]
+        )
+
+        self.escrow.get_escrow_state(escrow_address)
+
+        mock_has_escrow.assert_called_once_with(escrow_address)
+        calls = self.escrow.multicall.call.call_args.args[0]
+        self.assertEqual(len(calls), 8)
+
+    def test_get_escrow_state_invalid_address(self):
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.get_escrow_state("invalid_address")
+        self.assertEqual(f"Invalid escrow address: invalid_address", str(cm.exception))
+
+    def test_get_escrow_state_invalid_escrow(self):
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        self.escrow.multicall.is_aggregated = MagicMock(return_value=True)
+        self.escrow.multicall.call = MagicMock(
+            return_value=[MulticallError("Error")] * 8 + [False]
+        )
+
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.get_escrow_state(escrow_address)
+        self.assertEqual(
+            "Escrow address is not provided by the factory", str(cm.exception)
+        )
+        self.assertFalse(self.escrow._is_verified_escrow(escrow_address))
+        self.assertNotIn(escrow_address, self.escrow._escrow_contracts)
+
+    def test_get_escrow_state_failed_call(self):
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        self.escrow._verified_escrows.add(escrow_address)
+        self.escrow.multicall.is_aggregated = MagicMock(return_value=True)
+        self.escrow.multicall.call = MagicMock(
+            return_value=[MulticallError("Call to getBalance reverted")] + [""] * 7
+        )
+
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.get_escrow_state(escrow_address)
+        self.assertEqual(
+            "Failed to get escrow state: Call to getBalance reverted",
+            str(cm.exception),
+        )
+
+    def _mock_multicall(self, invalid_escrows=()):
+        def call(calls):
+            results = []
+            for call in calls:
+                if call.fn_name == "hasEscrow":
+                    results.append(call.args[0] not in invalid_escrows)
+                elif call.fn_name == "getBalance":
+                    results.append(int(call.address, 16) % 1000)
+                elif call.fn_name == "status":
+                    results.append(Status.Pending.value)
+                else:
+                    results.append("")
+            return results
+
+        self.escrow.multicall.is_aggregated = MagicMock(return_value=True)
+        self.escrow.multicall.call = MagicMock(side_effect=call)
+
+    def test_get_escrow_states(self):
+        escrow_addresses = [
+            Web3.toChecksumAddress(f"0x{i:040x}") for i in range(1, 251)
+        ]
+        self._mock_multicall()
+        chunk_callback = MagicMock()
+
+        results = list(
+            self.escrow.get_escrow_states(
+                escrow_addresses,
+                chunk_size=100,
+                max_workers=2,
+                chunk_callback=chunk_callback,
+            )
+        )
+
+        self.assertEqual([result.address for result in results], escrow_addresses)
+        self.assertEqual([result.balance for result in results], list(range(1, 251)))
+        self.assertEqual(self.escrow.multicall.call.call_count, 3)
+        self.assertEqual(
+            [call.args[:2] for call in chunk_callback.call_args_list],
+            [(0, 100), (1, 100), (2, 50)],
+        )
+        for call in chunk_callback.call_args_list:
+            self.assertGreaterEqual(call.args[2], 0)
+
+    def test_get_escrow_states_verified_escrows(self):
+        escrow_addresses = [Web3.toChecksumAddress(f"0x{i:040x}") for i in range(1, 11)]
+        self._mock_multicall()
+
+        list(self.escrow.get_escrow_states(escrow_addresses))
+        list(self.escrow.get_escrow_states(escrow_addresses))
+
+        first_calls = self.escrow.multicall.call.call_args_list[0].args[0]
+        second_calls = self.escrow.multicall.call.call_args_list[1].args[0]
+        self.assertEqual(len(first_calls), 90)
+        self.assertEqual(len(second_calls), 80)
+
+    def test_get_escrow_states_invalid_escrow(self):
+        escrow_addresses = [Web3.toChecksumAddress(f"0x{i:040x}") for i in range(1, 4)]
+        self._mock_multicall(invalid_escrows=[escrow_addresses[1]])
+
+        results = list(self.escrow.get_escrow_states(escrow_addresses))
+
+        self.assertIsInstance(results[0], EscrowState)
+        self.assertIsInstance(results[1], EscrowClientError)
+        self.assertEqual(
+            "Escrow address is not provided by the factory", str(results[1])
+        )
+        self.assertIsInstance(results[2], EscrowState)
+
+    def test_get_escrow_states_failed_factory_check(self):
+        escrow_addresses = [Web3.toChecksumAddress(f"0x{i:040x}") for i in range(1, 3)]
+        self._mock_multicall()
+        call = self.escrow.multicall.call.side_effect
+
+        def failing_has_escrow(calls):
+            return [
+                MulticallError("Call to hasEscrow reverted")
+                if result is True and calls[index].args[0] == escrow_addresses[0]
+                else result
+                for index, result in enumerate(call(calls))
+            ]
+
+        self.escrow.multicall.call.side_effect = failing_has_escrow
+
+        results = list(self.escrow.get_escrow_states(escrow_addresses))
+
+        self.assertIsInstance(results[0], EscrowClientError)
+        self.assertEqual(
+            "Failed to get escrow state: Call to hasEscrow reverted", str(results[0])
+        )
+        self.assertFalse(self.escrow._is_verified_escrow(escrow_addresses[0]))
+        self.assertIsInstance(results[1], EscrowState)
+
+    def test_get_escrow_states_failed_chunk(self):
+        escrow_addresses = [Web3.toChecksumAddress(f"0x{i:040x}") for i in range(1, 7)]
+        self._mock_multicall()
+        call = self.escrow.multicall.call.side_effect
+
+        def failing_call(calls):
+            if escrow_addresses[2] in [call.address for call in calls]:
+                raise Exception("Connection error")
+            return call(calls)
+
+        self.escrow.multicall.call.side_effect = failing_call
+
+        results = list(
+            self.escrow.get_escrow_states(escrow_addresses, chunk_size=2, max_workers=1)
+        )
+
+        for result in results[:2] + results[4:]:
+            self.assertIsInstance(result, EscrowState)
+        for result in results[2:4]:
+            self.assertIsInstance(result, EscrowClientError)
+            self.assertEqual("Connection error", str(result))
+
+    def test_get_escrow_states_failed_factory_call(self):
+        escrow_addresses = [Web3.toChecksumAddress(f"0x{i:040x}") for i in range(1, 3)]
+        self.escrow.multicall.is_aggregated = MagicMock(return_value=False)
+        self.escrow._is_factory_escrow = MagicMock(
+            side_effect=Exception("Connection error")
+        )
+
+        results = list(self.escrow.get_escrow_states(escrow_addresses))
+
+        for result in results:
+            self.assertIsInstance(result, EscrowClientError)
+            self.assertEqual("Connection error", str(result))
+
+    def test_get_escrow_states_stops_early(self):
+        escrow_addresses = [
+            Web3.toChecksumAddress(f"0x{i:040x}") for i in range(1, 101)
+        ]
+        self._mock_multicall()
+
+        escrow_states = self.escrow.get_escrow_states(
+            escrow_addresses, chunk_size=10, max_workers=1
+        )
+        next(escrow_states)
+        escrow_states.close()
+
+        self.assertLess(self.escrow.multicall.call.call_count, 10)
+
+    def test_get_escrow_states_invalid_params(self):
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.get_escrow_states(["invalid_address"])
+        self.assertEqual(f"Invalid escrow address: invalid_address", str(cm.exception))
+
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.get_escrow_states([], chunk_size=0)
+        self.assertEqual("Chunk size must be greater than 0", str(cm.exception))
+
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.get_escrow_states([], max_workers=0)
+        self.assertEqual("Max workers must be greater than 0", str(cm.exception))
+
+
+class AsyncEscrowTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.provider = FakeAsyncProvider()
+        self.w3 = async_web3(self.provider)
+        self.account = Account.from_key(DEFAULT_GAS_PAYER_PRIV)
+        self.escrow = await AsyncEscrowClient.create(self.w3, self.account)
+        self.escrow_address = "0x1234567890123456789012345678901234567890"
+
+    def encode(self, types, values):
+        return Web3.toHex(self.w3.codec.encode_abi(types, values))
+
+    async def test_create(self):
+        self.assertEqual(self.escrow.chain_id, ChainId.LOCALHOST.value)
+        self.assertEqual(self.escrow.network, NETWORKS[ChainId.LOCALHOST])
+        self.assertIs(self.escrow.account, self.account)
+
+    async def test_init_with_invalid_chain_id(self):
+        with self.assertRaises(EscrowClientError) as cm:
+            AsyncEscrowClient(self.w3, 9999)
+        self.assertEqual("Invalid ChainId: 9999", str(cm.exception))
+
+    async def test_get_status(self):
+        self.provider.set_call_result("status()", self.encode(["uint8"], [2]))
+
+        self.assertEqual(
+            await self.escrow.get_status(self.escrow_address), Status.Partial
+        )
+
+    async def test_get_status_invalid_address(self):
+        with self.assertRaises(EscrowClientError) as cm:
+            await self.escrow.get_status("invalid_address")
+        self.assertEqual("Invalid escrow address: invalid_address", str(cm.exception))
+
+    async def test_get_status_invalid_escrow(self):
+        self.provider.set_call_result(
+            "hasEscrow(address)", self.encode(["bool"], [False])
+        )
+
+        with self.assertRaises(EscrowClientError) as cm:
+            await self.escrow.get_status(self.escrow_address)
+        self.assertEqual(
+            "Escrow address is not provided by the factory", str(cm.exception)
+        )
+
+    async def test_get_escrow_contract_verified_once(self):
+        await self.escrow.get_balance(self.escrow_address)
+        await self.escrow.get_status(self.escrow_address)
+
+        self.assertEqual(
+            [method for method, _ in self.provider.requests].count("eth_call"), 3
+        )
+
+    async def test_get_escrow_state(self):
+        for signature, types, value in (
+            ("getBalance()", ["uint256"], 100),
+            ("status()", ["uint8"], 1),
+            ("manifestUrl()", ["string"], "https://manifest"),
+            ("finalResultsUrl()", ["string"], ""),
+            ("intermediateResultsUrl()", ["string"], "https://intermediate"),
+            ("token()", ["address"], self.escrow_address),
+            ("recordingOracle()", ["address"], self.account.address),
+            ("reputationOracle()", ["address"], self.account.address),
+        ):
+            self.provider.set_call_result(signature, self.encode(types, [value]))
+
+        escrow_state = await self.escrow.get_escrow_state(self.escrow_address)
+
+        self.assertEqual(escrow_state.address, self.escrow_address)
+        self.assertEqual(escrow_state.balance, 100)
+        self.assertEqual(escrow_state.status, Status.Pending)
+        self.assertEqual(escrow_state.manifest_url, "https://manifest")
+        self.assertEqual(escrow_state.intermediate_results_url, "https://intermediate")
+        self.assertEqual(escrow_state.reputation_oracle_address, self.account.address)
+
+    async def test_complete(self):
+        await self.escrow.complete(self.escrow_address)
+
+        [raw_transaction] = self.provider.transactions
+        self.assertEqual(
+            Account.recover_transaction(raw_transaction), self.account.address
+        )
+
+    async def test_complete_without_waiting(self):
+        pending = await self.escrow.complete(self.escrow_address, wait=False)
+
+        self.assertIsInstance(pending, AsyncPendingTransaction)
+        self.assertNotIn(
+            "eth_getTransactionReceipt",
+            [method for method, _ in self.provider.requests],
+        )
+        receipt = await pending.wait()
+        self.assertEqual(receipt["status"], 1)
+
+    async def test_complete_without_account(self):
+        escrow = AsyncEscrowClient(self.w3, ChainId.LOCALHOST.value)
+
+        with self.assertRaises(EscrowClientError) as cm:
+            await escrow.complete(self.escrow_address)
+        self.assertEqual("You must add an account to Web3 instance", str(cm.exception))
+
+    async def test_pipelined_transactions_use_consecutive_nonces(self):
+        self.provider.transaction_count = 7
+
+        pending = await asyncio.gather(
+            *[
+                self.escrow.store_results(
+                    self.escrow_address,
+                    "https://www.example.com/results",
+                    "hash",
+                    wait=False,
+                )
+                for _ in range(3)
+            ]
+        )
+
+        self.assertEqual(len({tx.tx_hash for tx in pending}), 3)
+        self.assertEqual(
+            [method for method, _ in self.provider.requests].count(
+                "eth_getTransactionCount"
+            ),
+            1,
+        )
+
+    async def test_bulk_payout_invalid_amounts(self):
+        with self.assertRaises(EscrowClientError) as cm:
+            await self.escrow.bulk_payout(
+                self.escrow_address,
+                [self.account.address],
+                [-10],
+                "https://www.example.com/results",
+                "hash",
+                1,
+            )
+        self.assertEqual("Amounts cannot be negative", str(cm.exception))
+
+    async def test_bulk_payout_not_enough_balance(self):
+        self.provider.set_call_result("getBalance()", self.encode(["uint256"], [10]))
+
+        with self.assertRaises(EscrowClientError) as cm:
+            await self.escrow.bulk_payout(
+                self.escrow_address,
+                [self.account.address],
+                [100],
+                "https://www.example.com/results",
+                "hash",
+                1,
+            )
+        self.assertEqual(
+            "Escrow does not have enough balance. Current balance: 10. Amounts: 100",
+            str(cm.exception),
+        )
+
+    async def test_get_launched_escrows(self):
+        with patch(
+            "human_protocol_sdk.utils.async_get_data_from_subgraph",
+            AsyncMock(
+                return_value={
+                    "data": {"launchedEscrows": [{"id": "0x1"}, {"id": "0x2"}]}
+                }
+            ),
+        ) as mock_function:
+            escrows = await self.escrow.get_launched_escrows(self.account.address)
+
+        self.assertEqual(escrows, ["0x1", "0x2"])
+        mock_function.assert_awaited_once_with(
+            NETWORKS[ChainId.LOCALHOST]["subgraph_url"],
+            LAUNCHED_ESCROWS_QUERY,
+            variables={
+                "first": 1000,
+                "where": {"from": self.account.address, "id_gt": ""},
+            },
+        )
+
 
 if __name__ == "__main__":
     unittest.main(exit=True)
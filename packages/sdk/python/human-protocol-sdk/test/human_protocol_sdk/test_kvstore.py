@@ -1,10 +1,19 @@
 import unittest
 
 from human_protocol_sdk.constants import NETWORKS
-from test.human_protocol_sdk.utils import DEFAULT_GAS_PAYER_PRIV
+from test.human_protocol_sdk.utils import (
+    DEFAULT_GAS_PAYER_PRIV,
+    FakeAsyncProvider,
+    async_web3,
+)
 from unittest.mock import MagicMock, PropertyMock, patch
 
-from human_protocol_sdk.kvstore import KVStoreClient, KVStoreClientError
+from eth_account import Account
+from human_protocol_sdk.kvstore import (
+    AsyncKVStoreClient,
+    KVStoreClient,
+    KVStoreClientError,
+)
 from human_protocol_sdk.constants import ChainId
 from web3 import Web3
 from web3.providers.rpc import HTTPProvider
@@ -203,5 +212,53 @@ class KVStoreTestCase(unittest.TestCase):
         self.assertEqual(result, "mock_value")
 
 
+class AsyncKVStoreTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.provider = FakeAsyncProvider()
+        self.w3 = async_web3(self.provider)
+        self.account = Account.from_key(DEFAULT_GAS_PAYER_PRIV)
+        self.kvstore = await AsyncKVStoreClient.create(self.w3, self.account)
+
+    async def test_create(self):
+        self.assertEqual(self.kvstore.network, NETWORKS[ChainId.LOCALHOST])
+        self.assertIsNotNone(self.kvstore.kvstore_contract)
+
+    async def test_init_with_invalid_chain_id(self):
+        with self.assertRaises(KVStoreClientError) as cm:
+            AsyncKVStoreClient(self.w3, 9999)
+        self.assertEqual("Invalid ChainId: 9999", str(cm.exception))
+
+    async def test_set(self):
+        await self.kvstore.set("key", "value")
+
+        [raw_transaction] = self.provider.transactions
+        self.assertEqual(
+            Account.recover_transaction(raw_transaction), self.account.address
+        )
+
+    async def test_set_empty_key(self):
+        with self.assertRaises(KVStoreClientError) as cm:
+            await self.kvstore.set("", "value")
+        self.assertEqual("Key can not be empty", str(cm.exception))
+        self.assertEqual(self.provider.transactions, [])
+
+    async def test_set_bulk_different_length_array(self):
+        with self.assertRaises(KVStoreClientError) as cm:
+            await self.kvstore.set_bulk(["key1", "key2"], ["value1"])
+        self.assertEqual("Arrays must have same length", str(cm.exception))
+
+    async def test_get(self):
+        self.provider.default_call_result = Web3.toHex(
+            self.w3.codec.encode_abi(["string"], ["value"])
+        )
+
+        self.assertEqual(await self.kvstore.get(self.account.address, "key"), "value")
+
+    async def test_get_invalid_address(self):
+        with self.assertRaises(KVStoreClientError) as cm:
+            await self.kvstore.get("invalid_address", "key")
+        self.assertEqual("Invalid address: invalid_address", str(cm.exception))
+
+
 if __name__ == "__main__":
     unittest.main(exit=True)
@@ -0,0 +1,181 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from human_protocol_sdk.multicall import MULTICALL3_ADDRESS, Multicall, MulticallError
+from human_protocol_sdk.utils import get_escrow_interface
+from web3 import Web3
+from web3.providers.ipc import IPCProvider
+from web3.providers.rpc import HTTPProvider
+
+ESCROW_ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+class MulticallTestCase(unittest.TestCase):
+    def setUp(self):
+        self.w3 = Web3(MagicMock(spec=HTTPProvider))
+        self.w3.eth.get_code = MagicMock(return_value=b"\x01")
+        self.escrow_contract = self.w3.eth.contract(
+            address=ESCROW_ADDRESS, abi=get_escrow_interface()["abi"]
+        )
+        self.multicall = Multicall(self.w3)
+
+    def test_init_without_address(self):
+        multicall = Multicall(self.w3, "")
+
+        self.assertIsNone(multicall.multicall_contract)
+        self.assertFalse(multicall.is_available())
+        self.w3.eth.get_code.assert_not_called()
+
+    def test_is_available_checked_once(self):
+        self.assertTrue(self.multicall.is_available())
+        self.assertTrue(self.multicall.is_available())
+
+        self.w3.eth.get_code.assert_called_once_with(MULTICALL3_ADDRESS)
+
+    def test_call_empty(self):
+        self.assertEqual(self.multicall.call([]), [])
+        self.w3.eth.get_code.assert_not_called()
+
+    def test_call_aggregates(self):
+        mock_aggregate = MagicMock()
+        mock_aggregate.return_value.call.return_value = [
+            (True, self.w3.codec.encode_abi(["uint256"], [100])),
+            (True, self.w3.codec.encode_abi(["string"], ["http://localhost"])),
+            (
+                True,
+                self.w3.codec.encode_abi(["address"], [ESCROW_ADDRESS.lower()]),
+            ),
+            (False, b""),
+        ]
+        self.multicall.multicall_contract.functions.aggregate3 = mock_aggregate
+        calls = [
+            self.escrow_contract.functions.getBalance(),
+            self.escrow_contract.functions.manifestUrl(),
+            self.escrow_contract.functions.token(),
+            self.escrow_contract.functions.cancel(),
+        ]
+
+        results = self.multicall.call(calls, block_identifier=10)
+
+        self.assertEqual(results[0], 100)
+        self.assertEqual(results[1], "http://localhost")
+        self.assertEqual(results[2], ESCROW_ADDRESS)
+        self.assertIsInstance(results[3], MulticallError)
+        mock_aggregate.assert_called_once_with(
+            [(ESCROW_ADDRESS, True, call._encode_transaction_data()) for call in calls]
+        )
+        mock_aggregate.return_value.call.assert_called_once_with(block_identifier=10)
+
+    def test_call_invalid_return_data(self):
+        mock_aggregate = MagicMock()
+        mock_aggregate.return_value.call.return_value = [(True, b"")]
+        self.multicall.multicall_contract.functions.aggregate3 = mock_aggregate
+
+        results = self.multicall.call([self.escrow_contract.functions.getBalance()])
+
+        self.assertIsInstance(results[0], MulticallError)
+
+    def test_call_batch(self):
+        self.w3.eth.get_code = MagicMock(return_value=b"")
+        self.w3.provider.endpoint_uri = "http://localhost:8545"
+        self.w3.provider.get_request_kwargs.return_value = {"timeout": 5}
+        calls = [
+            self.escrow_contract.functions.getBalance(),
+            self.escrow_contract.functions.manifestUrl(),
+            self.escrow_contract.functions.cancel(),
+        ]
+        responses = [
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "result": Web3.toHex(
+                    self.w3.codec.encode_abi(["string"], ["http://localhost"])
+                ),
+            },
+            {
+                "jsonrpc": "2.0",
+                "id": 0,
+                "result": Web3.toHex(self.w3.codec.encode_abi(["uint256"], [100])),
+            },
+            {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "error": {"code": -32000, "message": "execution reverted"},
+            },
+        ]
+
+        with patch(
+            "human_protocol_sdk.multicall.make_post_request",
+            return_value=json.dumps(responses).encode(),
+        ) as mock_post:
+            self.assertTrue(self.multicall.is_aggregated())
+            results = self.multicall.call(calls, block_identifier=10)
+
+        self.assertEqual(results[0], 100)
+        self.assertEqual(results[1], "http://localhost")
+        self.assertIsInstance(results[2], MulticallError)
+        self.assertEqual("Call to cancel failed: execution reverted", str(results[2]))
+        mock_post.assert_called_once()
+        self.assertEqual(mock_post.call_args.args[0], "http://localhost:8545")
+        self.assertEqual(mock_post.call_args.kwargs, {"timeout": 5})
+        self.assertEqual(
+            json.loads(mock_post.call_args.args[1]),
+            [
+                {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "method": "eth_call",
+                    "params": [
+                        {
+                            "to": ESCROW_ADDRESS,
+                            "data": call._encode_transaction_data(),
+                        },
+                        "0xa",
+                    ],
+                }
+                for request_id, call in enumerate(calls)
+            ],
+        )
+
+    def test_call_batch_not_supported(self):
+        self.w3.eth.get_code = MagicMock(return_value=b"")
+        self.w3.provider.get_request_kwargs.return_value = {}
+        mock_balance = MagicMock()
+        mock_balance.call.return_value = 100
+        mock_balance.address = ESCROW_ADDRESS
+        mock_balance._encode_transaction_data.return_value = "0x12065fe0"
+        error = {"jsonrpc": "2.0", "id": None, "error": {"message": "Invalid"}}
+
+        with patch(
+            "human_protocol_sdk.multicall.make_post_request",
+            return_value=json.dumps(error).encode(),
+        ) as mock_post:
+            self.assertEqual(self.multicall.call([mock_balance]), [100])
+            self.assertEqual(self.multicall.call([mock_balance]), [100])
+
+        mock_post.assert_called_once()
+        self.assertFalse(self.multicall.is_aggregated())
+        self.assertEqual(mock_balance.call.call_count, 2)
+
+    def test_call_without_multicall(self):
+        self.w3 = Web3(MagicMock(spec=IPCProvider))
+        self.w3.eth.get_code = MagicMock(return_value=b"")
+        self.multicall = Multicall(self.w3)
+        self.assertFalse(self.multicall.is_aggregated())
+        mock_balance = MagicMock()
+        mock_balance.call.return_value = 100
+        mock_status = MagicMock()
+        mock_status.call.side_effect = Exception("Error")
+        mock_status.fn_name = "status"
+
+        results = self.multicall.call([mock_balance, mock_status])
+
+        self.assertEqual(results[0], 100)
+        self.assertIsInstance(results[1], MulticallError)
+        self.assertEqual("Call to status failed: Error", str(results[1]))
+        mock_balance.call.assert_called_once_with(block_identifier="latest")
+
+
+if __name__ == "__main__":
+    unittest.main(exit=True)
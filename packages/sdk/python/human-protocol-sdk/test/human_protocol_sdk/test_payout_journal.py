@@ -0,0 +1,160 @@
+import os
+import tempfile
+import unittest
+
+from human_protocol_sdk.constants import PayoutChunkStatus
+from human_protocol_sdk.escrow import PayoutChunk
+from human_protocol_sdk.payout_journal import PayoutJournal, PayoutJournalError
+
+ESCROW_ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+class PayoutJournalTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "payouts.db")
+        self.journal = PayoutJournal(self.path)
+        self.chunks = [
+            PayoutChunk(2**200, [ESCROW_ADDRESS], [10**24]),
+            PayoutChunk(2**200 + 1, [ESCROW_ADDRESS, ESCROW_ADDRESS], [1, 2]),
+        ]
+
+    def tearDown(self):
+        self.journal.close()
+        self.directory.cleanup()
+
+    def test_record_plan_and_load(self):
+        self.journal.record_plan(
+            ESCROW_ADDRESS.lower(), self.chunks, "http://localhost", "test", 42
+        )
+        self.journal.close()
+        self.journal = PayoutJournal(self.path)
+
+        payout = self.journal.load(ESCROW_ADDRESS)
+
+        self.assertEqual(payout.escrow_address, ESCROW_ADDRESS)
+        self.assertEqual(payout.final_results_url, "http://localhost")
+        self.assertEqual(payout.final_results_hash, "test")
+        self.assertEqual(payout.from_block, 42)
+        self.assertEqual(
+            [(chunk.tx_id, chunk.recipients, chunk.amounts) for chunk in payout.chunks],
+            [
+                (2**200, [ESCROW_ADDRESS], [10**24]),
+                (2**200 + 1, [ESCROW_ADDRESS, ESCROW_ADDRESS], [1, 2]),
+            ],
+        )
+        self.assertTrue(
+            all(chunk.status == PayoutChunkStatus.Pending for chunk in payout.chunks)
+        )
+
+    def test_load_unknown_escrow(self):
+        self.assertIsNone(self.journal.load(ESCROW_ADDRESS))
+
+    def test_update_chunk(self):
+        self.journal.record_plan(
+            ESCROW_ADDRESS, self.chunks, "http://localhost", "test", 0
+        )
+        self.chunks[0].status = PayoutChunkStatus.Submitted
+        self.chunks[0].tx_hash = "0x01"
+        self.chunks[1].status = PayoutChunkStatus.Failed
+        self.chunks[1].error = "Error"
+
+        for chunk in self.chunks:
+            self.journal.update_chunk(ESCROW_ADDRESS, chunk)
+
+        chunks = self.journal.load(ESCROW_ADDRESS).chunks
+        self.assertEqual(
+            [(chunk.status, chunk.tx_hash, chunk.error) for chunk in chunks],
+            [
+                (PayoutChunkStatus.Submitted, "0x01", None),
+                (PayoutChunkStatus.Failed, None, "Error"),
+            ],
+        )
+
+    def test_update_unknown_chunk(self):
+        with self.assertRaises(PayoutJournalError) as cm:
+            self.journal.update_chunk(ESCROW_ADDRESS, PayoutChunk(1, [], []))
+        self.assertEqual(
+            f"Chunk 1 of escrow {ESCROW_ADDRESS} is not in the journal",
+            str(cm.exception),
+        )
+
+    def test_record_plan_unfinished_payout(self):
+        self.journal.record_plan(
+            ESCROW_ADDRESS, self.chunks, "http://localhost", "test", 0
+        )
+
+        with self.assertRaises(PayoutJournalError) as cm:
+            self.journal.record_plan(
+                ESCROW_ADDRESS, self.chunks, "http://localhost", "test", 0
+            )
+        self.assertEqual(
+            f"Escrow {ESCROW_ADDRESS} has an unfinished payout in the journal",
+            str(cm.exception),
+        )
+
+    def test_record_plan_replaces_completed_payout(self):
+        self.journal.record_plan(
+            ESCROW_ADDRESS, self.chunks, "http://localhost", "test", 0
+        )
+        for chunk in self.chunks:
+            chunk.status = PayoutChunkStatus.Confirmed
+            self.journal.update_chunk(ESCROW_ADDRESS, chunk)
+
+        self.journal.record_plan(
+            ESCROW_ADDRESS,
+            [PayoutChunk(7, [ESCROW_ADDRESS], [1])],
+            "http://localhost/new",
+            "new",
+            10,
+        )
+
+        payout = self.journal.load(ESCROW_ADDRESS)
+        self.assertEqual(payout.final_results_url, "http://localhost/new")
+        self.assertEqual([chunk.tx_id for chunk in payout.chunks], [7])
+
+    def test_discard(self):
+        self.journal.record_plan(
+            ESCROW_ADDRESS, self.chunks, "http://localhost", "test", 0
+        )
+        self.chunks[0].status = PayoutChunkStatus.Failed
+        self.journal.update_chunk(ESCROW_ADDRESS, self.chunks[0])
+
+        self.journal.discard(ESCROW_ADDRESS.lower())
+
+        self.assertIsNone(self.journal.load(ESCROW_ADDRESS))
+        self.journal.record_plan(
+            ESCROW_ADDRESS, self.chunks, "http://localhost", "test", 0
+        )
+
+    def test_discard_submitted_chunk(self):
+        self.journal.record_plan(
+            ESCROW_ADDRESS, self.chunks, "http://localhost", "test", 0
+        )
+        self.chunks[1].status = PayoutChunkStatus.Submitted
+        self.journal.update_chunk(ESCROW_ADDRESS, self.chunks[1])
+
+        with self.assertRaises(PayoutJournalError) as cm:
+            self.journal.discard(ESCROW_ADDRESS)
+        self.assertEqual(
+            f"Escrow {ESCROW_ADDRESS} has submitted chunks in the journal",
+            str(cm.exception),
+        )
+        self.assertEqual(len(self.journal.load(ESCROW_ADDRESS).chunks), 2)
+
+    def test_discard_sent_chunk(self):
+        self.journal.record_plan(
+            ESCROW_ADDRESS, self.chunks, "http://localhost", "test", 0
+        )
+        # The send failed, but the transaction may have reached the node
+        self.chunks[0].status = PayoutChunkStatus.Failed
+        self.chunks[0].nonce = 3
+        self.journal.update_chunk(ESCROW_ADDRESS, self.chunks[0])
+
+        with self.assertRaises(PayoutJournalError):
+            self.journal.discard(ESCROW_ADDRESS)
+        self.assertEqual(self.journal.load(ESCROW_ADDRESS).chunks[0].nonce, 3)
+
+
+if __name__ == "__main__":
+    unittest.main(exit=True)
@@ -6,11 +6,19 @@ from web3 import Web3
 from web3.middleware import construct_sign_and_send_raw_middleware
 from web3.providers.rpc import HTTPProvider
 
+from eth_account import Account
 from human_protocol_sdk.constants import ChainId, NETWORKS
-from human_protocol_sdk.staking import StakingClient, StakingClientError
+from human_protocol_sdk.staking import (
+    REWARDS_INFO_QUERY,
+    AsyncStakingClient,
+    StakingClient,
+    StakingClientError,
+)
 
 from test.human_protocol_sdk.utils import (
     DEFAULT_GAS_PAYER_PRIV,
+    FakeAsyncProvider,
+    async_web3,
 )
 
 
@@ -412,11 +420,8 @@ class StakingTestCase(unittest.TestCase):
 
             mock_function.assert_called_once_with(
                 "subgraph_url",
-                """
-rewardAddedEvents(where:{slasher:"slasher1"}) {
-    escrow
-    amount
-}""",
+                REWARDS_INFO_QUERY,
+                variables={"slasher": "slasher1"},
             )
 
             self.assertEqual(len(rewards_info), 2)
@@ -426,5 +431,65 @@ rewardAddedEvents(where:{slasher:"slasher1"}) {
             self.assertEqual(rewards_info[1]["amount"], 20)
 
 
+class AsyncStakingTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.provider = FakeAsyncProvider()
+        self.w3 = async_web3(self.provider)
+        self.account = Account.from_key(DEFAULT_GAS_PAYER_PRIV)
+        self.staking_client = await AsyncStakingClient.create(self.w3, self.account)
+        self.escrow_address = "0x1234567890123456789012345678901234567890"
+
+    async def test_create(self):
+        self.assertEqual(self.staking_client.network, NETWORKS[ChainId.LOCALHOST])
+        self.assertIsNotNone(self.staking_client.staking_contract)
+
+    async def test_init_with_invalid_chain_id(self):
+        with self.assertRaises(StakingClientError) as cm:
+            AsyncStakingClient(self.w3, 9999)
+        self.assertEqual("Invalid ChainId: 9999", str(cm.exception))
+
+    async def test_stake(self):
+        await self.staking_client.stake(100)
+
+        [raw_transaction] = self.provider.transactions
+        self.assertEqual(
+            Account.recover_transaction(raw_transaction), self.account.address
+        )
+
+    async def test_stake_invalid_amount(self):
+        with self.assertRaises(StakingClientError) as cm:
+            await self.staking_client.stake(0)
+        self.assertEqual("Amount to stake must be greater than 0", str(cm.exception))
+
+    async def test_allocate_invalid_escrow(self):
+        self.provider.default_call_result = Web3.toHex(
+            self.w3.codec.encode_abi(["bool"], [False])
+        )
+
+        with self.assertRaises(StakingClientError) as cm:
+            await self.staking_client.allocate(self.escrow_address, 10)
+        self.assertEqual(
+            f"Invalid escrow address: {self.escrow_address}", str(cm.exception)
+        )
+        self.assertEqual(self.provider.transactions, [])
+
+    async def test_get_staker_info(self):
+        self.provider.default_call_result = Web3.toHex(
+            self.w3.codec.encode_abi(
+                ["(uint256,uint256,uint256,uint256)"], [(1, 2, 3, 4)]
+            )
+        )
+
+        self.assertEqual(
+            await self.staking_client.get_staker_info(),
+            {
+                "tokens_staked": 1,
+                "tokens_allocated": 2,
+                "tokens_locked": 3,
+                "tokens_locked_until": 4,
+            },
+        )
+
+
 if __name__ == "__main__":
     unittest.main(exit=True)
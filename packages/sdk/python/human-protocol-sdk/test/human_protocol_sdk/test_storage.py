@@ -1,16 +1,25 @@
 import hashlib
+import io
 import json
+import os
 import random
+import tempfile
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 import types
 from minio import S3Error
+from minio.error import ServerError
 
 from human_protocol_sdk.storage import (
     Credentials,
     StorageClient,
     StorageClientError,
+    StorageDedupIndex,
+    StorageDiskCache,
     StorageFileNotFoundError,
+    get_storage_cache,
+    set_storage_cache,
 )
 import requests
 
@@ -41,6 +50,9 @@ class TestStorageClient(unittest.TestCase):
             region=self.region,
             credentials=self.credentials,
         )
+        backoff_patcher = patch("human_protocol_sdk.storage.STORAGE_RETRY_BACKOFF", 0)
+        backoff_patcher.start()
+        self.addCleanup(backoff_patcher.stop)
 
     def test_init_authenticated_access(self):
         with patch("human_protocol_sdk.storage.Minio") as mock_client:
@@ -152,6 +164,225 @@ class TestStorageClient(unittest.TestCase):
         )
         with self.assertRaises(StorageClientError):
             self.client.download_files(files=self.files, bucket=self.bucket)
+        # The retries of the other file stop once the first one fails
+        self.assertGreaterEqual(self.client.client.get_object.call_count, 4)
+
+    def test_download_files_exception_no_fail_fast(self):
+        self.client.client.get_object = MagicMock(
+            side_effect=Exception("Connection error")
+        )
+        result = self.client.download_files(
+            files=self.files, bucket=self.bucket, fail_fast=False
+        )
+        self.assertTrue(all(isinstance(e, StorageClientError) for e in result))
+        self.assertEqual(self.client.client.get_object.call_count, 8)
+
+    def test_download_files_ordered(self):
+        files = [f"file{i}.txt" for i in range(20)]
+
+        def get_object(bucket_name, object_name):
+            # Files at the start of the list finish last
+            time.sleep(0.001 * (20 - files.index(object_name)))
+            return MagicMock(read=MagicMock(return_value=object_name.encode()))
+
+        self.client.client.get_object = MagicMock(side_effect=get_object)
+        result = self.client.download_files(
+            files=files, bucket=self.bucket, max_workers=5
+        )
+        self.assertEqual(result, [file.encode() for file in files])
+
+    def test_download_files_sequential(self):
+        expected_result = [b"file1 contents", b"file2 contents"]
+        self.client.client.get_object = MagicMock(
+            side_effect=[
+                MagicMock(read=MagicMock(return_value=expected_result[0])),
+                MagicMock(read=MagicMock(return_value=expected_result[1])),
+            ]
+        )
+        result = self.client.download_files(
+            files=self.files, bucket=self.bucket, max_workers=1
+        )
+        self.assertEqual(result, expected_result)
+
+    def test_download_files_retry(self):
+        response = MagicMock(read=MagicMock(return_value=b"file contents"))
+        self.client.client.get_object = MagicMock(
+            side_effect=[Exception("Connection error"), response]
+        )
+        result = self.client.download_files(files=["file1.txt"], bucket=self.bucket)
+        self.assertEqual(result, [b"file contents"])
+        self.assertEqual(self.client.client.get_object.call_count, 2)
+        response.release_conn.assert_called_once()
+
+    def test_download_files_no_retry_permanent_error(self):
+        self.client.client.get_object = MagicMock(
+            side_effect=S3Error(
+                code="AccessDenied",
+                message="Access denied",
+                resource="",
+                request_id="",
+                host_id="",
+                response="",
+            )
+        )
+        with self.assertRaises(StorageClientError):
+            self.client.download_files(files=["file1.txt"], bucket=self.bucket)
+        self.client.client.get_object.assert_called_once()
+
+    def test_download_files_collect_errors(self):
+        def get_object(bucket_name, object_name):
+            if object_name == "file2.txt":
+                raise S3Error(
+                    code="NoSuchKey",
+                    message="Key not found",
+                    resource="",
+                    request_id="",
+                    host_id="",
+                    response="",
+                )
+            return MagicMock(read=MagicMock(return_value=object_name.encode()))
+
+        self.client.client.get_object = MagicMock(side_effect=get_object)
+        result = self.client.download_files(
+            files=["file1.txt", "file2.txt", "file3.txt"],
+            bucket=self.bucket,
+            fail_fast=False,
+        )
+        self.assertEqual(result[0], b"file1.txt")
+        self.assertIsInstance(result[1], StorageFileNotFoundError)
+        self.assertEqual(result[2], b"file3.txt")
+
+    def test_stream_file(self):
+        response = MagicMock(stream=MagicMock(return_value=iter([b"file", b"1"])))
+        self.client.client.get_object = MagicMock(return_value=response)
+
+        chunks = list(
+            self.client.stream_file("file1.txt", bucket=self.bucket, chunk_size=4)
+        )
+
+        self.assertEqual(chunks, [b"file", b"1"])
+        response.stream.assert_called_once_with(4)
+        response.release_conn.assert_called_once()
+
+    def test_stream_file_resume(self):
+        def stream(chunk_size):
+            yield b"file"
+            raise Exception("Connection reset")
+
+        self.client.client.get_object = MagicMock(
+            side_effect=[
+                MagicMock(stream=stream),
+                MagicMock(stream=MagicMock(return_value=iter([b"1 contents"]))),
+            ]
+        )
+
+        chunks = list(self.client.stream_file("file1.txt", bucket=self.bucket))
+
+        self.assertEqual(b"".join(chunks), b"file1 contents")
+        self.assertEqual(
+            self.client.client.get_object.call_args_list[1].kwargs["offset"], 4
+        )
+
+    def test_stream_file_close(self):
+        response = MagicMock(stream=MagicMock(return_value=iter([b"file", b"1"])))
+        self.client.client.get_object = MagicMock(return_value=response)
+
+        chunks = self.client.stream_file("file1.txt", bucket=self.bucket)
+        next(chunks)
+        chunks.close()
+
+        response.close.assert_called_once()
+        response.release_conn.assert_called_once()
+
+    def test_stream_file_not_found(self):
+        self.client.client.get_object = MagicMock(
+            side_effect=S3Error(
+                code="NoSuchKey",
+                message="Key not found",
+                resource="",
+                request_id="",
+                host_id="",
+                response="",
+            )
+        )
+        with self.assertRaises(StorageFileNotFoundError):
+            list(self.client.stream_file("file1.txt", bucket=self.bucket))
+
+    def test_download_file_to_path(self):
+        self.client.client.get_object = MagicMock(
+            return_value=MagicMock(
+                stream=MagicMock(return_value=iter([b"file1 ", b"contents"]))
+            )
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "file1.txt")
+
+            size = self.client.download_file_to_path(
+                "file1.txt", bucket=self.bucket, path=path
+            )
+
+            self.assertEqual(size, 14)
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), b"file1 contents")
+            self.assertEqual(os.listdir(directory), ["file1.txt"])
+
+    def test_download_file_to_path_error(self):
+        self.client.client.get_object = MagicMock(
+            side_effect=Exception("Connection error")
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "file1.txt")
+            with self.assertRaises(StorageClientError):
+                self.client.download_file_to_path(
+                    "file1.txt", bucket=self.bucket, path=path
+                )
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_download_file_into(self):
+        self.client.client.get_object = MagicMock(
+            return_value=MagicMock(
+                stream=MagicMock(return_value=iter([b"file1 ", b"contents"]))
+            )
+        )
+        buffer = bytearray(20)
+
+        size = self.client.download_file_into(
+            "file1.txt", bucket=self.bucket, buffer=memoryview(buffer)
+        )
+
+        self.assertEqual(size, 14)
+        self.assertEqual(buffer[:size], b"file1 contents")
+
+    def test_download_file_into_too_small(self):
+        response = MagicMock(
+            stream=MagicMock(return_value=iter([b"file1 ", b"contents"]))
+        )
+        self.client.client.get_object = MagicMock(return_value=response)
+
+        with self.assertRaises(StorageClientError):
+            self.client.download_file_into(
+                "file1.txt", bucket=self.bucket, buffer=bytearray(10)
+            )
+        response.release_conn.assert_called_once()
+
+    def test_stream_file_from_url(self):
+        with patch("requests.get") as mock_get:
+            mock_response = mock_get.return_value.__enter__.return_value
+            mock_response.iter_content.return_value = iter([b"Test file", b" content"])
+            url = "https://www.example.com/file.txt"
+
+            chunks = list(StorageClient.stream_file_from_url(url, chunk_size=9))
+
+            self.assertEqual(chunks, [b"Test file", b" content"])
+            mock_get.assert_called_once_with(url, stream=True)
+            mock_response.iter_content.assert_called_once_with(9)
+
+    def test_stream_file_from_url_invalid_url(self):
+        url = "invalid_url"
+
+        with self.assertRaises(StorageClientError) as cm:
+            list(StorageClient.stream_file_from_url(url))
+        self.assertEqual(f"Invalid URL: {url}", str(cm.exception))
 
     def test_upload_files(self):
         file3 = "file3 content"
@@ -192,6 +423,64 @@ class TestStorageClient(unittest.TestCase):
         )
         self.assertEqual(result[0]["hash"], hash)
 
+    def test_upload_files_parallel(self):
+        files = [{"index": i} for i in range(20)]
+        keys = [
+            "s3"
+            + hashlib.sha1(json.dumps(file, sort_keys=True).encode("utf-8")).hexdigest()
+            + ".json"
+            for file in files
+        ]
+        not_found = S3Error(
+            code="NoSuchKey",
+            message="Object does not exist",
+            resource="",
+            request_id="",
+            host_id="",
+            response="",
+        )
+
+        def stat_object(bucket_name, object_name):
+            # Files at even positions are already in the bucket
+            time.sleep(0.001 * (20 - keys.index(object_name)))
+            if keys.index(object_name) % 2:
+                raise not_found
+            return MagicMock()
+
+        self.client.client.stat_object = MagicMock(side_effect=stat_object)
+        self.client.client.put_object = MagicMock()
+        result = self.client.upload_files(
+            files=files + files[:2], bucket=self.bucket, max_workers=5
+        )
+
+        self.assertEqual([file["key"] for file in result], keys + keys[:2])
+        self.assertEqual(self.client.client.stat_object.call_count, 20)
+        self.assertEqual(
+            sorted(
+                call.kwargs["object_name"]
+                for call in self.client.client.put_object.call_args_list
+            ),
+            sorted(keys[1::2]),
+        )
+
+    def test_upload_files_parallel_error(self):
+        files = [{"index": i} for i in range(20)]
+        self.client.client.stat_object = MagicMock(
+            side_effect=S3Error(
+                code="InvalidAccessKeyId",
+                message="Access denied",
+                resource="",
+                request_id="",
+                host_id="",
+                response="",
+            )
+        )
+        self.client.client.put_object = MagicMock()
+        with self.assertRaises(StorageClientError):
+            self.client.upload_files(files=files, bucket=self.bucket, max_workers=2)
+        self.client.client.put_object.assert_not_called()
+        self.assertLess(self.client.client.stat_object.call_count, 20)
+
     def test_upload_files_error(self):
         file3 = "file3 content"
 
@@ -223,6 +512,124 @@ class TestStorageClient(unittest.TestCase):
         with self.assertRaises(StorageClientError):
             self.client.upload_files(files=[file3], bucket=self.bucket)
 
+    def test_upload_stream_path(self):
+        content = b"result " * 1000
+        hash = hashlib.sha1(content).hexdigest()
+        self.client.client.stat_object = MagicMock(side_effect=self.not_found_error())
+        self.client.client.put_object = MagicMock(side_effect=self.consume_put)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.zip")
+            with open(path, "wb") as f:
+                f.write(content)
+
+            result = self.client.upload_stream(
+                path, bucket=self.bucket, extension=".zip", part_size=100
+            )
+
+        self.assertEqual(result["key"], f"s3{hash}.zip")
+        self.assertEqual(
+            result["url"], f"https://s3.us-west-2.amazonaws.com/my-bucket/s3{hash}.zip"
+        )
+        self.assertEqual(result["hash"], hash)
+        put_kwargs = self.client.client.put_object.call_args.kwargs
+        self.assertEqual(put_kwargs["object_name"], f"s3{hash}.zip")
+        self.assertEqual(put_kwargs["length"], len(content))
+        self.assertEqual(put_kwargs["part_size"], 100)
+
+    def test_upload_stream_path_exists(self):
+        content = b"result " * 1000
+        hash = hashlib.sha1(content).hexdigest()
+        self.client.client.stat_object = MagicMock()
+        self.client.client.put_object = MagicMock()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.zip")
+            with open(path, "wb") as f:
+                f.write(content)
+
+            result = self.client.upload_stream(path, bucket=self.bucket)
+
+        self.assertEqual(result["key"], f"s3{hash}")
+        self.client.client.put_object.assert_not_called()
+
+    def test_upload_stream_generator(self):
+        chunks = [b"result " * i for i in range(100)]
+        hash = hashlib.sha1(b"".join(chunks)).hexdigest()
+        self.client.client.stat_object = MagicMock(side_effect=self.not_found_error())
+        self.client.client.put_object = MagicMock(side_effect=self.consume_put)
+        self.client.client.compose_object = MagicMock()
+        self.client.client.remove_object = MagicMock()
+
+        result = self.client.upload_stream(
+            (chunk for chunk in chunks), bucket=self.bucket, extension=".zip"
+        )
+
+        self.assertEqual(result["key"], f"s3{hash}.zip")
+        self.assertEqual(result["hash"], hash)
+        upload_key = self.client.client.put_object.call_args.kwargs["object_name"]
+        self.assertTrue(upload_key.startswith(".uploads/"))
+        self.assertEqual(self.client.client.put_object.call_args.kwargs["length"], -1)
+        compose_kwargs = self.client.client.compose_object.call_args.kwargs
+        self.assertEqual(compose_kwargs["object_name"], f"s3{hash}.zip")
+        self.assertEqual(compose_kwargs["sources"][0].object_name, upload_key)
+        self.client.client.remove_object.assert_called_once_with(
+            bucket_name=self.bucket, object_name=upload_key
+        )
+
+    def test_upload_stream_generator_exists(self):
+        self.client.client.stat_object = MagicMock()
+        self.client.client.put_object = MagicMock(side_effect=self.consume_put)
+        self.client.client.compose_object = MagicMock()
+        self.client.client.remove_object = MagicMock()
+
+        self.client.upload_stream(iter([b"result"]), bucket=self.bucket)
+
+        self.client.client.compose_object.assert_not_called()
+        self.client.client.remove_object.assert_called_once()
+
+    def test_upload_stream_file_with_key(self):
+        content = b"result " * 1000
+        self.client.client.put_object = MagicMock(side_effect=self.consume_put)
+        self.client.client.compose_object = MagicMock()
+
+        result = self.client.upload_stream(
+            io.BytesIO(content), bucket=self.bucket, key="results/job.zip"
+        )
+
+        self.assertEqual(result["key"], "results/job.zip")
+        self.assertEqual(result["hash"], hashlib.sha1(content).hexdigest())
+        self.client.client.compose_object.assert_not_called()
+
+    def test_upload_stream_error(self):
+        self.client.client.put_object = MagicMock(
+            side_effect=Exception("Connection error")
+        )
+        self.client.client.compose_object = MagicMock()
+        self.client.client.remove_object = MagicMock()
+
+        with self.assertRaises(StorageClientError):
+            self.client.upload_stream(iter([b"result"]), bucket=self.bucket)
+
+        self.client.client.compose_object.assert_not_called()
+        self.client.client.remove_object.assert_called_once()
+
+    @staticmethod
+    def consume_put(bucket_name, object_name, data, length, **kwargs):
+        while data.read(kwargs["part_size"]):
+            pass
+
+    @staticmethod
+    def not_found_error():
+        return S3Error(
+            code="NoSuchKey",
+            message="Object does not exist",
+            resource="",
+            request_id="",
+            host_id="",
+            response="",
+        )
+
     def test_bucket_exists(self):
         self.client.client.bucket_exists = MagicMock(side_effect=[True])
         result = self.client.bucket_exists(bucket=self.bucket)
@@ -307,3 +714,330 @@ class TestStorageClient(unittest.TestCase):
                 raise AssertionError(
                     f"Expected {expected_length} objects, but found {len(object_list)}"
                 )
+
+
+class TestStorageDedupIndex(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.index = StorageDedupIndex(max_age=60)
+        self.client = StorageClient(
+            endpoint_url="s3.us-west-2.amazonaws.com",
+            region="us-west-2",
+            credentials=Credentials(
+                access_key="my-access-key", secret_key="my-secret-key"
+            ),
+            dedup_index=self.index,
+        )
+        self.keys = [
+            "s3" + hashlib.sha1(json.dumps(i).encode("utf-8")).hexdigest() + ".json"
+            for i in range(20)
+        ]
+        self.client.client.stat_object = MagicMock()
+        self.client.client.put_object = MagicMock()
+        self.client.client.list_objects = MagicMock(side_effect=self.list_objects)
+
+    def list_objects(self, bucket_name, prefix):
+        # Files at even positions are already in the bucket
+        return [
+            types.SimpleNamespace(object_name=key)
+            for key in self.keys[::2]
+            if key.startswith(prefix)
+        ]
+
+    def test_prefix(self):
+        self.assertEqual(self.index.prefix("s3abcdef.json"), "s3a")
+        self.assertIsNone(self.index.prefix("results/job.zip"))
+        self.assertEqual(len(self.index.prefixes()), 16)
+        self.assertEqual(
+            len(StorageDedupIndex(prefix_length=2).prefixes()),
+            256,
+        )
+
+    def test_refresh(self):
+        self.assertTrue(self.index.is_stale("my-bucket", "s3a"))
+
+        self.index.refresh("my-bucket", "s3a", ["s3a1.json"], time.time())
+
+        self.assertFalse(self.index.is_stale("my-bucket", "s3a"))
+        self.assertTrue(self.index.contains("my-bucket", "s3a1.json"))
+        self.assertFalse(self.index.contains("my-bucket", "s3a2.json"))
+        self.assertFalse(self.index.contains("other-bucket", "s3a1.json"))
+        self.assertEqual(self.index.info()["hits"], 1)
+        self.assertEqual(self.index.info()["misses"], 2)
+
+        self.index.refresh("my-bucket", "s3a", ["s3a2.json"], time.time() - 60)
+
+        self.assertTrue(self.index.is_stale("my-bucket", "s3a"))
+        self.assertFalse(self.index.contains("my-bucket", "s3a1.json"))
+
+    def test_persistent(self):
+        path = os.path.join(self.directory.name, "index.db")
+        index = StorageDedupIndex(max_age=60, path=path)
+        index.refresh("my-bucket", "s3a", ["s3a1.json"], time.time())
+        index.add("my-bucket", "s3b1.json")
+        index.close()
+
+        index = StorageDedupIndex(max_age=60, path=path)
+        self.assertFalse(index.is_stale("my-bucket", "s3a"))
+        self.assertTrue(index.contains("my-bucket", "s3a1.json"))
+        self.assertTrue(index.contains("my-bucket", "s3b1.json"))
+
+        index.refresh("my-bucket", "s3a", [], time.time())
+        self.assertFalse(index.contains("my-bucket", "s3a1.json"))
+        self.assertTrue(index.contains("my-bucket", "s3b1.json"))
+        index.close()
+
+    def test_upload_files(self):
+        result = self.client.upload_files(files=list(range(20)), bucket="my-bucket")
+
+        self.assertEqual([file["key"] for file in result], self.keys)
+        self.client.client.stat_object.assert_not_called()
+        self.assertEqual(
+            sorted(
+                call.kwargs["object_name"]
+                for call in self.client.client.put_object.call_args_list
+            ),
+            sorted(self.keys[1::2]),
+        )
+        self.assertEqual(
+            self.client.client.list_objects.call_count,
+            len({self.index.prefix(key) for key in self.keys}),
+        )
+
+        # Uploaded files are in the index, nothing is listed or uploaded again
+        self.client.client.list_objects.reset_mock()
+        self.client.client.put_object.reset_mock()
+        self.client.upload_files(files=list(range(20)), bucket="my-bucket")
+        self.client.client.list_objects.assert_not_called()
+        self.client.client.put_object.assert_not_called()
+
+    def test_upload_files_stale(self):
+        self.index.max_age = 0
+        self.client.upload_files(files=[0], bucket="my-bucket")
+        self.client.upload_files(files=[0], bucket="my-bucket")
+
+        self.assertEqual(self.client.client.list_objects.call_count, 2)
+        self.client.client.put_object.assert_not_called()
+
+    def test_refresh_dedup_index(self):
+        self.client.refresh_dedup_index("my-bucket")
+
+        self.assertEqual(self.client.client.list_objects.call_count, 16)
+        self.assertEqual(
+            sorted(
+                call.kwargs["prefix"]
+                for call in self.client.client.list_objects.call_args_list
+            ),
+            self.index.prefixes(),
+        )
+
+        # Fresh prefixes aren't listed again
+        self.client.refresh_dedup_index("my-bucket")
+        self.assertEqual(self.client.client.list_objects.call_count, 16)
+
+    def test_refresh_dedup_index_error(self):
+        self.client.client.list_objects = MagicMock(
+            side_effect=Exception("Connection error")
+        )
+        with self.assertRaises(StorageClientError):
+            self.client.upload_files(files=[0], bucket="my-bucket")
+        self.assertTrue(
+            self.index.is_stale("my-bucket", self.index.prefix(self.keys[0]))
+        )
+
+    def test_no_dedup_index(self):
+        client = StorageClient(endpoint_url="s3.us-west-2.amazonaws.com")
+        with self.assertRaises(StorageClientError):
+            client.refresh_dedup_index("my-bucket")
+
+
+class TestStorageDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.cache = StorageDiskCache(self.directory.name, max_size=100, max_age=60)
+        self.addCleanup(self.cache.close)
+        set_storage_cache(self.cache)
+        self.addCleanup(set_storage_cache, None)
+
+        self.client = StorageClient(
+            endpoint_url="s3.us-west-2.amazonaws.com",
+            region="us-west-2",
+            credentials=Credentials(
+                access_key="my-access-key", secret_key="my-secret-key"
+            ),
+        )
+        self.content_key = "s3" + hashlib.sha1(b"manifest").hexdigest() + ".json"
+
+    def test_get_storage_cache(self):
+        self.assertIs(get_storage_cache(), self.cache)
+
+    def test_put(self):
+        self.cache.put("https://www.example.com/file.txt", b"contents", '"etag"')
+
+        entry = self.cache.get("https://www.example.com/file.txt")
+        self.assertEqual(entry.etag, '"etag"')
+        self.assertEqual(self.cache.read(entry), b"contents")
+        self.assertTrue(self.cache.is_fresh(entry))
+        self.assertIsNone(self.cache.get("https://www.example.com/other.txt"))
+
+        # Another process sees the file
+        cache = StorageDiskCache(self.directory.name, max_size=100, max_age=60)
+        entry = cache.get("https://www.example.com/file.txt")
+        self.assertEqual(cache.read(entry), b"contents")
+        cache.close()
+
+    def test_is_fresh(self):
+        self.cache.max_age = 0
+        self.cache.put("https://www.example.com/file.txt", b"contents")
+        self.cache.put(f"https://www.example.com/{self.content_key}", b"manifest")
+
+        self.assertFalse(
+            self.cache.is_fresh(self.cache.get("https://www.example.com/file.txt"))
+        )
+        self.assertTrue(
+            self.cache.is_fresh(
+                self.cache.get(f"https://www.example.com/{self.content_key}")
+            )
+        )
+
+    def test_evict(self):
+        self.cache.put("https://www.example.com/1", b"1" * 40)
+        self.cache.put("https://www.example.com/2", b"2" * 40)
+        # Same content as 2, stored once
+        self.cache.put("https://www.example.com/3", b"2" * 40)
+        self.assertEqual(self.cache.size(), 80)
+
+        self.cache.read(self.cache.get("https://www.example.com/1"))
+        self.cache.put("https://www.example.com/4", b"4" * 40)
+
+        self.assertIsNone(self.cache.get("https://www.example.com/2"))
+        self.assertIsNone(self.cache.get("https://www.example.com/3"))
+        self.assertIsNotNone(self.cache.get("https://www.example.com/1"))
+        self.assertIsNotNone(self.cache.get("https://www.example.com/4"))
+        self.assertEqual(self.cache.size(), 80)
+        self.assertEqual(self.cache.info()["evictions"], 2)
+
+        # Files bigger than the cache aren't stored
+        self.cache.put("https://www.example.com/5", b"5" * 101)
+        self.assertIsNone(self.cache.get("https://www.example.com/5"))
+
+    def test_clear(self):
+        self.cache.put("https://www.example.com/1", b"1")
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get("https://www.example.com/1"))
+        self.assertEqual(self.cache.size(), 0)
+
+    def test_download_file_from_url(self):
+        url = f"https://www.example.com/{self.content_key}"
+        with patch("requests.get") as mock_get:
+            mock_get.return_value.content = b"manifest"
+            mock_get.return_value.headers = {"ETag": '"etag"'}
+
+            self.assertEqual(StorageClient.download_file_from_url(url), b"manifest")
+            self.assertEqual(StorageClient.download_file_from_url(url), b"manifest")
+
+            mock_get.assert_called_once_with(url)
+        self.assertEqual(self.cache.info()["hits"], 1)
+        self.assertEqual(self.cache.info()["misses"], 1)
+        self.assertEqual(self.cache.info()["hit_rate"], 0.5)
+
+    def test_download_file_from_url_revalidate(self):
+        self.cache.max_age = 0
+        url = "https://www.example.com/file.txt"
+        with patch("requests.get") as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.content = b"contents"
+            mock_get.return_value.headers = {"ETag": '"etag"'}
+            StorageClient.download_file_from_url(url)
+
+            mock_get.return_value.status_code = 304
+            self.assertEqual(StorageClient.download_file_from_url(url), b"contents")
+
+            mock_get.assert_called_with(url, headers={"If-None-Match": '"etag"'})
+        self.assertEqual(self.cache.info()["revalidations"], 1)
+
+    def test_download_file_from_url_modified(self):
+        self.cache.max_age = 0
+        url = "https://www.example.com/file.txt"
+        with patch("requests.get") as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.content = b"contents"
+            mock_get.return_value.headers = {"ETag": '"etag"'}
+            StorageClient.download_file_from_url(url)
+
+            mock_get.return_value.content = b"new contents"
+            mock_get.return_value.headers = {"ETag": '"new-etag"'}
+            self.assertEqual(StorageClient.download_file_from_url(url), b"new contents")
+
+        self.assertEqual(self.cache.get(url).etag, '"new-etag"')
+        self.assertEqual(self.cache.info()["misses"], 2)
+
+    def test_download_files(self):
+        self.client.client.get_object = MagicMock(
+            return_value=MagicMock(
+                read=MagicMock(return_value=b"manifest"),
+                headers={"ETag": '"etag"'},
+            )
+        )
+
+        for _ in range(3):
+            result = self.client.download_files(
+                files=[self.content_key], bucket="my-bucket"
+            )
+            self.assertEqual(result, [b"manifest"])
+
+        self.client.client.get_object.assert_called_once_with(
+            bucket_name="my-bucket", object_name=self.content_key
+        )
+        self.assertEqual(self.cache.info()["hits"], 2)
+
+    def test_download_files_revalidate(self):
+        self.cache.max_age = 0
+        self.client.client.get_object = MagicMock(
+            side_effect=[
+                MagicMock(
+                    read=MagicMock(return_value=b"contents"),
+                    headers={"ETag": '"etag"'},
+                ),
+                ServerError("server failed with HTTP status code 304", 304),
+            ]
+        )
+
+        for _ in range(2):
+            result = self.client.download_files(files=["file1.txt"], bucket="my-bucket")
+            self.assertEqual(result, [b"contents"])
+
+        self.assertEqual(
+            self.client.client.get_object.call_args.kwargs["request_headers"],
+            {"If-None-Match": '"etag"'},
+        )
+        self.assertEqual(self.cache.info()["revalidations"], 1)
+
+    def test_download_files_evicted(self):
+        self.cache.max_age = 0
+        self.client.client.get_object = MagicMock(
+            side_effect=[
+                MagicMock(
+                    read=MagicMock(return_value=b"contents"),
+                    headers={"ETag": '"etag"'},
+                ),
+                ServerError("server failed with HTTP status code 304", 304),
+                MagicMock(
+                    read=MagicMock(return_value=b"contents"),
+                    headers={"ETag": '"etag"'},
+                ),
+            ]
+        )
+        self.client.download_files(files=["file1.txt"], bucket="my-bucket")
+        # Another process removed the file but not the entry yet
+        for root, _, files in os.walk(os.path.join(self.directory.name, "objects")):
+            for file in files:
+                os.unlink(os.path.join(root, file))
+
+        result = self.client.download_files(files=["file1.txt"], bucket="my-bucket")
+
+        self.assertEqual(result, [b"contents"])
+        self.assertEqual(self.client.client.get_object.call_count, 3)
@@ -0,0 +1,902 @@
+import asyncio
+import gzip
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from test.human_protocol_sdk.utils import (
+    DEFAULT_GAS_PAYER_PRIV,
+    FakeAsyncProvider,
+    async_web3,
+)
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from eth_account import Account
+from human_protocol_sdk.utils import (
+    AsyncNonceManager,
+    INTERFACE_CACHE,
+    InterfaceCache,
+    LRUCache,
+    NonceManager,
+    PendingTransaction,
+    SUBGRAPH_METRICS,
+    SubgraphCache,
+    SubgraphQuery,
+    SUBGRAPH_POOL_SIZE,
+    async_close_subgraph_sessions,
+    async_get_data_from_subgraph,
+    async_iter_subgraph_pages,
+    close_subgraph_sessions,
+    get_async_subgraph_session,
+    async_submit_transaction,
+    async_wait_for_receipts,
+    get_escrow_interface,
+    get_batched_data_from_subgraph,
+    get_data_from_subgraph,
+    get_factory_interface,
+    get_nonce_manager,
+    handle_transaction,
+    iter_subgraph_pages,
+    set_subgraph_cache,
+    submit_transaction,
+    wait_for_receipts,
+)
+from web3 import Web3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+from web3.middleware import construct_sign_and_send_raw_middleware
+from web3.providers.base import BaseProvider
+from web3.providers.rpc import HTTPProvider
+
+
+class InterfaceCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cache = InterfaceCache()
+        self.artifact = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
+        json.dump(
+            {
+                "contractName": "Test",
+                "sourceName": "contracts/Test.sol",
+                "abi": [{"type": "function", "name": "test"}],
+                "bytecode": "0x1234",
+                "deployedBytecode": "0x5678",
+            },
+            self.artifact,
+        )
+        self.artifact.close()
+
+    def tearDown(self):
+        os.remove(self.artifact.name)
+
+    def test_get_keeps_only_abi_fields(self):
+        interface = self.cache.get(self.artifact.name)
+
+        self.assertEqual(interface["contractName"], "Test")
+        self.assertEqual(interface["abi"], [{"type": "function", "name": "test"}])
+        self.assertNotIn("bytecode", interface)
+        self.assertNotIn("deployedBytecode", interface)
+
+    def test_get_loads_once(self):
+        first = self.cache.get(self.artifact.name)
+        second = self.cache.get(self.artifact.name)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.info(), {"hits": 1, "misses": 1, "size": 1})
+
+    def test_get_concurrent(self):
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(self.cache.get(self.artifact.name))
+            )
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.hits, 9)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_get_invalid_path(self):
+        with self.assertRaises(FileNotFoundError):
+            self.cache.get("invalid_path.json")
+        self.assertEqual(self.cache.info(), {"hits": 0, "misses": 0, "size": 0})
+
+    def test_clear(self):
+        self.cache.get(self.artifact.name)
+        self.cache.clear()
+
+        self.assertEqual(self.cache.info(), {"hits": 0, "misses": 0, "size": 0})
+
+    def test_get_interface_helpers_use_shared_cache(self):
+        get_escrow_interface()
+        hits = INTERFACE_CACHE.hits
+
+        escrow_interface = get_escrow_interface()
+        factory_interface = get_factory_interface()
+
+        self.assertIs(escrow_interface, get_escrow_interface())
+        self.assertGreaterEqual(INTERFACE_CACHE.hits, hits + 2)
+        self.assertIn("abi", factory_interface)
+
+
+class LRUCacheTestCase(unittest.TestCase):
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError) as cm:
+            LRUCache(0)
+        self.assertEqual("Cache size must be greater than 0", str(cm.exception))
+
+    def test_get_put(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("b", 2), 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_eviction(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_pop_clear(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        self.assertEqual(cache.pop("a"), 1)
+        self.assertIsNone(cache.pop("a"))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+ITEMS_QUERY = SubgraphQuery(
+    "Items",
+    {"first": "Int!", "where": "Item_filter!"},
+    "items(first: $first, orderBy: id, where: $where)",
+    "id",
+)
+
+
+REWARDS_QUERY = SubgraphQuery(
+    "Rewards",
+    {"slasher": "Bytes!"},
+    "rewardAddedEvents(where: {slasher: $slasher})",
+    "escrow amount",
+)
+
+
+class SubgraphQueryTestCase(unittest.TestCase):
+    def setUp(self):
+        patcher = patch(
+            "human_protocol_sdk.utils._post_subgraph_query",
+            side_effect=self.post_subgraph_query,
+        )
+        self.mock_post = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def post_subgraph_query(self, url, query, timeout, variables=None):
+        return {
+            "data": {
+                "q0": [{"id": "0x01"}],
+                "q1": [{"escrow": "0x02", "amount": "10"}],
+                "_meta": {"block": {"number": 10}},
+            }
+        }
+
+    def test_document(self):
+        self.assertEqual(REWARDS_QUERY.entity, "rewardAddedEvents")
+        self.assertEqual(
+            REWARDS_QUERY.document,
+            "query Rewards($slasher: Bytes!) "
+            "{ rewardAddedEvents(where: {slasher: $slasher}) { escrow amount } }",
+        )
+        self.assertEqual(
+            REWARDS_QUERY.id,
+            SubgraphQuery(
+                "Rewards",
+                {"slasher": "Bytes!"},
+                "rewardAddedEvents(where: {slasher: $slasher})",
+                "escrow amount",
+            ).id,
+        )
+        self.assertNotEqual(REWARDS_QUERY.id, ITEMS_QUERY.id)
+
+    def test_variables(self):
+        self.mock_post.side_effect = None
+        self.mock_post.return_value = {"data": {"rewardAddedEvents": []}}
+
+        get_data_from_subgraph("url", REWARDS_QUERY, variables={"slasher": "0x01"})
+
+        self.mock_post.assert_called_once_with(
+            "url", REWARDS_QUERY.document, 30, {"slasher": "0x01"}
+        )
+
+    def test_batch(self):
+        responses = get_batched_data_from_subgraph(
+            "url",
+            [
+                (ITEMS_QUERY, {"first": 1, "where": {}}),
+                (REWARDS_QUERY, {"slasher": "0x03"}),
+            ],
+        )
+
+        self.assertEqual(
+            responses,
+            [
+                {"data": {"items": [{"id": "0x01"}]}},
+                {"data": {"rewardAddedEvents": [{"escrow": "0x02", "amount": "10"}]}},
+            ],
+        )
+        [(url, document, _, variables)] = [
+            call.args for call in self.mock_post.call_args_list
+        ]
+        self.assertIn("query Batch($first_0: Int!, $where_0: Item_filter!", document)
+        self.assertIn("q1: rewardAddedEvents(where: {slasher: $slasher_1})", document)
+        self.assertEqual(variables, {"first_0": 1, "where_0": {}, "slasher_1": "0x03"})
+
+    def test_batch_cached(self):
+        cache = SubgraphCache(ttl=60)
+        set_subgraph_cache(cache)
+        self.addCleanup(set_subgraph_cache, None)
+        queries = [
+            (ITEMS_QUERY, {"first": 1, "where": {}}),
+            (REWARDS_QUERY, {"slasher": "0x03"}),
+        ]
+        get_batched_data_from_subgraph("url", queries[:1])
+
+        responses = get_batched_data_from_subgraph("url", queries)
+
+        self.assertEqual(responses[0], {"data": {"items": [{"id": "0x01"}]}})
+        self.assertEqual(self.mock_post.call_count, 2)
+        # Only the query missing from the cache is sent
+        self.assertNotIn("items", self.mock_post.call_args.args[1])
+        self.assertEqual(cache.info()["hits"], 1)
+
+
+class SubgraphPaginationTestCase(unittest.TestCase):
+    def setUp(self):
+        self.items = [{"id": f"0x{i:02x}"} for i in range(1, 6)]
+
+    def get_data_from_subgraph(self, url, query, variables):
+        self.assertIs(query, ITEMS_QUERY)
+        self.assertEqual(variables["where"]["kind"], "test")
+        last_id = variables["where"]["id_gt"]
+        return {
+            "data": {
+                "items": [item for item in self.items if item["id"] > last_id][
+                    : variables["first"]
+                ]
+            }
+        }
+
+    def test_iter_subgraph_pages(self):
+        with patch(
+            "human_protocol_sdk.utils.get_data_from_subgraph",
+            side_effect=self.get_data_from_subgraph,
+        ) as mock_function:
+            pages = list(
+                iter_subgraph_pages("url", ITEMS_QUERY, {"where": {"kind": "test"}}, 2)
+            )
+
+        self.assertEqual(pages, [self.items[:2], self.items[2:4], self.items[4:]])
+        self.assertEqual(mock_function.call_count, 3)
+
+    def test_iter_subgraph_pages_full_last_page(self):
+        self.items = self.items[:4]
+        with patch(
+            "human_protocol_sdk.utils.get_data_from_subgraph",
+            side_effect=self.get_data_from_subgraph,
+        ) as mock_function:
+            pages = list(
+                iter_subgraph_pages(
+                    "url", ITEMS_QUERY, {"where": {"kind": "test"}}, 2, prefetch=False
+                )
+            )
+
+        self.assertEqual(pages, [self.items[:2], self.items[2:4]])
+        # An empty page tells there is nothing left
+        self.assertEqual(mock_function.call_count, 3)
+
+    def test_iter_subgraph_pages_invalid_page_size(self):
+        for page_size in (0, 1001):
+            with self.assertRaises(ValueError) as cm:
+                next(iter_subgraph_pages("url", ITEMS_QUERY, None, page_size))
+            self.assertEqual(
+                f"Page size must be between 1 and 1000: {page_size}",
+                str(cm.exception),
+            )
+
+    def test_async_iter_subgraph_pages(self):
+        async def get_pages():
+            return [
+                page
+                async for page in async_iter_subgraph_pages(
+                    "url", ITEMS_QUERY, {"where": {"kind": "test"}}, 2
+                )
+            ]
+
+        with patch(
+            "human_protocol_sdk.utils.async_get_data_from_subgraph",
+            AsyncMock(side_effect=self.get_data_from_subgraph),
+        ) as mock_function:
+            pages = asyncio.run(get_pages())
+
+        self.assertEqual(pages, [self.items[:2], self.items[2:4], self.items[4:]])
+        self.assertEqual(mock_function.await_count, 3)
+
+
+class StubSubgraphHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        body = json.dumps({"data": {"launchedEscrows": []}}).encode()
+        gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+        if gzipped:
+            body = gzip.compress(body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class SubgraphSessionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubSubgraphHandler)
+        self.server.connections = 0
+        self.server.statuses = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/subgraph"
+        SUBGRAPH_METRICS.clear()
+
+    def tearDown(self):
+        close_subgraph_sessions()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connection_reuse(self):
+        for _ in range(5):
+            self.assertEqual(
+                get_data_from_subgraph(self.url, "{ launchedEscrows { id } }"),
+                {"data": {"launchedEscrows": []}},
+            )
+
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(SUBGRAPH_METRICS.info()["queries"], 5)
+
+    def test_retry_on_server_error(self):
+        self.server.statuses = [503, 429]
+
+        get_data_from_subgraph(self.url, "{ launchedEscrows { id } }")
+
+        self.assertEqual(self.server.statuses, [])
+        self.assertEqual(SUBGRAPH_METRICS.info()["failures"], 0)
+
+    def test_error_status(self):
+        self.server.statuses = [400]
+
+        with self.assertRaises(Exception) as cm:
+            get_data_from_subgraph(self.url, "{ launchedEscrows { id } }")
+        self.assertIn("Subgraph query failed. return code is 400.", str(cm.exception))
+        self.assertEqual(SUBGRAPH_METRICS.info()["failures"], 1)
+
+    def test_metrics_callback(self):
+        queries = []
+        SUBGRAPH_METRICS.callback = lambda *args: queries.append(args)
+        self.addCleanup(setattr, SUBGRAPH_METRICS, "callback", None)
+
+        get_data_from_subgraph(self.url, "{ launchedEscrows { id } }")
+
+        [(url, latency, status)] = queries
+        self.assertEqual((url, status), (self.url, 200))
+        self.assertGreater(latency, 0)
+        self.assertEqual(SUBGRAPH_METRICS.info()["max_latency"], latency)
+
+
+class AsyncSubgraphSessionTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubSubgraphHandler)
+        self.server.connections = 0
+        self.server.statuses = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/subgraph"
+        SUBGRAPH_METRICS.clear()
+
+    async def asyncTearDown(self):
+        await async_close_subgraph_sessions()
+        self.server.shutdown()
+        self.server.server_close()
+
+    async def test_connection_reuse(self):
+        responses = await asyncio.gather(
+            *[
+                async_get_data_from_subgraph(self.url, "{ launchedEscrows { id } }")
+                for _ in range(20)
+            ]
+        )
+
+        self.assertEqual(responses, [{"data": {"launchedEscrows": []}}] * 20)
+        self.assertLessEqual(self.server.connections, SUBGRAPH_POOL_SIZE)
+        self.assertIs(
+            get_async_subgraph_session(self.url), get_async_subgraph_session(self.url)
+        )
+
+    async def test_retry_on_server_error(self):
+        self.server.statuses = [503, 429]
+
+        with patch("human_protocol_sdk.utils.SUBGRAPH_RETRY_BACKOFF", 0):
+            await async_get_data_from_subgraph(self.url, "{ launchedEscrows { id } }")
+
+        self.assertEqual(self.server.statuses, [])
+        self.assertEqual(SUBGRAPH_METRICS.info()["failures"], 0)
+
+    async def test_error_status(self):
+        self.server.statuses = [400]
+
+        with self.assertRaises(Exception) as cm:
+            await async_get_data_from_subgraph(self.url, "{ launchedEscrows { id } }")
+        self.assertIn("Subgraph query failed. return code is 400.", str(cm.exception))
+        self.assertEqual(self.server.statuses, [])
+
+
+class SubgraphCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.block = 10
+        self.cache = SubgraphCache(max_size=10, ttl=60)
+        set_subgraph_cache(self.cache)
+        self.addCleanup(set_subgraph_cache, None)
+        patcher = patch(
+            "human_protocol_sdk.utils._post_subgraph_query",
+            side_effect=self.post_subgraph_query,
+        )
+        self.mock_post = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def post_subgraph_query(self, url, query, timeout, variables=None):
+        data = {"_meta": {"block": {"number": self.block}}}
+        if "escrows" in query:
+            data["escrows"] = [{"id": f"0x{self.block:02x}"}]
+        return {"data": data}
+
+    def expire(self, query):
+        self.cache.get(SubgraphCache.key("url", query)).stored_at -= 60
+
+    def test_hit(self):
+        first = get_data_from_subgraph("url", "{ escrows { id } }")
+        second = get_data_from_subgraph("url", "{\n  escrows {\n    id\n  }\n}")
+
+        self.assertEqual(first, {"data": {"escrows": [{"id": "0x0a"}]}})
+        self.assertEqual(second, first)
+        self.assertIsNot(second, first)
+        self.mock_post.assert_called_once()
+        self.assertIn("_meta { block { number } }", self.mock_post.call_args.args[1])
+        self.assertEqual(self.cache.info(), {"hits": 1, "misses": 1, "size": 1})
+
+    def test_hit_returns_copy(self):
+        first = get_data_from_subgraph("url", "{ escrows { id } }")
+        first["data"]["escrows"].pop()
+        second = get_data_from_subgraph("url", "{ escrows { id } }")
+        second["data"]["escrows"][0]["id"] = "0xff"
+
+        third = get_data_from_subgraph("url", "{ escrows { id } }")
+        self.assertEqual(third, {"data": {"escrows": [{"id": "0x0a"}]}})
+        self.mock_post.assert_called_once()
+
+    def test_expired_same_block(self):
+        get_data_from_subgraph("url", "{ escrows { id } }")
+        get_data_from_subgraph("url", "{ escrows(first:1) { id } }")
+        self.expire("{ escrows { id } }")
+        self.expire("{ escrows(first:1) { id } }")
+        self.cache._head_blocks.clear()
+
+        get_data_from_subgraph("url", "{ escrows { id } }")
+        get_data_from_subgraph("url", "{ escrows(first:1) { id } }")
+
+        # A single head block query revalidates both responses
+        self.assertEqual(self.mock_post.call_count, 3)
+        self.assertNotIn("escrows", self.mock_post.call_args.args[1])
+        self.assertEqual(self.cache.hits, 2)
+
+    def test_expired_head_moved(self):
+        get_data_from_subgraph("url", "{ escrows { id } }")
+        self.expire("{ escrows { id } }")
+        self.cache._head_blocks.clear()
+        self.block = 11
+
+        data = get_data_from_subgraph("url", "{ escrows { id } }")
+
+        self.assertEqual(data, {"data": {"escrows": [{"id": "0x0b"}]}})
+        self.assertEqual(self.mock_post.call_count, 3)
+        self.assertEqual(self.cache.get_head_block("url"), 11)
+
+    def test_errors_not_cached(self):
+        self.mock_post.side_effect = lambda url, query, timeout, variables=None: {
+            "errors": [{"message": "error"}],
+            "data": {"_meta": {"block": {"number": 10}}},
+        }
+
+        get_data_from_subgraph("url", "{ escrows { id } }")
+        get_data_from_subgraph("url", "{ escrows { id } }")
+
+        self.assertEqual(self.mock_post.call_count, 2)
+
+    def test_lru_eviction(self):
+        for i in range(11):
+            get_data_from_subgraph("url", f"{{ escrows(first:{i}) {{ id }} }}")
+
+        self.assertEqual(self.cache.info()["size"], 10)
+        self.assertIsNone(
+            self.cache.get(SubgraphCache.key("url", "{ escrows(first:0) { id } }"))
+        )
+
+    def test_disk_backend(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "subgraph.db")
+            cache = SubgraphCache(path=path)
+            set_subgraph_cache(cache)
+            get_data_from_subgraph("url", "{ escrows { id } }")
+            cache.close()
+
+            cache = SubgraphCache(path=path)
+            set_subgraph_cache(cache)
+            data = get_data_from_subgraph("url", "{ escrows { id } }")
+            cache.close()
+
+        self.assertEqual(data, {"data": {"escrows": [{"id": "0x0a"}]}})
+        self.mock_post.assert_called_once()
+
+    def test_disabled(self):
+        set_subgraph_cache(None)
+
+        get_data_from_subgraph("url", "{ escrows { id } }")
+        get_data_from_subgraph("url", "{ escrows { id } }")
+
+        self.assertEqual(self.mock_post.call_count, 2)
+        self.assertNotIn("_meta", self.mock_post.call_args.args[1])
+
+
+class AlreadyKnownProvider(BaseProvider):
+    def make_request(self, method, params):
+        return {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "error": {"code": -32000, "message": "already known"},
+        }
+
+
+class TransactionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.w3 = Web3(MagicMock(spec=HTTPProvider))
+        self.gas_payer = self.w3.eth.account.from_key(DEFAULT_GAS_PAYER_PRIV)
+        self.w3.middleware_onion.add(
+            construct_sign_and_send_raw_middleware(self.gas_payer),
+            "construct_sign_and_send_raw_middleware",
+        )
+        self.w3.eth.default_account = self.gas_payer.address
+        self.w3.eth.get_transaction_count = MagicMock(return_value=5)
+
+        self.tx = MagicMock()
+        self.tx.transact.side_effect = lambda tx: bytes([tx["nonce"]]) * 32
+
+    def test_nonce_manager(self):
+        nonce_manager = NonceManager(self.w3)
+
+        self.assertEqual(
+            [nonce_manager.next_nonce(self.gas_payer.address) for _ in range(3)],
+            [5, 6, 7],
+        )
+        self.w3.eth.get_transaction_count.assert_called_once_with(
+            self.gas_payer.address, "pending"
+        )
+
+        nonce_manager.reset(self.gas_payer.address)
+        self.w3.eth.get_transaction_count.return_value = 9
+        self.assertEqual(nonce_manager.next_nonce(self.gas_payer.address), 9)
+
+    def test_nonce_manager_concurrent(self):
+        nonce_manager = NonceManager(self.w3)
+        nonces = []
+        threads = [
+            threading.Thread(
+                target=lambda: nonces.append(
+                    nonce_manager.next_nonce(self.gas_payer.address)
+                )
+            )
+            for _ in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(nonces), list(range(5, 25)))
+
+    def test_get_nonce_manager(self):
+        self.assertIs(get_nonce_manager(self.w3), get_nonce_manager(self.w3))
+        self.assertIsNot(
+            get_nonce_manager(self.w3),
+            get_nonce_manager(Web3(MagicMock(spec=HTTPProvider))),
+        )
+
+    def test_submit_transaction(self):
+        pending = [
+            submit_transaction(self.w3, "Test", self.tx, Exception, {"gas": 100})
+            for _ in range(3)
+        ]
+
+        self.assertEqual(
+            [tx.tx_hash for tx in pending],
+            [Web3.toHex(bytes([nonce]) * 32) for nonce in (5, 6, 7)],
+        )
+        self.assertEqual(self.tx.transact.call_args.args[0], {"gas": 100, "nonce": 7})
+        self.w3.eth.get_transaction_count.assert_called_once()
+
+    def test_submit_transaction_error(self):
+        self.tx.transact.side_effect = Exception(
+            "execution reverted: VM Exception while processing transaction: "
+            "reverted with reason string 'Not enough balance'"
+        )
+
+        with self.assertRaises(ValueError) as cm:
+            submit_transaction(self.w3, "Test", self.tx, ValueError)
+        self.assertEqual(
+            "Test transaction failed: Not enough balance", str(cm.exception)
+        )
+
+        # The nonce is not consumed by a failed transaction
+        self.tx.transact.side_effect = lambda tx: bytes([tx["nonce"]]) * 32
+        self.assertEqual(
+            submit_transaction(self.w3, "Test", self.tx, ValueError).tx_hash,
+            Web3.toHex(bytes([5]) * 32),
+        )
+
+    def test_submit_transaction_nonce_out_of_sync(self):
+        get_nonce_manager(self.w3).next_nonce(self.gas_payer.address)
+        self.w3.eth.get_transaction_count.return_value = 8
+        self.tx.transact.side_effect = [
+            ValueError({"code": -32000, "message": "nonce too low"}),
+            b"\x08" * 32,
+        ]
+
+        pending = submit_transaction(self.w3, "Test", self.tx, Exception)
+
+        self.assertEqual(pending.tx_hash, Web3.toHex(b"\x08" * 32))
+        self.assertEqual(
+            [call.args[0]["nonce"] for call in self.tx.transact.call_args_list],
+            [6, 8],
+        )
+
+    def test_submit_transaction_reserved_nonce(self):
+        self.tx.transact.side_effect = ValueError(
+            {"code": -32000, "message": "nonce too low"}
+        )
+
+        with self.assertRaises(ValueError):
+            submit_transaction(self.w3, "Test", self.tx, ValueError, nonce=3)
+
+        # Never sent with another nonce
+        self.tx.transact.assert_called_once_with({"nonce": 3})
+
+    def test_submit_transaction_already_known(self):
+        raw_transaction = self.gas_payer.sign_transaction(
+            {
+                "to": self.gas_payer.address,
+                "value": 1,
+                "gas": 21000,
+                "gasPrice": 1,
+                "nonce": 5,
+                "chainId": 1,
+            }
+        ).rawTransaction
+        self.w3.provider = AlreadyKnownProvider()
+        self.tx.transact.side_effect = lambda tx: self.w3.eth.send_raw_transaction(
+            raw_transaction
+        )
+
+        pending = submit_transaction(self.w3, "Test", self.tx, Exception)
+
+        self.assertEqual(pending.tx_hash, Web3.toHex(Web3.keccak(raw_transaction)))
+        self.tx.transact.assert_called_once()
+        # The nonce is used by the known transaction
+        self.assertEqual(
+            get_nonce_manager(self.w3).next_nonce(self.gas_payer.address), 6
+        )
+
+    def test_submit_transaction_without_account(self):
+        self.w3.eth.default_account = None
+
+        with self.assertRaises(ValueError) as cm:
+            submit_transaction(self.w3, "Test", self.tx, ValueError)
+        self.assertEqual("You must add an account to Web3 instance", str(cm.exception))
+
+    def test_handle_transaction(self):
+        self.w3.eth.wait_for_transaction_receipt = MagicMock(return_value={"status": 1})
+
+        receipt = handle_transaction(self.w3, "Test", self.tx, Exception)
+
+        self.assertEqual(receipt, {"status": 1})
+        self.w3.eth.wait_for_transaction_receipt.assert_called_once_with(
+            Web3.toHex(bytes([5]) * 32)
+        )
+
+    def test_handle_transaction_timeout(self):
+        self.w3.eth.wait_for_transaction_receipt = MagicMock(
+            side_effect=TimeExhausted("Not mined")
+        )
+
+        with self.assertRaises(ValueError):
+            handle_transaction(self.w3, "Test", self.tx, ValueError)
+
+        # The dropped nonce is read from the node again
+        self.w3.eth.get_transaction_count.return_value = 5
+        self.assertEqual(
+            get_nonce_manager(self.w3).next_nonce(self.gas_payer.address), 5
+        )
+        self.assertEqual(self.w3.eth.get_transaction_count.call_count, 2)
+
+    def test_wait_for_receipts(self):
+        polls = {"0x01": 0, "0x02": 0}
+
+        def get_transaction_receipt(tx_hash):
+            if tx_hash not in polls:
+                raise TransactionNotFound(tx_hash)
+            polls[tx_hash] += 1
+            # Mined on the second check
+            if polls[tx_hash] < 2:
+                raise TransactionNotFound(tx_hash)
+            return {"status": int(tx_hash, 16) % 2}
+
+        self.w3.eth.get_transaction_receipt = MagicMock(
+            side_effect=get_transaction_receipt
+        )
+        pending = [
+            PendingTransaction(self.w3, "Test", tx_hash, ValueError)
+            for tx_hash in ("0x01", "0x02", "0x03")
+        ]
+
+        receipts = wait_for_receipts(self.w3, pending, timeout=0.05, poll_latency=0)
+
+        self.assertEqual(receipts[:2], [{"status": 1}, {"status": 0}])
+        self.assertIsInstance(receipts[2], ValueError)
+        self.assertIn("Test transaction 0x03 not mined", str(receipts[2]))
+        self.assertEqual(polls, {"0x01": 2, "0x02": 2})
+
+    def test_wait_for_receipts_timeout_resets_nonce(self):
+        self.w3.eth.get_transaction_receipt = MagicMock(
+            side_effect=TransactionNotFound("Not found")
+        )
+        pending = submit_transaction(self.w3, "Test", self.tx, ValueError)
+
+        [receipt] = wait_for_receipts(self.w3, [pending], timeout=0, poll_latency=0)
+
+        self.assertIsInstance(receipt, ValueError)
+        self.assertEqual(
+            get_nonce_manager(self.w3).next_nonce(self.gas_payer.address), 5
+        )
+        self.assertEqual(self.w3.eth.get_transaction_count.call_count, 2)
+
+    def test_pending_transaction_wait(self):
+        self.w3.eth.get_transaction_receipt = MagicMock(return_value={"status": 1})
+        self.assertEqual(
+            PendingTransaction(self.w3, "Test", "0x01", ValueError).wait(),
+            {"status": 1},
+        )
+
+        self.w3.eth.get_transaction_receipt = MagicMock(return_value={"status": 0})
+        with self.assertRaises(ValueError) as cm:
+            PendingTransaction(self.w3, "Test", "0x01", ValueError).wait()
+        self.assertEqual("Test transaction failed: reverted", str(cm.exception))
+
+
+class AsyncTransactionTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.provider = FakeAsyncProvider()
+        self.provider.transaction_count = 5
+        self.w3 = async_web3(self.provider)
+        self.account = Account.from_key(DEFAULT_GAS_PAYER_PRIV)
+        self.tx = MagicMock()
+        self.tx.address = "0x1234567890123456789012345678901234567890"
+        self.tx._encode_transaction_data.return_value = "0x"
+
+    async def test_nonce_manager_concurrent(self):
+        nonce_manager = AsyncNonceManager(self.w3)
+
+        nonces = await asyncio.gather(
+            *[nonce_manager.next_nonce(self.account.address) for _ in range(20)]
+        )
+
+        self.assertEqual(sorted(nonces), list(range(5, 25)))
+        self.assertEqual(
+            [method for method, _ in self.provider.requests],
+            ["eth_getTransactionCount"],
+        )
+
+    async def test_submit_transaction(self):
+        pending = await asyncio.gather(
+            *[
+                async_submit_transaction(
+                    self.w3, "Test", self.tx, ValueError, self.account, {"gas": 100}
+                )
+                for _ in range(3)
+            ]
+        )
+
+        self.assertEqual(len({tx.tx_hash for tx in pending}), 3)
+        for raw_transaction in self.provider.transactions:
+            self.assertEqual(
+                Account.recover_transaction(raw_transaction), self.account.address
+            )
+        methods = [method for method, _ in self.provider.requests]
+        self.assertNotIn("eth_estimateGas", methods)
+        self.assertEqual(methods.count("eth_getTransactionCount"), 1)
+
+    async def test_submit_transaction_already_known(self):
+        make_request = self.provider.make_request
+
+        async def already_known(method, params):
+            if method == "eth_sendRawTransaction":
+                self.provider.transactions.append(params[0])
+                return {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "error": {"code": -32000, "message": "already known"},
+                }
+            return await make_request(method, params)
+
+        self.provider.make_request = already_known
+
+        pending = await async_submit_transaction(
+            self.w3, "Test", self.tx, ValueError, self.account, {"gas": 100}
+        )
+
+        [raw_transaction] = self.provider.transactions
+        self.assertEqual(
+            pending.tx_hash, Web3.toHex(Web3.keccak(hexstr=raw_transaction))
+        )
+
+    async def test_submit_transaction_without_account(self):
+        with self.assertRaises(ValueError) as cm:
+            await async_submit_transaction(self.w3, "Test", self.tx, ValueError)
+        self.assertEqual("You must add an account to Web3 instance", str(cm.exception))
+
+    async def test_wait_for_receipts(self):
+        self.provider.receipt_status = 0
+        pending = await async_submit_transaction(
+            self.w3, "Test", self.tx, ValueError, self.account
+        )
+
+        [receipt] = await async_wait_for_receipts(self.w3, [pending])
+
+        self.assertEqual(receipt["status"], 0)
+        with self.assertRaises(ValueError) as cm:
+            await pending.wait()
+        self.assertEqual("Test transaction failed: reverted", str(cm.exception))
+
+
+if __name__ == "__main__":
+    unittest.main(exit=True)
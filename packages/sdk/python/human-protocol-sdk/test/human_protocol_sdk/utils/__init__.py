@@ -1,2 +1,3 @@
 from .encryption import *
 from .job import DEFAULT_GAS_PAYER, DEFAULT_GAS_PAYER_PRIV
+from .async_provider import FakeAsyncProvider, async_web3, function_selector
@@ -0,0 +1,75 @@
+from eth_utils import keccak
+from web3 import Web3
+from web3.eth import AsyncEth
+from web3.providers.async_base import AsyncBaseProvider
+
+from human_protocol_sdk.constants import ChainId
+
+
+def function_selector(signature: str) -> str:
+    return "0x" + keccak(text=signature)[:4].hex()
+
+
+class FakeAsyncProvider(AsyncBaseProvider):
+    """In-process async provider answering the RPC calls used by async clients.
+
+    ``eth_call`` results are looked up by function selector in ``call_results``,
+    falling back to ``default_call_result``. Sent transactions are mined right
+    away with ``receipt_status``.
+    """
+
+    def __init__(self, chain_id: int = ChainId.LOCALHOST.value):
+        self.chain_id = chain_id
+        self.call_results = {}
+        self.default_call_result = "0x" + (1).to_bytes(32, "big").hex()
+        self.receipt_status = 1
+        self.receipt_logs = []
+        self.transaction_count = 0
+        self.requests = []
+        self.transactions = []
+
+    def set_call_result(self, signature: str, result: str) -> None:
+        self.call_results[function_selector(signature)] = result
+
+    async def make_request(self, method, params):
+        self.requests.append((method, params))
+        if method == "eth_chainId":
+            result = hex(self.chain_id)
+        elif method == "eth_call":
+            result = self.call_results.get(
+                params[0]["data"][:10], self.default_call_result
+            )
+        elif method == "eth_estimateGas":
+            result = hex(100000)
+        elif method == "eth_gasPrice":
+            result = hex(10**9)
+        elif method == "eth_getTransactionCount":
+            result = hex(self.transaction_count)
+        elif method in ("eth_sendTransaction", "eth_sendRawTransaction"):
+            self.transactions.append(params[0])
+            result = "0x" + keccak(text=str(len(self.transactions))).hex()
+        elif method == "eth_getTransactionReceipt":
+            result = {
+                "transactionHash": params[0],
+                "blockHash": "0x" + "00" * 32,
+                "blockNumber": "0x1",
+                "transactionIndex": "0x0",
+                "from": "0x" + "00" * 20,
+                "to": "0x" + "00" * 20,
+                "cumulativeGasUsed": "0x1",
+                "gasUsed": "0x1",
+                "contractAddress": None,
+                "logs": self.receipt_logs,
+                "logsBloom": "0x" + "00" * 256,
+                "status": hex(self.receipt_status),
+            }
+        else:
+            raise NotImplementedError(method)
+        return {"jsonrpc": "2.0", "id": len(self.requests), "result": result}
+
+    async def isConnected(self):
+        return True
+
+
+def async_web3(provider: FakeAsyncProvider) -> Web3:
+    return Web3(provider, middlewares=[], modules={"eth": (AsyncEth,)})